@@ -1,10 +1,14 @@
 import json
+import struct
+import threading
 import time
+import uuid
 from concurrent import futures
-from typing import AsyncGenerator, Generator, Mapping
+from typing import AsyncGenerator, Generator, List, Mapping
 
 import grpc
 import pytest
+import pytest_asyncio
 from grpc import ServicerContext
 from pytest_httpserver import HeaderValueMatcher, HTTPServer
 from werkzeug.wrappers import Request, Response
@@ -13,6 +17,7 @@ import weaviate
 from mock_tests.mock_data import mock_class
 from weaviate.connect.base import ConnectionParams, ProtocolParams
 from weaviate.proto.v1 import (
+    base_pb2,
     batch_delete_pb2,
     batch_pb2,
     properties_pb2,
@@ -141,7 +146,7 @@ def weaviate_client(
     client.close()
 
 
-@pytest.fixture(scope="function")
+@pytest_asyncio.fixture(scope="function")
 async def weaviate_client_async(
     weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
 ) -> AsyncGenerator[weaviate.WeaviateAsyncClient, None]:
@@ -262,6 +267,218 @@ def timeouts_collection(
     return weaviate_timeouts_client.collections.use(mock_class["class"])
 
 
+@pytest.fixture(scope="function")
+def numpy_vectors_collection(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> Generator[weaviate.collections.Collection, None, None]:
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def Search(
+            self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+        ) -> search_get_pb2.SearchReply:
+            return search_get_pb2.SearchReply(
+                results=[
+                    search_get_pb2.SearchResult(
+                        metadata=search_get_pb2.MetadataResult(
+                            vectors=[
+                                base_pb2.Vectors(
+                                    name="single",
+                                    vector_bytes=struct.pack("<3f", 1.0, 2.0, 3.0),
+                                    type=base_pb2.Vectors.VECTOR_TYPE_SINGLE_FP32,
+                                ),
+                                base_pb2.Vectors(
+                                    name="multi",
+                                    vector_bytes=struct.pack("<H", 2)
+                                    + struct.pack("<4f", 1.0, 2.0, 3.0, 4.0),
+                                    type=base_pb2.Vectors.VECTOR_TYPE_MULTI_FP32,
+                                ),
+                            ]
+                        ),
+                    ),
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    client = weaviate.connect_to_local(
+        host=MOCK_IP,
+        port=MOCK_PORT,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=weaviate.classes.init.AdditionalConfig(vector_format="numpy"),
+    )
+    yield client.collections.use("NumpyVectorsCollection")
+    client.close()
+
+
+# the last UUID ends in a null byte, which fixed-width numpy bytes arrays would drop
+COLUMNAR_UUIDS = [uuid.UUID(int=1), uuid.UUID(int=2), uuid.UUID(int=0x300)]
+
+
+@pytest.fixture(scope="function")
+def columnar_collection(
+    weaviate_client: weaviate.WeaviateClient, start_grpc_server: grpc.Server
+) -> weaviate.collections.Collection:
+    class MockWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+        def Search(
+            self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+        ) -> search_get_pb2.SearchReply:
+            return search_get_pb2.SearchReply(
+                results=[
+                    search_get_pb2.SearchResult(
+                        metadata=search_get_pb2.MetadataResult(
+                            id_as_bytes=uid.bytes,
+                            distance=0.5 * i,
+                            distance_present=True,
+                            creation_time_unix=1_700_000_000_000 + i,
+                            creation_time_unix_present=True,
+                            vectors=[
+                                base_pb2.Vectors(
+                                    name="default",
+                                    vector_bytes=struct.pack("<2f", i, i + 1),
+                                    type=base_pb2.Vectors.VECTOR_TYPE_SINGLE_FP32,
+                                )
+                            ],
+                        ),
+                        properties=search_get_pb2.PropertiesResult(
+                            non_ref_props=properties_pb2.Properties(
+                                fields={
+                                    "name": properties_pb2.Value(text_value=f"name{i}"),
+                                    **(
+                                        {"count": properties_pb2.Value(int_value=i)}
+                                        if i != 1
+                                        else {}
+                                    ),
+                                }
+                            )
+                        ),
+                    )
+                    for i, uid in enumerate(COLUMNAR_UUIDS)
+                ]
+            )
+
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(MockWeaviateService(), start_grpc_server)
+    return weaviate_client.collections.use("ColumnarCollection")
+
+
+ITERATOR_UUIDS = [uuid.UUID(int=i * 2**128 // 250 + 7) for i in range(250)]
+
+
+class MockIteratorWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self) -> None:
+        self.limits: List[int] = []
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.limits.append(request.limit)
+        # every scan pages with the cursor, which starts after any UUID, not only those of objects
+        assert not request.HasField("filters") and len(request.sort_by) == 0
+        after = uuid.UUID(request.after) if request.after else None
+        uuids = [uid for uid in ITERATOR_UUIDS if after is None or uid > after]
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    metadata=search_get_pb2.MetadataResult(id_as_bytes=uid.bytes),
+                    properties=search_get_pb2.PropertiesResult(
+                        non_ref_props=properties_pb2.Properties(
+                            fields={"name": properties_pb2.Value(text_value="x" * 100)}
+                        )
+                    ),
+                )
+                for uid in uuids[: request.limit]
+            ]
+        )
+
+
+@pytest.fixture(scope="function")
+def iterator_service(start_grpc_server: grpc.Server) -> MockIteratorWeaviateService:
+    service = MockIteratorWeaviateService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    return service
+
+
+class MockBatchQueryWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+    """Returns as many objects as the limit of a search, and fails searches with a limit of 13."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.__lock = threading.Lock()
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        with self.__lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.__lock:
+            self.in_flight -= 1
+        if request.limit == 13:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "unlucky limit")
+        return search_get_pb2.SearchReply(
+            results=[
+                search_get_pb2.SearchResult(
+                    metadata=search_get_pb2.MetadataResult(id_as_bytes=uuid.UUID(int=i).bytes)
+                )
+                for i in range(request.limit)
+            ]
+        )
+
+
+@pytest.fixture(scope="function")
+def batch_query_service(start_grpc_server: grpc.Server) -> MockBatchQueryWeaviateService:
+    service = MockBatchQueryWeaviateService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    return service
+
+
+class MockCountingWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+    """Counts the searches that reach the server and answers searches, batch inserts and batch deletes.
+
+    The next `slow_searches` searches are answered after a second.
+    """
+
+    def __init__(self) -> None:
+        self.searches = 0
+        self.slow_searches = 0
+
+    def Search(
+        self, request: search_get_pb2.SearchRequest, context: grpc.ServicerContext
+    ) -> search_get_pb2.SearchReply:
+        self.searches += 1
+        if self.slow_searches > 0:
+            self.slow_searches -= 1
+            time.sleep(1)
+        return search_get_pb2.SearchReply(
+            took=0.02,
+            results=[
+                search_get_pb2.SearchResult(
+                    metadata=search_get_pb2.MetadataResult(id_as_bytes=uuid.UUID(int=i).bytes)
+                )
+                for i in range(request.limit)
+            ],
+        )
+
+    def BatchObjects(
+        self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+    ) -> batch_pb2.BatchObjectsReply:
+        return batch_pb2.BatchObjectsReply(
+            took=0.5,
+            errors=[batch_pb2.BatchObjectsReply.BatchError(index=0, error="invalid")],
+        )
+
+    def BatchDelete(
+        self, request: batch_delete_pb2.BatchDeleteRequest, context: grpc.ServicerContext
+    ) -> batch_delete_pb2.BatchDeleteReply:
+        return batch_delete_pb2.BatchDeleteReply(matches=1, successful=1)
+
+
+@pytest.fixture(scope="function")
+def counting_service(start_grpc_server: grpc.Server) -> MockCountingWeaviateService:
+    service = MockCountingWeaviateService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    return service
+
+
 class MockMetadataCaptureWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
     captured_metadata: dict = {}
 
@@ -1,9 +1,15 @@
+import struct
+import time
+import uuid
 from typing import AsyncGenerator, Generator, List
 
 import grpc
 import pytest
 import pytest_asyncio
 import weaviate
+from weaviate.collections.batch.grpc_batch import SERIALIZATION_MIN_CHUNK_SIZE
+from weaviate.collections.batch.spill import _SpillLog
+from weaviate.collections.classes.batch import BatchObject
 from weaviate.proto.v1 import batch_pb2, weaviate_pb2_grpc
 from .conftest import MOCK_IP, MOCK_PORT, MOCK_PORT_GRPC, mock_class, HTTPServer
 
@@ -160,3 +166,190 @@ def test_ssb_stream_reports_has_errors(
             batch.add_object({"name": f"Object {i}"})
     assert len(failed_object_stream.batch.failed_objects) == 2
     assert failed_object_stream.batch.results.objs.has_errors
+
+
+def test_ssb_flush_returns_once_the_queue_is_sent(
+    failed_object_stream: weaviate.collections.Collection,
+) -> None:
+    with failed_object_stream.batch.stream() as batch:
+        for i in range(4):
+            batch.add_object({"name": f"Object {i}"})
+        start = time.monotonic()
+        batch.flush()
+        # the flush is woken up by the batching loop instead of waiting for its timeout
+        assert time.monotonic() - start < 0.9
+    assert len(failed_object_stream.batch.failed_objects) == 2
+
+
+class MockBatchObjectsWeaviateService(weaviate_pb2_grpc.WeaviateServicer):
+    """Captures the received objects and rejects the second object of every request."""
+
+    def __init__(self) -> None:
+        self.objects: List[batch_pb2.BatchObject] = []
+        self.requests: List[int] = []
+
+    def BatchObjects(
+        self, request: batch_pb2.BatchObjectsRequest, context: grpc.ServicerContext
+    ) -> batch_pb2.BatchObjectsReply:
+        self.objects.extend(request.objects)
+        self.requests.append(len(request.objects))
+        return batch_pb2.BatchObjectsReply(
+            errors=[batch_pb2.BatchObjectsReply.BatchError(index=1, error="mock failure")]
+        )
+
+
+@pytest.fixture(scope="function")
+def batch_objects_service(start_grpc_server: grpc.Server) -> MockBatchObjectsWeaviateService:
+    service = MockBatchObjectsWeaviateService()
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(service, start_grpc_server)
+    return service
+
+
+def _assert_inserted_columns(service: MockBatchObjectsWeaviateService) -> None:
+    assert len(service.objects) == 3
+    assert [obj.properties.non_ref_properties["name"] for obj in service.objects] == [
+        "a",
+        "b",
+        "c",
+    ]
+    assert [obj.properties.non_ref_properties["count"] for obj in service.objects] == [1, 2, 3]
+    assert service.objects[2].vector_bytes == struct.pack("<2f", 3.0, 4.0)
+    assert service.objects[0].uuid == str(uuid.UUID(int=0))
+
+
+@pytest.mark.parametrize("dtype", ["S16", "V16"])
+def test_insert_columns(
+    weaviate_client: weaviate.WeaviateClient,
+    batch_objects_service: MockBatchObjectsWeaviateService,
+    dtype: str,
+) -> None:
+    np = pytest.importorskip("numpy")
+    collection = weaviate_client.collections.use(mock_class["class"])
+    # UUIDs that end in null bytes
+    uuids = [uuid.UUID(int=i << 8) for i in range(3)]
+    result = collection.data.insert_columns(
+        vectors=np.array([[1.0, 2.0], [2.0, 3.0], [3.0, 4.0]]),
+        properties={"name": ["a", "b", "c"], "count": np.array([1, 2, 3])},
+        uuids=np.array([uid.bytes for uid in uuids], dtype=dtype),
+    )
+    _assert_inserted_columns(batch_objects_service)
+    assert [obj.uuid for obj in batch_objects_service.objects] == [str(uid) for uid in uuids]
+    assert list(result.uuids.keys()) == [0, 2]
+    assert result.errors[1].message == "mock failure"
+    assert result.errors[1].object_.vector == [2.0, 3.0]
+    assert result.errors[1].object_.properties == {"name": "b", "count": 2}
+
+
+def test_insert_columns_named_vectors(
+    weaviate_client: weaviate.WeaviateClient,
+    batch_objects_service: MockBatchObjectsWeaviateService,
+) -> None:
+    np = pytest.importorskip("numpy")
+    collection = weaviate_client.collections.use(mock_class["class"])
+    result = collection.data.insert_columns(
+        vectors={"first": np.ones((2, 3)), "second": np.zeros((2, 2))},
+    )
+    assert len(result.uuids) == 1
+    assert [vec.name for vec in batch_objects_service.objects[0].vectors] == ["first", "second"]
+    assert batch_objects_service.objects[0].vectors[1].vector_bytes == struct.pack("<2f", 0, 0)
+    assert result.errors[1].object_.vector == {"first": [1.0, 1.0, 1.0], "second": [0.0, 0.0]}
+
+
+def test_insert_columns_mismatched_lengths(weaviate_client: weaviate.WeaviateClient) -> None:
+    np = pytest.importorskip("numpy")
+    collection = weaviate_client.collections.use(mock_class["class"])
+    with pytest.raises(weaviate.exceptions.WeaviateInvalidInputError):
+        collection.data.insert_columns(vectors=np.ones((2, 3)), properties={"name": ["a"]})
+    with pytest.raises(weaviate.exceptions.WeaviateInvalidInputError):
+        collection.data.insert_columns(vectors=np.ones(3))
+
+
+def test_fixed_size_batch_respects_batch_bytes(
+    weaviate_mock: HTTPServer,
+    weaviate_client: weaviate.WeaviateClient,
+    batch_objects_service: MockBatchObjectsWeaviateService,
+) -> None:
+    weaviate_mock.expect_request(f"/v1/schema/{mock_class['class']}").respond_with_json(mock_class)
+    collection = weaviate_client.collections.use(mock_class["class"])
+    with collection.batch.fixed_size(batch_size=100, batch_bytes=3500) as batch:
+        for _ in range(10):
+            batch.add_object({"name": "x" * 1000})
+        batch.add_object({"name": "x" * 5000})  # larger than the budget, sent on its own
+
+    assert sum(batch_objects_service.requests) == 11
+    assert max(batch_objects_service.requests) <= 3
+    histogram = collection.batch.results.request_objects
+    assert histogram.count == len(batch_objects_service.requests)
+    assert histogram.total == 11
+    assert collection.batch.results.request_bytes.largest > 5000
+
+
+def test_fixed_size_batch_resumes_from_spill_dir(
+    tmp_path,
+    weaviate_mock: HTTPServer,
+    weaviate_client: weaviate.WeaviateClient,
+    batch_objects_service: MockBatchObjectsWeaviateService,
+) -> None:
+    weaviate_mock.expect_request(f"/v1/schema/{mock_class['class']}").respond_with_json(mock_class)
+    # the queue of an earlier batch that crashed before its objects were sent
+    log = _SpillLog(str(tmp_path / "objects"))
+    for i in range(3):
+        log.append(
+            BatchObject(collection=mock_class["class"], properties={"name": f"{i}"}, index=i)
+        )
+    log.close()
+
+    collection = weaviate_client.collections.use(mock_class["class"])
+    with collection.batch.fixed_size(batch_size=2, spill_dir=str(tmp_path)) as batch:
+        batch.add_object({"name": "3"})
+
+    names = [obj.properties.non_ref_properties["name"] for obj in batch_objects_service.objects]
+    assert names == ["0", "1", "2", "3"]
+    # every object was sent, so nothing is left to resume
+    assert list((tmp_path / "objects").iterdir()) == []
+
+
+def test_fixed_size_batch_with_serialization_processes(
+    weaviate_mock: HTTPServer,
+    weaviate_client: weaviate.WeaviateClient,
+    batch_objects_service: MockBatchObjectsWeaviateService,
+) -> None:
+    weaviate_mock.expect_request(f"/v1/schema/{mock_class['class']}").respond_with_json(mock_class)
+    collection = weaviate_client.collections.use(mock_class["class"])
+    with collection.batch.fixed_size(batch_size=1000, serialization_processes=2) as batch:
+        for i in range(1000):
+            batch.add_object({"name": f"{i}"}, uuid=uuid.UUID(int=i))
+
+    names = [obj.properties.non_ref_properties["name"] for obj in batch_objects_service.objects]
+    assert sorted(names, key=int) == [f"{i}" for i in range(1000)]
+    assert max(batch_objects_service.requests) > SERIALIZATION_MIN_CHUNK_SIZE
+    results = collection.batch.results.objs
+    # the mock rejects the second object of every request
+    assert len(results.errors) == len(batch_objects_service.requests)
+    assert all(results.uuids[i] == uuid.UUID(int=i) for i in results.uuids)
+
+
+@pytest_asyncio.fixture
+async def batch_objects_client_async(
+    weaviate_mock: HTTPServer, start_grpc_server: grpc.Server
+) -> AsyncGenerator[weaviate.WeaviateAsyncClient, None]:
+    client = weaviate.use_async_with_local(port=MOCK_PORT, host=MOCK_IP, grpc_port=MOCK_PORT_GRPC)
+    await client.connect()
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_insert_columns_async(
+    batch_objects_client_async: weaviate.WeaviateAsyncClient,
+    batch_objects_service: MockBatchObjectsWeaviateService,
+) -> None:
+    np = pytest.importorskip("numpy")
+    collection = batch_objects_client_async.collections.use(mock_class["class"])
+    result = await collection.data.insert_columns(
+        vectors=np.array([[1.0, 2.0], [2.0, 3.0], [3.0, 4.0]], dtype=np.float32),
+        properties={"name": np.array(["a", "b", "c"]), "count": [1, 2, 3]},
+        uuids=[str(uuid.UUID(int=i)) for i in range(3)],
+    )
+    _assert_inserted_columns(batch_objects_service)
+    assert list(result.uuids.keys()) == [0, 2]
@@ -1,5 +1,10 @@
+import asyncio
+import dataclasses
 import datetime
-from typing import Any, Dict, Literal
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Literal, Optional
 
 import grpc
 import pytest
@@ -9,9 +14,14 @@ import weaviate
 import weaviate.classes as wvc
 from weaviate import __version__ as client_version
 from mock_tests.conftest import (
+    COLUMNAR_UUIDS,
+    ITERATOR_UUIDS,
     MOCK_IP,
     MOCK_PORT,
     MOCK_PORT_GRPC,
+    MockBatchQueryWeaviateService,
+    MockCountingWeaviateService,
+    MockIteratorWeaviateService,
     MockMetadataCaptureWeaviateService,
     MockRetriesWeaviateService,
 )
@@ -33,6 +43,8 @@ from weaviate.collections.classes.config import (
 )
 from weaviate.connect.base import ConnectionParams, ProtocolParams
 from weaviate.connect.integrations import _IntegrationConfig
+from weaviate.connect.query_cache import QueryCacheStats
+from weaviate.connect.transport import _SHARED_TRANSPORTS
 from weaviate.exceptions import (
     BackupCanceledError,
     InsufficientPermissionsError,
@@ -293,6 +305,586 @@ def test_year_zero(year_zero_collection: weaviate.collections.Collection) -> Non
         assert str(recwarn[0].message).startswith("Con004")
 
 
+def test_numpy_vector_format(numpy_vectors_collection: weaviate.collections.Collection) -> None:
+    np = pytest.importorskip("numpy")
+    obj = numpy_vectors_collection.query.fetch_objects(include_vector=True).objects[0]
+
+    assert isinstance(obj.vector["single"], np.ndarray)
+    assert obj.vector["single"].tolist() == [1.0, 2.0, 3.0]
+    assert isinstance(obj.vector["multi"], np.ndarray)
+    assert obj.vector["multi"].tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+
+def test_columnar_return_format(columnar_collection: weaviate.collections.Collection) -> None:
+    np = pytest.importorskip("numpy")
+    res = columnar_collection.query.fetch_objects(
+        include_vector=True,
+        return_metadata=wvc.query.MetadataQuery(distance=True, creation_time=True),
+        return_format="columns",
+    )
+
+    assert len(res) == 3
+    assert [uuid.UUID(bytes=bytes(uid)) for uid in res.uuids] == COLUMNAR_UUIDS
+    assert res.metadata["distance"].tolist() == [0.0, 0.5, 1.0]
+    assert res.metadata["creation_time"][0] == np.datetime64(1_700_000_000_000, "ms")
+    assert res.vectors["default"].shape == (3, 2)
+    assert res.vectors["default"].tolist() == [[0.0, 1.0], [1.0, 2.0], [2.0, 3.0]]
+    assert res.properties == {"name": ["name0", "name1", "name2"], "count": [0, None, 2]}
+
+
+def test_columnar_return_format_to_dataframes(
+    columnar_collection: weaviate.collections.Collection,
+) -> None:
+    pytest.importorskip("numpy")
+    res = columnar_collection.query.fetch_objects(include_vector=True, return_format="columns")
+
+    pd = pytest.importorskip("pandas")
+    df = res.to_pandas()
+    assert isinstance(df, pd.DataFrame)
+    assert list(df.columns)[:2] == ["uuid", "vector"]
+    assert set(df.columns) == {"uuid", "vector", "name", "count"}
+    assert df["name"].tolist() == ["name0", "name1", "name2"]
+    assert [uuid.UUID(bytes=uid) for uid in df["uuid"]] == COLUMNAR_UUIDS
+
+    pl = pytest.importorskip("polars")
+    df_pl = res.to_polars()
+    assert isinstance(df_pl, pl.DataFrame)
+    assert df_pl["vector"].to_list() == [[0.0, 1.0], [1.0, 2.0], [2.0, 3.0]]
+    assert [uuid.UUID(bytes=uid) for uid in df_pl["uuid"]] == COLUMNAR_UUIDS
+
+    pa = pytest.importorskip("pyarrow")
+    table = res.to_arrow()
+    assert table.schema.field("uuid").type == pa.binary(16)
+    assert table.schema.field("vector").type == pa.list_(pa.float32(), 2)
+
+
+def test_columnar_return_format_with_group_by(
+    columnar_collection: weaviate.collections.Collection,
+) -> None:
+    with pytest.raises(weaviate.exceptions.WeaviateInvalidInputError):
+        columnar_collection.query.near_vector(
+            [1.0, 2.0],
+            group_by=wvc.query.GroupBy(prop="name", number_of_groups=1, objects_per_group=1),
+            return_format="columns",
+        )
+
+
+def test_lazy_return_format(columnar_collection: weaviate.collections.Collection) -> None:
+    res = columnar_collection.query.fetch_objects(
+        include_vector=True,
+        return_metadata=wvc.query.MetadataQuery(distance=True),
+        return_format="lazy",
+    )
+    eager = columnar_collection.query.fetch_objects(
+        include_vector=True, return_metadata=wvc.query.MetadataQuery(distance=True)
+    )
+
+    assert [obj.uuid for obj in res.objects] == COLUMNAR_UUIDS
+    assert all("properties" not in vars(obj) for obj in res.objects)
+
+    obj = res.objects[1]
+    assert obj.properties == {"name": "name1"}
+    assert obj.properties is obj.properties
+    assert obj.metadata.distance == 0.5
+    assert obj.vector == {"default": [1.0, 2.0]}
+    assert obj.references is None
+    assert "properties" not in vars(res.objects[0])
+    assert [dataclasses.asdict(obj) for obj in res.objects] == [
+        dataclasses.asdict(obj) for obj in eager.objects
+    ]
+
+
+def test_lazy_return_format_with_group_by(
+    columnar_collection: weaviate.collections.Collection,
+) -> None:
+    with pytest.raises(weaviate.exceptions.WeaviateInvalidInputError):
+        columnar_collection.query.near_vector(
+            [1.0, 2.0],
+            group_by=wvc.query.GroupBy(prop="name", number_of_groups=1, objects_per_group=1),
+            return_format="lazy",
+        )
+
+
+@pytest.mark.parametrize("prefetch", [0, 1, 3])
+def test_iterator_prefetch(
+    weaviate_client: weaviate.WeaviateClient,
+    iterator_service: MockIteratorWeaviateService,
+    prefetch: int,
+) -> None:
+    collection = weaviate_client.collections.use("IteratorCollection")
+    uuids = [obj.uuid for obj in collection.iterator(cache_size=40, prefetch=prefetch)]
+
+    assert uuids == ITERATOR_UUIDS
+    # a prefetching scan stops at the last, partial page instead of fetching an empty one
+    assert iterator_service.limits == [40] * (8 if prefetch == 0 else 7)
+
+
+def test_iterator_prefetch_stops_when_abandoned(
+    weaviate_client: weaviate.WeaviateClient, iterator_service: MockIteratorWeaviateService
+) -> None:
+    collection = weaviate_client.collections.use("IteratorCollection")
+    for _ in range(5):
+        for _ in collection.iterator(cache_size=10, prefetch=2):
+            break
+
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline and any(
+        thread.name == "WeaviateIteratorPrefetch" for thread in threading.enumerate()
+    ):
+        time.sleep(0.01)
+    assert not any(thread.name == "WeaviateIteratorPrefetch" for thread in threading.enumerate())
+
+
+def test_iterator_page_bytes(
+    weaviate_client: weaviate.WeaviateClient, iterator_service: MockIteratorWeaviateService
+) -> None:
+    collection = weaviate_client.collections.use("IteratorCollection")
+    uuids = [obj.uuid for obj in collection.iterator(cache_size=10, page_bytes=20_000)]
+
+    assert uuids == ITERATOR_UUIDS
+    # the page size doubles until about 20kB of objects with a 100 character property fit into a page
+    assert iterator_service.limits[:5] == [10, 20, 40, 80, 116]
+
+
+@pytest.mark.parametrize("after", [None, ITERATOR_UUIDS[100]])
+def test_iterator_parallelism(
+    weaviate_client: weaviate.WeaviateClient,
+    iterator_service: MockIteratorWeaviateService,
+    after: Optional[uuid.UUID],
+) -> None:
+    collection = weaviate_client.collections.use("IteratorCollection")
+    uuids = [obj.uuid for obj in collection.iterator(cache_size=20, parallelism=4, after=after)]
+
+    expected = ITERATOR_UUIDS if after is None else ITERATOR_UUIDS[101:]
+    assert sorted(uuids) == expected
+    # besides full pages, every range only fetches the page that crosses its end
+    assert len(iterator_service.limits) <= len(expected) // 20 + 4
+
+
+@pytest.mark.asyncio
+async def test_iterator_prefetch_async(
+    weaviate_client_async: weaviate.WeaviateAsyncClient,
+    iterator_service: MockIteratorWeaviateService,
+) -> None:
+    collection = weaviate_client_async.collections.use("IteratorCollection")
+    uuids = [obj.uuid async for obj in collection.iterator(cache_size=40, prefetch=2)]
+
+    assert uuids == ITERATOR_UUIDS
+    assert iterator_service.limits == [40] * 7
+
+    uuids = [obj.uuid async for obj in collection.iterator(cache_size=20, parallelism=3)]
+    assert sorted(uuids) == ITERATOR_UUIDS
+
+
+@pytest.mark.asyncio
+async def test_iterator_prefetch_async_stops_when_abandoned(
+    weaviate_client_async: weaviate.WeaviateAsyncClient,
+    iterator_service: MockIteratorWeaviateService,
+) -> None:
+    collection = weaviate_client_async.collections.use("IteratorCollection")
+    tasks = asyncio.all_tasks()
+    async for _ in collection.iterator(cache_size=10, prefetch=2):
+        break
+    await asyncio.sleep(0.1)
+    assert asyncio.all_tasks() == tasks
+
+
+def _batch_queries() -> List[Any]:
+    return [
+        wvc.query.BatchQuery.near_vector([1.0, 2.0], limit=3),
+        wvc.query.BatchQuery.bm25("query", limit=13),
+        wvc.query.BatchQuery.hybrid("query", limit=1),
+        wvc.query.BatchQuery.near_vector([1.0, 2.0], return_format="unknown"),
+        *[wvc.query.BatchQuery.bm25("query", limit=i % 5) for i in range(20)],
+    ]
+
+
+def test_batch_query_rejects_unknown_arguments() -> None:
+    with pytest.raises(TypeError, match="limt"):
+        wvc.query.BatchQuery.hybrid("query", limt=3)
+    # alpha is an argument of hybrid searches only
+    with pytest.raises(TypeError, match="alpha"):
+        wvc.query.BatchQuery.near_vector([1.0, 2.0], alpha=0.5)
+
+
+def _assert_batch_query_results(res: Any, service: MockBatchQueryWeaviateService) -> None:
+    assert [len(r.objects) if r is not None else None for r in res.results] == [
+        3,
+        None,
+        1,
+        None,
+        *[i % 5 for i in range(20)],
+    ]
+    assert list(res.errors) == [1, 3]
+    assert isinstance(res.errors[1], weaviate.exceptions.WeaviateQueryError)
+    assert isinstance(res.errors[3], weaviate.exceptions.WeaviateInvalidInputError)
+    assert res.has_errors
+    assert 1 < service.max_in_flight <= 4
+
+
+def test_batch_query(
+    weaviate_client: weaviate.WeaviateClient, batch_query_service: MockBatchQueryWeaviateService
+) -> None:
+    collection = weaviate_client.collections.use("BatchQueryCollection")
+    res = collection.query.batch(_batch_queries(), max_concurrency=4)
+    _assert_batch_query_results(res, batch_query_service)
+
+
+@pytest.mark.asyncio
+async def test_batch_query_async(
+    weaviate_client_async: weaviate.WeaviateAsyncClient,
+    batch_query_service: MockBatchQueryWeaviateService,
+) -> None:
+    collection = weaviate_client_async.collections.use("BatchQueryCollection")
+    res = await collection.query.batch(_batch_queries(), max_concurrency=4)
+    _assert_batch_query_results(res, batch_query_service)
+
+
+def test_query_cache(
+    weaviate_mock: HTTPServer, counting_service: MockCountingWeaviateService
+) -> None:
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_json({})
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(
+            query_cache=wvc.init.QueryCache(max_entries=2, collection_ttl={"Expiring": 0.05})
+        ),
+    )
+    cached = client.collections.use("Cached")
+    other = client.collections.use("Other")
+
+    first = cached.query.fetch_objects(limit=3)
+    second = cached.query.fetch_objects(limit=3)
+    assert counting_service.searches == 1
+    assert [o.uuid for o in first.objects] == [o.uuid for o in second.objects]
+
+    cached.with_tenant("tenant").query.fetch_objects(limit=3)
+    cached.query.fetch_objects(limit=4)
+    assert counting_service.searches == 3
+
+    other.data.insert({"name": "unrelated"})
+    cached.query.fetch_objects(limit=4)
+    assert counting_service.searches == 3
+
+    cached.data.insert({"name": "new"})
+    cached.query.fetch_objects(limit=4)
+    assert counting_service.searches == 4
+
+    cached.data.delete_many(where=wvc.query.Filter.by_property("name").equal("new"))
+    cached.query.fetch_objects(limit=4)
+    assert counting_service.searches == 5
+
+    expiring = client.collections.use("Expiring")
+    expiring.query.fetch_objects(limit=1)
+    time.sleep(0.1)
+    expiring.query.fetch_objects(limit=1)
+    assert counting_service.searches == 7
+
+    stats = client.query_cache_stats()
+    assert stats is not None
+    assert stats == QueryCacheStats(hits=2, misses=7, evictions=1, invalidations=3, size=2)
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_query_cache_async(
+    weaviate_mock: HTTPServer, counting_service: MockCountingWeaviateService
+) -> None:
+    async with weaviate.use_async_with_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(query_cache=wvc.init.QueryCache()),
+    ) as client:
+        collection = client.collections.use("Cached")
+        await collection.query.hybrid("autocomplete", limit=5)
+        await collection.query.hybrid("autocomplete", limit=5)
+        await collection.query.hybrid("autocompletion", limit=5)
+        assert counting_service.searches == 2
+        stats = client.query_cache_stats()
+        assert stats is not None
+        assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_prepare_near_vector(
+    weaviate_client: weaviate.WeaviateClient, counting_service: MockCountingWeaviateService
+) -> None:
+    collection = weaviate_client.collections.use("Prepared")
+    search = collection.query.prepare_near_vector(
+        limit=3, filters=wvc.query.Filter.by_property("lang").equal("en")
+    )
+    for vector in ([0.1, 0.2], [0.3, 0.4]):
+        assert len(search(vector).objects) == 3
+    assert counting_service.searches == 2
+
+
+@pytest.mark.asyncio
+async def test_prepare_near_vector_async(
+    weaviate_client_async: weaviate.WeaviateAsyncClient,
+    counting_service: MockCountingWeaviateService,
+) -> None:
+    collection = weaviate_client_async.collections.use("Prepared")
+    search = collection.query.prepare_near_vector(limit=2, return_format="columns")
+    res = await search([0.1, 0.2])
+    assert res.uuids.tobytes() == uuid.UUID(int=0).bytes + uuid.UUID(int=1).bytes
+
+
+def test_tracer_spans(
+    weaviate_mock: HTTPServer, counting_service: MockCountingWeaviateService
+) -> None:
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_json({})
+    spans: List[wvc.init.SpanRecord] = []
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(tracer=wvc.init.CallbackTracer(spans.append)),
+    )
+    collection = client.collections.use("Traced")
+    spans.clear()
+
+    collection.query.near_vector([0.1, 0.2], limit=4)
+    assert [span.name for span in spans] == [
+        "weaviate.query.build",
+        "weaviate.grpc.Search",
+        "weaviate.query.decode",
+    ]
+    build, rpc, decode = spans
+    assert build.attributes == {"weaviate.collection": "Traced"}
+    assert rpc.attributes["weaviate.collection"] == "Traced"
+    assert rpc.attributes["weaviate.retries"] == 0
+    assert rpc.attributes["rpc.request.size"] > 0
+    assert rpc.attributes["rpc.response.size"] > 0
+    assert decode.attributes["weaviate.results"] == 4
+    assert all(span.duration >= 0 for span in spans)
+
+    spans.clear()
+    collection.data.insert({"name": "traced"})
+    (rest,) = spans
+    assert rest.name == "weaviate.rest.POST"
+    assert rest.attributes["url.path"] == "/v1/objects"
+    assert rest.attributes["http.response.status_code"] == 200
+    assert rest.attributes["http.request.body.size"] > 0
+
+    spans.clear()
+    collection.data.delete_many(where=wvc.query.Filter.by_property("name").equal("traced"))
+    assert [span.name for span in spans] == ["weaviate.grpc.BatchDelete"]
+    client.close()
+
+
+def test_client_metrics(
+    weaviate_mock: HTTPServer, counting_service: MockCountingWeaviateService
+) -> None:
+    spans: List[wvc.init.SpanRecord] = []
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(
+            metrics=True, tracer=wvc.init.CallbackTracer(spans.append)
+        ),
+    )
+    collection = client.collections.use("Measured")
+    collection.query.fetch_objects(limit=3)
+    collection.query.fetch_objects(limit=2)
+    collection.data.insert_many([{"name": "a"}, {"name": "b"}])
+
+    metrics = client.metrics()
+    assert metrics is not None
+    snapshot = metrics.snapshot()
+    assert snapshot["weaviate_requests_total"]["grpc.Search"] == 2
+    assert snapshot["weaviate_requests_total"]["grpc.BatchObjects"] == 1
+    assert snapshot["weaviate_in_flight_requests"]["grpc.Search"] == 0
+    assert snapshot["weaviate_request_duration_seconds"]["grpc.Search"]["count"] == 2
+    assert snapshot["weaviate_server_took_seconds"]["grpc.Search"]["sum"] == pytest.approx(0.04)
+    assert snapshot["weaviate_server_took_seconds"]["grpc.BatchObjects"]["buckets"][0.5] == 1
+    assert snapshot["weaviate_sent_bytes_total"]["grpc.Search"] > 0
+    assert snapshot["weaviate_query_results_total"] == 5
+    assert snapshot["weaviate_batch_objects_total"] == 2
+    assert snapshot["weaviate_batch_object_errors_total"] == 1
+    assert snapshot["rates"]["batch_objects_per_second"] > 0
+    assert 'weaviate_requests_total{rpc="grpc.Search"} 2' in metrics.to_prometheus()
+
+    # the configured tracer still receives every span
+    assert [span.name for span in spans if span.name.startswith("weaviate.grpc.")] == [
+        "weaviate.grpc.Search",
+        "weaviate.grpc.Search",
+        "weaviate.grpc.BatchObjects",
+    ]
+    client.close()
+
+
+def test_grpc_pool_discovers_nodes(
+    ready_mock: HTTPServer, counting_service: MockCountingWeaviateService
+) -> None:
+    ready_mock.expect_request("/v1/meta").respond_with_json({"version": "1.36"})
+    ready_mock.expect_request("/v1/nodes").respond_with_json(
+        {
+            "nodes": [
+                {"name": MOCK_IP, "status": "HEALTHY"},
+                {"name": "localhost", "status": "HEALTHY"},
+                {"name": "unreachable", "status": "UNAVAILABLE"},
+            ]
+        }
+    )
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(
+            grpc_config=wvc.init.GrpcConfig(
+                pool_size=2, discover_nodes=True, load_balancing="least_outstanding"
+            )
+        ),
+    )
+    pool = client._connection._grpc_pool
+    assert pool is not None
+    assert pool.targets == [f"{MOCK_IP}:{MOCK_PORT_GRPC}", f"localhost:{MOCK_PORT_GRPC}"]
+
+    collection = client.collections.use("Pooled")
+    for _ in range(4):
+        assert len(collection.query.fetch_objects(limit=2).objects) == 2
+    assert counting_service.searches == 4
+    client.close()
+    assert client._connection._grpc_pool is None
+
+
+def test_grpc_pool_falls_back_to_configured_address(
+    weaviate_mock: HTTPServer, counting_service: MockCountingWeaviateService
+) -> None:
+    with pytest.warns(UserWarning, match="Con006"):
+        client = weaviate.connect_to_local(
+            port=MOCK_PORT,
+            host=MOCK_IP,
+            grpc_port=MOCK_PORT_GRPC,
+            additional_config=wvc.init.AdditionalConfig(
+                grpc_config=wvc.init.GrpcConfig(discover_nodes=True)
+            ),
+        )
+    pool = client._connection._grpc_pool
+    assert pool is not None
+    assert pool.targets == [f"{MOCK_IP}:{MOCK_PORT_GRPC}"]
+    assert len(client.collections.use("Pooled").query.fetch_objects(limit=1).objects) == 1
+    client.close()
+
+
+def test_hedged_search(
+    weaviate_mock: HTTPServer, counting_service: MockCountingWeaviateService
+) -> None:
+    spans: List[wvc.init.SpanRecord] = []
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(
+            hedging=wvc.init.Hedging(initial_delay=0.05),
+            metrics=True,
+            tracer=wvc.init.CallbackTracer(spans.append),
+        ),
+    )
+    collection = client.collections.use("Hedged")
+    counting_service.slow_searches = 1
+    start = time.perf_counter()
+    assert len(collection.query.fetch_objects(limit=2).objects) == 2
+    assert time.perf_counter() - start < 1
+    assert counting_service.searches == 2
+
+    (search,) = [span for span in spans if span.name == "weaviate.grpc.Search"]
+    assert search.attributes["weaviate.hedged"] is True
+    assert [event[0] for event in search.events] == ["hedge"]
+    metrics = client.metrics()
+    assert metrics is not None
+    assert metrics.snapshot()["weaviate_hedged_requests_total"]["grpc.Search"] == 1
+
+    # fast searches are not duplicated
+    collection.query.fetch_objects(limit=2)
+    assert counting_service.searches == 3
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_hedged_search_async(
+    weaviate_mock: HTTPServer, counting_service: MockCountingWeaviateService
+) -> None:
+    async with weaviate.use_async_with_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(hedging=wvc.init.Hedging(initial_delay=0.05)),
+    ) as client:
+        collection = client.collections.use("Hedged")
+        counting_service.slow_searches = 1
+        start = time.perf_counter()
+        assert len((await collection.query.fetch_objects(limit=2)).objects) == 2
+        assert time.perf_counter() - start < 1
+        assert counting_service.searches == 2
+
+
+def test_grpc_compression(
+    weaviate_mock: HTTPServer, counting_service: MockCountingWeaviateService
+) -> None:
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(
+            grpc_config=wvc.init.GrpcConfig(
+                compression="gzip", compression_overrides={"search": "none"}
+            )
+        ),
+    )
+    collection = client.collections.use("Compressed")
+    res = collection.data.insert_many(
+        [{"text": f"The quick brown fox jumps over the lazy dog {i}."} for i in range(100)]
+    )
+    assert len(res.errors) == 1
+    assert res.compression_ratio is not None and res.compression_ratio > 1
+    assert len(collection.query.fetch_objects(limit=2).objects) == 2
+    client.close()
+
+
+def test_shared_transport(
+    weaviate_mock: HTTPServer, counting_service: MockCountingWeaviateService
+) -> None:
+    config = wvc.init.AdditionalConfig(
+        connection=weaviate.ConnectionConfig(share_transport=True, keepalive_expiry=30)
+    )
+    clients = [
+        weaviate.connect_to_local(
+            port=MOCK_PORT, host=MOCK_IP, grpc_port=MOCK_PORT_GRPC, additional_config=config
+        )
+        for _ in range(3)
+    ]
+    assert len(_SHARED_TRANSPORTS) == 1
+    for client in clients:
+        assert client.is_ready()
+    for client in clients:
+        client.close()
+    assert len(_SHARED_TRANSPORTS) == 0
+
+
+@pytest.mark.parametrize(
+    "connection",
+    [weaviate.ConnectionConfig(), weaviate.ConnectionConfig(share_transport=True)],
+)
+def test_no_proxy_is_respected(
+    monkeypatch: pytest.MonkeyPatch,
+    weaviate_mock: HTTPServer,
+    counting_service: MockCountingWeaviateService,
+    connection: weaviate.ConnectionConfig,
+) -> None:
+    # requests to the mock would fail if they were sent to this proxy
+    monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:1")
+    monkeypatch.setenv("NO_PROXY", MOCK_IP)
+    config = wvc.init.AdditionalConfig(connection=connection, trust_env=True)
+    with weaviate.connect_to_local(
+        port=MOCK_PORT, host=MOCK_IP, grpc_port=MOCK_PORT_GRPC, additional_config=config
+    ) as client:
+        assert client.is_ready()
+
+
 @pytest.mark.parametrize("output", ["minimal", "verbose"])
 def test_node_with_timeout(
     httpserver: HTTPServer, start_grpc_server: grpc.Server, output: Literal["minimal", "verbose"]
@@ -449,6 +1041,29 @@ def test_grpc_retry_logic(
     assert service.tenants_count == 2
 
 
+def test_rest_retry_policy(ready_mock: HTTPServer, start_grpc_server: grpc.Server) -> None:
+    ready_mock.expect_request("/v1/meta").respond_with_json({"version": "1.36"})
+    ready_mock.expect_oneshot_request("/v1/schema/Flaky", method="GET").respond_with_json(
+        {}, status=503
+    )
+    ready_mock.expect_request("/v1/schema/Flaky", method="GET").respond_with_json(
+        {"class": "Flaky"}
+    )
+    client = weaviate.connect_to_local(
+        port=MOCK_PORT,
+        host=MOCK_IP,
+        grpc_port=MOCK_PORT_GRPC,
+        additional_config=wvc.init.AdditionalConfig(
+            retry_policy=wvc.init.RetryPolicy(initial_backoff=0.01), metrics=True
+        ),
+    )
+    assert client.collections.exists("Flaky")
+    metrics = client.metrics()
+    assert metrics is not None
+    assert metrics.snapshot()["weaviate_retries_total"] == {"rest.GET": 1}
+    client.close()
+
+
 def test_grpc_forbidden_exception(forbidden: weaviate.collections.Collection) -> None:
     with pytest.raises(weaviate.exceptions.InsufficientPermissionsError):
         forbidden.query.fetch_objects()
@@ -1,18 +1,53 @@
+import asyncio
+import datetime
+import pickle
+import threading
+import time
 import uuid
+from dataclasses import replace
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, TypedDict
 
 import pytest
 
-from weaviate.collections.batch.grpc_batch import _validate_props
+from weaviate.collections.batch.base import ObjectsBatchRequest, ReferencesBatchRequest
+from weaviate.collections.batch.controller import (
+    AIMDBatchController,
+    BatchClusterStats,
+    BatchRequestStats,
+)
+from weaviate.collections.batch.grpc_batch import (
+    SERIALIZATION_MIN_CHUNK_SIZE,
+    _BatchGRPC,
+    _SerializationPool,
+    _merge_serialized,
+    _validate_props,
+)
+from weaviate.collections.batch.grpc_properties import _PropertySerializer
+from weaviate.collections.batch.spill import _SpillLog
 from weaviate.collections.classes.batch import (
     MAX_STORED_RESULTS,
     BatchObject,
     BatchObjectReturn,
     BatchReference,
     BatchReferenceReturn,
+    BatchSizeHistogram,
     ErrorObject,
     ErrorReference,
+    _BatchObject,
+    _estimate_size,
 )
-from weaviate.exceptions import WeaviateInsertInvalidPropertyError
+from weaviate.collections.classes.config import DataType
+from weaviate.collections.classes.config_methods import _properties_from_config
+from weaviate.collections.classes.internal import Nested, ReferenceToMulti
+from weaviate.collections.classes.types import GeoCoordinate, PhoneNumber
+from weaviate.exceptions import (
+    WeaviateBatchValidationError,
+    WeaviateInsertInvalidPropertyError,
+    WeaviateInvalidInputError,
+)
+from weaviate.proto.v1 import base_pb2, batch_pb2
+from weaviate.util import _ServerVersion
 
 
 def _error_object(index: int) -> ErrorObject:
@@ -117,3 +152,527 @@ def test_validate_props_raises_for_top_level_vector() -> None:
 def test_validate_props_raises_for_nested_vector() -> None:
     with pytest.raises(WeaviateInsertInvalidPropertyError):
         _validate_props({"vector": [0.1, 0.2]}, nested=True)
+
+
+@pytest.mark.parametrize(
+    "vector",
+    [
+        [1.0, 2.0, 3.0],
+        {"a": [1.0, 2.0, 3.0], "b": [[1.0, 2.0], [3.0, 4.0]]},
+        {"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0]},
+    ],
+)
+def test_batch_object_numpy_vectors_are_prepacked(vector) -> None:
+    np = pytest.importorskip("numpy")
+    if isinstance(vector, dict):
+        # mix array and list inputs to cover both paths
+        np_vector = {"a": np.array(vector["a"]), "b": vector["b"]}
+    else:
+        np_vector = np.array(vector)
+    uuid_ = uuid.uuid4()
+    from_list = BatchObject(collection="Test", vector=vector, uuid=uuid_, index=0)
+    from_numpy = BatchObject(collection="Test", vector=np_vector, uuid=uuid_, index=0)
+    assert from_numpy.vector is np_vector
+
+    grpc = _BatchGRPC(_ServerVersion(1, 30, 0), None, None)
+    assert grpc.grpc_object(from_numpy._to_internal()) == grpc.grpc_object(from_list._to_internal())
+    retried = BatchObject._from_internal(from_numpy._to_internal())
+    assert grpc.grpc_object(retried._to_internal()) == grpc.grpc_object(from_list._to_internal())
+
+
+def test_batch_object_squeezes_numpy_named_vectors() -> None:
+    np = pytest.importorskip("numpy")
+    uuid_ = uuid.uuid4()
+    from_list = BatchObject(collection="Test", vector={"a": [1.0, 2.0, 3.0]}, uuid=uuid_, index=0)
+    from_numpy = BatchObject(
+        collection="Test", vector={"a": np.array([[1.0, 2.0, 3.0]])}, uuid=uuid_, index=0
+    )
+
+    grpc = _BatchGRPC(_ServerVersion(1, 30, 0), None, None)
+    sent = grpc.grpc_object(from_numpy._to_internal())
+    assert sent.vectors[0].type == base_pb2.Vectors.VECTOR_TYPE_SINGLE_FP32
+    assert sent == grpc.grpc_object(from_list._to_internal())
+
+
+def test_estimate_size_counts_utf8_bytes() -> None:
+    assert _estimate_size("日本語") == len("日本語".encode()) + 2 == 11
+    assert _estimate_size({"größe": "wörld"}) == 7 + 2 + 6 + 2
+    assert _estimate_size(["emoji 🚀"]) == 10 + 2 + 2
+    assert _estimate_size("ascii") == 7
+
+
+def test_grpc_object_chunks_respect_max_message_size() -> None:
+    grpc = _BatchGRPC(_ServerVersion(1, 30, 0), None, 200)
+    objects = [
+        _BatchObject(
+            collection="Test",
+            vector=None,
+            uuid=str(uuid.uuid4()),
+            properties={"name": "x" * 20},
+            tenant=None,
+            references=None,
+            index=i,
+            packed_vector=bytes(40),
+        )
+        for i in range(10)
+    ]
+    chunks = list(grpc.grpc_object_chunks(objects))
+    assert len(chunks) > 1
+    assert [obj.index for chunk, _ in chunks for obj in chunk] == list(range(10))
+    for chunk, weaviate_objs in chunks:
+        assert len(chunk) == len(weaviate_objs)
+        assert sum(obj.ByteSize() for obj in weaviate_objs) < 200
+
+    with pytest.raises(WeaviateBatchValidationError):
+        list(grpc.grpc_object_chunks([replace(objects[0], packed_vector=bytes(400))]))
+
+
+class _Nested(TypedDict):
+    text: str
+    count: int
+
+
+class _DataModel(TypedDict):
+    text: str
+    count: int
+    price: float
+    available: bool
+    created: datetime.datetime
+    ref_id: uuid.UUID
+    tags: List[str]
+    counts: List[int]
+    prices: List[float]
+    flags: List[bool]
+    dates: List[datetime.datetime]
+    ids: List[uuid.UUID]
+    location: GeoCoordinate
+    phone: PhoneNumber
+    nested: Nested[_Nested]
+    nested_list: Nested[List[_Nested]]
+    optional: Optional[str]
+
+
+_PROPERTIES = {
+    "text": "some text",
+    "count": 3,
+    "price": 1.5,
+    "available": True,
+    "created": datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+    "ref_id": uuid.UUID(int=1),
+    "tags": ["a", "b"],
+    "counts": [1, 2],
+    "prices": [1.0, 2.5],
+    "flags": [True, False],
+    "dates": [datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)],
+    "ids": [uuid.UUID(int=2)],
+    "location": GeoCoordinate(latitude=1.0, longitude=2.0),
+    "phone": PhoneNumber(number="0123"),
+    "nested": {"text": "inner", "count": 1, "unknown": 2.5},
+    "nested_list": [{"text": "a", "count": 1}, {"text": "b", "count": 2}],
+    "optional": None,
+    "unknown": "not in the schema",
+}
+
+
+def _serializer_from_config() -> _PropertySerializer:
+    def prop(name: str, data_type: DataType, **kwargs: Any) -> Dict[str, Any]:
+        return {
+            "name": name,
+            "dataType": [data_type.value],
+            "indexFilterable": True,
+            "indexSearchable": True,
+            **kwargs,
+        }
+
+    nested = [prop("text", DataType.TEXT)]
+    properties = _properties_from_config(
+        {
+            "properties": [
+                prop("text", DataType.TEXT),
+                prop("count", DataType.INT),
+                prop("price", DataType.NUMBER),
+                prop("created", DataType.DATE),
+                prop("ref_id", DataType.UUID),
+                prop("counts", DataType.NUMBER_ARRAY),  # int values are left to the fallback
+                prop("dates", DataType.DATE_ARRAY),
+                prop("location", DataType.GEO_COORDINATES),
+                prop("nested", DataType.OBJECT, nestedProperties=nested),
+                prop("nested_list", DataType.OBJECT_ARRAY, nestedProperties=nested),
+            ]
+        }
+    )
+    return _PropertySerializer.from_config(properties)
+
+
+@pytest.mark.parametrize(
+    "serializer",
+    [_serializer_from_config, lambda: _PropertySerializer.from_data_model(_DataModel)],
+)
+def test_compiled_property_serializer_matches_generic_serialization(serializer) -> None:
+    obj = _BatchObject(
+        collection="Test",
+        vector=None,
+        uuid=str(uuid.uuid4()),
+        properties=_PROPERTIES,
+        tenant=None,
+        references={"ref": uuid.UUID(int=3)},
+        index=0,
+    )
+    generic = _BatchGRPC(_ServerVersion(1, 30, 0), None, None)
+    compiled = _BatchGRPC(_ServerVersion(1, 30, 0), None, None, {"Test": serializer()})
+
+    expected = generic.grpc_object(obj).properties
+    actual = compiled.grpc_object(obj).properties
+    assert actual.non_ref_properties == expected.non_ref_properties
+    assert actual.single_target_ref_props == expected.single_target_ref_props
+    for field in [
+        "text_array_properties",
+        "int_array_properties",
+        "number_array_properties",
+        "boolean_array_properties",
+        "object_properties",
+        "object_array_properties",
+    ]:
+        key = attrgetter("prop_name")
+        assert sorted(getattr(actual, field), key=key) == sorted(getattr(expected, field), key=key)
+
+
+def test_compiled_property_serializer_validates_props() -> None:
+    serializer = _PropertySerializer.from_data_model(_DataModel)
+    grpc = _BatchGRPC(_ServerVersion(1, 30, 0), None, None, {"Test": serializer})
+    obj = _BatchObject(
+        collection="Test",
+        vector=None,
+        uuid=str(uuid.uuid4()),
+        properties={"text": "a", "id": "b"},
+        tenant=None,
+        references=None,
+        index=0,
+    )
+    with pytest.raises(WeaviateInsertInvalidPropertyError):
+        grpc.grpc_object(obj)
+
+
+def test_compiled_property_serializer_survives_pickling() -> None:
+    serializer = pickle.loads(pickle.dumps(_serializer_from_config()))
+    obj = _BatchObject(
+        collection="Test",
+        vector=None,
+        uuid=str(uuid.uuid4()),
+        properties=_PROPERTIES,
+        tenant=None,
+        references=None,
+        index=0,
+    )
+    expected = _BatchGRPC(_ServerVersion(1, 30, 0), None, None, {"Test": _serializer_from_config()})
+    actual = _BatchGRPC(_ServerVersion(1, 30, 0), None, None, {"Test": serializer})
+    assert actual.grpc_object(obj) == expected.grpc_object(obj)
+
+
+def test_serialized_objects_with_process_pool() -> None:
+    grpc = _BatchGRPC(_ServerVersion(1, 30, 0), None, None, {"Test": _serializer_from_config()})
+    objects = [
+        _BatchObject(
+            collection="Test",
+            vector=[float(i), 0.5],
+            uuid=str(uuid.uuid4()),
+            properties={**_PROPERTIES, "count": i},
+            tenant=None,
+            references=None,
+            index=i,
+        )
+        for i in range(SERIALIZATION_MIN_CHUNK_SIZE * 2 + 1)
+    ]
+    pool = _SerializationPool(grpc, 2)
+    try:
+        serialized = grpc.serialized_objects(objects, pool)
+    finally:
+        pool.shutdown()
+
+    assert [batch_pb2.BatchObject.FromString(data) for data in serialized] == (
+        grpc.grpc_objects(objects)
+    )
+
+    request = _merge_serialized(
+        batch_pb2.BatchObjectsRequest(
+            consistency_level=base_pb2.ConsistencyLevel.CONSISTENCY_LEVEL_ONE
+        ),
+        "objects",
+        serialized,
+    )
+    assert request == batch_pb2.BatchObjectsRequest(
+        objects=grpc.grpc_objects(objects),
+        consistency_level=base_pb2.ConsistencyLevel.CONSISTENCY_LEVEL_ONE,
+    )
+
+
+def test_merge_serialized_stream_objects() -> None:
+    grpc = _BatchGRPC(_ServerVersion(1, 36, 0), None, None)
+    objects = [
+        _BatchObject("Test", None, str(uuid.uuid4()), {"name": "x" * 200}, None, None, i)
+        for i in range(3)
+    ]
+    request = batch_pb2.BatchStreamRequest()
+    _merge_serialized(request.data.objects, "values", grpc.serialized_objects(objects, None))
+
+    expected = batch_pb2.BatchStreamRequest()
+    expected.data.objects.values.extend(grpc.grpc_objects(objects))
+    assert request == expected
+
+
+def test_aimd_controller_increases_batch_size_then_concurrency() -> None:
+    controller = AIMDBatchController(
+        initial_batch_size=100, max_batch_size=200, initial_concurrent_requests=2
+    )
+    for _ in range(4):
+        controller.on_request_done(BatchRequestStats(started=time.time(), took=0.1, objects=100))
+    assert controller.batch_size == 200
+    assert controller.concurrent_requests == 2
+
+    controller.on_request_done(BatchRequestStats(started=time.time(), took=0.1, objects=100))
+    assert controller.concurrent_requests == 3
+    # requests that were started before the last increase do not increase the concurrency again
+    controller.on_request_done(BatchRequestStats(started=0, took=0.1, objects=100))
+    assert controller.concurrent_requests == 3
+
+
+def test_aimd_controller_decreases_once_per_round() -> None:
+    controller = AIMDBatchController(initial_batch_size=400, min_batch_size=100)
+    started = time.time()
+    controller.on_request_done(BatchRequestStats(started=started, took=1, objects=400, failed=True))
+    assert controller.batch_size == 200
+    # another request of the same round fails, but it was sent before the load was decreased
+    controller.on_request_done(BatchRequestStats(started=started, took=1, objects=400, errors=400))
+    assert controller.batch_size == 200
+
+    controller.on_request_done(
+        BatchRequestStats(started=time.time(), took=1, objects=200, retries=50)
+    )
+    assert controller.batch_size == 100
+    controller.on_request_done(
+        BatchRequestStats(started=time.time(), took=1, objects=100, failed=True)
+    )
+    assert controller.batch_size == 100
+    assert controller.concurrent_requests == 1
+
+
+def test_aimd_controller_backs_off_on_cluster_queue() -> None:
+    controller = AIMDBatchController(initial_batch_size=400, target_queue_seconds=2)
+    controller.on_cluster_stats(BatchClusterStats(queue_length=1000, rate_per_second=1000, nodes=3))
+    assert controller.batch_size == 400
+
+    controller.on_cluster_stats(BatchClusterStats(queue_length=5000, rate_per_second=1000, nodes=3))
+    assert controller.batch_size == 200
+    # no request has finished since the decrease, so the same backlog is not counted twice
+    controller.on_cluster_stats(BatchClusterStats(queue_length=5000, rate_per_second=1000, nodes=3))
+    assert controller.batch_size == 200
+
+    controller.on_cluster_stats(BatchClusterStats(queue_length=None, rate_per_second=None, nodes=3))
+    controller.on_request_done(BatchRequestStats(started=time.time(), took=0.1, objects=200))
+    assert controller.batch_size > 200
+
+
+def test_aimd_controller_backs_off_on_rising_latency() -> None:
+    controller = AIMDBatchController(initial_batch_size=100, latency_tolerance=2)
+    for _ in range(10):
+        controller.on_request_done(BatchRequestStats(started=time.time(), took=0.1, objects=100))
+    size = controller.batch_size
+    controller.on_request_done(BatchRequestStats(started=time.time(), took=1, objects=100))
+    assert controller.batch_size == size // 2
+
+
+def test_aimd_controller_validates_arguments() -> None:
+    with pytest.raises(WeaviateInvalidInputError):
+        AIMDBatchController(min_batch_size=200, initial_batch_size=100)
+    with pytest.raises(WeaviateInvalidInputError):
+        AIMDBatchController(initial_concurrent_requests=0)
+    with pytest.raises(WeaviateInvalidInputError):
+        AIMDBatchController(multiplicative_decrease=1)
+
+
+def test_batch_request_wait_wakes_up_on_add_to_shared_queue() -> None:
+    condition = threading.Condition()
+    objects = ObjectsBatchRequest[BatchObject](condition)
+    references = ReferencesBatchRequest[BatchReference](condition)
+
+    assert not objects.wait(lambda: len(references) > 0, timeout=0.01)
+
+    reference = BatchReference(
+        from_object_collection="Test",
+        from_object_uuid=uuid.uuid4(),
+        from_property_name="ref",
+        to_object_uuid=uuid.uuid4(),
+        to_object_collection=None,
+        tenant=None,
+        index=0,
+    )
+    timer = threading.Timer(0.05, references.add, args=(reference,))
+    start = time.time()
+    timer.start()
+    # the waiter is woken up by the add instead of running into the timeout
+    assert objects.wait(lambda: len(references) > 0, timeout=10)
+    assert time.time() - start < 5
+    timer.join()
+
+
+@pytest.mark.asyncio
+async def test_batch_request_await_for_wakes_up_on_notify() -> None:
+    objects = ObjectsBatchRequest[BatchObject]()
+    stopped = asyncio.Event()
+
+    assert not await objects.await_for(stopped.is_set, timeout=0.01)
+
+    async def stop() -> None:
+        await asyncio.sleep(0.05)
+        stopped.set()
+        await objects.anotify()
+
+    task = asyncio.create_task(stop())
+    start = time.time()
+    assert await objects.await_for(stopped.is_set, timeout=10)
+    assert time.time() - start < 5
+    await task
+
+
+def test_objects_batch_request_pops_by_size_in_bytes() -> None:
+    objects = ObjectsBatchRequest[BatchObject]()
+    for i in range(5):
+        objects.add(BatchObject(collection="Test", properties={"text": "x" * 1000}, index=i))
+    objects.add(BatchObject(collection="Test", properties={"text": "x" * 10000}, index=5))
+    size = objects.size_in_bytes()
+    assert size > 15000
+
+    popped = objects.pop_items(100, max_bytes=2500)
+    assert [obj.index for obj in popped] == [0, 1]
+    assert objects.size_in_bytes() == size - sum(obj._size for obj in popped)
+
+    objects.prepend(popped)
+    assert objects.size_in_bytes() == size
+    assert len(objects.pop_items(4, max_bytes=100000)) == 4
+    # objects larger than the budget are still sent on their own
+    assert [obj.index for obj in objects.pop_items(100, max_bytes=2500)] == [4]
+    assert [obj.index for obj in objects.pop_items(100, max_bytes=2500)] == [5]
+    assert objects.size_in_bytes() == 0
+
+
+def test_batch_size_histogram() -> None:
+    histogram = BatchSizeHistogram()
+    for size in [1, 100, 128, 129, 5000]:
+        histogram.add(size)
+    assert histogram.buckets == {1: 1, 128: 2, 256: 1, 8192: 1}
+    assert histogram.count == 5
+    assert histogram.total == 5358
+    assert histogram.largest == 5000
+    assert histogram.mean == 5358 / 5
+
+
+def _spilled_objects(directory: str, max_in_memory: int = 3) -> ObjectsBatchRequest[BatchObject]:
+    return ObjectsBatchRequest[BatchObject](
+        spill=_SpillLog(directory, max_in_memory=max_in_memory, segment_size=200)
+    )
+
+
+def test_spilled_batch_request_keeps_bounded_items_in_memory(tmp_path) -> None:
+    objects = _spilled_objects(str(tmp_path))
+    for i in range(10):
+        objects.add(BatchObject(collection="Test", properties={"name": f"{i}"}, index=i))
+    assert len(objects) == 10
+    assert objects.spilled() == 7
+    assert len(list(tmp_path.glob("*.seg"))) > 1
+
+    popped = objects.pop_items(5)
+    assert [obj.index for obj in popped] == [0, 1, 2]
+    assert len(objects) == 7
+    popped += objects.pop_items(5)
+    assert [obj.index for obj in popped] == [0, 1, 2, 3, 4, 5]
+    assert objects.spilled() == 1
+
+    # the objects are acknowledged out of order, only the prefix up to the first gap is checkpointed
+    objects.ack([popped[i] for i in [0, 1, 3, 4]])
+    objects.close()
+
+    resumed = _spilled_objects(str(tmp_path), max_in_memory=100)
+    assert [obj.index for obj in resumed.pop_items(100)] == [2, 3, 4, 5, 6, 7, 8, 9]
+    resumed.close()
+
+
+def test_spilled_batch_request_removes_log_when_everything_is_acked(tmp_path) -> None:
+    objects = _spilled_objects(str(tmp_path))
+    for i in range(10):
+        objects.add(BatchObject(collection="Test", index=i))
+    popped: List[BatchObject] = []
+    while len(objects) > 0:
+        popped += objects.pop_items(100)
+    assert len(popped) == 10
+    objects.ack(popped)
+    objects.close()
+    assert list(tmp_path.iterdir()) == []
+
+    assert len(_spilled_objects(str(tmp_path))) == 0
+
+
+def test_spill_log_truncates_partially_written_record(tmp_path) -> None:
+    log = _SpillLog(str(tmp_path))
+    log.append("first")
+    log.append("second")
+    log.close()
+    (segment,) = tmp_path.glob("*.seg")
+    with open(segment, "ab") as f:
+        f.write(b"\x10\x00\x00\x00abc")
+
+    log = _SpillLog(str(tmp_path))
+    assert [item for _, item in log.load(10)] == ["first", "second"]
+    assert log.append("third") == 2
+
+
+def test_spill_log_only_restores_batch_items(tmp_path) -> None:
+    np = pytest.importorskip("numpy")
+    log = _SpillLog(str(tmp_path))
+    obj = BatchObject(
+        collection="Article",
+        properties={
+            "date": datetime.datetime.now(datetime.timezone.utc),
+            "ref": uuid.uuid4(),
+            "location": GeoCoordinate(latitude=1, longitude=2),
+            "phone": PhoneNumber(number="0123"),
+        },
+        vector={"a": np.array([1.0, 2.0]), "b": [[1.0]]},
+        index=0,
+    )
+    log.append(obj)
+    log.append(
+        BatchReference(
+            from_object_collection="Article",
+            from_object_uuid=uuid.uuid4(),
+            from_property_name="ref",
+            to_object_uuid=uuid.uuid4(),
+            index=1,
+        )
+    )
+    log.append(threading.Lock)
+    log.append("last")
+    log.close()
+
+    log = _SpillLog(str(tmp_path))
+    (_, loaded), (_, ref), (offset, last) = log.load(10)
+    assert loaded.uuid == obj.uuid and loaded.properties == obj.properties
+    assert ref.from_property_name == "ref"
+    # the record of the lock is skipped, the offsets of later records are kept
+    assert (offset, last) == (3, "last")
+    log.ack([0, 1, 3])
+    log.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spill_log_restores_multi_target_references(tmp_path) -> None:
+    references = {
+        "single": uuid.uuid4(),
+        "many": [uuid.uuid4(), str(uuid.uuid4())],
+        "multi": ReferenceToMulti(target_collection="Author", uuids=[uuid.uuid4(), uuid.uuid4()]),
+    }
+    log = _SpillLog(str(tmp_path))
+    log.append(BatchObject(collection="Article", references=references, index=0))
+    log.close()
+
+    ((_, loaded),) = _SpillLog(str(tmp_path)).load(1)
+    assert loaded.references == references
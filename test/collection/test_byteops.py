@@ -1,4 +1,8 @@
-from weaviate.collections.grpc.shared import _ByteOps
+import array
+
+import pytest
+
+from weaviate.collections.grpc.shared import _ByteOps, _Pack, _Unpack
 
 
 def test_decode_float32s():
@@ -22,3 +26,47 @@ def test_decode_int64s():
     assert _ByteOps.decode_int64s(
         b"\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00"
     ) == [1, 2]
+
+
+def test_unpack_single_numpy():
+    np = pytest.importorskip("numpy")
+    packed = _Pack.single([1.0, 2.0, 0.0])
+    vec = _Unpack.single_numpy(packed)
+    assert isinstance(vec, np.ndarray)
+    assert vec.dtype == np.float32
+    assert vec.tolist() == _Unpack.single(packed)
+
+
+def test_unpack_multi_numpy():
+    np = pytest.importorskip("numpy")
+    packed = _Pack.multi([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    vec = _Unpack.multi_numpy(packed)
+    assert isinstance(vec, np.ndarray)
+    assert vec.shape == (2, 3)
+    assert vec.tolist() == _Unpack.multi(packed)
+
+
+def test_pack_numpy_matches_list_packing():
+    np = pytest.importorskip("numpy")
+    single = [1.5, -2.0, 0.25]
+    multi = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    assert _Pack.single(np.array(single, dtype=np.float64)) == _Pack.single(single)
+    assert _Pack.single(np.array([single])) == _Pack.single(single)
+    assert _Pack.multi(np.array(multi)) == _Pack.multi(multi)
+    # non-contiguous views are packed in logical order
+    assert _Pack.multi(np.array(multi).T.copy().T) == _Pack.multi(multi)
+
+
+def test_pack_buffer_protocol():
+    pytest.importorskip("numpy")
+    single = [1.5, -2.0, 0.25]
+    assert _Pack.single(array.array("d", single)) == _Pack.single(single)
+    assert _Pack.single(memoryview(array.array("f", single))) == _Pack.single(single)
+
+
+def test_pack_parse_single_or_multi_numpy():
+    np = pytest.importorskip("numpy")
+    single = _Pack.parse_single_or_multi_vec(np.array([1.0, 2.0]))
+    assert single == _Pack.parse_single_or_multi_vec([1.0, 2.0])
+    multi = _Pack.parse_single_or_multi_vec(np.array([[1.0, 2.0], [3.0, 4.0]]))
+    assert multi == _Pack.parse_single_or_multi_vec([[1.0, 2.0], [3.0, 4.0]])
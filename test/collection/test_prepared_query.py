@@ -0,0 +1,59 @@
+"""Unit tests: a prepared near_vector request is identical to one built from scratch."""
+
+from typing import Any
+
+import numpy as np
+import pytest
+
+from weaviate.classes.query import Filter, MetadataQuery, TargetVectors
+from weaviate.collections.classes.grpc import _MetadataQuery
+from weaviate.collections.grpc.query import _QueryGRPC
+from weaviate.util import _ServerVersion
+
+
+def _builder(version: _ServerVersion) -> _QueryGRPC:
+    return _QueryGRPC(
+        weaviate_version=version,
+        name="Dummy",
+        tenant="tenant",
+        consistency_level=None,
+        validate_arguments=True,
+        uses_125_api=True,
+        uses_127_api=True,
+    )
+
+
+@pytest.mark.parametrize("version", [_ServerVersion(1, 27, 0), _ServerVersion(1, 32, 0)])
+@pytest.mark.parametrize(
+    "near_vector,target_vector",
+    [
+        ([0.1, 0.2, 0.3], None),
+        ([0.1, 0.2, 0.3], "title"),
+        ([[0.1, 0.2], [0.3, 0.4]], "colbert"),
+        (np.array([0.1, 0.2, 0.3], dtype=np.float32), None),
+        ({"title": [0.1, 0.2], "body": [0.3, 0.4]}, TargetVectors.sum(["title", "body"])),
+    ],
+)
+def test_prepared_near_vector_matches_near_vector(
+    version: _ServerVersion, near_vector: Any, target_vector: Any
+) -> None:
+    if version.is_lower_than(1, 29, 0) and target_vector == "colbert":
+        pytest.skip("multi-vectors require Weaviate 1.29")
+    builder = _builder(version)
+    kwargs: Any = {
+        "certainty": 0.7,
+        "limit": 5,
+        "filters": Filter.by_property("lang").equal("en"),
+        "target_vector": target_vector,
+        "return_metadata": _MetadataQuery.from_public(MetadataQuery(distance=True), False),
+        "return_properties": ["title"],
+    }
+    prepared = builder.prepare_near_vector(**kwargs)
+
+    assert builder.near_vector_prepared(prepared, near_vector) == builder.near_vector(
+        near_vector=near_vector, **kwargs
+    )
+    # the template must not be modified by the calls
+    assert builder.near_vector_prepared(prepared, [1.0, 2.0, 3.0]) == builder.near_vector(
+        near_vector=[1.0, 2.0, 3.0], **kwargs
+    )
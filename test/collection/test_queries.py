@@ -1,10 +1,19 @@
+import datetime
+import struct
+import uuid
 from typing import Awaitable
 
 import pytest
 
+from weaviate.collections.classes.types import GeoCoordinate
+from weaviate.collections.queries.base_executor import (
+    _deserialize_column_value,
+    _deserialize_properties,
+)
 from weaviate.collections.query import _QueryCollectionAsync
 from weaviate.connect import ConnectionV4
 from weaviate.exceptions import WeaviateInvalidInputError
+from weaviate.proto.v1 import properties_pb2
 
 # TODO: re-enable tests once string syntax is re-enabled in the API
 
@@ -130,3 +139,79 @@ async def test_bad_query_inputs(connection: ConnectionV4) -> None:
 
     # near image
     await _test_query(lambda: query.near_image(42))
+
+
+def test_deserialize_properties() -> None:
+    uid = uuid.uuid4()
+    nested = properties_pb2.Properties(fields={"name": properties_pb2.Value(text_value="inner")})
+    properties = properties_pb2.Properties(
+        fields={
+            "text": properties_pb2.Value(text_value="text"),
+            "int": properties_pb2.Value(int_value=3),
+            "number": properties_pb2.Value(number_value=1.5),
+            "bool": properties_pb2.Value(bool_value=True),
+            "uuid": properties_pb2.Value(uuid_value=str(uid)),
+            "date": properties_pb2.Value(date_value="2024-01-02T03:04:05Z"),
+            "geo": properties_pb2.Value(
+                geo_value=properties_pb2.GeoCoordinate(latitude=1.0, longitude=2.0)
+            ),
+            "blob": properties_pb2.Value(blob_value="YmxvYg=="),
+            "null": properties_pb2.Value(null_value=0),
+            "object": properties_pb2.Value(object_value=nested),
+            "ints": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    int_values=properties_pb2.IntValues(values=struct.pack("<2q", 1, 2))
+                )
+            ),
+            "texts": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    text_values=properties_pb2.TextValues(values=["a", "b"])
+                )
+            ),
+            "objects": properties_pb2.Value(
+                list_value=properties_pb2.ListValue(
+                    object_values=properties_pb2.ObjectValues(values=[nested, nested])
+                )
+            ),
+        }
+    )
+    assert _deserialize_properties(properties) == {
+        "text": "text",
+        "int": 3,
+        "number": 1.5,
+        "bool": True,
+        "uuid": uid,
+        "date": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        "geo": GeoCoordinate(latitude=1.0, longitude=2.0),
+        "blob": "YmxvYg==",
+        "null": None,
+        "object": {"name": "inner"},
+        "ints": [1, 2],
+        "texts": ["a", "b"],
+        "objects": [{"name": "inner"}, {"name": "inner"}],
+    }
+
+
+def test_deserialize_properties_warns_on_unset_value() -> None:
+    with pytest.warns(UserWarning, match="Grpc002"):
+        assert _deserialize_properties(
+            properties_pb2.Properties(fields={"empty": properties_pb2.Value()})
+        ) == {"empty": None}
+
+
+def test_deserialize_column_value_decodes_dates_into_datetime64() -> None:
+    np = pytest.importorskip("numpy")
+    value = properties_pb2.Value(
+        list_value=properties_pb2.ListValue(
+            date_values=properties_pb2.DateValues(
+                values=["2024-01-02T03:04:05Z", "2024-01-02T03:04:05.123456789Z"]
+            )
+        )
+    )
+    dates = _deserialize_column_value(value)
+    assert dates.dtype == np.dtype("datetime64[us]")
+    assert dates.tolist() == [
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        datetime.datetime(2024, 1, 2, 3, 4, 5, 123456),
+    ]
+    assert _deserialize_column_value(properties_pb2.Value(int_value=3)) == 3
@@ -0,0 +1,102 @@
+from collections import Counter
+from typing import Any, Callable, List, Tuple
+
+import grpc
+import pytest
+
+from weaviate.connect.pool import _ChannelPool, _parse_address
+
+
+class _Unavailable(grpc.RpcError):
+    def code(self) -> grpc.StatusCode:
+        return grpc.StatusCode.UNAVAILABLE
+
+
+class _FakeChannel:
+    """Answers every unary call with the target of the channel, or fails for the targets in `down`."""
+
+    def __init__(self, target: str, down: List[str]) -> None:
+        self.target = target
+        self.down = down
+
+    def unary_unary(self, *args: Any, **kwargs: Any) -> Callable[..., str]:
+        def call(request: Any, **kwargs: Any) -> str:
+            if self.target in self.down:
+                raise _Unavailable()
+            return self.target
+
+        return call
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return lambda *args, **kwargs: None
+
+
+def _pool(
+    addresses: List[Tuple[str, int]], down: List[str], **kwargs: Any
+) -> Tuple[_ChannelPool, List[_FakeChannel]]:
+    channels: List[_FakeChannel] = []
+
+    def factory(address: Tuple[str, int]) -> Any:
+        channels.append(_FakeChannel(f"{address[0]}:{address[1]}", down))
+        return channels[-1]
+
+    options = {
+        "channels_per_target": 2,
+        "load_balancing": "round_robin",
+        "ejection_time": 30,
+        "is_async": False,
+    }
+    options.update(kwargs)
+    return _ChannelPool(factory, addresses, **options), channels
+
+
+def test_round_robin_spreads_calls_over_all_channels() -> None:
+    pool, channels = _pool([("a", 1), ("b", 1), ("a", 1)], down=[])
+    assert pool.targets == ["a:1", "b:1"]
+    assert len(channels) == 4
+
+    search = pool.method("Search")
+    assert Counter(search(None) for _ in range(8)) == {"a:1": 4, "b:1": 4}
+
+
+def test_least_outstanding_prefers_idle_targets() -> None:
+    pool, _ = _pool(
+        [("a", 1), ("b", 1)], down=[], channels_per_target=1, load_balancing="least_outstanding"
+    )
+    busy = pool._acquire()
+    idle = "b:1" if busy.target == "a:1" else "a:1"
+    search = pool.method("Search")
+    assert {search(None) for _ in range(3)} == {idle}
+
+
+def test_unavailable_targets_are_ejected() -> None:
+    down = ["b:1"]
+    pool, _ = _pool([("a", 1), ("b", 1)], down=down, channels_per_target=1)
+    search = pool.method("Search")
+
+    results = []
+    for _ in range(4):
+        try:
+            results.append(search(None))
+        except grpc.RpcError:
+            results.append("error")
+    assert results == ["a:1", "error", "a:1", "a:1"]
+    assert pool.ejected() == ["b:1"]
+
+    # with every target ejected, calls are sent to all of them again
+    down.append("a:1")
+    for _ in range(2):
+        with pytest.raises(grpc.RpcError):
+            search(None)
+    down.clear()
+    assert sorted(search(None) for _ in range(2)) == ["a:1", "b:1"]
+
+
+def test_parse_address() -> None:
+    assert _parse_address("weaviate-0.weaviate-headless:50051") == (
+        "weaviate-0.weaviate-headless",
+        50051,
+    )
+    assert _parse_address("[::1]:50051") == ("[::1]", 50051)
+    with pytest.raises(ValueError):
+        _parse_address("weaviate-0")
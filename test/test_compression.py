@@ -0,0 +1,53 @@
+import grpc
+
+from weaviate.collections.classes.batch import BatchObjectReturn
+from weaviate.config import GrpcConfig
+from weaviate.connect.compression import _Compression
+from weaviate.proto.v1 import batch_pb2, search_get_pb2
+
+
+def _batch(objects: int) -> batch_pb2.BatchObjectsRequest:
+    return batch_pb2.BatchObjectsRequest(
+        objects=[
+            batch_pb2.BatchObject(collection="Article", uuid=f"{i:032x}") for i in range(objects)
+        ]
+    )
+
+
+def test_overrides_take_precedence_over_the_default() -> None:
+    compression = _Compression(
+        GrpcConfig(compression="gzip", compression_overrides={"search": "none"})
+    )
+    assert compression.for_request("batch", _batch(1)) == grpc.Compression.Gzip
+    assert compression.for_request("search", search_get_pb2.SearchRequest()) is None
+    assert compression.for_stream("batch_stream") == grpc.Compression.Gzip
+    assert _Compression(None).for_stream("batch_stream") is None
+
+
+def test_threshold_skips_small_requests() -> None:
+    compression = _Compression(GrpcConfig(compression="gzip", compression_threshold=1000))
+    assert compression.for_request("batch", _batch(1)) == grpc.Compression.NoCompression
+    assert compression.for_request("batch", _batch(100)) == grpc.Compression.Gzip
+
+
+def test_estimate() -> None:
+    request = _batch(2000)
+    estimate = _Compression.estimate(request.ByteSize(), request.objects)
+    assert estimate.size == request.ByteSize()
+    assert 0 < estimate.compressed < estimate.size
+
+
+def test_only_some_requests_are_sampled() -> None:
+    compression = _Compression(GrpcConfig(compression="gzip"))
+    request = _batch(10)
+    samples = [compression.sample(request.ByteSize(), request.objects) for _ in range(33)]
+    assert [i for i, sample in enumerate(samples) if sample is not None] == [0, 16, 32]
+
+
+def test_compression_ratio_of_combined_batch_results() -> None:
+    res = BatchObjectReturn()
+    assert res.compression_ratio is None
+    res += BatchObjectReturn(_compressed_request_bytes=300, _compressed_wire_bytes=100)
+    res += BatchObjectReturn()
+    res += BatchObjectReturn(_compressed_request_bytes=100, _compressed_wire_bytes=100)
+    assert res.compression_ratio == 2
@@ -0,0 +1,137 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, List, Optional
+
+import grpc
+import pytest
+
+from weaviate.config import Hedging
+from weaviate.connect.hedging import _Hedger
+
+_KEY = ("Search", "Article")
+
+
+def test_delay_follows_the_percentile_of_the_window() -> None:
+    hedger = _Hedger(Hedging(percentile=90, window=100, min_samples=10, initial_delay=0.5))
+    for i in range(9):
+        hedger.record(_KEY, i / 100)
+    assert hedger.delay(_KEY) == 0.5
+
+    hedger.record(_KEY, 0.09)
+    assert hedger.delay(_KEY) == pytest.approx(0.08)
+    # other collections keep their own window
+    assert hedger.delay(("Search", "Other")) == 0.5
+
+    # the percentile is only recomputed every window // 20 requests
+    for _ in range(4):
+        hedger.record(_KEY, 1)
+    assert hedger.delay(_KEY) == pytest.approx(0.08)
+    hedger.record(_KEY, 1)
+    assert hedger.delay(_KEY) == 1
+
+
+def test_delay_is_not_shorter_than_min_delay() -> None:
+    hedger = _Hedger(Hedging(min_samples=1, min_delay=0.01))
+    hedger.record(_KEY, 0.001)
+    assert hedger.delay(_KEY) == 0.01
+
+
+class _Future(concurrent.futures.Future):
+    """A future that times out like the futures of gRPC calls."""
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        try:
+            return super().result(timeout)
+        except concurrent.futures.TimeoutError as e:
+            raise grpc.FutureTimeoutError() from e
+
+
+class _Calls:
+    """Starts futures that are completed by the test, in the order in which they were started."""
+
+    def __init__(self) -> None:
+        self.futures: List[_Future] = []
+        self.timeouts: List[Any] = []
+        self.started = threading.Semaphore(0)
+
+    def start(self, request: str, timeout: Any = None) -> _Future:
+        self.futures.append(_Future())
+        self.timeouts.append(timeout)
+        self.started.release()
+        return self.futures[-1]
+
+
+def test_fast_requests_are_not_hedged() -> None:
+    calls, hedges = _Calls(), []
+    hedger = _Hedger(Hedging(initial_delay=5))
+
+    def start(request: str, **kwargs: Any) -> _Future:
+        future = calls.start(request, **kwargs)
+        future.set_result("reply")
+        return future
+
+    assert hedger.call(_KEY, start, hedges.append, "request") == "reply"
+    assert len(calls.futures) == 1
+    assert hedges == []
+
+
+def test_slow_requests_are_hedged() -> None:
+    calls, hedges = _Calls(), []
+    hedger = _Hedger(Hedging(initial_delay=0.01))
+    result: List[str] = []
+    thread = threading.Thread(
+        target=lambda: result.append(
+            hedger.call(_KEY, calls.start, hedges.append, "request", timeout=10)
+        )
+    )
+    thread.start()
+    for _ in range(2):
+        assert calls.started.acquire(timeout=5)
+    calls.futures[1].set_result("duplicate")
+    thread.join(timeout=5)
+
+    assert result == ["duplicate"]
+    assert hedges == [0.01]
+    assert calls.futures[0].cancelled()
+    assert calls.timeouts[1] < 10
+
+
+def test_hedged_request_fails_only_if_both_fail() -> None:
+    calls = _Calls()
+    hedger = _Hedger(Hedging(initial_delay=0.01))
+    result: List[str] = []
+    thread = threading.Thread(
+        target=lambda: result.append(hedger.call(_KEY, calls.start, lambda _: None, "request"))
+    )
+    thread.start()
+    for _ in range(2):
+        assert calls.started.acquire(timeout=5)
+    calls.futures[1].set_exception(ValueError("unavailable"))
+    calls.futures[0].set_result("first")
+    thread.join(timeout=5)
+    assert result == ["first"]
+
+
+@pytest.mark.asyncio
+async def test_slow_requests_are_hedged_async() -> None:
+    hedges: List[float] = []
+    cancelled: List[int] = []
+    calls = 0
+
+    async def search(request: str, **kwargs: Any) -> str:
+        nonlocal calls
+        calls += 1
+        attempt = calls
+        try:
+            await asyncio.sleep(10 if attempt == 1 else 0)
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return f"reply {attempt}"
+
+    hedger = _Hedger(Hedging(initial_delay=0.01))
+    assert await hedger.acall(_KEY, search, hedges.append, "request") == "reply 2"
+    await asyncio.sleep(0)
+    assert hedges == [0.01]
+    assert cancelled == [1]
@@ -0,0 +1,51 @@
+from typing import List
+
+import grpc
+import pytest
+
+from weaviate.config import RetryPolicy
+from weaviate.instrumentation import CallbackTracer, SpanRecord, _Instrumentation
+from weaviate.retry import _Retry
+
+
+class _Unavailable(grpc.RpcError):
+    def code(self) -> grpc.StatusCode:
+        return grpc.StatusCode.UNAVAILABLE
+
+
+def test_retries_are_recorded_on_the_rpc_span(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("weaviate.retry.time.sleep", lambda _: None)
+    spans: List[SpanRecord] = []
+    instrumentation = _Instrumentation(CallbackTracer(spans.append))
+    calls = 0
+
+    def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 3:
+            raise _Unavailable()
+        return "ok"
+
+    with instrumentation.span("rpc", {"weaviate.retries": 0}) as span:
+        assert (
+            _Retry(
+                RetryPolicy(jitter=False), instrumentation.retry_recorder(span)
+            ).with_exponential_backoff(0, "test", flaky)
+            == "ok"
+        )
+
+    (record,) = spans
+    assert record.attributes["weaviate.retries"] == 2
+    assert [event for event, _ in record.events] == ["retry", "retry"]
+    assert record.events[1][1] == {
+        "attempt": 1,
+        "backoff_seconds": 2,
+        "error": "_Unavailable",
+    }
+
+
+def test_disabled_instrumentation_opens_no_span() -> None:
+    instrumentation = _Instrumentation(None)
+    with instrumentation.span("anything") as span:
+        assert span is None
+    assert instrumentation.retry_recorder(span) is None
@@ -0,0 +1,47 @@
+import pytest
+
+from weaviate.collections.batch.base import ObjectsBatchRequest
+from weaviate.collections.classes.batch import BatchObject
+from weaviate.metrics import ClientMetrics
+
+
+def test_failed_requests_are_counted_as_errors() -> None:
+    metrics = ClientMetrics()
+    with pytest.raises(ValueError):
+        with metrics.start_as_current_span("weaviate.grpc.Search", {"rpc.request.size": 10}):
+            raise ValueError("unavailable")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["weaviate_requests_total"] == {"grpc.Search": 1}
+    assert snapshot["weaviate_request_errors_total"] == {"grpc.Search": 1}
+    assert snapshot["weaviate_in_flight_requests"] == {"grpc.Search": 0}
+    assert snapshot["weaviate_sent_bytes_total"] == {"grpc.Search": 10}
+
+
+def test_prometheus_format() -> None:
+    metrics = ClientMetrics()
+    with metrics.start_as_current_span("weaviate.rest.GET") as span:
+        span.set_attribute("http.response.body.size", 7)
+        span.set_attribute("weaviate.retries", 2)
+    with metrics.start_as_current_span("weaviate.query.build"):
+        pass
+
+    text = metrics.to_prometheus()
+    assert "# TYPE weaviate_request_duration_seconds histogram" in text
+    assert 'weaviate_request_duration_seconds_bucket{rpc="rest.GET",le="+Inf"} 1' in text
+    assert 'weaviate_request_duration_seconds_count{rpc="rest.GET"} 1' in text
+    assert 'weaviate_received_bytes_total{rpc="rest.GET"} 7' in text
+    assert 'weaviate_retries_total{rpc="rest.GET"} 2' in text
+    assert "weaviate_batch_queue_depth 0" in text
+    assert text.endswith("\n")
+
+
+def test_batch_queue_depth() -> None:
+    metrics = ClientMetrics()
+    queue = ObjectsBatchRequest[BatchObject](on_depth_change=metrics._set_batch_queue_depth)
+    for i in range(3):
+        queue.add(BatchObject(collection="Test", properties={}, index=i))
+    assert metrics.snapshot()["weaviate_batch_queue_depth"] == 3
+
+    queue.pop_items(2)
+    assert metrics.snapshot()["weaviate_batch_queue_depth"] == 1
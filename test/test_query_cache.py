@@ -0,0 +1,67 @@
+from weaviate.config import QueryCache
+from weaviate.connect.query_cache import _QueryCache
+from weaviate.proto.v1 import batch_pb2, search_get_pb2
+
+
+def _reply(n: int) -> search_get_pb2.SearchReply:
+    return search_get_pb2.SearchReply(took=n)
+
+
+def test_reply_of_search_racing_a_write_is_not_stored() -> None:
+    cache = _QueryCache(QueryCache())
+    request = search_get_pb2.SearchRequest(collection="A", limit=1)
+
+    key, generation, cached = cache.get(request)
+    assert cached is None
+    cache.invalidate(["A"])
+    cache.put(key, generation, request, _reply(1))
+    assert cache.get(request)[2] is None
+
+    key, generation, _ = cache.get(request)
+    cache.invalidate()
+    cache.put(key, generation, request, _reply(2))
+    assert cache.get(request)[2] is None
+
+
+def test_key_includes_tenant_and_consistency_level() -> None:
+    cache = _QueryCache(QueryCache())
+    plain = search_get_pb2.SearchRequest(collection="A", limit=1)
+    tenant = search_get_pb2.SearchRequest(collection="A", limit=1, tenant="t")
+    for request, took in ((plain, 1), (tenant, 2)):
+        key, generation, _ = cache.get(request)
+        cache.put(key, generation, request, _reply(took))
+    assert cache.get(plain)[2] == _reply(1)
+    assert cache.get(tenant)[2] == _reply(2)
+
+
+def test_rest_and_stream_writes_invalidate_their_collection() -> None:
+    cache = _QueryCache(QueryCache())
+    requests = [search_get_pb2.SearchRequest(collection=name) for name in ("A", "B")]
+
+    def fill() -> None:
+        for request in requests:
+            key, generation, _ = cache.get(request)
+            cache.put(key, generation, request, _reply(0))
+
+    fill()
+    cache.invalidate_rest_write("/graphql", {"query": "{}"})
+    cache.invalidate_rest_write("/objects/A/1234", None)
+    assert cache.stats().size == 1
+    cache.invalidate_rest_write("/objects", {"class": "B"})
+    assert cache.stats().size == 0
+
+    fill()
+    cache.invalidate_batch_stream(
+        batch_pb2.BatchStreamRequest(
+            data=batch_pb2.BatchStreamRequest.Data(
+                references=batch_pb2.BatchStreamRequest.Data.References(
+                    values=[batch_pb2.BatchReference(from_collection="B", to_collection="A")]
+                )
+            )
+        )
+    )
+    assert cache.get(requests[0])[2] is not None
+    assert cache.get(requests[1])[2] is None
+
+    cache.invalidate_rest_write("/batch/references", [])
+    assert cache.stats().size == 0
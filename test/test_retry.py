@@ -0,0 +1,105 @@
+from typing import Callable, List, Tuple
+
+import grpc
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from weaviate.config import RetryPolicy
+from weaviate.exceptions import WeaviateRetryError
+from weaviate.retry import _Retry
+
+
+class _Error(grpc.RpcError):
+    def __init__(self, code: grpc.StatusCode) -> None:
+        self.__code = code
+
+    def code(self) -> grpc.StatusCode:
+        return self.__code
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    sleeps: List[float] = []
+    monkeypatch.setattr("weaviate.retry.time.sleep", sleeps.append)
+    return sleeps
+
+
+def _failing(code: grpc.StatusCode, failures: int) -> Tuple[List[int], Callable[..., str]]:
+    calls: List[int] = []
+
+    def f(**kwargs: float) -> str:
+        calls.append(len(calls))
+        if len(calls) <= failures:
+            raise _Error(code)
+        return "ok"
+
+    return calls, f
+
+
+def test_backoff_is_capped_and_jittered(
+    sleeps: List[float], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("weaviate.retry.random.uniform", lambda low, high: high / 2)
+    calls, f = _failing(grpc.StatusCode.UNAVAILABLE, 4)
+    policy = RetryPolicy(initial_backoff=1, max_backoff=3)
+    assert _Retry(policy).with_exponential_backoff(0, "test", f) == "ok"
+    assert sleeps == [0.5, 1, 1.5, 1.5]
+
+
+def test_retries_are_limited_to_max_attempts(sleeps: List[float]) -> None:
+    calls, f = _failing(grpc.StatusCode.UNAVAILABLE, 10)
+    with pytest.raises(WeaviateRetryError):
+        _Retry(RetryPolicy(max_attempts=3, jitter=False)).with_exponential_backoff(0, "test", f)
+    assert len(calls) == 3
+    assert sleeps == [1, 2]
+
+    calls, f = _failing(grpc.StatusCode.UNAVAILABLE, 10)
+    with pytest.raises(WeaviateRetryError):
+        _Retry(RetryPolicy(max_attempts=3), max_retries=5).with_exponential_backoff(0, "test", f)
+    assert len(calls) == 6
+
+
+def test_read_codes_are_only_retried_for_reads(sleeps: List[float]) -> None:
+    policy = RetryPolicy(retryable_read_codes={"RESOURCE_EXHAUSTED"})
+    calls, f = _failing(grpc.StatusCode.RESOURCE_EXHAUSTED, 1)
+    with pytest.raises(grpc.RpcError):
+        _Retry(policy).with_exponential_backoff(0, "test", f)
+    assert len(calls) == 1
+
+    calls, f = _failing(grpc.StatusCode.RESOURCE_EXHAUSTED, 1)
+    assert _Retry(policy, read=True).with_exponential_backoff(0, "test", f) == "ok"
+
+
+def test_total_timeout_limits_retries_and_attempt_timeouts(sleeps: List[float]) -> None:
+    timeouts: List[float] = []
+
+    def f(timeout: float) -> str:
+        timeouts.append(timeout)
+        raise _Error(grpc.StatusCode.UNAVAILABLE)
+
+    policy = RetryPolicy(jitter=False, total_timeout=3.5)
+    with pytest.raises(WeaviateRetryError):
+        _Retry(policy).with_exponential_backoff(0, "test", f, timeout=30)
+    # a third retry would wait for 4 seconds, which does not fit into the budget
+    assert sleeps == [1, 2]
+    assert all(timeout <= 3.5 for timeout in timeouts)
+
+
+def test_http_statuses_are_retried(sleeps: List[float]) -> None:
+    statuses = [503, 502, 200]
+    request = httpx.Request("GET", "http://localhost/v1/schema")
+
+    def send(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(statuses.pop(0), request=request)
+
+    assert _Retry(RetryPolicy()).send(send, request).status_code == 200
+    assert len(sleeps) == 2
+
+    statuses = [404]
+    assert _Retry(RetryPolicy()).send(send, request).status_code == 404
+
+
+def test_unknown_status_code() -> None:
+    with pytest.raises(ValidationError):
+        RetryPolicy(retryable_codes={"NOT_A_CODE"})
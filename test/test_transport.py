@@ -0,0 +1,79 @@
+from typing import List
+
+import httpx
+import pytest
+
+from weaviate.config import ConnectionConfig
+from weaviate.connect.transport import _AsyncSharedTransport, _no_proxy_mounts, _SharedTransport
+
+
+class _Transport(httpx.HTTPTransport):
+    def __init__(self, closed: List[str]) -> None:
+        super().__init__()
+        self.closed = closed
+
+    def close(self) -> None:
+        self.closed.append("closed")
+        super().close()
+
+
+def test_shared_transport_is_closed_with_its_last_handle() -> None:
+    closed: List[str] = []
+    created: List[_Transport] = []
+
+    def factory() -> _Transport:
+        created.append(_Transport(closed))
+        return created[-1]
+
+    first = _SharedTransport(("test", 1), factory)
+    second = _SharedTransport(("test", 1), factory)
+    other = _SharedTransport(("test", 2), factory)
+    assert len(created) == 2
+
+    first.close()
+    first.close()
+    assert closed == []
+    second.close()
+    assert closed == ["closed"]
+    other.close()
+    assert closed == ["closed", "closed"]
+
+    # a new handle after all were closed opens a new transport
+    _SharedTransport(("test", 1), factory).close()
+    assert len(created) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_shared_transports_are_per_event_loop() -> None:
+    created: List[httpx.AsyncHTTPTransport] = []
+
+    def factory() -> httpx.AsyncHTTPTransport:
+        created.append(httpx.AsyncHTTPTransport())
+        return created[-1]
+
+    first = _AsyncSharedTransport(("test", 3), factory)
+    second = _AsyncSharedTransport(("test", 3), factory)
+    assert len(created) == 1
+    await first.aclose()
+    await second.aclose()
+
+
+def test_http2_requires_h2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("weaviate.config.find_spec", lambda name: None)
+    with pytest.raises(ValueError, match="h2"):
+        ConnectionConfig(http2=True)
+    with pytest.raises(ValueError):
+        ConnectionConfig(keepalive_expiry=-1)
+
+
+def test_no_proxy_mounts(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("NO_PROXY", "example.com, 10.0.0.1,::1,localhost,http://internal")
+    assert _no_proxy_mounts() == {
+        "all://*example.com": None,
+        "all://10.0.0.1": None,
+        "all://[::1]": None,
+        "all://localhost": None,
+        "http://internal": None,
+    }
+    monkeypatch.setenv("NO_PROXY", "example.com,*")
+    assert _no_proxy_mounts() == {}
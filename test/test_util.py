@@ -10,8 +10,11 @@ from test.util import check_error_message
 from weaviate.exceptions import SchemaValidationException
 from weaviate.util import (
     MINIMUM_NO_WARNING_VERSION,
+    _datetime64_from_weaviate_strs,
     _datetime_from_weaviate_str,
+    _datetime_from_weaviate_str_strptime,
     _is_sub_schema,
+    _parse_rfc3339,
     _sanitize_str,
     generate_uuid5,
     get_domain_from_weaviate_url,
@@ -456,12 +459,53 @@ def test_is_weaviate_too_old(version: str, too_old: bool):
             "2023-01-15T14:30:45.123456789Z",
             datetime(2023, 1, 15, 14, 30, 45, 123456, tzinfo=timezone.utc),
         ),
+        # Test parsing with a short fraction and a negative offset
+        (
+            "2023-01-15T14:30:45.5-05:30",
+            datetime(
+                2023, 1, 15, 14, 30, 45, 500000, tzinfo=timezone(-timedelta(hours=5, minutes=30))
+            ),
+        ),
         # Test handling year 0 (should return datetime.min)
         ("0000-01-15T14:30:45.123456Z", datetime.min),
     ],
 )
 def test_datetime_from_weaviate_str(input_str: str, expected: datetime) -> None:
     assert _datetime_from_weaviate_str(input_str) == expected
+    assert _datetime_from_weaviate_str(input_str).utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize(
+    "input_str",
+    [
+        "2023-01-15T14:30:45.123456Z",
+        "2023-01-15T14:30:45+02:00",
+        "2023-01-15T14:30:45.123456789-05:30",
+        "2023-01-15T14:30:45.Z",
+        "2023-01-15 14:30:45Z",
+    ],
+)
+def test_parse_rfc3339_matches_strptime(input_str: str) -> None:
+    try:
+        expected = _datetime_from_weaviate_str_strptime(input_str)
+    except ValueError:
+        with pytest.raises(ValueError):
+            _parse_rfc3339(input_str)
+        return
+    assert _parse_rfc3339(input_str) == expected
+
+
+def test_datetime64_from_weaviate_strs() -> None:
+    np = pytest.importorskip("numpy")
+    utc = _datetime64_from_weaviate_strs(["2023-01-15T14:30:45.123456789Z", "2023-01-15T14:30:45Z"])
+    assert utc.dtype == np.dtype("datetime64[us]")
+    assert utc.tolist() == [
+        datetime(2023, 1, 15, 14, 30, 45, 123456),
+        datetime(2023, 1, 15, 14, 30, 45),
+    ]
+
+    offset = _datetime64_from_weaviate_strs(["2023-01-15T14:30:45+02:00", "2023-01-15T14:30:45Z"])
+    assert offset.tolist() == [datetime(2023, 1, 15, 12, 30, 45), datetime(2023, 1, 15, 14, 30, 45)]
 
 
 @pytest.mark.parametrize(
@@ -11,6 +11,7 @@ class ExecutorTransformer(ast.NodeTransformer):
     def __init__(self, colour: Literal["async", "sync"]):
         self.colour = colour
         self.executor_names = []
+        self.no_wrapping_names = set()
 
     def visit_ClassDef(self, node):
         self.executor_names.append(node.name)
@@ -25,11 +26,19 @@ class ExecutorTransformer(ast.NodeTransformer):
     def __is_overload(self, fn: ast.FunctionDef):
         return any(isinstance(d, ast.Name) and d.id == "overload" for d in fn.decorator_list)
 
+    def __is_no_wrapping(self, fn: ast.FunctionDef):
+        # methods marked with @executor.no_wrapping stay sync in the async stubs
+        return any(
+            isinstance(d, ast.Attribute) and d.attr == "no_wrapping" for d in fn.decorator_list
+        )
+
     def __parse_body(self, node: ast.ClassDef):
         funcs_by_name = defaultdict(list)
         for stmt in node.body:
             if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
                 funcs_by_name[stmt.name].append(stmt)
+                if self.__is_no_wrapping(stmt):
+                    self.no_wrapping_names.add(stmt.name)
 
         new_body: list[ast.stmt] = []
         for stmt in node.body:
@@ -112,14 +121,27 @@ class ExecutorTransformer(ast.NodeTransformer):
             return node.slice  # Return T
         return node  # fallback, return original if not matching
 
+    def __replace_connection_type(self, node: ast.expr | None) -> ast.expr | None:
+        # the return types of methods that are not wrapped name the connection of the executor, e.g. Prepared[ConnectionType, T]
+        if node is None:
+            return None
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and child.id == "ConnectionType":
+                child.id = self.__which_connection_type()
+        return node
+
     def visit_FunctionDef(self, node):
-        func_def = ast.AsyncFunctionDef if self.colour == "async" else ast.FunctionDef
+        func_def = (
+            ast.AsyncFunctionDef
+            if self.colour == "async" and node.name not in self.no_wrapping_names
+            else ast.FunctionDef
+        )
         new_node = func_def(
             name=node.name,
             args=node.args,
             body=[ast.Expr(value=ast.Constant(value=Ellipsis))],
             decorator_list=node.decorator_list,
-            returns=self.__extract_inner_return_type(node.returns),
+            returns=self.__replace_connection_type(self.__extract_inner_return_type(node.returns)),
             type_comment=node.type_comment,
         )
         return ast.copy_location(new_node, node)
@@ -1,5 +1,15 @@
+from weaviate.collections.batch.controller import (
+    AIMDBatchController,
+    BatchClusterStats,
+    BatchController,
+    BatchRequestStats,
+)
 from weaviate.collections.classes.batch import Shard
 
 __all__ = [
+    "AIMDBatchController",
+    "BatchClusterStats",
+    "BatchController",
+    "BatchRequestStats",
     "Shard",
 ]
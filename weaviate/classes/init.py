@@ -1,4 +1,24 @@
 from weaviate.auth import Auth
-from weaviate.config import AdditionalConfig, GrpcConfig, Proxies, Timeout
+from weaviate.config import (
+    AdditionalConfig,
+    GrpcConfig,
+    Hedging,
+    Proxies,
+    QueryCache,
+    RetryPolicy,
+    Timeout,
+)
+from weaviate.instrumentation import CallbackTracer, SpanRecord
 
-__all__ = ["Auth", "AdditionalConfig", "GrpcConfig", "Proxies", "Timeout"]
+__all__ = [
+    "Auth",
+    "AdditionalConfig",
+    "CallbackTracer",
+    "GrpcConfig",
+    "Hedging",
+    "Proxies",
+    "QueryCache",
+    "RetryPolicy",
+    "SpanRecord",
+    "Timeout",
+]
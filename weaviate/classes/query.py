@@ -5,6 +5,7 @@ from weaviate.collections.classes.grpc import (
     BM25OperatorFactory as BM25Operator,
 )
 from weaviate.collections.classes.grpc import (
+    BatchQuery,
     Boost,
     BoostReturn,
     Diversity,
@@ -24,6 +25,7 @@ from weaviate.collections.classes.grpc import (
 from weaviate.collections.classes.types import GeoCoordinate
 
 __all__ = [
+    "BatchQuery",
     "Diversity",
     "Filter",
     "FilterReturn",
@@ -10,9 +10,11 @@ from weaviate.client_executor import _WeaviateClientExecutor
 from weaviate.collections.classes.internal import _RawGQLReturn
 from weaviate.collections.collections.async_ import _CollectionsAsync
 from weaviate.collections.collections.sync import _Collections
+from weaviate.connect.query_cache import QueryCacheStats
 from weaviate.connect.v4 import ConnectionAsync, ConnectionSync
 from weaviate.groups.async_ import _GroupsAsync
 from weaviate.groups.sync import _Groups
+from weaviate.metrics import ClientMetrics
 from weaviate.users.async_ import _UsersAsync
 from weaviate.users.sync import _Users
 
@@ -49,6 +51,8 @@ class WeaviateAsyncClient(_WeaviateClientExecutor[ConnectionAsync]):
     async def graphql_raw_query(self, gql_query: str) -> _RawGQLReturn: ...
     async def get_meta(self) -> dict: ...
     async def get_open_id_configuration(self) -> Optional[Dict[str, Any]]: ...
+    def query_cache_stats(self) -> Optional[QueryCacheStats]: ...
+    def metrics(self) -> Optional[ClientMetrics]: ...
     async def __aenter__(self) -> "WeaviateAsyncClient": ...
     async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None: ...
 
@@ -74,6 +78,8 @@ class WeaviateClient(_WeaviateClientExecutor[ConnectionSync]):
     def graphql_raw_query(self, gql_query: str) -> _RawGQLReturn: ...
     def get_meta(self) -> dict: ...
     def get_open_id_configuration(self) -> Optional[Dict[str, Any]]: ...
+    def query_cache_stats(self) -> Optional[QueryCacheStats]: ...
+    def metrics(self) -> Optional[ClientMetrics]: ...
     def __enter__(self) -> "WeaviateClient": ...
     def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None: ...
 
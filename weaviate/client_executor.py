@@ -24,8 +24,10 @@ from .connect.base import (
     ConnectionParams,
     ProtocolParams,
 )
+from .connect.query_cache import QueryCacheStats
 from .connect.v4 import ConnectionAsync, ConnectionType, _ExpectedStatusCodes
 from .embedded import EmbeddedOptions, EmbeddedV4
+from .metrics import ClientMetrics
 from .types import NUMBER
 from .util import _decode_json_response_dict
 from .validator import _validate_input, _ValidateArgument
@@ -82,6 +84,12 @@ class _WeaviateClientExecutor(Generic[ConnectionType]):
             trust_env=config.trust_env,
             skip_init_checks=skip_init_checks,
             grpc_config=config.grpc_config,
+            vector_format=config.vector_format,
+            query_cache=config.query_cache,
+            tracer=config.tracer,
+            metrics=config.metrics,
+            retry_policy=config.retry_policy,
+            hedging=config.hedging,
         )
 
         self.integrations = _Integrations(self._connection)
@@ -312,3 +320,24 @@ class _WeaviateClientExecutor(Generic[ConnectionType]):
             `True` if the client is connected to Weaviate with an open connection pool, `False` otherwise.
         """
         return self._connection.is_connected()
+
+    @executor.no_wrapping
+    def query_cache_stats(self) -> Optional[QueryCacheStats]:
+        """Get the hit, miss, eviction and invalidation counters of the client-side query cache.
+
+        Returns:
+            The counters and current number of cached replies, or `None` if `AdditionalConfig.query_cache` was not set.
+        """
+        if self._connection._query_cache is None:
+            return None
+        return self._connection._query_cache.stats()
+
+    @executor.no_wrapping
+    def metrics(self) -> Optional[ClientMetrics]:
+        """Get the throughput and latency metrics of the requests made by this client.
+
+        Returns:
+            The metrics, which can be exported with `snapshot()` or `to_prometheus()`, or `None` if
+            `AdditionalConfig.metrics` was not enabled.
+        """
+        return self._connection._metrics
@@ -3,6 +3,7 @@ import time
 import uuid as uuid_package
 from typing import (
     AsyncGenerator,
+    Dict,
     Generator,
     List,
     Optional,
@@ -13,14 +14,19 @@ from typing import (
 from pydantic import ValidationError
 
 from weaviate.collections.batch.base import (
+    BATCH_LINGER_TIME,
     GCP_STREAM_TIMEOUT,
     ObjectsBatchRequest,
     ReferencesBatchRequest,
     _BatchDataWrapper,
+    _BatchMode,
     _BatchStreamRequest,
+    _max_batch_bytes,
     _ClusterBatchAsync,
+    _queue_depth_reporter,
 )
 from weaviate.collections.batch.grpc_batch import _BatchGRPC
+from weaviate.collections.batch.grpc_properties import _PropertySerializer
 from weaviate.collections.classes.batch import (
     BatchObject,
     BatchObjectReturn,
@@ -71,11 +77,21 @@ class _BatchBaseAsync:
         connection: ConnectionAsync,
         consistency_level: Optional[ConsistencyLevel],
         results: _BatchDataWrapper,
+        batch_mode: Optional[_BatchMode] = None,
         objects: Optional[ObjectsBatchRequest[BatchObject]] = None,
         references: Optional[ReferencesBatchRequest[BatchReference]] = None,
+        property_serializers: Optional[Dict[str, _PropertySerializer]] = None,
     ) -> None:
-        self.__batch_objects = objects or ObjectsBatchRequest[BatchObject]()
-        self.__batch_references = references or ReferencesBatchRequest[BatchReference]()
+        # both queues share a condition so that the batching loop wakes up when either of them receives items
+        acondition = asyncio.Condition()
+        self.__batch_objects = objects or ObjectsBatchRequest[BatchObject](
+            acondition=acondition, on_depth_change=_queue_depth_reporter(connection)
+        )
+        self.__batch_references = references or ReferencesBatchRequest[BatchReference](
+            acondition=acondition
+        )
+        self.__linger = batch_mode.linger if batch_mode is not None else BATCH_LINGER_TIME
+        self.__is_flushing = asyncio.Event()
 
         self.__connection = connection
         self.__is_gcp_on_wcd = connection._connection_params.is_gcp_on_wcd()
@@ -84,8 +100,12 @@ class _BatchBaseAsync:
         self.__batch_size = 100
 
         self.__batch_grpc = _BatchGRPC(
-            connection._weaviate_version, self.__consistency_level, connection._grpc_max_msg_size
+            connection._weaviate_version,
+            self.__consistency_level,
+            connection._grpc_max_msg_size,
+            property_serializers,
         )
+        self.__max_batch_bytes = _max_batch_bytes(batch_mode, self.__batch_grpc.grpc_max_msg_size)
         self.__cluster = _ClusterBatchAsync(self.__connection)
 
         # lookup table for objects that are currently being processed - is used to not send references from objects that have not been added yet
@@ -204,6 +224,7 @@ class _BatchBaseAsync:
 
     async def _shutdown(self) -> None:
         self.__is_stopped.set()
+        await self.__batch_objects.anotify()
 
     async def __put(self, req: _BatchStreamRequest | None):
         try:
@@ -217,20 +238,20 @@ class _BatchBaseAsync:
     async def __loop(self) -> None:
         refresh_time: float = 0.01
         while self.__bg_exception is None and not self.__shutdown_loop.is_set():
-            if len(self.__batch_objects) + len(self.__batch_references) > 0:
-                start = time.time()
-                while (len_o := len(self.__batch_objects)) + (
-                    len_r := len(self.__batch_references)
-                ) < self.__batch_size:
-                    # wait for more objects to be added up to the batch size
-                    await asyncio.sleep(refresh_time)
-                    if time.time() - start >= 1 and (
-                        len_o == len(self.__batch_objects) and len_r == len(self.__batch_references)
-                    ):
-                        # no new objects were added in the last second, exit the loop
-                        break
+            if self.__queued() > 0:
+                # wait for more objects to be added up to the batch size, for at most the linger time
+                await self.__batch_objects.await_for(
+                    lambda: self.__queued() >= self.__batch_size
+                    or self.__batch_objects.size_in_bytes() >= self.__max_batch_bytes
+                    or self.__is_flushing.is_set()
+                    or self.__is_stopped.is_set()
+                    or self.__shutdown_loop.is_set(),
+                    timeout=self.__linger,
+                )
 
-                objs = await self.__batch_objects.apop_items(self.__batch_size)
+                objs = await self.__batch_objects.apop_items(
+                    self.__batch_size, max_bytes=self.__max_batch_bytes
+                )
                 async with self.__uuid_lookup_lock:
                     refs = await self.__batch_references.apop_items(
                         self.__batch_size - len(objs),
@@ -258,16 +279,28 @@ class _BatchBaseAsync:
                     if not await self.__put(req):
                         logger.info("Batch loop is shutting down, stopping putting new requests...")
                         return
-            elif (
-                self.__is_stopped.is_set()
-                and not self.__is_hungup.is_set()
-                and not self.__is_shutting_down.is_set()
-                and not self.__is_oom.is_set()
-            ):
-                await self.__put(None)
-                logger.info("Sent sentinel, stopping batch loop...")
-                return
-            await asyncio.sleep(refresh_time)
+            elif self.__is_stopped.is_set():
+                if (
+                    not self.__is_hungup.is_set()
+                    and not self.__is_shutting_down.is_set()
+                    and not self.__is_oom.is_set()
+                ):
+                    await self.__put(None)
+                    logger.info("Sent sentinel, stopping batch loop...")
+                    return
+                # wait for the stream to be re-established before sending the sentinel
+                await asyncio.sleep(refresh_time)
+            else:
+                # sleep until items are added or the batch is stopped
+                await self.__batch_objects.await_for(
+                    lambda: self.__queued() > 0
+                    or self.__is_stopped.is_set()
+                    or self.__shutdown_loop.is_set(),
+                    timeout=1,
+                )
+
+    def __queued(self) -> int:
+        return len(self.__batch_objects) + len(self.__batch_references)
 
     def __generate_stream_requests(
         self,
@@ -279,6 +312,11 @@ class _BatchBaseAsync:
         def request_maker():
             return batch_pb2.BatchStreamRequest()
 
+        def request_done(request, total_size, uuids, beacons) -> _BatchStreamRequest:
+            if (n_objs := len(request.data.objects.values)) > 0:
+                self.__results_for_wrapper.results._add_request(total_size, n_objs)
+            return _BatchStreamRequest(request, uuids, beacons)
+
         request = request_maker()
         total_size = request.ByteSize()
 
@@ -292,8 +330,8 @@ class _BatchBaseAsync:
                     f"Object with uuid {object_.uuid} is too large to be sent in a batch request. Size: {obj_size} bytes, max size: {self.__batch_grpc.grpc_max_msg_size} bytes."
                 )
 
-            if total_size + obj_size >= self.__batch_grpc.grpc_max_msg_size:
-                yield _BatchStreamRequest(request, uuids, beacons)
+            if total_size + obj_size >= self.__max_batch_bytes and len(uuids) > 0:
+                yield request_done(request, total_size, uuids, beacons)
                 request = request_maker()
                 total_size = request.ByteSize()
                 uuids, beacons = set(), set()
@@ -306,8 +344,8 @@ class _BatchBaseAsync:
             ref = self.__batch_grpc.grpc_reference(reference._to_internal())
             ref_size = ref.ByteSize() + per_object_overhead
 
-            if total_size + ref_size >= self.__batch_grpc.grpc_max_msg_size:
-                yield _BatchStreamRequest(request, uuids, beacons)
+            if total_size + ref_size >= self.__max_batch_bytes and len(uuids) + len(beacons) > 0:
+                yield request_done(request, total_size, uuids, beacons)
                 request = request_maker()
                 total_size = request.ByteSize()
                 uuids, beacons = set(), set()
@@ -317,7 +355,7 @@ class _BatchBaseAsync:
             beacons.add(reference._to_beacon())
 
         if len(request.data.objects.values) > 0 or len(request.data.references.values) > 0:
-            yield _BatchStreamRequest(request, uuids, beacons)
+            yield request_done(request, total_size, uuids, beacons)
 
     async def __send(self) -> AsyncGenerator[batch_pb2.BatchStreamRequest, None]:
         yield batch_pb2.BatchStreamRequest(
@@ -500,6 +538,7 @@ class _BatchBaseAsync:
 
         logger.info("Server closed the stream from its side, shutting down batch")
         self.__shutdown_loop.set()
+        await self.__batch_objects.anotify()
 
     async def __reconnect(self, retry: int = 0) -> None:
         if self.__consistency_level == ConsistencyLevel.ALL or self.__number_of_nodes == 1:
@@ -529,9 +568,15 @@ class _BatchBaseAsync:
 
     async def flush(self) -> None:
         """Flush the batch queue and wait for all requests to be finished."""
-        # bg thread is sending objs+refs automatically, so simply wait for everything to be done
-        while len(self.__batch_objects) > 0 or len(self.__batch_references) > 0:
-            await asyncio.sleep(0.01)
+        # bg thread is sending objs+refs automatically, so simply wait for everything to be done. Queued objects are sent
+        # right away instead of waiting for the linger time
+        self.__is_flushing.set()
+        await self.__batch_objects.anotify()
+        try:
+            while len(self.__batch_objects) > 0 or len(self.__batch_references) > 0:
+                await asyncio.sleep(0.01)
+        finally:
+            self.__is_flushing.clear()
 
     async def _add_object(
         self,
@@ -11,14 +11,24 @@ from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generic, List, Optional, Set, TypeVar, Union, cast
+from typing import Any, Callable, Dict, Generic, List, Optional, Set, TypeVar, Union, cast
 
 from pydantic import ValidationError
 from typing_extensions import TypeAlias
 
 from weaviate.cluster.types import Node
-from weaviate.collections.batch.grpc_batch import _BatchGRPC
+from weaviate.collections.batch.controller import (
+    BatchClusterStats,
+    BatchController,
+    BatchRequestStats,
+)
+from weaviate.collections.batch.grpc_batch import (
+    _BatchGRPC,
+    _SerializationPool,
+)
+from weaviate.collections.batch.grpc_properties import _PropertySerializer
 from weaviate.collections.batch.rest import _BatchREST
+from weaviate.collections.batch.spill import _SpillLog
 from weaviate.collections.classes.batch import (
     BatchObject,
     BatchObjectReturn,
@@ -58,8 +68,9 @@ CONCURRENT_REQUESTS_DYNAMIC_VECTORIZER = 2
 BATCH_TIME_TARGET = 10
 VECTORIZER_BATCHING_STEP_SIZE = 48  # cohere max batch size is 96
 MAX_RETRIES = float(
-    os.getenv("WEAVIATE_BATCH_MAX_RETRIES", "9.299")
-)  # approximately 10m30s of waiting in worst case, e.g. server scale up event
+    os.getenv("WEAVIATE_BATCH_MAX_RETRIES", "25")
+)  # approximately 10m30s of waiting in worst case with the default backoff of the retry policy, e.g. server scale up event
+BATCH_LINGER_TIME = 1.0  # how long to wait for a batch to fill up before sending it anyway
 GCP_STREAM_TIMEOUT = (
     160  # GCP connections have a max lifetime of 180s, leave 20s of buffer as safety
 )
@@ -68,29 +79,122 @@ GCP_STREAM_TIMEOUT = (
 class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
     """`BatchRequest` abstract class used as a interface for batch requests."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        condition: Optional[threading.Condition] = None,
+        acondition: Optional[asyncio.Condition] = None,
+        spill: Optional[_SpillLog] = None,
+        on_load: Optional[Callable[[TBatchInput], None]] = None,
+        on_depth_change: Optional[Callable[[int], None]] = None,
+    ) -> None:
         self._items: List[TBatchInput] = []
-        self._lock = threading.Lock()
-        self._alock = asyncio.Lock()
+        # running total of the estimated sizes of the queued items, updated as items are added and popped
+        self._bytes = 0
+        # the conditions are notified whenever items are added. Queues that share them can be waited on together
+        self._lock = condition or threading.Condition()
+        self._alock = acondition or asyncio.Condition()
+        # if a spill log is given, all items are written to it and only up to its `max_in_memory` items are kept in memory.
+        # The others are loaded back as the queue drains. `on_load` is called for every item that is loaded into memory
+        self._spill = spill
+        self._on_load = on_load
+        # called with the new length whenever items are added or popped, e.g. to report the queue depth as a metric
+        self._on_depth_change = on_depth_change
+        self._offsets: Dict[Any, List[int]] = {}
+        self._refill()
 
     def __len__(self) -> int:
         with self._lock:
-            return len(self._items)
+            return self._len()
 
     async def alen(self) -> int:
         """Asynchronously get the length of the BatchRequest."""
         async with self._alock:
-            return len(self._items)
+            return self._len()
+
+    def _len(self) -> int:
+        return len(self._items) + (self._spill.unloaded if self._spill is not None else 0)
+
+    def spilled(self) -> int:
+        """Get the number of items that are stored on disk and not loaded into memory yet."""
+        with self._lock:
+            return self._spill.unloaded if self._spill is not None else 0
+
+    def _depth_changed(self) -> None:
+        if self._on_depth_change is not None:
+            self._on_depth_change(self._len())
+
+    def _spill_key(self, item: TBatchInput) -> Any:
+        """Get the key under which the offset of an item in the spill log is stored until it is acknowledged."""
+        return id(item)
+
+    def _append(self, item: TBatchInput) -> None:
+        if self._spill is None:
+            self._items.append(item)
+            self._bytes += self._size_of(item)
+            return
+        caught_up = self._spill.unloaded == 0
+        offset = self._spill.append(item)
+        if caught_up and len(self._items) < self._spill.max_in_memory:
+            self._spill.skip_unloaded()
+            self._load(item, offset)
+
+    def _load(self, item: TBatchInput, offset: int) -> None:
+        self._items.append(item)
+        self._bytes += self._size_of(item)
+        self._offsets.setdefault(self._spill_key(item), []).append(offset)
+        if self._on_load is not None:
+            self._on_load(item)
+
+    def _refill(self) -> None:
+        if self._spill is None or self._spill.unloaded == 0:
+            return
+        for offset, item in self._spill.load(self._spill.max_in_memory - len(self._items)):
+            self._load(item, offset)
+
+    def ack(self, items: List[TBatchInput]) -> None:
+        """Acknowledge that the given items were sent, so that they are not sent again when a spilled batch is resumed."""
+        if self._spill is None:
+            return
+        with self._lock:
+            offsets: List[int] = []
+            for item in items:
+                key = self._spill_key(item)
+                if (item_offsets := self._offsets.get(key)) is None:
+                    continue
+                offsets.append(item_offsets.pop(0))
+                if len(item_offsets) == 0:
+                    del self._offsets[key]
+            self._spill.ack(offsets)
+
+    def close(self) -> None:
+        """Close the spill log of the BatchRequest, if any."""
+        if self._spill is None:
+            return
+        with self._lock:
+            self._spill.close()
+
+    def size_in_bytes(self) -> int:
+        """Get the estimated size in bytes of all items in the BatchRequest."""
+        with self._lock:
+            return self._bytes
+
+    def _size_of(self, item: TBatchInput) -> int:
+        """Get the estimated size in bytes of a single item, only objects are assembled by their size."""
+        return 0
 
     def add(self, item: TBatchInput) -> None:
         """Add an item to the BatchRequest."""
         with self._lock:
-            self._items.append(item)
+            self._append(item)
+            self._depth_changed()
+            self._lock.notify_all()
 
     async def aadd(self, item: TBatchInput) -> None:
         """Asynchronously add an item to the BatchRequest."""
         async with self._alock:
-            self._items.append(item)
+            self._append(item)
+            self._depth_changed()
+            self._alock.notify_all()
 
     def prepend(self, item: List[TBatchInput]) -> None:
         """Add items to the front of the BatchRequest.
@@ -99,6 +203,9 @@ class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
         """
         with self._lock:
             self._items = item + self._items
+            self._bytes += sum(self._size_of(i) for i in item)
+            self._depth_changed()
+            self._lock.notify_all()
 
     async def aprepend(self, item: List[TBatchInput]) -> None:
         """Asynchronously add items to the front of the BatchRequest.
@@ -107,6 +214,45 @@ class BatchRequest(ABC, Generic[TBatchInput, TBatchReturn]):
         """
         async with self._alock:
             self._items = item + self._items
+            self._bytes += sum(self._size_of(i) for i in item)
+            self._depth_changed()
+            self._alock.notify_all()
+
+    def wait(self, predicate: Callable[[], bool], timeout: float) -> bool:
+        """Block until `predicate` is true or `timeout` seconds have passed.
+
+        The predicate is re-evaluated whenever items are added to this or any queue sharing its condition, or when `notify`
+        is called.
+
+        Returns:
+            The last result of the predicate.
+        """
+        with self._lock:
+            return self._lock.wait_for(predicate, timeout)
+
+    async def await_for(self, predicate: Callable[[], bool], timeout: float) -> bool:
+        """Asynchronously wait until `predicate` is true or `timeout` seconds have passed, see `wait`.
+
+        The predicate must not use the async methods of the queue, as it is evaluated while holding the async lock.
+
+        Returns:
+            The last result of the predicate.
+        """
+        async with self._alock:
+            try:
+                return await asyncio.wait_for(self._alock.wait_for(predicate), timeout)
+            except asyncio.TimeoutError:
+                return predicate()
+
+    def notify(self) -> None:
+        """Wake up all waiters so that they re-evaluate their predicates, e.g. after the batch was stopped."""
+        with self._lock:
+            self._lock.notify_all()
+
+    async def anotify(self) -> None:
+        """Asynchronously wake up all waiters so that they re-evaluate their predicates, see `notify`."""
+        async with self._alock:
+            self._alock.notify_all()
 
 
 Ref = TypeVar("Ref", bound=BatchReference)
@@ -126,6 +272,8 @@ class ReferencesBatchRequest(BatchRequest[Ref, BatchReferenceReturn]):
                 ret.append(self._items.pop(i))
             else:
                 i += 1
+        self._refill()
+        self._depth_changed()
         return ret
 
     def pop_items(self, pop_amount: int, uuid_lookup: Set[str]) -> List[Ref]:
@@ -176,32 +324,56 @@ Obj = TypeVar("Obj", bound=BatchObject)
 class ObjectsBatchRequest(Generic[Obj], BatchRequest[Obj, BatchObjectReturn]):
     """Collect objects for one batch request to weaviate."""
 
-    def __pop_items(self, pop_amount: int) -> List[Obj]:
+    def _size_of(self, item: Obj) -> int:
+        return item._size
+
+    def _spill_key(self, item: Obj) -> Any:
+        # retried objects are re-created from their internal representation, so they are identified by their uuid
+        return str(item.uuid)
+
+    def __pop_items(self, pop_amount: int, max_bytes: Optional[int]) -> List[Obj]:
+        if max_bytes is not None and self._bytes > max_bytes:
+            # take objects until the byte budget is used up, but always at least one so that large objects are sent too
+            size = 0
+            for i, item in enumerate(self._items[:pop_amount]):
+                size += item._size
+                if size > max_bytes and i > 0:
+                    pop_amount = i
+                    break
         if pop_amount >= len(self._items):
             ret = copy(self._items)
             self._items.clear()
+            self._bytes = 0
         else:
             ret = copy(self._items[:pop_amount])
             self._items = self._items[pop_amount:]
+            self._bytes -= sum(item._size for item in ret)
+        self._refill()
+        self._depth_changed()
         return ret
 
-    def pop_items(self, pop_amount: int) -> List[Obj]:
+    def pop_items(self, pop_amount: int, max_bytes: Optional[int] = None) -> List[Obj]:
         """Pop the given number of items from the BatchRequest queue.
 
+        Args:
+            pop_amount: The maximum number of items to pop.
+            max_bytes: The maximum estimated size in bytes of the popped items. At least one item is popped regardless of
+                its size. If not provided, the items are only limited by their number.
+
         Returns:
             A list of items from the BatchRequest.
         """
         with self._lock:
-            return self.__pop_items(pop_amount)
+            return self.__pop_items(pop_amount, max_bytes)
 
-    async def apop_items(self, pop_amount: int) -> List[Obj]:
-        """Asynchronously pop the given number of items from the BatchRequest queue.
+    async def apop_items(self, pop_amount: int, max_bytes: Optional[int] = None) -> List[Obj]:
+        """Asynchronously pop the given number of items from the BatchRequest queue, see `pop_items`.
 
         Returns:
             A list of items from the BatchRequest.
         """
         async with self._alock:
-            return self.__pop_items(pop_amount)
+            return self.__pop_items(pop_amount, max_bytes)
 
     def __head(self) -> Optional[Obj]:
         if len(self._items) > 0:
@@ -244,23 +416,34 @@ class _BatchDataWrapper:
 
 @dataclass
 class _DynamicBatching:
-    pass
+    controller: Optional[BatchController] = None
+    linger: float = BATCH_LINGER_TIME
+    batch_bytes: Optional[int] = None
+    spill_dir: Optional[str] = None
 
 
 @dataclass
 class _FixedSizeBatching:
     batch_size: int
     concurrent_requests: int
+    linger: float = BATCH_LINGER_TIME
+    batch_bytes: Optional[int] = None
+    spill_dir: Optional[str] = None
 
 
 @dataclass
 class _RateLimitedBatching:
     requests_per_minute: int
+    linger: float = BATCH_LINGER_TIME
+    batch_bytes: Optional[int] = None
+    spill_dir: Optional[str] = None
 
 
 @dataclass
 class _ServerSideBatching:
     concurrency: int
+    linger: float = BATCH_LINGER_TIME
+    batch_bytes: Optional[int] = None
 
 
 _BatchMode: TypeAlias = Union[
@@ -268,6 +451,22 @@ _BatchMode: TypeAlias = Union[
 ]
 
 
+def _max_batch_bytes(batch_mode: Optional[_BatchMode], grpc_max_msg_size: int) -> int:
+    """Get the byte budget of a single request, which never exceeds the maximum gRPC message size."""
+    if batch_mode is None or batch_mode.batch_bytes is None:
+        return grpc_max_msg_size
+    return min(batch_mode.batch_bytes, grpc_max_msg_size)
+
+
+def _queue_depth_reporter(
+    connection: Union[ConnectionSync, ConnectionAsync],
+) -> Optional[Callable[[int], None]]:
+    """Return a callback that reports the number of queued objects to the metrics of the connection, if enabled."""
+    if connection._metrics is None:
+        return None
+    return connection._metrics._set_batch_queue_depth
+
+
 class _BatchBase:
     def __init__(
         self,
@@ -279,22 +478,44 @@ class _BatchBase:
         vectorizer_batching: bool,
         objects: Optional[ObjectsBatchRequest[BatchObject]] = None,
         references: Optional[ReferencesBatchRequest[BatchReference]] = None,
+        property_serializers: Optional[Dict[str, _PropertySerializer]] = None,
+        serialization_processes: Optional[int] = None,
     ) -> None:
-        self.__batch_objects = objects or ObjectsBatchRequest[BatchObject]()
-        self.__batch_references = references or ReferencesBatchRequest[BatchReference]()
+        # lookup table for objects that are currently being processed - is used to not send references from objects that have not been added yet
+        self.__uuid_lookup: Set[str] = set()
+
+        # both queues share a condition so that the sending thread wakes up when either of them receives items
+        condition = threading.Condition()
+        spill_dir = (
+            batch_mode.spill_dir if not isinstance(batch_mode, _ServerSideBatching) else None
+        )
+        # with a spill directory, objects are only tracked in the uuid lookup once they are loaded into memory
+        self.__spilling = spill_dir is not None
+        self.__batch_objects = objects or ObjectsBatchRequest[BatchObject](
+            condition,
+            spill=_SpillLog(os.path.join(spill_dir, "objects")) if spill_dir is not None else None,
+            on_load=lambda obj: self.__uuid_lookup.add(str(obj.uuid)),
+            on_depth_change=_queue_depth_reporter(connection),
+        )
+        self.__batch_references = references or ReferencesBatchRequest[BatchReference](
+            condition,
+            spill=(
+                _SpillLog(os.path.join(spill_dir, "references")) if spill_dir is not None else None
+            ),
+        )
 
         self.__connection = connection
         self.__consistency_level: Optional[ConsistencyLevel] = consistency_level
         self.__vectorizer_batching = vectorizer_batching
 
         self.__batch_grpc = _BatchGRPC(
-            connection._weaviate_version, self.__consistency_level, connection._grpc_max_msg_size
+            connection._weaviate_version,
+            self.__consistency_level,
+            connection._grpc_max_msg_size,
+            property_serializers,
         )
         self.__batch_rest = _BatchREST(self.__consistency_level)
 
-        # lookup table for objects that are currently being processed - is used to not send references from objects that have not been added yet
-        self.__uuid_lookup: Set[str] = set()
-
         # we do not want that users can access the results directly as they are not thread-safe
         self.__results_for_wrapper_backup = results
         self.__results_for_wrapper = _BatchDataWrapper()
@@ -303,14 +524,30 @@ class _BatchBase:
 
         self.__batching_mode: _BatchMode = batch_mode
         self.__max_batch_size: int = 1000
+        self.__linger = batch_mode.linger
+        self.__max_batch_bytes = _max_batch_bytes(batch_mode, self.__batch_grpc.grpc_max_msg_size)
+        self.__is_flushing = threading.Event()
 
         self.__executor = executor
+        self.__serialization_pool = (
+            _SerializationPool(self.__batch_grpc, serialization_processes)
+            if serialization_processes is not None
+            else None
+        )
         self.__objs_count = 0
         self.__refs_count = 0
         self.__objs_logs_count = 0
         self.__refs_logs_count = 0
 
-        if isinstance(self.__batching_mode, _FixedSizeBatching):
+        self.__controller = (
+            self.__batching_mode.controller
+            if isinstance(self.__batching_mode, _DynamicBatching)
+            else None
+        )
+        if self.__controller is not None:
+            self.__recommended_num_objects = self.__controller.batch_size
+            self.__concurrent_requests = self.__controller.concurrent_requests
+        elif isinstance(self.__batching_mode, _FixedSizeBatching):
             self.__recommended_num_objects = self.__batching_mode.batch_size
             self.__concurrent_requests = self.__batching_mode.concurrent_requests
         elif isinstance(self.__batching_mode, _RateLimitedBatching):
@@ -375,8 +612,13 @@ class _BatchBase:
 
         # we are done, shut bg threads down and end the event loop
         self.__shut_background_thread_down.set()
+        self.__batch_objects.notify()
         while self.__bg_threads.is_alive():
             time.sleep(0.01)
+        self.__batch_objects.close()
+        self.__batch_references.close()
+        if self.__serialization_pool is not None:
+            self.__serialization_pool.shutdown()
 
         # copy the results to the public results
         self.__results_for_wrapper_backup.results = self.__results_for_wrapper.results
@@ -388,6 +630,18 @@ class _BatchBase:
             self.__results_for_wrapper.imported_shards
         )
 
+    def __is_sendable(self) -> bool:
+        return self.__active_requests < self.__concurrent_requests and (
+            len(self.__batch_objects) + len(self.__batch_references) > 0
+        )
+
+    def __is_batch_full(self) -> bool:
+        return (
+            len(self.__batch_objects) >= self.__recommended_num_objects
+            or self.__batch_objects.size_in_bytes() >= self.__max_batch_bytes
+            or len(self.__batch_references) >= self.__recommended_num_refs
+        )
+
     def __batch_send(self) -> None:
         refresh_time: float = 0.01
         while (
@@ -401,8 +655,11 @@ class _BatchBase:
                 ):
                     time.sleep(1)
                     continue
-                refresh_time = 0
-            elif isinstance(self.__batching_mode, _DynamicBatching) and self.__vectorizer_batching:
+            elif (
+                isinstance(self.__batching_mode, _DynamicBatching)
+                and self.__vectorizer_batching
+                and self.__controller is None
+            ):
                 if self.__dynamic_batching_sleep_time > 0:
                     if (
                         time.time() - self.__time_stamp_last_request
@@ -411,39 +668,39 @@ class _BatchBase:
                         time.sleep(1)
                         continue
 
-            if (
-                self.__active_requests < self.__concurrent_requests
-                and len(self.__batch_objects) + len(self.__batch_references) > 0
-            ):
+            if self.__is_sendable():
                 self.__time_stamp_last_request = time.time()
 
                 self._batch_send = True
                 with self.__active_requests_lock:
                     self.__active_requests += 1
 
-                start = time.time()
-                while (len_o := len(self.__batch_objects)) < self.__recommended_num_objects and (
-                    len_r := len(self.__batch_references)
-                ) < self.__recommended_num_refs:
-                    # wait for more objects to be added up to the recommended number
-                    time.sleep(0.01)
-                    if (
-                        self.__shut_background_thread_down is not None
-                        and self.__shut_background_thread_down.is_set()
-                    ):
-                        # shutdown was requested, exit the loop
-                        break
-                    if time.time() - start >= 1 and (
-                        len_o == len(self.__batch_objects) and len_r == len(self.__batch_references)
-                    ):
-                        # no new objects were added in the last second, exit the loop
-                        break
+                # wait for more objects to be added up to the recommended number, for at most the linger time
+                self.__batch_objects.wait(
+                    lambda: self.__is_batch_full()
+                    or self.__is_flushing.is_set()
+                    or self.__shut_background_thread_down.is_set(),
+                    timeout=self.__linger,
+                )
 
-                objs = self.__batch_objects.pop_items(self.__recommended_num_objects)
-                refs = self.__batch_references.pop_items(
-                    self.__recommended_num_refs,
-                    uuid_lookup=self.__uuid_lookup,
+                objs = self.__batch_objects.pop_items(
+                    self.__recommended_num_objects, max_bytes=self.__max_batch_bytes
+                )
+                # references can only be checked against the uuid lookup once all earlier objects are loaded from disk
+                refs = (
+                    self.__batch_references.pop_items(
+                        self.__recommended_num_refs,
+                        uuid_lookup=self.__uuid_lookup,
+                    )
+                    if self.__batch_objects.spilled() == 0
+                    else []
                 )
+                if len(objs) == 0 and len(refs) == 0:
+                    # the queued references point to objects that are still being sent
+                    with self.__active_requests_lock:
+                        self.__active_requests -= 1
+                    self.__shut_background_thread_down.wait(refresh_time)
+                    continue
                 # do not block the thread - the results are written to a central (locked) list and we want to have multiple concurrent batch-requests
                 ctx = contextvars.copy_context()
                 self.__executor.submit(
@@ -455,8 +712,12 @@ class _BatchBase:
                         readd_rate_limit=isinstance(self.__batching_mode, _RateLimitedBatching),
                     ),
                 )
-
-            time.sleep(refresh_time)
+            else:
+                # sleep until items are added, a request finishes or the batch is shut down
+                self.__batch_objects.wait(
+                    lambda: self.__is_sendable() or self.__shut_background_thread_down.is_set(),
+                    timeout=1,
+                )
 
     def __dynamic_batch_rate_loop(self) -> None:
         refresh_time = 1
@@ -507,11 +768,36 @@ class _BatchBase:
 
         return demonBatchSend
 
+    def __apply_controller(self, controller: BatchController) -> None:
+        self.__recommended_num_objects = controller.batch_size
+        self.__concurrent_requests = controller.concurrent_requests
+
     def __dynamic_batching(self) -> None:
         status = self.__cluster.get_nodes_status()
+        if self.__controller is not None:
+            batch_stats = [node.get("batchStats", {}) for node in status]
+            reported = all(
+                "queueLength" in stats and "ratePerSecond" in stats for stats in batch_stats
+            )
+            self.__controller.on_cluster_stats(
+                BatchClusterStats(
+                    queue_length=(
+                        sum(stats["queueLength"] for stats in batch_stats) if reported else None
+                    ),
+                    rate_per_second=(
+                        sum(stats["ratePerSecond"] for stats in batch_stats) if reported else None
+                    ),
+                    nodes=len(status),
+                )
+            )
+            self.__apply_controller(self.__controller)
+            return
+
         if "batchStats" not in status[0] or "queueLength" not in status[0]["batchStats"]:
             # async indexing - just send a lot
-            self.__batching_mode = _FixedSizeBatching(1000, 10)
+            self.__batching_mode = _FixedSizeBatching(
+                1000, 10, self.__linger, self.__batching_mode.batch_bytes
+            )
             self.__recommended_num_objects = 1000
             self.__concurrent_requests = 10
             return
@@ -606,6 +892,11 @@ class _BatchBase:
     ) -> None:
         if (n_objs := len(objs)) > 0:
             start = time.time()
+            failed = False
+            with self.__results_lock:
+                self.__results_for_wrapper.results._add_request(
+                    sum(obj._size for obj in objs), n_objs
+                )
             try:
                 response_obj = executor.result(
                     self.__batch_grpc.objects(
@@ -613,6 +904,7 @@ class _BatchBase:
                         objects=[obj._to_internal() for obj in objs],
                         timeout=self.__connection.timeout_config.insert,
                         max_retries=MAX_RETRIES,
+                        serialization_pool=self.__serialization_pool,
                     )
                 )
                 if response_obj.has_errors:
@@ -623,6 +915,7 @@ class _BatchBase:
                         }
                     )
             except Exception as e:
+                failed = True
                 errors_obj = {
                     idx: ErrorObject(message=repr(e), object_=obj) for idx, obj in enumerate(objs)
                 }
@@ -699,6 +992,8 @@ class _BatchBase:
                         if i not in readded_objects
                     ],
                     elapsed_seconds=response_obj.elapsed_seconds,
+                    _compressed_request_bytes=response_obj._compressed_request_bytes,
+                    _compressed_wire_bytes=response_obj._compressed_wire_bytes,
                 )
                 if readd_rate_limit:
                     # for rate limited batching the timing is handled by the outer loop => no sleep here
@@ -715,6 +1010,7 @@ class _BatchBase:
                 self.__uuid_lookup.difference_update(
                     str(obj.uuid) for obj in objs if obj.uuid not in readded_uuids
                 )
+            self.__batch_objects.ack([obj for obj in objs if obj.uuid not in readded_uuids])
 
             if (n_obj_errs := len(response_obj.errors)) > 0 and self.__objs_logs_count < 30:
                 logger.error(
@@ -733,6 +1029,18 @@ class _BatchBase:
                 self.__results_for_wrapper.results.objs += response_obj
                 self.__results_for_wrapper.failed_objects.extend(response_obj.errors.values())
             self.__took_queue.append(time.time() - start)
+            if self.__controller is not None:
+                self.__controller.on_request_done(
+                    BatchRequestStats(
+                        started=start,
+                        took=response_obj.elapsed_seconds,
+                        objects=n_objs,
+                        errors=len(response_obj.errors),
+                        retries=len(readded_objects),
+                        failed=failed,
+                    )
+                )
+                self.__apply_controller(self.__controller)
 
         if (n_refs := len(refs)) > 0:
             start = time.time()
@@ -770,20 +1078,28 @@ class _BatchBase:
             with self.__results_lock:
                 self.__results_for_wrapper.results.refs += response_ref
                 self.__results_for_wrapper.failed_references.extend(response_ref.errors.values())
+            self.__batch_references.ack(refs)
 
         with self.__active_requests_lock:
             self.__active_requests -= 1
+        self.__batch_objects.notify()
 
     def flush(self) -> None:
         """Flush the batch queue and wait for all requests to be finished."""
-        # bg thread is sending objs+refs automatically, so simply wait for everything to be done
-        while (
-            self.__active_requests > 0
-            or len(self.__batch_objects) > 0
-            or len(self.__batch_references) > 0
-        ):
-            time.sleep(0.01)
-            self.__check_bg_threads_alive()
+        # bg thread is sending objs+refs automatically, so simply wait for everything to be done. Queued objects are sent
+        # right away instead of waiting for the linger time
+        self.__is_flushing.set()
+        self.__batch_objects.notify()
+        try:
+            while not self.__batch_objects.wait(
+                lambda: self.__active_requests == 0
+                and len(self.__batch_objects) == 0
+                and len(self.__batch_references) == 0,
+                timeout=1,
+            ):
+                self.__check_bg_threads_alive()
+        finally:
+            self.__is_flushing.clear()
 
     def _add_object(
         self,
@@ -811,14 +1127,18 @@ class _BatchBase:
             )
         except ValidationError as e:
             raise WeaviateBatchValidationError(repr(e))
-        self.__uuid_lookup.add(str(batch_object.uuid))
+        if not self.__spilling:
+            self.__uuid_lookup.add(str(batch_object.uuid))
         self.__batch_objects.add(batch_object)
 
         # block if queue gets too long or weaviate is overloaded - reading files is faster them sending them so we do
-        # not need a long queue
-        while (
-            self.__recommended_num_objects == 0
-            or len(self.__batch_objects) >= self.__recommended_num_objects * 2
+        # not need a long queue. A spilled queue keeps the objects that do not fit into memory on disk instead
+        while self.__recommended_num_objects == 0 or (
+            not self.__spilling
+            and (
+                len(self.__batch_objects) >= self.__recommended_num_objects * 2
+                or self.__batch_objects.size_in_bytes() >= self.__max_batch_bytes * 2
+            )
         ):
             self.__check_bg_threads_alive()
             time.sleep(0.01)
@@ -5,6 +5,7 @@ from typing_extensions import deprecated as typing_deprecated
 
 from weaviate.collections.batch.async_ import _BatchBaseAsync
 from weaviate.collections.batch.base import (
+    BATCH_LINGER_TIME,
     _BatchBase,
     _BatchDataWrapper,
     _DynamicBatching,
@@ -21,6 +22,7 @@ from weaviate.collections.batch.batch_wrapper import (
     _ContextManagerAsync,
     _ContextManagerSync,
 )
+from weaviate.collections.batch.controller import BatchController
 from weaviate.collections.batch.sync import _BatchBaseSync
 from weaviate.collections.classes.config import ConsistencyLevel, Vectorizers
 from weaviate.collections.classes.internal import ReferenceInput, ReferenceInputs
@@ -162,6 +164,7 @@ class _BatchClientWrapper(_BatchWrapper):
         super().__init__(connection, consistency_level)
         self.__config = config
         self._vectorizer_batching: Optional[bool] = None
+        self.__serialization_processes: Optional[int] = None
         self.__executor = ThreadPoolExecutor()
         # define one executor per client with it shared between all child batch contexts
 
@@ -204,11 +207,19 @@ class _BatchClientWrapper(_BatchWrapper):
                 batch_mode=self._batch_mode,
                 executor=self.__executor,
                 vectorizer_batching=self._vectorizer_batching,
+                serialization_processes=self.__serialization_processes,
             )
         )
 
     def dynamic(
-        self, consistency_level: Optional[ConsistencyLevel] = None
+        self,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        *,
+        linger: float = BATCH_LINGER_TIME,
+        batch_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        controller: Optional[BatchController] = None,
+        serialization_processes: Optional[int] = None,
     ) -> ClientBatchingContextManager:
         """Configure dynamic batching.
 
@@ -216,9 +227,25 @@ class _BatchClientWrapper(_BatchWrapper):
 
         Args:
             consistency_level: The consistency level to be used to send batches. If not provided, the default value is `None`.
+            linger: The maximum time in seconds that queued objects wait for a batch to fill up before they are sent. Lower values
+                make objects visible sooner, higher values allow for larger batches. If not provided, the default value is 1 second.
+            batch_bytes: The target size in bytes of the objects sent in one request. Batches are cut off once the estimated size
+                of their objects reaches this value, so that large objects are sent in smaller batches. If not provided, batches
+                are only limited by the maximum gRPC message size.
+            spill_dir: A directory in which the queued objects and references are stored until they are sent. Only a bounded number
+                of them is kept in memory, so objects can be added far ahead of the server. If the directory contains the queue of
+                an earlier batch that did not finish, e.g. because of a crash, its unsent objects and references are sent first.
+                The directory should only be writable by trusted users, as the queued items are read back from it.
+                If not provided, the queue is kept in memory.
+            controller: The strategy that adjusts the batch size and the number of concurrent requests to the load of the cluster,
+                e.g. `wvc.batch.AIMDBatchController()`. If not provided, the built-in heuristics are used.
+            serialization_processes: The number of worker processes that translate the objects to serialized gRPC messages. Building
+                the messages is CPU-bound and holds the GIL, so the workers spread it across cores. They are started with the batch
+                and stopped when it finishes. If not provided, the objects are serialized in the batching thread.
         """
-        self._batch_mode: _BatchMode = _DynamicBatching()
+        self._batch_mode: _BatchMode = _DynamicBatching(controller, linger, batch_bytes, spill_dir)
         self._consistency_level = consistency_level
+        self.__serialization_processes = serialization_processes
         return self.__create_batch_and_reset(_BatchClient)
 
     def fixed_size(
@@ -226,6 +253,11 @@ class _BatchClientWrapper(_BatchWrapper):
         batch_size: int = 100,
         concurrent_requests: int = 2,
         consistency_level: Optional[ConsistencyLevel] = None,
+        *,
+        linger: float = BATCH_LINGER_TIME,
+        batch_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        serialization_processes: Optional[int] = None,
     ) -> ClientBatchingContextManager:
         """Configure fixed size batches. Note that the default is dynamic batching.
 
@@ -236,16 +268,34 @@ class _BatchClientWrapper(_BatchWrapper):
             concurrent_requests: The number of concurrent requests when sending batches. This controls the number of concurrent requests
                 made to Weaviate and not the speed of batch creation within Python.
             consistency_level: The consistency level to be used to send batches. If not provided, the default value is `None`.
-
+            linger: The maximum time in seconds that queued objects wait for a batch to fill up before they are sent. Lower values
+                make objects visible sooner, higher values allow for larger batches. If not provided, the default value is 1 second.
+            batch_bytes: The target size in bytes of the objects sent in one request. Batches are cut off once the estimated size
+                of their objects reaches this value, so that large objects are sent in smaller batches. If not provided, batches
+                are only limited by the maximum gRPC message size.
+            spill_dir: A directory in which the queued objects and references are stored until they are sent. Only a bounded number
+                of them is kept in memory, so objects can be added far ahead of the server. If the directory contains the queue of
+                an earlier batch that did not finish, e.g. because of a crash, its unsent objects and references are sent first.
+                The directory should only be writable by trusted users, as the queued items are read back from it.
+                If not provided, the queue is kept in memory.
+            serialization_processes: The number of worker processes that translate the objects to serialized gRPC messages. Building
+                the messages is CPU-bound and holds the GIL, so the workers spread it across cores. They are started with the batch
+                and stopped when it finishes. If not provided, the objects are serialized in the batching thread.
         """
-        self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests)
+        self._batch_mode = _FixedSizeBatching(
+            batch_size, concurrent_requests, linger, batch_bytes, spill_dir
+        )
         self._consistency_level = consistency_level
+        self.__serialization_processes = serialization_processes
         return self.__create_batch_and_reset(_BatchClient)
 
     def rate_limit(
         self,
         requests_per_minute: int,
         consistency_level: Optional[ConsistencyLevel] = None,
+        *,
+        batch_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
     ) -> ClientBatchingContextManager:
         """Configure batches with a rate limited vectorizer.
 
@@ -254,9 +304,20 @@ class _BatchClientWrapper(_BatchWrapper):
         Args:
             requests_per_minute: The number of requests that the vectorizer can process per minute.
             consistency_level: The consistency level to be used to send batches. If not provided, the default value is `None`.
+            batch_bytes: The target size in bytes of the objects sent in one request. Batches are cut off once the estimated size
+                of their objects reaches this value, so that large objects are sent in smaller batches. If not provided, batches
+                are only limited by the maximum gRPC message size.
+            spill_dir: A directory in which the queued objects and references are stored until they are sent. Only a bounded number
+                of them is kept in memory, so objects can be added far ahead of the server. If the directory contains the queue of
+                an earlier batch that did not finish, e.g. because of a crash, its unsent objects and references are sent first.
+                The directory should only be writable by trusted users, as the queued items are read back from it.
+                If not provided, the queue is kept in memory.
         """
-        self._batch_mode = _RateLimitedBatching(requests_per_minute)
+        self._batch_mode = _RateLimitedBatching(
+            requests_per_minute, batch_bytes=batch_bytes, spill_dir=spill_dir
+        )
         self._consistency_level = consistency_level
+        self.__serialization_processes = None
         return self.__create_batch_and_reset(_BatchClient)
 
     @docstring_deprecated(
@@ -277,6 +338,9 @@ class _BatchClientWrapper(_BatchWrapper):
         *,
         concurrency: Optional[int] = None,
         consistency_level: Optional[ConsistencyLevel] = None,
+        linger: float = BATCH_LINGER_TIME,
+        batch_bytes: Optional[int] = None,
+        serialization_processes: Optional[int] = None,
     ) -> ClientBatchingContextManager:
         """Configure the batching context manager to use batch streaming.
 
@@ -285,6 +349,14 @@ class _BatchClientWrapper(_BatchWrapper):
         Args:
             concurrency: The number of concurrent streams to use when sending batches. If not provided, the default will be one.
             consistency_level: The consistency level to be used when inserting data. If not provided, the default value is `None`.
+            linger: The maximum time in seconds that queued objects wait for a batch to fill up before they are sent. Lower values
+                make objects visible sooner, higher values allow for larger batches. If not provided, the default value is 1 second.
+            batch_bytes: The target size in bytes of the objects sent in one request. Batches are cut off once the estimated size
+                of their objects reaches this value, so that large objects are sent in smaller batches. If not provided, batches
+                are only limited by the maximum gRPC message size.
+            serialization_processes: The number of worker processes that translate the objects to serialized gRPC messages. Building
+                the messages is CPU-bound and holds the GIL, so the workers spread it across cores. They are started with the batch
+                and stopped when it finishes. If not provided, the objects are serialized in the batching thread.
         """
         if self._connection._weaviate_version.is_lower_than(1, 36, 0):
             raise WeaviateUnsupportedFeatureError(
@@ -295,8 +367,11 @@ class _BatchClientWrapper(_BatchWrapper):
             # if concurrency is not None
             # else len(self._cluster.get_nodes_status())
             concurrency=1,  # hard-code until client-side multi-threading is fixed
+            linger=linger,
+            batch_bytes=batch_bytes,
         )
         self._consistency_level = consistency_level
+        self.__serialization_processes = serialization_processes
         return self.__create_batch_and_reset(_BatchClientSync)
 
 
@@ -315,6 +390,7 @@ class _BatchClientWrapperAsync(_BatchWrapperAsync):
                 connection=self._connection,
                 consistency_level=self._consistency_level,
                 results=self._batch_data,
+                batch_mode=self._batch_mode,
             )
         )
 
@@ -336,6 +412,8 @@ class _BatchClientWrapperAsync(_BatchWrapperAsync):
         *,
         concurrency: Optional[int] = None,
         consistency_level: Optional[ConsistencyLevel] = None,
+        linger: float = BATCH_LINGER_TIME,
+        batch_bytes: Optional[int] = None,
     ) -> ClientBatchingContextManagerAsync:
         """Configure the batching context manager to use batch streaming.
 
@@ -344,6 +422,11 @@ class _BatchClientWrapperAsync(_BatchWrapperAsync):
         Args:
             concurrency: The number of concurrent streams to use when sending batches. If not provided, the default will be one.
             consistency_level: The consistency level to be used when inserting data. If not provided, the default value is `None`.
+            linger: The maximum time in seconds that queued objects wait for a batch to fill up before they are sent. Lower values
+                make objects visible sooner, higher values allow for larger batches. If not provided, the default value is 1 second.
+            batch_bytes: The target size in bytes of the objects sent in one request. Batches are cut off once the estimated size
+                of their objects reaches this value, so that large objects are sent in smaller batches. If not provided, batches
+                are only limited by the maximum gRPC message size.
         """
         if self._connection._weaviate_version.is_lower_than(1, 36, 0):
             raise WeaviateUnsupportedFeatureError(
@@ -354,6 +437,8 @@ class _BatchClientWrapperAsync(_BatchWrapperAsync):
             # if concurrency is not None
             # else len(self._cluster.get_nodes_status())
             concurrency=1,  # hard-code until client-side multi-threading is fixed
+            linger=linger,
+            batch_bytes=batch_bytes,
         )
         self._consistency_level = consistency_level
         return self.__create_batch_and_reset()
@@ -5,6 +5,7 @@ from typing_extensions import deprecated as typing_deprecated
 
 from weaviate.collections.batch.async_ import _BatchBaseAsync
 from weaviate.collections.batch.base import (
+    BATCH_LINGER_TIME,
     _BatchBase,
     _BatchDataWrapper,
     _BatchMode,
@@ -21,6 +22,8 @@ from weaviate.collections.batch.batch_wrapper import (
     _ContextManagerAsync,
     _ContextManagerSync,
 )
+from weaviate.collections.batch.controller import BatchController
+from weaviate.collections.batch.grpc_properties import _PropertySerializer
 from weaviate.collections.batch.sync import _BatchBaseSync
 from weaviate.collections.classes.config import ConsistencyLevel, Vectorizers
 from weaviate.collections.classes.internal import ReferenceInput, ReferenceInputs
@@ -45,6 +48,8 @@ class _BatchCollection(Generic[Properties], _BatchBase):
         name: str,
         tenant: Optional[str],
         vectorizer_batching: bool,
+        property_serializer: Optional[_PropertySerializer] = None,
+        serialization_processes: Optional[int] = None,
     ) -> None:
         super().__init__(
             connection=connection,
@@ -53,6 +58,8 @@ class _BatchCollection(Generic[Properties], _BatchBase):
             batch_mode=batch_mode,
             executor=executor,
             vectorizer_batching=vectorizer_batching,
+            property_serializers={name: property_serializer} if property_serializer else None,
+            serialization_processes=serialization_processes,
         )
         self.__name = name
         self.__tenant = tenant
@@ -96,6 +103,8 @@ class _BatchCollectionSync(Generic[Properties], _BatchBaseSync):
         executor: Optional[ThreadPoolExecutor] = None,
         batch_mode: Optional[_BatchMode] = None,
         vectorizer_batching: bool = False,
+        property_serializer: Optional[_PropertySerializer] = None,
+        serialization_processes: Optional[int] = None,
     ) -> None:
         super().__init__(
             connection=connection,
@@ -104,6 +113,8 @@ class _BatchCollectionSync(Generic[Properties], _BatchBaseSync):
             batch_mode=batch_mode,
             executor=executor,
             vectorizer_batching=vectorizer_batching,
+            property_serializers={name: property_serializer} if property_serializer else None,
+            serialization_processes=serialization_processes,
         )
         self.__name = name
         self.__tenant = tenant
@@ -144,11 +155,15 @@ class _BatchCollectionAsync(Generic[Properties], _BatchBaseAsync):
         results: _BatchDataWrapper,
         name: str,
         tenant: Optional[str],
+        batch_mode: Optional[_BatchMode] = None,
+        property_serializer: Optional[_PropertySerializer] = None,
     ) -> None:
         super().__init__(
             connection=connection,
             consistency_level=consistency_level,
             results=results,
+            batch_mode=batch_mode,
+            property_serializers={name: property_serializer} if property_serializer else None,
         )
         self.__name = name
         self.__tenant = tenant
@@ -210,6 +225,8 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
         self.__tenant = tenant
         self.__config = config
         self._vectorizer_batching: Optional[bool] = None
+        self.__property_serializer: Optional[_PropertySerializer] = None
+        self.__serialization_processes: Optional[int] = None
         self.__executor = ThreadPoolExecutor()
         # define one executor per client with it shared between all child batch contexts
         self.__batch_client = batch_client
@@ -223,6 +240,7 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
         if self._vectorizer_batching is None:
             try:
                 config = self.__config.get(simple=True)
+                self.__property_serializer = _PropertySerializer.from_config(config.properties)
                 if config.vector_config is not None:
                     vectorizer_batching = False
                     for vec_config in config.vector_config.values():
@@ -249,19 +267,54 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
                 name=self.__name,
                 tenant=self.__tenant,
                 vectorizer_batching=self._vectorizer_batching,
+                property_serializer=self.__property_serializer,
+                serialization_processes=self.__serialization_processes,
             )
         )
 
-    def dynamic(self) -> CollectionBatchingContextManager[Properties]:
+    def dynamic(
+        self,
+        *,
+        linger: float = BATCH_LINGER_TIME,
+        batch_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        controller: Optional[BatchController] = None,
+        serialization_processes: Optional[int] = None,
+    ) -> CollectionBatchingContextManager[Properties]:
         """Configure dynamic batching.
 
         When you exit the context manager, the final batch will be sent automatically.
+
+        Args:
+            linger: The maximum time in seconds that queued objects wait for a batch to fill up before they are sent. Lower values
+                make objects visible sooner, higher values allow for larger batches. If not provided, the default value is 1 second.
+            batch_bytes: The target size in bytes of the objects sent in one request. Batches are cut off once the estimated size
+                of their objects reaches this value, so that large objects are sent in smaller batches. If not provided, batches
+                are only limited by the maximum gRPC message size.
+            spill_dir: A directory in which the queued objects and references are stored until they are sent. Only a bounded number
+                of them is kept in memory, so objects can be added far ahead of the server. If the directory contains the queue of
+                an earlier batch that did not finish, e.g. because of a crash, its unsent objects and references are sent first.
+                The directory should only be writable by trusted users, as the queued items are read back from it.
+                If not provided, the queue is kept in memory.
+            controller: The strategy that adjusts the batch size and the number of concurrent requests to the load of the cluster,
+                e.g. `wvc.batch.AIMDBatchController()`. If not provided, the built-in heuristics are used.
+            serialization_processes: The number of worker processes that translate the objects to serialized gRPC messages. Building
+                the messages is CPU-bound and holds the GIL, so the workers spread it across cores. They are started with the batch
+                and stopped when it finishes. If not provided, the objects are serialized in the batching thread.
         """
-        self._batch_mode: _BatchMode = _DynamicBatching()
+        self._batch_mode: _BatchMode = _DynamicBatching(controller, linger, batch_bytes, spill_dir)
+        self.__serialization_processes = serialization_processes
         return self.__create_batch_and_reset(_BatchCollection)
 
     def fixed_size(
-        self, batch_size: int = 100, concurrent_requests: int = 2
+        self,
+        batch_size: int = 100,
+        concurrent_requests: int = 2,
+        *,
+        linger: float = BATCH_LINGER_TIME,
+        batch_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        serialization_processes: Optional[int] = None,
     ) -> CollectionBatchingContextManager[Properties]:
         """Configure fixed size batches. Note that the default is dynamic batching.
 
@@ -271,19 +324,52 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
             batch_size: The number of objects/references to be sent in one batch. If not provided, the default value is 100.
             concurrent_requests: The number of concurrent requests when sending batches. This controls the number of concurrent requests
                 made to Weaviate and not the speed of batch creation within Python.
+            linger: The maximum time in seconds that queued objects wait for a batch to fill up before they are sent. Lower values
+                make objects visible sooner, higher values allow for larger batches. If not provided, the default value is 1 second.
+            batch_bytes: The target size in bytes of the objects sent in one request. Batches are cut off once the estimated size
+                of their objects reaches this value, so that large objects are sent in smaller batches. If not provided, batches
+                are only limited by the maximum gRPC message size.
+            spill_dir: A directory in which the queued objects and references are stored until they are sent. Only a bounded number
+                of them is kept in memory, so objects can be added far ahead of the server. If the directory contains the queue of
+                an earlier batch that did not finish, e.g. because of a crash, its unsent objects and references are sent first.
+                The directory should only be writable by trusted users, as the queued items are read back from it.
+                If not provided, the queue is kept in memory.
+            serialization_processes: The number of worker processes that translate the objects to serialized gRPC messages. Building
+                the messages is CPU-bound and holds the GIL, so the workers spread it across cores. They are started with the batch
+                and stopped when it finishes. If not provided, the objects are serialized in the batching thread.
         """
-        self._batch_mode = _FixedSizeBatching(batch_size, concurrent_requests)
+        self._batch_mode = _FixedSizeBatching(
+            batch_size, concurrent_requests, linger, batch_bytes, spill_dir
+        )
+        self.__serialization_processes = serialization_processes
         return self.__create_batch_and_reset(_BatchCollection)
 
-    def rate_limit(self, requests_per_minute: int) -> CollectionBatchingContextManager[Properties]:
+    def rate_limit(
+        self,
+        requests_per_minute: int,
+        *,
+        batch_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ) -> CollectionBatchingContextManager[Properties]:
         """Configure batches with a rate limited vectorizer.
 
         When you exit the context manager, the final batch will be sent automatically.
 
         Args:
             requests_per_minute: The number of requests that the vectorizer can process per minute.
+            batch_bytes: The target size in bytes of the objects sent in one request. Batches are cut off once the estimated size
+                of their objects reaches this value, so that large objects are sent in smaller batches. If not provided, batches
+                are only limited by the maximum gRPC message size.
+            spill_dir: A directory in which the queued objects and references are stored until they are sent. Only a bounded number
+                of them is kept in memory, so objects can be added far ahead of the server. If the directory contains the queue of
+                an earlier batch that did not finish, e.g. because of a crash, its unsent objects and references are sent first.
+                The directory should only be writable by trusted users, as the queued items are read back from it.
+                If not provided, the queue is kept in memory.
         """
-        self._batch_mode = _RateLimitedBatching(requests_per_minute)
+        self._batch_mode = _RateLimitedBatching(
+            requests_per_minute, batch_bytes=batch_bytes, spill_dir=spill_dir
+        )
+        self.__serialization_processes = None
         return self.__create_batch_and_reset(_BatchCollection)
 
     @docstring_deprecated(
@@ -302,6 +388,9 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
         self,
         *,
         concurrency: Optional[int] = None,
+        linger: float = BATCH_LINGER_TIME,
+        batch_bytes: Optional[int] = None,
+        serialization_processes: Optional[int] = None,
     ) -> CollectionBatchingContextManager[Properties]:
         """Configure the batching context manager to use batch streaming.
 
@@ -310,6 +399,14 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
         Args:
             concurrency: The number of concurrent requests when sending batches. This controls the number of concurrent requests
                 made to Weaviate. If not provided, the default value is 1.
+            linger: The maximum time in seconds that queued objects wait for a batch to fill up before they are sent. Lower values
+                make objects visible sooner, higher values allow for larger batches. If not provided, the default value is 1 second.
+            batch_bytes: The target size in bytes of the objects sent in one request. Batches are cut off once the estimated size
+                of their objects reaches this value, so that large objects are sent in smaller batches. If not provided, batches
+                are only limited by the maximum gRPC message size.
+            serialization_processes: The number of worker processes that translate the objects to serialized gRPC messages. Building
+                the messages is CPU-bound and holds the GIL, so the workers spread it across cores. They are started with the batch
+                and stopped when it finishes. If not provided, the objects are serialized in the batching thread.
         """
         if self._connection._weaviate_version.is_lower_than(1, 36, 0):
             raise WeaviateUnsupportedFeatureError(
@@ -320,7 +417,10 @@ class _BatchCollectionWrapper(Generic[Properties], _BatchWrapper):
             # if concurrency is not None
             # else len(self._cluster.get_nodes_status())
             concurrency=concurrency or 1,
+            linger=linger,
+            batch_bytes=batch_bytes,
         )
+        self.__serialization_processes = serialization_processes
         return self.__create_batch_and_reset(_BatchCollectionSync)
 
 
@@ -345,6 +445,7 @@ class _BatchCollectionWrapperAsync(Generic[Properties], _BatchWrapperAsync):
                 results=self._batch_data,
                 name=self.__name,
                 tenant=self.__tenant,
+                batch_mode=self._batch_mode,
             )
         )
 
@@ -362,6 +463,8 @@ class _BatchCollectionWrapperAsync(Generic[Properties], _BatchWrapperAsync):
         self,
         *,
         concurrency: Optional[int] = None,
+        linger: float = BATCH_LINGER_TIME,
+        batch_bytes: Optional[int] = None,
     ) -> CollectionBatchingContextManagerAsync[Properties]:
         """Configure the batching context manager to use batch streaming.
 
@@ -370,6 +473,11 @@ class _BatchCollectionWrapperAsync(Generic[Properties], _BatchWrapperAsync):
         Args:
             concurrency: The number of concurrent requests when sending batches. This controls the number of concurrent requests
                 made to Weaviate. If not provided, the default value is 1.
+            linger: The maximum time in seconds that queued objects wait for a batch to fill up before they are sent. Lower values
+                make objects visible sooner, higher values allow for larger batches. If not provided, the default value is 1 second.
+            batch_bytes: The target size in bytes of the objects sent in one request. Batches are cut off once the estimated size
+                of their objects reaches this value, so that large objects are sent in smaller batches. If not provided, batches
+                are only limited by the maximum gRPC message size.
         """
         if self._connection._weaviate_version.is_lower_than(1, 36, 0):
             raise WeaviateUnsupportedFeatureError(
@@ -380,5 +488,7 @@ class _BatchCollectionWrapperAsync(Generic[Properties], _BatchWrapperAsync):
             # if concurrency is not None
             # else len(self._cluster.get_nodes_status())
             concurrency=concurrency or 1,
+            linger=linger,
+            batch_bytes=batch_bytes,
         )
         return self.__create_batch_and_reset()
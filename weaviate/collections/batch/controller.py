@@ -0,0 +1,226 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+from weaviate.exceptions import WeaviateInvalidInputError
+
+
+@dataclass
+class BatchRequestStats:
+    """Feedback about a single batch request that has finished.
+
+    Attributes:
+        started: The time at which the request was started, as returned by `time.time()`.
+        took: The time in seconds that the request took.
+        objects: The number of objects that were sent in the request.
+        errors: The number of objects that could not be inserted.
+        retries: The number of objects that were re-added to the queue to be retried, e.g. because of rate limits.
+        failed: Whether the whole request failed, e.g. because of a timeout or a connection error.
+    """
+
+    started: float
+    took: float
+    objects: int
+    errors: int = 0
+    retries: int = 0
+    failed: bool = False
+
+
+@dataclass
+class BatchClusterStats:
+    """The batch statistics reported by the nodes of the cluster.
+
+    Attributes:
+        queue_length: The total number of objects that are waiting to be indexed on all nodes. `None` if the nodes do
+            not report it, e.g. because asynchronous indexing is enabled.
+        rate_per_second: The total number of objects that all nodes index per second. `None` if the nodes do not report it.
+        nodes: The number of nodes in the cluster.
+    """
+
+    queue_length: Optional[int]
+    rate_per_second: Optional[float]
+    nodes: int
+
+
+class BatchController(ABC):
+    """Decides how many objects are sent per request and how many requests are in flight during dynamic batching.
+
+    The batching threads read `batch_size` and `concurrent_requests` before sending new requests, report every finished
+    request to `on_request_done` and report the cluster statistics to `on_cluster_stats` about once per second.
+    Implementations must be thread-safe, as requests finish concurrently.
+    """
+
+    @property
+    @abstractmethod
+    def batch_size(self) -> int:
+        """The number of objects to send in a single request."""
+        ...
+
+    @property
+    @abstractmethod
+    def concurrent_requests(self) -> int:
+        """The maximum number of requests that are in flight at the same time."""
+        ...
+
+    @abstractmethod
+    def on_request_done(self, stats: BatchRequestStats) -> None:
+        """Update the controller with the feedback of a finished request."""
+        ...
+
+    @abstractmethod
+    def on_cluster_stats(self, stats: BatchClusterStats) -> None:
+        """Update the controller with the latest batch statistics of the cluster."""
+        ...
+
+
+class AIMDBatchController(BatchController):
+    """A controller that increases the load additively and decreases it multiplicatively on congestion.
+
+    While no congestion is detected, the batch size grows by `additive_increase` objects per round of
+    `concurrent_requests` requests until it reaches `max_batch_size`, after which one more concurrent request is allowed.
+    On congestion the batch size is multiplied by `multiplicative_decrease`, and once it is at `min_batch_size` the number
+    of concurrent requests is reduced instead.
+
+    A request signals congestion if it failed, if more than `max_error_rate` of its objects failed or had to be retried,
+    or if its latency per object rose above `latency_tolerance` times the long-term average. The cluster signals
+    congestion if its queue would take more than `target_queue_seconds` to index at the reported rate. Signals from
+    requests that were started before the last decrease are ignored, so that a single overload only halves the load once.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_batch_size: int = 100,
+        min_batch_size: int = 10,
+        max_batch_size: int = 1000,
+        initial_concurrent_requests: int = 2,
+        max_concurrent_requests: int = 10,
+        additive_increase: int = 50,
+        multiplicative_decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        target_queue_seconds: float = 2.0,
+        max_error_rate: float = 0.1,
+    ) -> None:
+        """Create a new controller.
+
+        Args:
+            initial_batch_size: The batch size to start with.
+            min_batch_size: The smallest batch size the controller decreases to.
+            max_batch_size: The largest batch size the controller increases to.
+            initial_concurrent_requests: The number of concurrent requests to start with.
+            max_concurrent_requests: The largest number of concurrent requests the controller increases to.
+            additive_increase: The number of objects the batch size grows by per round of requests without congestion.
+            multiplicative_decrease: The factor the batch size is multiplied with on congestion.
+            latency_tolerance: How much higher than the long-term average the latency per object may rise before it is
+                considered congestion.
+            target_queue_seconds: How many seconds of work the queue of the cluster may hold before it is considered congestion.
+            max_error_rate: The fraction of failed or retried objects of a request above which it is considered congestion.
+        """
+        if not 1 <= min_batch_size <= initial_batch_size <= max_batch_size:
+            raise WeaviateInvalidInputError(
+                "The batch sizes must satisfy 1 <= min_batch_size <= initial_batch_size <= max_batch_size"
+            )
+        if not 1 <= initial_concurrent_requests <= max_concurrent_requests:
+            raise WeaviateInvalidInputError(
+                "The concurrent requests must satisfy 1 <= initial_concurrent_requests <= max_concurrent_requests"
+            )
+        if not 0 < multiplicative_decrease < 1:
+            raise WeaviateInvalidInputError("multiplicative_decrease must be between 0 and 1")
+
+        self.__min_batch_size = min_batch_size
+        self.__max_batch_size = max_batch_size
+        self.__max_concurrent_requests = max_concurrent_requests
+        self.__additive_increase = additive_increase
+        self.__multiplicative_decrease = multiplicative_decrease
+        self.__latency_tolerance = latency_tolerance
+        self.__target_queue_seconds = target_queue_seconds
+        self.__max_error_rate = max_error_rate
+
+        self.__batch_size = float(initial_batch_size)
+        self.__concurrent_requests = initial_concurrent_requests
+
+        # short-term and long-term moving averages of the latency per object, their ratio is the latency gradient
+        self.__latency_short: Optional[float] = None
+        self.__latency_long: Optional[float] = None
+        self.__queue_seconds: float = 0
+        self.__last_decrease: float = 0
+        self.__last_concurrency_increase: float = 0
+        self.__last_started: float = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def batch_size(self) -> int:
+        return int(self.__batch_size)
+
+    @property
+    def concurrent_requests(self) -> int:
+        return self.__concurrent_requests
+
+    def on_request_done(self, stats: BatchRequestStats) -> None:
+        with self.__lock:
+            if stats.objects == 0:
+                return
+            self.__last_started = max(self.__last_started, stats.started)
+            # the latency of failed requests, e.g. timeouts, says nothing about the load of the cluster
+            latency_rising = not stats.failed and self.__is_latency_rising(
+                stats.took / stats.objects
+            )
+            congested = (
+                stats.failed
+                or latency_rising
+                or (stats.errors + stats.retries) / stats.objects > self.__max_error_rate
+                or self.__queue_seconds > self.__target_queue_seconds
+            )
+            if congested:
+                if stats.started >= self.__last_decrease:
+                    self.__decrease()
+            else:
+                self.__increase(stats.started)
+
+    def on_cluster_stats(self, stats: BatchClusterStats) -> None:
+        with self.__lock:
+            if stats.queue_length is None or stats.rate_per_second is None:
+                self.__queue_seconds = 0
+                return
+            self.__queue_seconds = (
+                stats.queue_length / stats.rate_per_second if stats.rate_per_second > 0 else 0
+            )
+            # only decrease again once a request that was sent after the last decrease has finished
+            if (
+                self.__queue_seconds > self.__target_queue_seconds
+                and self.__last_started >= self.__last_decrease
+            ):
+                self.__decrease()
+
+    def __is_latency_rising(self, latency: float) -> bool:
+        if self.__latency_short is None or self.__latency_long is None:
+            self.__latency_short = self.__latency_long = latency
+            return False
+        self.__latency_short = 0.5 * self.__latency_short + 0.5 * latency
+        self.__latency_long = 0.95 * self.__latency_long + 0.05 * latency
+        return self.__latency_short > self.__latency_tolerance * self.__latency_long
+
+    def __increase(self, started: float) -> None:
+        if self.__batch_size < self.__max_batch_size:
+            self.__batch_size = min(
+                self.__batch_size + self.__additive_increase / self.__concurrent_requests,
+                self.__max_batch_size,
+            )
+        elif (
+            self.__concurrent_requests < self.__max_concurrent_requests
+            and started >= self.__last_concurrency_increase
+        ):
+            # at most one more request per round, i.e. only once a request sent after the last increase has finished
+            self.__concurrent_requests += 1
+            self.__last_concurrency_increase = time.time()
+
+    def __decrease(self) -> None:
+        if self.__batch_size > self.__min_batch_size:
+            self.__batch_size = max(
+                self.__batch_size * self.__multiplicative_decrease, self.__min_batch_size
+            )
+        elif self.__concurrent_requests > 1:
+            self.__concurrent_requests -= 1
+        self.__last_decrease = time.time()
@@ -1,22 +1,30 @@
 import datetime
+import multiprocessing
 import struct
 import time
 import uuid as uuid_package
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from typing import (
     Any,
     AsyncGenerator,
     Dict,
     Generator,
+    Iterable,
     List,
     Mapping,
     Optional,
     Sequence,
+    Tuple,
+    TypeVar,
     Union,
     cast,
 )
 
+from google.protobuf.message import Message
 from google.protobuf.struct_pb2 import Struct
 
+from weaviate.collections.batch.grpc_properties import _PropertySerializer, _validate_props
 from weaviate.collections.classes.batch import (
     BatchObject,
     BatchObjectReturn,
@@ -28,12 +36,13 @@ from weaviate.collections.classes.batch import (
 from weaviate.collections.classes.config import ConsistencyLevel
 from weaviate.collections.classes.internal import ReferenceInputs, ReferenceToMulti
 from weaviate.collections.classes.types import GeoCoordinate, PhoneNumber
-from weaviate.collections.grpc.shared import _BaseGRPC, _is_1d_vector, _Pack
+from weaviate.collections.grpc.shared import _BaseGRPC, _is_1d_vector, _Pack, _Packing
 from weaviate.connect import executor
 from weaviate.connect.base import MAX_GRPC_MESSAGE_LENGTH
+from weaviate.connect.compression import _CompressedSize
 from weaviate.connect.v4 import Connection, ConnectionAsync, ConnectionSync
 from weaviate.exceptions import (
-    WeaviateInsertInvalidPropertyError,
+    WeaviateBatchValidationError,
     WeaviateInsertManyAllFailedError,
     WeaviateInvalidInputError,
 )
@@ -41,6 +50,32 @@ from weaviate.proto.v1 import base_pb2, batch_pb2
 from weaviate.types import VECTORS
 from weaviate.util import _datetime_to_string, _ServerVersion
 
+# the least number of objects that a serialization worker translates per task, so that sending the objects to the worker
+# and their messages back does not outweigh the work that is moved off the batching thread
+SERIALIZATION_MIN_CHUNK_SIZE = 256
+
+M = TypeVar("M", bound=Message)
+
+
+def _varint(value: int) -> bytes:
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _merge_serialized(message: M, field_name: str, serialized: Iterable[bytes]) -> M:
+    """Append the already serialized messages to the repeated message field `field_name` of `message`.
+
+    The messages are framed as occurrences of the field and parsed by the protobuf runtime in a single call, which is much
+    cheaper than translating the objects to messages a second time.
+    """
+    tag = _varint(message.DESCRIPTOR.fields_by_name[field_name].number << 3 | 2)
+    message.MergeFromString(b"".join(tag + _varint(len(data)) + data for data in serialized))
+    return message
+
 
 class _BatchGRPC(_BaseGRPC):
     """This class is used to insert multiple objects into Weaviate using the gRPC API.
@@ -54,24 +89,35 @@ class _BatchGRPC(_BaseGRPC):
         weaviate_version: _ServerVersion,
         consistency_level: Optional[ConsistencyLevel],
         grpc_max_msg_size: Optional[int],
+        property_serializers: Optional[Dict[str, _PropertySerializer]] = None,
     ):
         super().__init__(weaviate_version, consistency_level, False)
         self.grpc_max_msg_size = grpc_max_msg_size or MAX_GRPC_MESSAGE_LENGTH
+        # compiled serializers for the properties of collections with a known schema, keyed by collection name
+        self.__property_serializers = property_serializers or {}
 
     def __single_vec(self, vectors: Optional[VECTORS]) -> Optional[bytes]:
         if not _is_1d_vector(vectors):
             return None
         return _Pack.single(vectors)
 
-    def __multi_vec(self, vectors: Optional[VECTORS]) -> Optional[List[base_pb2.Vectors]]:
+    def __multi_vec(
+        self, vectors: Optional[VECTORS], packed: Optional[Dict[str, _Packing]]
+    ) -> Optional[List[base_pb2.Vectors]]:
+        packed = packed or {}
         if vectors is None or _is_1d_vector(vectors):
-            return None
+            if len(packed) == 0:
+                return None
+            return [
+                base_pb2.Vectors(name=name, vector_bytes=packing.bytes_, type=packing.type_)
+                for name, packing in packed.items()
+            ]
         # pylance fails to type narrow TypeGuard in _is_1d_vector properly
         vectors = cast(Mapping[str, Union[Sequence[float], Sequence[Sequence[float]]]], vectors)
         return [
             base_pb2.Vectors(name=name, vector_bytes=packing.bytes_, type=packing.type_)
             for name, vec_or_vecs in vectors.items()
-            if (packing := _Pack.parse_single_or_multi_vec(vec_or_vecs))
+            if (packing := packed.get(name) or _Pack.parse_single_or_multi_vec(vec_or_vecs))
         ]
 
     def grpc_object(self, obj: _BatchObject) -> batch_pb2.BatchObject:
@@ -79,21 +125,37 @@ class _BatchGRPC(_BaseGRPC):
             collection=obj.collection,
             uuid=(str(obj.uuid) if obj.uuid is not None else str(uuid_package.uuid4())),
             properties=(
-                self.__translate_properties_from_python_to_grpc(
-                    obj.properties,
-                    obj.references if obj.references is not None else {},
-                )
+                self.__translate_properties(obj.collection, obj.properties, obj.references)
                 if obj.properties is not None
                 else None
             ),
             tenant=obj.tenant,
-            vector_bytes=self.__single_vec(obj.vector),
-            vectors=self.__multi_vec(obj.vector),
+            vector_bytes=(
+                obj.packed_vector
+                if obj.packed_vector is not None
+                else self.__single_vec(obj.vector)
+            ),
+            vectors=(
+                self.__multi_vec(obj.vector, obj.packed_vectors)
+                if obj.packed_vector is None
+                else None
+            ),
         )
 
     def grpc_objects(self, objects: List[_BatchObject]) -> List[batch_pb2.BatchObject]:
         return [self.grpc_object(obj) for obj in objects]
 
+    def serialized_objects(
+        self, objects: List[_BatchObject], serialization_pool: Optional["_SerializationPool"]
+    ) -> List[bytes]:
+        """Translate the objects to their serialized gRPC messages, in the same order as `objects`.
+
+        If a pool is given, the objects are split into chunks that are serialized by its workers.
+        """
+        if serialization_pool is None or len(objects) <= SERIALIZATION_MIN_CHUNK_SIZE:
+            return _serialize_objects(self, objects)
+        return serialization_pool.serialize(objects)
+
     def grpc_reference(self, reference: _BatchReference) -> batch_pb2.BatchReference:
         ref = BatchReference._from_internal(reference)
         return batch_pb2.BatchReference(
@@ -108,6 +170,34 @@ class _BatchGRPC(_BaseGRPC):
     def grpc_references(self, references: List[_BatchReference]) -> List[batch_pb2.BatchReference]:
         return [self.grpc_reference(ref) for ref in references]
 
+    def grpc_object_chunks(
+        self, objects: Iterable[_BatchObject]
+    ) -> Generator[Tuple[List[_BatchObject], List[batch_pb2.BatchObject]], None, None]:
+        """Translate the objects to gRPC messages and group them into chunks that fit into a single request.
+
+        Raises:
+            WeaviateBatchValidationError: If a single object exceeds the maximum gRPC message size.
+        """
+        per_object_overhead = 4  # extra overhead bytes per object in the request
+        chunk: List[_BatchObject] = []
+        weaviate_objs: List[batch_pb2.BatchObject] = []
+        total_size = 0
+        for obj in objects:
+            weaviate_obj = self.grpc_object(obj)
+            obj_size = weaviate_obj.ByteSize() + per_object_overhead
+            if obj_size > self.grpc_max_msg_size:
+                raise WeaviateBatchValidationError(
+                    f"Object with uuid {obj.uuid} is too large to be sent in a batch request. Size: {obj_size} bytes, max size: {self.grpc_max_msg_size} bytes."
+                )
+            if total_size + obj_size >= self.grpc_max_msg_size:
+                yield chunk, weaviate_objs
+                chunk, weaviate_objs, total_size = [], [], 0
+            chunk.append(obj)
+            weaviate_objs.append(weaviate_obj)
+            total_size += obj_size
+        if len(chunk) > 0:
+            yield chunk, weaviate_objs
+
     def objects(
         self,
         connection: Connection,
@@ -115,6 +205,7 @@ class _BatchGRPC(_BaseGRPC):
         objects: List[_BatchObject],
         timeout: Union[int, float],
         max_retries: float,
+        serialization_pool: Optional["_SerializationPool"] = None,
     ) -> executor.Result[BatchObjectReturn]:
         """Insert multiple objects into Weaviate through the gRPC API.
 
@@ -126,12 +217,79 @@ class _BatchGRPC(_BaseGRPC):
                 The UUIDs of the objects that failed to be inserted will be returned in the `errors` attribute of the returned `_BatchReturn` object.
             timeout: The timeout in seconds for the request.
             max_retries: The maximum number of retries in case of a failure.
+            serialization_pool: The worker processes to translate the objects to gRPC messages with, see `serialized_objects`.
         """
-        weaviate_objs = self.grpc_objects(objects)
+        if serialization_pool is None:
+            return self.send_objects(
+                connection,
+                objects=objects,
+                weaviate_objs=self.grpc_objects(objects),
+                timeout=timeout,
+                max_retries=max_retries,
+            )
+        # the workers cannot report the uuids that they generate, so they are generated up front
+        objects = [
+            obj if obj.uuid is not None else replace(obj, uuid=str(uuid_package.uuid4()))
+            for obj in objects
+        ]
+        return self.__send(
+            connection,
+            objects=objects,
+            uuids=[obj.uuid for obj in objects],
+            request=_merge_serialized(
+                batch_pb2.BatchObjectsRequest(consistency_level=self._consistency_level),
+                "objects",
+                self.serialized_objects(objects, serialization_pool),
+            ),
+            timeout=timeout,
+            max_retries=max_retries,
+        )
+
+    def send_objects(
+        self,
+        connection: Connection,
+        *,
+        objects: List[_BatchObject],
+        weaviate_objs: List[batch_pb2.BatchObject],
+        timeout: Union[int, float],
+        max_retries: float,
+    ) -> executor.Result[BatchObjectReturn]:
+        """Send already translated objects to Weaviate through the gRPC API.
+
+        Args:
+            connection: The connection to the Weaviate instance.
+            objects: The `_BatchObject`s that `weaviate_objs` were created from, used to report the results.
+            weaviate_objs: The gRPC messages of the objects to be inserted, in the same order as `objects`.
+            timeout: The timeout in seconds for the request.
+            max_retries: The maximum number of retries in case of a failure.
+        """
+        return self.__send(
+            connection,
+            objects=objects,
+            uuids=[obj.uuid for obj in weaviate_objs],
+            request=batch_pb2.BatchObjectsRequest(
+                objects=weaviate_objs,
+                consistency_level=self._consistency_level,
+            ),
+            timeout=timeout,
+            max_retries=max_retries,
+        )
+
+    def __send(
+        self,
+        connection: Connection,
+        *,
+        objects: List[_BatchObject],
+        uuids: List[str],
+        request: batch_pb2.BatchObjectsRequest,
+        timeout: Union[int, float],
+        max_retries: float,
+    ) -> executor.Result[BatchObjectReturn]:
         start = time.time()
 
-        def resp(errors: Dict[int, str]) -> BatchObjectReturn:
-            if len(errors) == len(weaviate_objs):
+        def resp(res: Tuple[Dict[int, str], Optional[_CompressedSize]]) -> BatchObjectReturn:
+            errors, compressed = res
+            if len(errors) == len(uuids):
                 # Escape sequence (backslash) not allowed in expression portion of f-string prior to Python 3.12: pylance
                 raise WeaviateInsertManyAllFailedError(
                     "Here is the set of all errors: {}".format(
@@ -142,11 +300,11 @@ class _BatchGRPC(_BaseGRPC):
             elapsed_time = time.time() - start
             all_responses: List[Union[uuid_package.UUID, ErrorObject]] = cast(
                 List[Union[uuid_package.UUID, ErrorObject]],
-                list(range(len(weaviate_objs))),
+                list(range(len(uuids))),
             )
             return_success: Dict[int, uuid_package.UUID] = {}
             return_errors: Dict[int, ErrorObject] = {}
-            for idx, weav_obj in enumerate(weaviate_objs):
+            for idx, uuid in enumerate(uuids):
                 obj = objects[idx]
                 if idx in errors:
                     error = ErrorObject(
@@ -157,7 +315,7 @@ class _BatchGRPC(_BaseGRPC):
                     return_errors[obj.index] = error
                     all_responses[idx] = error
                 else:
-                    success = uuid_package.UUID(weav_obj.uuid)
+                    success = uuid_package.UUID(uuid)
                     return_success[obj.index] = success
                     all_responses[idx] = success
 
@@ -167,12 +325,10 @@ class _BatchGRPC(_BaseGRPC):
                 has_errors=len(errors) > 0,
                 _all_responses=all_responses,
                 elapsed_seconds=elapsed_time,
+                _compressed_request_bytes=compressed.size if compressed is not None else 0,
+                _compressed_wire_bytes=compressed.compressed if compressed is not None else 0,
             )
 
-        request = batch_pb2.BatchObjectsRequest(
-            objects=weaviate_objs,
-            consistency_level=self._consistency_level,
-        )
         return executor.execute(
             response_callback=resp,
             method=connection.grpc_batch_objects,
@@ -237,6 +393,23 @@ class _BatchGRPC(_BaseGRPC):
         """
         return connection.grpc_batch_stream(requests=requests)
 
+    def __translate_properties(
+        self, collection: str, data: Dict[str, Any], refs: Optional[ReferenceInputs]
+    ) -> batch_pb2.BatchObject.Properties:
+        serializer = self.__property_serializers.get(collection)
+        if serializer is None:
+            return self.__translate_properties_from_python_to_grpc(
+                data, refs if refs is not None else {}
+            )
+        return serializer.serialize(
+            data, refs if refs is not None else {}, self.__translate_properties_fallback
+        )
+
+    def __translate_properties_fallback(
+        self, data: Dict[str, Any], refs: ReferenceInputs, nested: bool
+    ) -> batch_pb2.BatchObject.Properties:
+        return self.__translate_properties_from_python_to_grpc(data, refs, nested=nested)
+
     def __translate_properties_from_python_to_grpc(
         self, data: Dict[str, Any], refs: ReferenceInputs, *, nested: bool = False
     ) -> batch_pb2.BatchObject.Properties:
@@ -362,11 +535,53 @@ class _BatchGRPC(_BaseGRPC):
         )
 
 
-def _validate_props(props: Dict[str, Any], nested: bool = False) -> None:
-    if not nested and "id" in props:
-        raise WeaviateInsertInvalidPropertyError(props)
-    if "vector" in props:
-        raise WeaviateInsertInvalidPropertyError(props)
+def _serialize_objects(batch_grpc: _BatchGRPC, objects: List[_BatchObject]) -> List[bytes]:
+    return [batch_grpc.grpc_object(obj).SerializeToString() for obj in objects]
+
+
+# the serializer of a worker process of a `_SerializationPool`, set once when the worker starts
+_worker_batch_grpc: Optional[_BatchGRPC] = None
+
+
+def _init_serialization_worker(batch_grpc: _BatchGRPC) -> None:
+    global _worker_batch_grpc
+    _worker_batch_grpc = batch_grpc
+
+
+def _serialize_in_worker(objects: List[_BatchObject]) -> List[bytes]:
+    assert _worker_batch_grpc is not None
+    return _serialize_objects(_worker_batch_grpc, objects)
+
+
+class _SerializationPool:
+    """Worker processes that translate batch objects to serialized gRPC messages.
+
+    Building the messages is CPU-bound and holds the GIL, so it is spread across processes. Each worker receives the
+    serializer once when it starts, the tasks only carry the objects. A batch is split into one chunk per worker, but chunks
+    are never smaller than `SERIALIZATION_MIN_CHUNK_SIZE` objects.
+    """
+
+    def __init__(self, batch_grpc: _BatchGRPC, processes: int) -> None:
+        self.__processes = processes
+        # gRPC does not support forking a process with open channels, so the workers are spawned
+        self.__executor = ProcessPoolExecutor(
+            processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_serialization_worker,
+            initargs=(batch_grpc,),
+        )
+
+    def serialize(self, objects: List[_BatchObject]) -> List[bytes]:
+        chunk_size = max(SERIALIZATION_MIN_CHUNK_SIZE, -(-len(objects) // self.__processes))
+        chunks = [objects[i : i + chunk_size] for i in range(0, len(objects), chunk_size)]
+        return [
+            serialized
+            for chunk in self.__executor.map(_serialize_in_worker, chunks)
+            for serialized in chunk
+        ]
+
+    def shutdown(self) -> None:
+        self.__executor.shutdown()
 
 
 def _serialize_primitive(value: Any) -> Any:
@@ -0,0 +1,435 @@
+import datetime
+import struct
+import uuid as uuid_package
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from weaviate.collections.classes.config import DataType
+from weaviate.collections.classes.internal import ReferenceInputs
+from weaviate.collections.classes.types import GeoCoordinate, PhoneNumber
+from weaviate.exceptions import WeaviateInsertInvalidPropertyError
+from weaviate.proto.v1 import base_pb2, batch_pb2
+from weaviate.util import _datetime_to_string
+
+
+class _PropertyDefinition(Protocol):
+    @property
+    def name(self) -> str: ...
+    @property
+    def data_type(self) -> DataType: ...
+    @property
+    def nested_properties(self) -> Optional[Sequence[Any]]: ...
+
+
+_Fallback = Callable[[Dict[str, Any], ReferenceInputs, bool], batch_pb2.BatchObject.Properties]
+
+
+@dataclass
+class _Accumulator:
+    fallback: _Fallback
+    non_ref: Dict[str, Any] = field(default_factory=dict)
+    text_arrays: List[base_pb2.TextArrayProperties] = field(default_factory=list)
+    int_arrays: List[base_pb2.IntArrayProperties] = field(default_factory=list)
+    float_arrays: List[base_pb2.NumberArrayProperties] = field(default_factory=list)
+    bool_arrays: List[base_pb2.BooleanArrayProperties] = field(default_factory=list)
+    object_properties: List[base_pb2.ObjectProperties] = field(default_factory=list)
+    object_array_properties: List[base_pb2.ObjectArrayProperties] = field(default_factory=list)
+    empty_lists: List[str] = field(default_factory=list)
+
+
+# A handler adds a value to the accumulator if it has the expected Python type and returns False otherwise, in which case the
+# value is serialized by the generic type-inspecting fallback instead. The checks mirror the ones of the fallback so that both
+# paths produce identical messages.
+_Handler = Callable[[str, Any, _Accumulator], bool]
+
+
+def _text(key: str, value: Any, acc: _Accumulator) -> bool:
+    if type(value) is not str:
+        return False
+    acc.non_ref[key] = value
+    return True
+
+
+def _int(key: str, value: Any, acc: _Accumulator) -> bool:
+    if type(value) is not int:
+        return False
+    acc.non_ref[key] = value
+    return True
+
+
+def _number(key: str, value: Any, acc: _Accumulator) -> bool:
+    if type(value) is not float and type(value) is not int:
+        return False
+    acc.non_ref[key] = value
+    return True
+
+
+def _bool(key: str, value: Any, acc: _Accumulator) -> bool:
+    if type(value) is not bool:
+        return False
+    acc.non_ref[key] = value
+    return True
+
+
+def _date(key: str, value: Any, acc: _Accumulator) -> bool:
+    if type(value) is str:
+        acc.non_ref[key] = value
+    elif isinstance(value, datetime.datetime):
+        acc.non_ref[key] = _datetime_to_string(value)
+    else:
+        return False
+    return True
+
+
+def _uuid(key: str, value: Any, acc: _Accumulator) -> bool:
+    if type(value) is str:
+        acc.non_ref[key] = value
+    elif isinstance(value, uuid_package.UUID):
+        acc.non_ref[key] = str(value)
+    else:
+        return False
+    return True
+
+
+def _geo(key: str, value: Any, acc: _Accumulator) -> bool:
+    if not isinstance(value, GeoCoordinate):
+        return False
+    acc.non_ref[key] = value._to_dict()
+    return True
+
+
+def _phone(key: str, value: Any, acc: _Accumulator) -> bool:
+    if not isinstance(value, PhoneNumber):
+        return False
+    acc.non_ref[key] = value._to_dict()
+    return True
+
+
+def _array(handler: Callable[[str, List[Any], _Accumulator], bool]) -> _Handler:
+    def add(key: str, value: Any, acc: _Accumulator) -> bool:
+        if type(value) is not list:
+            return False
+        if len(value) == 0:
+            acc.empty_lists.append(key)
+            return True
+        return handler(key, value, acc)
+
+    return add
+
+
+@_array
+def _text_array(key: str, value: List[Any], acc: _Accumulator) -> bool:
+    if type(value[0]) is not str:
+        return False
+    acc.text_arrays.append(base_pb2.TextArrayProperties(prop_name=key, values=value))
+    return True
+
+
+@_array
+def _date_array(key: str, value: List[Any], acc: _Accumulator) -> bool:
+    if type(value[0]) is str:
+        values = value
+    elif isinstance(value[0], datetime.datetime):
+        values = [_datetime_to_string(x) for x in value]
+    else:
+        return False
+    acc.text_arrays.append(base_pb2.TextArrayProperties(prop_name=key, values=values))
+    return True
+
+
+@_array
+def _uuid_array(key: str, value: List[Any], acc: _Accumulator) -> bool:
+    if type(value[0]) is str:
+        values = value
+    elif isinstance(value[0], uuid_package.UUID):
+        values = [str(x) for x in value]
+    else:
+        return False
+    acc.text_arrays.append(base_pb2.TextArrayProperties(prop_name=key, values=values))
+    return True
+
+
+@_array
+def _int_array(key: str, value: List[Any], acc: _Accumulator) -> bool:
+    if type(value[0]) is not int:
+        return False
+    acc.int_arrays.append(base_pb2.IntArrayProperties(prop_name=key, values=value))
+    return True
+
+
+@_array
+def _number_array(key: str, value: List[Any], acc: _Accumulator) -> bool:
+    if type(value[0]) is not float:
+        return False
+    values_bytes = struct.pack("{}d".format(len(value)), *value)
+    acc.float_arrays.append(
+        base_pb2.NumberArrayProperties(prop_name=key, values_bytes=values_bytes)
+    )
+    return True
+
+
+@_array
+def _bool_array(key: str, value: List[Any], acc: _Accumulator) -> bool:
+    if type(value[0]) is not bool:
+        return False
+    acc.bool_arrays.append(base_pb2.BooleanArrayProperties(prop_name=key, values=value))
+    return True
+
+
+_HANDLERS: Dict[DataType, _Handler] = {
+    DataType.TEXT: _text,
+    DataType.BLOB: _text,
+    DataType.INT: _int,
+    DataType.NUMBER: _number,
+    DataType.BOOL: _bool,
+    DataType.DATE: _date,
+    DataType.UUID: _uuid,
+    DataType.GEO_COORDINATES: _geo,
+    DataType.PHONE_NUMBER: _phone,
+    DataType.TEXT_ARRAY: _text_array,
+    DataType.DATE_ARRAY: _date_array,
+    DataType.UUID_ARRAY: _uuid_array,
+    DataType.INT_ARRAY: _int_array,
+    DataType.NUMBER_ARRAY: _number_array,
+    DataType.BOOL_ARRAY: _bool_array,
+}
+
+_PYTHON_TYPES: Dict[Any, Tuple[DataType, DataType]] = {
+    str: (DataType.TEXT, DataType.TEXT_ARRAY),
+    int: (DataType.INT, DataType.INT_ARRAY),
+    float: (DataType.NUMBER, DataType.NUMBER_ARRAY),
+    bool: (DataType.BOOL, DataType.BOOL_ARRAY),
+    datetime.datetime: (DataType.DATE, DataType.DATE_ARRAY),
+    uuid_package.UUID: (DataType.UUID, DataType.UUID_ARRAY),
+}
+
+
+def _object_value(parsed: batch_pb2.BatchObject.Properties) -> base_pb2.ObjectPropertiesValue:
+    return base_pb2.ObjectPropertiesValue(
+        non_ref_properties=parsed.non_ref_properties,
+        int_array_properties=parsed.int_array_properties,
+        text_array_properties=parsed.text_array_properties,
+        number_array_properties=parsed.number_array_properties,
+        boolean_array_properties=parsed.boolean_array_properties,
+        object_properties=parsed.object_properties,
+        object_array_properties=parsed.object_array_properties,
+        empty_list_props=parsed.empty_list_props,
+    )
+
+
+class _PropertySerializer:
+    """Serializes the properties of objects of a collection with a known schema to their gRPC representation.
+
+    The handler of each property is chosen once from its data type so that serializing an object only needs one lookup and
+    type check per property. Properties that are not part of the schema, or whose values do not have the expected type, are
+    serialized by the generic fallback.
+    """
+
+    def __init__(self, properties: Sequence[_PropertyDefinition]):
+        self.__properties = [_DataModelProperty.from_definition(prop) for prop in properties]
+        self.__handlers: Dict[str, _Handler] = {}
+        for prop in properties:
+            if prop.data_type in (DataType.OBJECT, DataType.OBJECT_ARRAY):
+                if prop.nested_properties:
+                    self.__handlers[prop.name] = _PropertySerializer(
+                        prop.nested_properties
+                    ).__object_handler(is_array=prop.data_type == DataType.OBJECT_ARRAY)
+            elif (handler := _HANDLERS.get(prop.data_type)) is not None:
+                self.__handlers[prop.name] = handler
+
+    def __reduce__(self) -> Tuple[Type["_PropertySerializer"], Tuple[List["_DataModelProperty"]]]:
+        # the handlers of nested objects are closures, so the serializer is recompiled from its properties when unpickled,
+        # e.g. in the workers of a process pool
+        return (_PropertySerializer, (self.__properties,))
+
+    @classmethod
+    def from_config(cls, properties: Sequence[_PropertyDefinition]) -> "_PropertySerializer":
+        """Compile a serializer from the properties of a collection config, e.g. `collection.config.get().properties`."""
+        return cls(properties)
+
+    @classmethod
+    def from_data_model(cls, data_model: Type[Mapping[str, Any]]) -> "_PropertySerializer":
+        """Compile a serializer from the type hints of a `TypedDict` data model."""
+        return _serializer_from_data_model(data_model)
+
+    def __object_handler(self, *, is_array: bool) -> _Handler:
+        def add_object(key: str, value: Any, acc: _Accumulator) -> bool:
+            if type(value) is not dict:
+                return False
+            acc.object_properties.append(
+                base_pb2.ObjectProperties(
+                    prop_name=key, value=self.__serialize_nested(value, acc.fallback)
+                )
+            )
+            return True
+
+        def add_object_array(key: str, value: List[Any], acc: _Accumulator) -> bool:
+            if type(value[0]) is not dict:
+                return False
+            acc.object_array_properties.append(
+                base_pb2.ObjectArrayProperties(
+                    values=[self.__serialize_nested(v, acc.fallback) for v in value],
+                    prop_name=key,
+                )
+            )
+            return True
+
+        return _array(add_object_array) if is_array else add_object
+
+    def __accumulate(self, data: Dict[str, Any], acc: _Accumulator) -> Dict[str, Any]:
+        leftover: Dict[str, Any] = {}
+        handlers = self.__handlers
+        for key, value in data.items():
+            handler = handlers.get(key)
+            if handler is None or not handler(key, value, acc):
+                leftover[key] = value
+        return leftover
+
+    def __serialize_nested(
+        self, data: Dict[str, Any], fallback: _Fallback
+    ) -> base_pb2.ObjectPropertiesValue:
+        _validate_props(data, nested=True)
+        acc = _Accumulator(fallback)
+        leftover = self.__accumulate(data, acc)
+        value = base_pb2.ObjectPropertiesValue(
+            text_array_properties=acc.text_arrays,
+            number_array_properties=acc.float_arrays,
+            int_array_properties=acc.int_arrays,
+            boolean_array_properties=acc.bool_arrays,
+            object_properties=acc.object_properties,
+            object_array_properties=acc.object_array_properties,
+            empty_list_props=acc.empty_lists,
+        )
+        value.non_ref_properties.SetInParent()
+        if len(acc.non_ref) > 0:
+            value.non_ref_properties.update(acc.non_ref)
+        if len(leftover) > 0:
+            value.MergeFrom(_object_value(fallback(leftover, {}, True)))
+        return value
+
+    def serialize(
+        self, data: Dict[str, Any], refs: ReferenceInputs, fallback: _Fallback
+    ) -> batch_pb2.BatchObject.Properties:
+        """Serialize the properties and references of an object.
+
+        Args:
+            data: The properties of the object.
+            refs: The references of the object, which are always serialized by `fallback`.
+            fallback: The generic serializer for everything the compiled handlers do not cover.
+        """
+        _validate_props(data)
+        acc = _Accumulator(fallback)
+        leftover = self.__accumulate(data, acc)
+        properties = batch_pb2.BatchObject.Properties(
+            text_array_properties=acc.text_arrays,
+            number_array_properties=acc.float_arrays,
+            int_array_properties=acc.int_arrays,
+            boolean_array_properties=acc.bool_arrays,
+            object_properties=acc.object_properties,
+            object_array_properties=acc.object_array_properties,
+            empty_list_props=acc.empty_lists,
+        )
+        properties.non_ref_properties.SetInParent()
+        if len(acc.non_ref) > 0:
+            properties.non_ref_properties.update(acc.non_ref)
+        if len(leftover) > 0 or len(refs) > 0:
+            properties.MergeFrom(fallback(leftover, refs, False))
+        return properties
+
+
+def _data_type_from_hint(hint: Any) -> Optional[Union[DataType, Tuple[DataType, Any]]]:
+    origin = get_origin(hint)
+    if origin is Union:
+        types = [arg for arg in get_args(hint) if arg is not type(None)]
+        return _data_type_from_hint(types[0]) if len(types) == 1 else None
+    if origin is Annotated:
+        inner, *metadata = get_args(hint)
+        if metadata == ["NESTED"]:
+            if get_origin(inner) is list:
+                return DataType.OBJECT_ARRAY, get_args(inner)[0]
+            return DataType.OBJECT, inner
+        return None
+    if origin is list:
+        args = get_args(hint)
+        if len(args) != 1:
+            return None
+        if args[0] in _PYTHON_TYPES:
+            return _PYTHON_TYPES[args[0]][1]
+        if _is_typed_dict(args[0]):
+            return DataType.OBJECT_ARRAY, args[0]
+        return None
+    if hint in _PYTHON_TYPES:
+        return _PYTHON_TYPES[hint][0]
+    if hint is GeoCoordinate:
+        return DataType.GEO_COORDINATES
+    if hint is PhoneNumber:
+        return DataType.PHONE_NUMBER
+    if _is_typed_dict(hint):
+        return DataType.OBJECT, hint
+    return None
+
+
+def _is_typed_dict(hint: Any) -> bool:
+    return isinstance(hint, type) and issubclass(hint, dict) and hasattr(hint, "__annotations__")
+
+
+@dataclass
+class _DataModelProperty:
+    name: str
+    data_type: DataType
+    nested_properties: Optional[Sequence["_DataModelProperty"]]
+
+    @classmethod
+    def from_definition(cls, prop: _PropertyDefinition) -> "_DataModelProperty":
+        return cls(
+            prop.name,
+            prop.data_type,
+            (
+                [cls.from_definition(nested) for nested in prop.nested_properties]
+                if prop.nested_properties
+                else None
+            ),
+        )
+
+
+def _properties_from_data_model(data_model: Any) -> List[_DataModelProperty]:
+    properties: List[_DataModelProperty] = []
+    for name, hint in get_type_hints(data_model, include_extras=True).items():
+        data_type = _data_type_from_hint(hint)
+        if isinstance(data_type, tuple):
+            data_type, inner = data_type
+            properties.append(
+                _DataModelProperty(name, data_type, _properties_from_data_model(inner))
+            )
+        elif data_type is not None:
+            properties.append(_DataModelProperty(name, data_type, None))
+    return properties
+
+
+@lru_cache(maxsize=128)
+def _serializer_from_data_model(data_model: Any) -> _PropertySerializer:
+    return _PropertySerializer.from_config(_properties_from_data_model(data_model))
+
+
+def _validate_props(props: Dict[str, Any], nested: bool = False) -> None:
+    if not nested and "id" in props:
+        raise WeaviateInsertInvalidPropertyError(props)
+    if "vector" in props:
+        raise WeaviateInsertInvalidPropertyError(props)
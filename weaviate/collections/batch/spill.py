@@ -0,0 +1,256 @@
+import io
+import os
+import pickle
+import struct
+from typing import IO, Any, Iterable, List, Optional, Set, Tuple
+
+from weaviate.logger import logger
+
+# a new segment file is started once the current one exceeds this size
+SPILL_SEGMENT_SIZE = 64 * 1024 * 1024
+# the number of items that a queue keeps in memory, further items stay on disk until the queue drains
+SPILL_MAX_IN_MEMORY = 10000
+
+_HEADER = struct.Struct("<I")
+_SEGMENT_SUFFIX = ".seg"
+_CHECKPOINT = "checkpoint"
+
+# the classes that queued batch objects and references are made of, records that reference any other global are rejected
+# as unpickling it could run arbitrary code
+_ALLOWED_GLOBALS = {
+    ("weaviate.collections.classes.batch", "BatchObject"),
+    ("weaviate.collections.classes.batch", "BatchReference"),
+    ("weaviate.collections.classes.internal", "ReferenceToMulti"),
+    ("weaviate.collections.classes.types", "GeoCoordinate"),
+    ("weaviate.collections.classes.types", "PhoneNumber"),
+    ("weaviate.collections.grpc.shared", "_Packing"),
+    ("datetime", "date"),
+    ("datetime", "datetime"),
+    ("datetime", "time"),
+    ("datetime", "timedelta"),
+    ("datetime", "timezone"),
+    ("uuid", "UUID"),
+    ("numpy", "dtype"),
+    ("numpy", "ndarray"),
+    ("numpy.core.numeric", "_frombuffer"),
+    ("numpy._core.numeric", "_frombuffer"),
+    ("numpy.core.multiarray", "_reconstruct"),
+    ("numpy._core.multiarray", "_reconstruct"),
+}
+
+
+class _RecordUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in _ALLOWED_GLOBALS:
+            raise pickle.UnpicklingError(
+                f"Spilled batch record references {module}.{name}, which is not allowed"
+            )
+        return super().find_class(module, name)
+
+
+class _SpillLog:
+    """An append-only log of queued batch items that is stored in segment files within a directory.
+
+    Every item gets a consecutive offset when it is appended. Once an item was sent to Weaviate its offset is acknowledged,
+    and the log persists the lowest offset below which all items are acknowledged. Opening the log on a directory of an
+    earlier run resumes from this offset, so that items that were not acknowledged before a crash are sent again. Items
+    that were acknowledged out of order can therefore be sent twice, which is harmless as they are identified by their UUID.
+
+    Records are flushed to the operating system as they are appended, so they survive a crash of the process. Segments are
+    synced to disk when they are completed and when the log is closed.
+
+    Records are pickled, but only the classes of batch items are restored from them. The directory should nevertheless
+    only be writable by trusted users.
+
+    The log is not thread-safe, it is guarded by the lock of the queue that owns it.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_in_memory: int = SPILL_MAX_IN_MEMORY,
+        segment_size: int = SPILL_SEGMENT_SIZE,
+    ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.__directory = directory
+        self.max_in_memory = max_in_memory
+        self.__segment_size = segment_size
+
+        # the start offsets of the segments on disk, in ascending order
+        self.__segments: List[int] = sorted(
+            int(name[: -len(_SEGMENT_SUFFIX)])
+            for name in os.listdir(directory)
+            if name.endswith(_SEGMENT_SUFFIX)
+        )
+        self.__acked = self.__read_checkpoint()
+        # offsets above the checkpoint that were acknowledged out of order
+        self.__acked_above: Set[int] = set()
+
+        self.__next_offset = self.__recover()
+        if len(self.__segments) == 0 or self.__next_offset < self.__acked:
+            # nothing to resume, either a new directory or all items were acknowledged
+            self.__remove_segments(self.__segments)
+            self.__segments = [self.__next_offset]
+            self.__acked = self.__next_offset
+        self.__writer: IO[bytes] = open(self.__segment_path(self.__segments[-1]), "ab")
+
+        self.__read_offset = self.__segments[0]
+        self.__reader: Optional[IO[bytes]] = None
+        self.__reader_segment = -1
+        self.__reader_position = 0
+        if self.__read_offset < self.__acked:
+            # skip the items that were acknowledged in an earlier run
+            self.__skip(self.__acked - self.__read_offset)
+        if self.unloaded > 0:
+            logger.info(f"Resuming {self.unloaded} unacknowledged batch items from {directory}")
+
+    @property
+    def unloaded(self) -> int:
+        """The number of items that were appended but not read back into memory yet."""
+        return self.__next_offset - self.__read_offset
+
+    def append(self, item: Any) -> int:
+        """Append an item to the log and return its offset."""
+        data = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        if self.__writer.tell() > self.__segment_size:
+            self.__roll()
+        self.__writer.write(_HEADER.pack(len(data)))
+        self.__writer.write(data)
+        self.__writer.flush()
+        offset = self.__next_offset
+        self.__next_offset += 1
+        return offset
+
+    def skip_unloaded(self) -> None:
+        """Mark all appended items as loaded, used when they are kept in memory right away."""
+        self.__close_reader()
+        self.__reader_segment = self.__segments[-1]
+        self.__reader_position = self.__writer.tell()
+        self.__read_offset = self.__next_offset
+
+    def load(self, max_items: int) -> List[Tuple[int, Any]]:
+        """Read up to `max_items` items that were not read back into memory yet, in the order they were appended.
+
+        Records that cannot be restored are logged and acknowledged, so that they are skipped.
+        """
+        items: List[Tuple[int, Any]] = []
+        while len(items) < max_items and self.unloaded > 0:
+            offset, data = self.__read_offset, self.__read_record()
+            self.__read_offset += 1
+            try:
+                items.append((offset, _RecordUnpickler(io.BytesIO(data)).load()))
+            except Exception as e:
+                # a record that cannot be restored is never sent, it must not hold back the checkpoint
+                logger.error(f"Skipping spilled batch item {offset} in {self.__directory}: {e}")
+                self.ack([offset])
+        return items
+
+    def ack(self, offsets: Iterable[int]) -> None:
+        """Acknowledge that the items at the given offsets were sent and persist the new checkpoint."""
+        self.__acked_above.update(offsets)
+        acked = self.__acked
+        while acked in self.__acked_above:
+            self.__acked_above.remove(acked)
+            acked += 1
+        if acked == self.__acked:
+            return
+        self.__acked = acked
+        self.__write_checkpoint()
+        # all items of a segment are acknowledged once the next segment starts at or below the checkpoint
+        done = [
+            start
+            for start, next_start in zip(self.__segments, self.__segments[1:])
+            if next_start <= self.__acked and start != self.__reader_segment
+        ]
+        if len(done) > 0:
+            self.__remove_segments(done)
+            self.__segments = [start for start in self.__segments if start not in done]
+
+    def close(self) -> None:
+        """Sync the log to disk and close its files."""
+        self.__writer.flush()
+        os.fsync(self.__writer.fileno())
+        self.__writer.close()
+        self.__close_reader()
+        if self.__acked == self.__next_offset:
+            # everything was sent, the next run starts from scratch
+            self.__remove_segments(self.__segments)
+            try:
+                os.remove(os.path.join(self.__directory, _CHECKPOINT))
+            except FileNotFoundError:
+                pass
+
+    def __segment_path(self, start: int) -> str:
+        return os.path.join(self.__directory, f"{start:020d}{_SEGMENT_SUFFIX}")
+
+    def __read_checkpoint(self) -> int:
+        try:
+            with open(os.path.join(self.__directory, _CHECKPOINT)) as f:
+                return int(f.read())
+        except FileNotFoundError:
+            return 0
+
+    def __write_checkpoint(self) -> None:
+        path = os.path.join(self.__directory, _CHECKPOINT)
+        with open(path + ".tmp", "w") as f:
+            f.write(str(self.__acked))
+        os.replace(path + ".tmp", path)
+
+    def __recover(self) -> int:
+        """Count the records of the last segment and cut off a record that was only partially written by a crash."""
+        if len(self.__segments) == 0:
+            return self.__acked
+        start = self.__segments[-1]
+        path = self.__segment_path(start)
+        count, position = 0, 0
+        with open(path, "rb") as f:
+            while len(header := f.read(_HEADER.size)) == _HEADER.size:
+                (length,) = _HEADER.unpack(header)
+                if len(f.read(length)) < length:
+                    break
+                count += 1
+                position = f.tell()
+        if position < os.path.getsize(path):
+            logger.warning(f"Truncating a partially written record in {path}")
+            os.truncate(path, position)
+        return start + count
+
+    def __roll(self) -> None:
+        self.__writer.flush()
+        os.fsync(self.__writer.fileno())
+        self.__writer.close()
+        self.__segments.append(self.__next_offset)
+        self.__writer = open(self.__segment_path(self.__next_offset), "ab")
+
+    def __read_record(self) -> bytes:
+        segment = max(start for start in self.__segments if start <= self.__read_offset)
+        if self.__reader_segment != segment:
+            # the records of the previous segment are used up, continue at the start of the next one
+            self.__close_reader()
+            self.__reader_segment = segment
+        if self.__reader is None:
+            self.__reader = open(self.__segment_path(segment), "rb")
+            self.__reader.seek(self.__reader_position)
+        (length,) = _HEADER.unpack(self.__reader.read(_HEADER.size))
+        data = self.__reader.read(length)
+        self.__reader_position = self.__reader.tell()
+        return data
+
+    def __skip(self, count: int) -> None:
+        for _ in range(count):
+            self.__read_record()
+            self.__read_offset += 1
+
+    def __close_reader(self) -> None:
+        if self.__reader is not None:
+            self.__reader.close()
+        self.__reader = None
+        self.__reader_segment = -1
+        self.__reader_position = 0
+
+    def __remove_segments(self, starts: Iterable[int]) -> None:
+        for start in starts:
+            try:
+                os.remove(self.__segment_path(start))
+            except FileNotFoundError:
+                pass
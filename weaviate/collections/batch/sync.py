@@ -3,21 +3,29 @@ import time
 import uuid as uuid_package
 from concurrent.futures import ThreadPoolExecutor
 from queue import Empty, Full, Queue
-from typing import Generator, List, Optional, Set, Union
+from typing import Dict, Generator, List, Optional, Set, Union
 
 from pydantic import ValidationError
 
 from weaviate.collections.batch.base import (
+    BATCH_LINGER_TIME,
     GCP_STREAM_TIMEOUT,
     ObjectsBatchRequest,
     ReferencesBatchRequest,
     _BatchDataWrapper,
     _BatchMode,
     _BatchStreamRequest,
+    _max_batch_bytes,
     _BgThreads,
     _ClusterBatch,
+    _queue_depth_reporter,
 )
-from weaviate.collections.batch.grpc_batch import _BatchGRPC
+from weaviate.collections.batch.grpc_batch import (
+    _BatchGRPC,
+    _SerializationPool,
+    _merge_serialized,
+)
+from weaviate.collections.batch.grpc_properties import _PropertySerializer
 from weaviate.collections.classes.batch import (
     BatchObject,
     BatchObjectReturn,
@@ -59,9 +67,17 @@ class _BatchBaseSync:
         vectorizer_batching: bool = False,
         objects: Optional[ObjectsBatchRequest[BatchObject]] = None,
         references: Optional[ReferencesBatchRequest[BatchReference]] = None,
+        property_serializers: Optional[Dict[str, _PropertySerializer]] = None,
+        serialization_processes: Optional[int] = None,
     ) -> None:
-        self.__batch_objects = objects or ObjectsBatchRequest[BatchObject]()
-        self.__batch_references = references or ReferencesBatchRequest[BatchReference]()
+        # both queues share a condition so that the batching loop wakes up when either of them receives items
+        condition = threading.Condition()
+        self.__batch_objects = objects or ObjectsBatchRequest[BatchObject](
+            condition, on_depth_change=_queue_depth_reporter(connection)
+        )
+        self.__batch_references = references or ReferencesBatchRequest[BatchReference](condition)
+        self.__linger = batch_mode.linger if batch_mode is not None else BATCH_LINGER_TIME
+        self.__is_flushing = threading.Event()
 
         self.__connection = connection
         self.__is_gcp_on_wcd = connection._connection_params.is_gcp_on_wcd()
@@ -70,7 +86,17 @@ class _BatchBaseSync:
         self.__batch_size = 100
 
         self.__batch_grpc = _BatchGRPC(
-            connection._weaviate_version, self.__consistency_level, connection._grpc_max_msg_size
+            connection._weaviate_version,
+            self.__consistency_level,
+            connection._grpc_max_msg_size,
+            property_serializers,
+        )
+        self.__max_batch_bytes = _max_batch_bytes(batch_mode, self.__batch_grpc.grpc_max_msg_size)
+        # builds the serialized gRPC messages of the objects outside of the batching loop thread if requested
+        self.__serialization_pool = (
+            _SerializationPool(self.__batch_grpc, serialization_processes)
+            if serialization_processes is not None
+            else None
         )
         self.__cluster = _ClusterBatch(self.__connection)
         self.__number_of_nodes = self.__cluster.get_number_of_nodes()
@@ -141,6 +167,9 @@ class _BatchBaseSync:
             raise WeaviateBatchStreamError(
                 "Background batch threads did not terminate after forced shutdown."
             ) from e
+        finally:
+            if self.__serialization_pool is not None:
+                self.__serialization_pool.shutdown()
 
         # copy the results to the public results
         self.__results_for_wrapper_backup.results = self.__results_for_wrapper.results
@@ -155,6 +184,7 @@ class _BatchBaseSync:
     def _shutdown(self) -> None:
         # Shutdown the current batch and wait for all requests to be finished
         self.__is_stopped.set()
+        self.__batch_objects.notify()
 
     def __put(self, req: _BatchStreamRequest | None):
         while True:
@@ -169,25 +199,27 @@ class _BatchBaseSync:
     def __loop(self) -> None:
         refresh_time: float = 0.01
         while self.__bg_exception is None and not self.__shutdown_loop.is_set():
-            if len(self.__batch_objects) + len(self.__batch_references) > 0:
-                start = time.time()
-                while (len_o := len(self.__batch_objects)) + (
-                    len_r := len(self.__batch_references)
-                ) < self.__batch_size:
-                    # wait for more objects to be added up to the batch size
-                    time.sleep(refresh_time)
-                    if time.time() - start >= 1 and (
-                        len_o == len(self.__batch_objects) and len_r == len(self.__batch_references)
-                    ):
-                        # no new objects were added in the last second, exit the loop
-                        break
+            if self.__queued() > 0:
+                # wait for more objects to be added up to the batch size, for at most the linger time
+                self.__batch_objects.wait(
+                    lambda: self.__queued() >= self.__batch_size
+                    or self.__batch_objects.size_in_bytes() >= self.__max_batch_bytes
+                    or self.__is_flushing.is_set()
+                    or self.__is_stopped.is_set()
+                    or self.__shutdown_loop.is_set(),
+                    timeout=self.__linger,
+                )
 
-                objs = self.__batch_objects.pop_items(self.__batch_size)
+                objs = self.__batch_objects.pop_items(
+                    self.__batch_size, max_bytes=self.__max_batch_bytes
+                )
                 with self.__uuid_lookup_lock:
                     refs = self.__batch_references.pop_items(
                         self.__batch_size - len(objs),
                         uuid_lookup=self.__uuid_lookup,
                     )
+                # wake up a flush that waits for the queues to be emptied
+                self.__batch_objects.notify()
 
                 for req in self.__generate_stream_requests(objs, refs):
                     start, paused = time.time(), False
@@ -210,16 +242,28 @@ class _BatchBaseSync:
                     if not self.__put(req):
                         logger.info("Batch loop is shutting down, stopping putting requests...")
                         return
-            elif (
-                self.__is_stopped.is_set()
-                and not self.__is_hungup.is_set()
-                and not self.__is_shutting_down.is_set()
-                and not self.__is_oom.is_set()
-            ):
-                self.__put(None)
-                logger.info("Sent sentinel, stopping batch loop...")
-                return
-            time.sleep(refresh_time)
+            elif self.__is_stopped.is_set():
+                if (
+                    not self.__is_hungup.is_set()
+                    and not self.__is_shutting_down.is_set()
+                    and not self.__is_oom.is_set()
+                ):
+                    self.__put(None)
+                    logger.info("Sent sentinel, stopping batch loop...")
+                    return
+                # wait for the stream to be re-established before sending the sentinel
+                time.sleep(refresh_time)
+            else:
+                # sleep until items are added or the batch is stopped
+                self.__batch_objects.wait(
+                    lambda: self.__queued() > 0
+                    or self.__is_stopped.is_set()
+                    or self.__shutdown_loop.is_set(),
+                    timeout=1,
+                )
+
+    def __queued(self) -> int:
+        return len(self.__batch_objects) + len(self.__batch_references)
 
     def __generate_stream_requests(
         self,
@@ -231,45 +275,56 @@ class _BatchBaseSync:
         def request_maker():
             return batch_pb2.BatchStreamRequest()
 
+        def request_done(request, serialized, total_size, uuids, beacons) -> _BatchStreamRequest:
+            _merge_serialized(request.data.objects, "values", serialized)
+            if len(serialized) > 0:
+                with self.__results_lock:
+                    self.__results_for_wrapper.results._add_request(total_size, len(serialized))
+            return _BatchStreamRequest(request, uuids, beacons)
+
         request = request_maker()
         total_size = request.ByteSize()
 
-        uuids, beacons = set(), set()
-        for object_ in objects:
-            obj = self.__batch_grpc.grpc_object(object_._to_internal())
-            obj_size = obj.ByteSize() + per_object_overhead
+        uuids, beacons, serialized_objs = set(), set(), []
+        for object_, serialized in zip(
+            objects,
+            self.__batch_grpc.serialized_objects(
+                [object_._to_internal() for object_ in objects], self.__serialization_pool
+            ),
+        ):
+            obj_size = len(serialized) + per_object_overhead
 
             if obj_size > self.__batch_grpc.grpc_max_msg_size:
                 raise WeaviateBatchValidationError(
                     f"Object with uuid {object_.uuid} is too large to be sent in a batch request. Size: {obj_size} bytes, max size: {self.__batch_grpc.grpc_max_msg_size} bytes."
                 )
 
-            if total_size + obj_size >= self.__batch_grpc.grpc_max_msg_size:
-                yield _BatchStreamRequest(request, uuids, beacons)
+            if total_size + obj_size >= self.__max_batch_bytes and len(uuids) > 0:
+                yield request_done(request, serialized_objs, total_size, uuids, beacons)
                 request = request_maker()
                 total_size = request.ByteSize()
-                uuids, beacons = set(), set()
+                uuids, beacons, serialized_objs = set(), set(), []
 
-            request.data.objects.values.append(obj)
+            serialized_objs.append(serialized)
             total_size += obj_size
-            uuids.add(obj.uuid)
+            uuids.add(str(object_.uuid))
 
         for reference in references:
             ref = self.__batch_grpc.grpc_reference(reference._to_internal())
             ref_size = ref.ByteSize() + per_object_overhead
 
-            if total_size + ref_size >= self.__batch_grpc.grpc_max_msg_size:
-                yield _BatchStreamRequest(request, uuids, beacons)
+            if total_size + ref_size >= self.__max_batch_bytes and len(uuids) + len(beacons) > 0:
+                yield request_done(request, serialized_objs, total_size, uuids, beacons)
                 request = request_maker()
                 total_size = request.ByteSize()
-                uuids, beacons = set(), set()
+                uuids, beacons, serialized_objs = set(), set(), []
 
             request.data.references.values.append(ref)
             total_size += ref_size
             beacons.add(reference._to_beacon())
 
-        if len(request.data.objects.values) > 0 or len(request.data.references.values) > 0:
-            yield _BatchStreamRequest(request, uuids, beacons)
+        if len(serialized_objs) > 0 or len(request.data.references.values) > 0:
+            yield request_done(request, serialized_objs, total_size, uuids, beacons)
 
     def __send(
         self,
@@ -462,6 +517,7 @@ class _BatchBaseSync:
 
         logger.info("Server closed the stream from its side, shutting down batch")
         self.__shutdown_loop.set()
+        self.__batch_objects.notify()
 
     def __reconnect(self, retry: int = 0) -> None:
         if self.__consistency_level == ConsistencyLevel.ALL or self.__number_of_nodes == 1:
@@ -546,10 +602,15 @@ class _BatchBaseSync:
 
     def flush(self) -> None:
         """Flush the batch queue and wait for all requests to be finished."""
-        # bg thread is sending objs+refs automatically, so simply wait for everything to be done
-        while len(self.__batch_objects) > 0 or len(self.__batch_references) > 0:
-            time.sleep(0.01)
-            self.__check_bg_threads_alive()
+        # bg thread is sending objs+refs automatically, so simply wait for everything to be done. Queued objects are sent
+        # right away instead of waiting for the linger time
+        self.__is_flushing.set()
+        self.__batch_objects.notify()
+        try:
+            while not self.__batch_objects.wait(lambda: self.__queued() == 0, timeout=1):
+                self.__check_bg_threads_alive()
+        finally:
+            self.__is_flushing.clear()
 
     def _add_object(
         self,
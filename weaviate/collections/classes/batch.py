@@ -2,15 +2,49 @@ import uuid as uuid_package
 from dataclasses import dataclass, field
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union, cast
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from weaviate.collections.classes.internal import ReferenceInputs
 from weaviate.collections.classes.types import WeaviateField
+from weaviate.collections.grpc.shared import _Pack, _Packing, _Unpack
+from weaviate.proto.v1 import base_pb2
 from weaviate.types import BEACON, UUID, VECTORS
 from weaviate.util import _capitalize_first_letter, _get_vector_v4, get_valid_uuid
 from weaviate.warnings import _Warnings
 
 MAX_STORED_RESULTS = 100000
+# estimated size in bytes of the fields of a gRPC batch object that are not properties or vectors, e.g. the uuid
+OBJECT_SIZE_OVERHEAD = 64
+
+
+def _utf8_length(value: str) -> int:
+    return len(value) if value.isascii() else len(value.encode("utf-8", "surrogatepass"))
+
+
+def _estimate_size(value: Any) -> int:
+    """Roughly estimate the number of bytes that a property value takes up in a gRPC message."""
+    if isinstance(value, str):
+        return _utf8_length(value) + 2
+    if isinstance(value, (bool, int, float)):
+        return 9
+    if isinstance(value, (bytes, bytearray)):
+        return len(value) * 4 // 3 + 2  # blobs are sent base64 encoded
+    if isinstance(value, dict):
+        return sum(_utf8_length(key) + 2 + _estimate_size(val) for key, val in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_size(val) for val in value) + 2
+    if value is None:
+        return 0
+    return _utf8_length(str(value)) + 2
+
+
+def _estimate_vector_size(vector: Any) -> int:
+    """Estimate the number of bytes of a vector, multi-vector or named vectors packed as float32."""
+    if isinstance(vector, dict):
+        return sum(len(name) + 4 + _estimate_vector_size(vec) for name, vec in vector.items())
+    if len(vector) > 0 and isinstance(vector[0], (list, tuple)):
+        return sum(len(vec) * 4 for vec in vector) + 4
+    return len(vector) * 4
 
 
 @dataclass
@@ -23,6 +57,8 @@ class _BatchObject:
     references: Optional[ReferenceInputs]
     index: int
     retry_count: int = 0
+    packed_vector: Optional[bytes] = None
+    packed_vectors: Optional[Dict[str, _Packing]] = None
 
 
 @dataclass
@@ -39,7 +75,8 @@ class BatchObject(BaseModel):
     """A Weaviate object to be added to the database.
 
     Performs validation on the class name and UUID, and automatically generates a UUID if one is not provided.
-    Also converts the vector to a list of floats if it is provided as a numpy array.
+    Also converts the vector to a list of floats if it is provided as a tensor or series. Numpy arrays and other
+    buffer-protocol vectors are packed into their gRPC wire format up front and kept as provided.
     """
 
     collection: str = Field(min_length=1)
@@ -51,13 +88,26 @@ class BatchObject(BaseModel):
     index: int
     retry_count: int = 0
 
+    _packed_vector: Optional[bytes] = PrivateAttr(default=None)
+    _packed_vectors: Optional[Dict[str, _Packing]] = PrivateAttr(default=None)
+    # estimated size of the object in a gRPC request, used to assemble batches by their size in bytes
+    _size: int = PrivateAttr(default=0)
+
     def __init__(self, **data: Any) -> None:
         v = data.get("vector")
+        packed_vector: Optional[bytes] = None
+        packed_vectors: Dict[str, _Packing] = {}
         if v is not None:
             if isinstance(v, dict):  # named vector
+                unpacked: Dict[str, Any] = {}
                 for key, val in v.items():
-                    v[key] = _get_vector_v4(val)
-                data["vector"] = v
+                    if (packing := _Pack.array(val, squeeze=True)) is not None:
+                        packed_vectors[key] = packing
+                    else:
+                        unpacked[key] = _get_vector_v4(val)
+                data["vector"] = unpacked
+            elif (packed_vector := _Pack.array_single(v)) is not None:
+                data["vector"] = None
             else:
                 data["vector"] = _get_vector_v4(v)
 
@@ -65,6 +115,26 @@ class BatchObject(BaseModel):
             get_valid_uuid(u) if (u := data.get("uuid")) is not None else uuid_package.uuid4()
         )
         super().__init__(**data)
+        if packed_vector is not None or len(packed_vectors) > 0:
+            # the vector field cannot validate arrays, so keep the input as provided next to its packed bytes
+            self.vector = v
+            self._packed_vector = packed_vector
+            self._packed_vectors = packed_vectors or None
+        self._size = self.__estimate_size(data.get("vector"))
+
+    def __estimate_size(self, unpacked_vector: Optional[VECTORS]) -> int:
+        size = OBJECT_SIZE_OVERHEAD + len(self.collection) + len(self.tenant or "")
+        if self.properties is not None:
+            size += _estimate_size(self.properties)
+        if self.references is not None:
+            size += _estimate_size(self.references)
+        if self._packed_vector is not None:
+            size += len(self._packed_vector)
+        for name, packing in (self._packed_vectors or {}).items():
+            size += len(name) + len(packing.bytes_) + 4
+        if unpacked_vector is not None:
+            size += _estimate_vector_size(unpacked_vector)
+        return size
 
     def _to_internal(self) -> _BatchObject:
         return _BatchObject(
@@ -75,13 +145,27 @@ class BatchObject(BaseModel):
             tenant=self.tenant,
             references=self.references,
             index=self.index,
+            packed_vector=self._packed_vector,
+            packed_vectors=self._packed_vectors,
         )
 
     @classmethod
     def _from_internal(cls, obj: _BatchObject) -> "BatchObject":
+        vector = obj.vector
+        if vector is None and obj.packed_vector is not None:
+            vector = _Unpack.single(obj.packed_vector)
+        elif vector is None and obj.packed_vectors is not None:
+            vector = {
+                name: (
+                    _Unpack.multi(packing.bytes_)
+                    if packing.type_ == base_pb2.Vectors.VECTOR_TYPE_MULTI_FP32
+                    else _Unpack.single(packing.bytes_)
+                )
+                for name, packing in obj.packed_vectors.items()
+            }
         return BatchObject(
             collection=obj.collection,
-            vector=obj.vector,
+            vector=vector,
             uuid=uuid_package.UUID(obj.uuid),
             properties=obj.properties,
             tenant=obj.tenant,
@@ -208,6 +292,7 @@ class BatchObjectReturn:
         errors: A dictionary of all the failed responses from the batch operation. The keys are the indices of the objects in the batch, and the values are the `Error` objects.
         uuids: A dictionary of all the successful responses from the batch operation. The keys are the indices of the objects in the batch, and the values are the `uuid_package.UUID` objects.
         has_errors: A boolean indicating whether or not any of the objects in the batch failed to be inserted. If this is `True`, then the `errors` dictionary will contain at least one entry.
+        compression_ratio: The estimated ratio of the uncompressed to the compressed size of the requests that were sent with gRPC compression, see `GrpcConfig.compression`. It is estimated from a sample of the compressed requests and is `None` if none of them was sampled.
     """
 
     _all_responses: List[Union[uuid_package.UUID, ErrorObject]] = field(default_factory=list)
@@ -215,6 +300,8 @@ class BatchObjectReturn:
     errors: Dict[int, ErrorObject] = field(default_factory=dict)
     uuids: Dict[int, uuid_package.UUID] = field(default_factory=dict)
     has_errors: bool = False
+    _compressed_request_bytes: int = 0
+    _compressed_wire_bytes: int = 0
 
     def __post_init__(self) -> None:
         self.has_errors = self.has_errors or len(self.errors) > 0
@@ -228,8 +315,16 @@ class BatchObjectReturn:
         _Warnings.batch_results_objects_all_responses_attribute()
         return self._all_responses
 
+    @property
+    def compression_ratio(self) -> Optional[float]:
+        if self._compressed_wire_bytes == 0:
+            return None
+        return self._compressed_request_bytes / self._compressed_wire_bytes
+
     def __add__(self, other: "BatchObjectReturn") -> "BatchObjectReturn":
         self._all_responses += other._all_responses
+        self._compressed_request_bytes += other._compressed_request_bytes
+        self._compressed_wire_bytes += other._compressed_wire_bytes
 
         self.errors.update(other.errors)
         self.uuids.update(other.uuids)
@@ -304,6 +399,36 @@ class BatchReferenceReturn:
         self.errors.update(errors)
 
 
+@dataclass
+class BatchSizeHistogram:
+    """This class contains a histogram of the sizes of the requests sent by a batch operation.
+
+    Attributes:
+        buckets: The number of requests per bucket. The keys are the inclusive upper bounds of the buckets, which are powers of two.
+        count: The number of requests.
+        total: The sum of the sizes of all requests.
+        largest: The size of the largest request.
+    """
+
+    buckets: Dict[int, int] = field(default_factory=dict)
+    count: int = 0
+    total: int = 0
+    largest: int = 0
+
+    @property
+    def mean(self) -> float:
+        """The mean size of the requests."""
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def add(self, size: int) -> None:
+        """Add the size of a single request to the histogram."""
+        bound = 1 << max(size - 1, 0).bit_length()
+        self.buckets[bound] = self.buckets.get(bound, 0) + 1
+        self.count += 1
+        self.total += size
+        self.largest = max(self.largest, size)
+
+
 class BatchResult:
     """This class contains the results of a batch operation.
 
@@ -313,11 +438,19 @@ class BatchResult:
     Attributes:
         objs: The results of the batch object operation.
         refs: The results of the batch reference operation.
+        request_bytes: The histogram of the estimated payload sizes in bytes of the requests that sent objects.
+        request_objects: The histogram of the number of objects in the requests that sent objects.
     """
 
     def __init__(self) -> None:
         self.objs: BatchObjectReturn = BatchObjectReturn()
         self.refs: BatchReferenceReturn = BatchReferenceReturn()
+        self.request_bytes: BatchSizeHistogram = BatchSizeHistogram()
+        self.request_objects: BatchSizeHistogram = BatchSizeHistogram()
+
+    def _add_request(self, size: int, objects: int) -> None:
+        self.request_bytes.add(size)
+        self.request_objects.add(objects)
 
 
 @dataclass
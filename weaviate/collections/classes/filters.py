@@ -480,6 +480,38 @@ class _FilterById(_FilterBase):
             operator=_Operator.NOT_EQUAL,
         )
 
+    def less_than(self, uuid: UUID) -> _Filters:
+        """Filter for objects whose ID is less than the given ID."""
+        return _FilterValue(
+            target=self._target_path(),
+            value=get_valid_uuid(uuid),
+            operator=_Operator.LESS_THAN,
+        )
+
+    def less_or_equal(self, uuid: UUID) -> _Filters:
+        """Filter for objects whose ID is less than or equal to the given ID."""
+        return _FilterValue(
+            target=self._target_path(),
+            value=get_valid_uuid(uuid),
+            operator=_Operator.LESS_THAN_EQUAL,
+        )
+
+    def greater_than(self, uuid: UUID) -> _Filters:
+        """Filter for objects whose ID is greater than the given ID."""
+        return _FilterValue(
+            target=self._target_path(),
+            value=get_valid_uuid(uuid),
+            operator=_Operator.GREATER_THAN,
+        )
+
+    def greater_or_equal(self, uuid: UUID) -> _Filters:
+        """Filter for objects whose ID is greater than or equal to the given ID."""
+        return _FilterValue(
+            target=self._target_path(),
+            value=get_valid_uuid(uuid),
+            operator=_Operator.GREATER_THAN_EQUAL,
+        )
+
 
 class _FilterByCount(_FilterBase):
     def __init__(self, link_on: str, target: Optional[_TargetRefs] = None) -> None:
@@ -1,3 +1,4 @@
+import inspect
 from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from enum import Enum, auto
@@ -784,6 +785,57 @@ class NearVector:
             raise WeaviateInvalidInputError(f"At least one vector must be given, got: {vectors}")
 
 
+@dataclass
+class _BatchQueryInput:
+    method: Literal["bm25", "hybrid", "near_vector"]
+    kwargs: Dict[str, Any]
+
+
+def _batch_query(
+    method: Literal["bm25", "hybrid", "near_vector"], kwargs: Dict[str, Any]
+) -> _BatchQueryInput:
+    # imported here as the query executors import this module
+    from weaviate.collections.queries.batch.executor import _BatchQueryExecutor
+
+    try:
+        inspect.signature(getattr(_BatchQueryExecutor, method)).bind(None, **kwargs)
+    except TypeError as e:
+        raise TypeError(f"BatchQuery.{method}(): {e}") from None
+    return _BatchQueryInput(method=method, kwargs=kwargs)
+
+
+class BatchQuery:
+    """Factory class to use when defining the queries of a `collection.query.batch()` call.
+
+    Every method takes the same arguments as the method of the same name within the `.query` namespace of a collection.
+    The arguments are checked against that method when the query is defined, so that a misspelled argument fails early.
+    """
+
+    @staticmethod
+    def bm25(query: Optional[str], **kwargs: Any) -> _BatchQueryInput:
+        """Define a keyword (BM25) search to run within the batch.
+
+        The arguments are the same as those of `collection.query.bm25()`.
+        """
+        return _batch_query("bm25", {"query": query, **kwargs})
+
+    @staticmethod
+    def hybrid(query: Optional[str], **kwargs: Any) -> _BatchQueryInput:
+        """Define a hybrid search to run within the batch.
+
+        The arguments are the same as those of `collection.query.hybrid()`.
+        """
+        return _batch_query("hybrid", {"query": query, **kwargs})
+
+    @staticmethod
+    def near_vector(near_vector: NearVectorInputType, **kwargs: Any) -> _BatchQueryInput:
+        """Define a vector search to run within the batch.
+
+        The arguments are the same as those of `collection.query.near_vector()`.
+        """
+        return _batch_query("near_vector", {"near_vector": near_vector, **kwargs})
+
+
 class _HybridNearBase(_WeaviateInput):
     model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
 
@@ -7,6 +7,7 @@ from typing import (
     Dict,
     Generic,
     List,
+    Literal,
     Mapping,
     Optional,
     Sequence,
@@ -303,6 +304,98 @@ class QueryReturn(Generic[P, R]):
     query_profile: Optional[QueryProfileReturn] = None
 
 
+@dataclass
+class BatchQueryReturn(Generic[P, R]):
+    """The return type of the `batch` query within the `.query` namespace of a collection.
+
+    The results are in the order of the queries. A query that failed has a result of `None` and its error is stored in
+    `errors` under the index of the query.
+    """
+
+    results: List[Optional[Union[QueryReturn[P, R], GroupByReturn[P, R], "ColumnarQueryReturn"]]]
+    errors: Dict[int, Exception]
+
+    @property
+    def has_errors(self) -> bool:
+        """Whether any of the queries failed."""
+        return len(self.errors) > 0
+
+
+ReturnFormat: TypeAlias = Literal["objects", "lazy", "columns"]
+
+
+@dataclass
+class ColumnarQueryReturn:
+    """The return type of a query within the `.query` namespace of a collection when `return_format="columns"` is specified.
+
+    Instead of one `Object` per result, every returned field is decoded into a single column with one entry per object,
+    in the order returned by Weaviate:
+        - `uuids` is a `numpy.ndarray` of 16-byte binary UUIDs with dtype `V16`. `bytes(uuid)` returns the raw bytes of
+            an element.
+        - `metadata` maps each returned metadata field to a typed `numpy.ndarray`. Missing values are `NaN`, `NaT` or `None`.
+        - `vectors` maps each returned vector name to a 2-D `numpy.ndarray` of shape `(len(result), dimensions)`.
+            Multi-vectors, or vectors that are not returned for every object, are lists of `numpy.ndarray` instead.
+        - `properties` maps each returned property name to a list of values. Missing values are `None`. Lists of dates
+            are decoded into `numpy.ndarray`s of UTC `datetime64[us]` values.
+
+    Use `to_pandas()`, `to_polars()` or `to_arrow()` to convert the columns into a dataframe or table. The `numpy` package
+    is required for this return format.
+    """
+
+    uuids: Any
+    metadata: Dict[str, Any]
+    vectors: Dict[str, Any]
+    properties: Dict[str, List[Any]]
+    query_profile: Optional[QueryProfileReturn] = None
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def _columns(self, nested_lists: bool) -> Dict[str, Any]:
+        # dataframe libraries store the raw bytes as binary, but do not understand numpy's void dtype
+        columns: Dict[str, Any] = {"uuid": self.uuids.tolist()}
+        columns.update(self.metadata)
+        for name, vector in self.vectors.items():
+            key = "vector" if name == "default" else f"vector_{name}"
+            if isinstance(vector, list) and nested_lists:
+                # multi-vectors and partially returned vectors cannot be expressed as a single array
+                columns[key] = [None if vec is None else vec.tolist() for vec in vector]
+            else:
+                columns[key] = vector
+        columns.update(self.properties)
+        return columns
+
+    def to_pandas(self) -> Any:
+        """Convert the columns into a `pandas.DataFrame` with one row per object. Requires the `pandas` package."""
+        import pandas as pd  # type: ignore
+
+        columns = self._columns(nested_lists=False)
+        for key, column in columns.items():
+            if getattr(column, "ndim", 1) > 1:
+                columns[key] = list(column)
+        return pd.DataFrame(columns)
+
+    def to_polars(self) -> Any:
+        """Convert the columns into a `polars.DataFrame` with one row per object. Requires the `polars` package."""
+        import polars as pl
+
+        return pl.DataFrame(self._columns(nested_lists=True))
+
+    def to_arrow(self) -> Any:
+        """Convert the columns into a `pyarrow.Table` with one row per object. Requires the `pyarrow` package."""
+        import pyarrow as pa  # type: ignore
+
+        columns = self._columns(nested_lists=True)
+        for key, column in columns.items():
+            if key == "uuid":
+                columns[key] = pa.array(column, type=pa.binary(16))
+            elif getattr(column, "ndim", 1) > 1:
+                columns[key] = pa.FixedSizeListArray.from_arrays(
+                    column.reshape(-1), column.shape[1]
+                )
+        return pa.table(columns)
+
+
 _GQLEntryReturnType: TypeAlias = Dict[str, List[Dict[str, Any]]]
 
 
@@ -712,6 +805,7 @@ class _QueryOptions:
     include_references: bool
     include_vector: bool
     is_group_by: bool
+    lazy: bool = False
 
     @classmethod
     def from_input(
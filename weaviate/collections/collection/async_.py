@@ -216,6 +216,9 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
         return_references: Literal[None] = None,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectAIterator[Properties, References]: ...
 
     @overload
@@ -228,6 +231,9 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
         return_references: REFERENCES,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectAIterator[Properties, CrossReferences]: ...
 
     @overload
@@ -240,6 +246,9 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
         return_references: Type[TReferences],
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectAIterator[Properties, TReferences]: ...
 
     @overload
@@ -252,6 +261,9 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
         return_references: Literal[None] = None,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectAIterator[TProperties, References]: ...
 
     @overload
@@ -264,6 +276,9 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
         return_references: REFERENCES,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectAIterator[TProperties, CrossReferences]: ...
 
     @overload
@@ -276,6 +291,9 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
         return_references: Type[TReferences],
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectAIterator[TProperties, TReferences]: ...
 
     def iterator(
@@ -287,6 +305,9 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
         return_references: Optional[ReturnReferences[TReferences]] = None,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> Union[
         _ObjectAIterator[Properties, References],
         _ObjectAIterator[Properties, CrossReferences],
@@ -312,6 +333,13 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
             return_references: The references to return with each object.
             after: The cursor to use to mark the initial starting point of the iterator in the collection.
             cache_size: How many objects should be fetched in each request to Weaviate during the iteration. The default is 100.
+            prefetch: How many pages of objects should be fetched ahead in the background while the current page is consumed.
+                The default is 0, which fetches the next page only once the current page is consumed.
+            page_bytes: The estimated number of bytes that each page of objects should take up. If set, the number of objects
+                per page starts at `cache_size` and grows or shrinks towards this target after every page.
+            parallelism: How many ranges of the UUIDs of the collection should be scanned concurrently. The default is 1, which
+                scans the collection with a single cursor. With more than one range the objects are returned in no particular order.
+                Every range is scanned with its own cursor in a background task.
 
         Raises:
             weaviate.exceptions.WeaviateGRPCQueryError: If the request to the Weaviate server fails.
@@ -326,4 +354,7 @@ class CollectionAsync(Generic[Properties, References], _CollectionBase[Connectio
                 after=after,
             ),
             cache_size=cache_size,
+            prefetch=prefetch,
+            page_bytes=page_bytes,
+            parallelism=parallelism,
         )
@@ -110,7 +110,7 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
         self.config: _ConfigCollection = config
         """This namespace includes all the CRUD methods available to you when modifying the configuration of the collection in Weaviate."""
         self.data: _DataCollection[Properties] = _DataCollection[Properties](
-            connection, name, consistency_level, tenant, validate_arguments
+            connection, name, consistency_level, tenant, validate_arguments, properties
         )
         """This namespace includes all the CUD methods available to you when modifying the data of the collection in Weaviate."""
         self.generate: _GenerateCollection[Properties, References] = _GenerateCollection[
@@ -235,6 +235,9 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
         return_references: Literal[None] = None,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectIterator[Properties, References]: ...
 
     @overload
@@ -247,6 +250,9 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
         return_references: REFERENCES,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectIterator[Properties, CrossReferences]: ...
 
     @overload
@@ -259,6 +265,9 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
         return_references: Type[TReferences],
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectIterator[Properties, TReferences]: ...
 
     @overload
@@ -271,6 +280,9 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
         return_references: Literal[None] = None,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectIterator[TProperties, References]: ...
 
     @overload
@@ -283,6 +295,9 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
         return_references: REFERENCES,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectIterator[TProperties, CrossReferences]: ...
 
     @overload
@@ -295,6 +310,9 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
         return_references: Type[TReferences],
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> _ObjectIterator[TProperties, TReferences]: ...
 
     def iterator(
@@ -306,6 +324,9 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
         return_references: Optional[ReturnReferences[TReferences]] = None,
         after: Optional[UUID] = None,
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> Union[
         _ObjectIterator[Properties, References],
         _ObjectIterator[Properties, CrossReferences],
@@ -331,6 +352,13 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
             return_references:     The references to return with each object.
             after:     The cursor to use to mark the initial starting point of the iterator in the collection.
             cache_size:     How many objects should be fetched in each request to Weaviate during the iteration. The default is 100.
+            prefetch:     How many pages of objects should be fetched ahead in the background while the current page is consumed.
+                The default is 0, which fetches the next page only once the current page is consumed.
+            page_bytes:     The estimated number of bytes that each page of objects should take up. If set, the number of objects
+                per page starts at `cache_size` and grows or shrinks towards this target after every page.
+            parallelism:     How many ranges of the UUIDs of the collection should be scanned concurrently. The default is 1, which
+                scans the collection with a single cursor. With more than one range the objects are returned in no particular order.
+                Every range is scanned with its own cursor in a background thread.
 
         Raises:
             weaviate.exceptions.WeaviateGRPCQueryError: If the request to the Weaviate server fails.
@@ -345,4 +373,7 @@ class Collection(Generic[Properties, References], _CollectionBase[ConnectionSync
                 after=after,
             ),
             cache_size=cache_size,
+            prefetch=prefetch,
+            page_bytes=page_bytes,
+            parallelism=parallelism,
         )
@@ -29,6 +29,7 @@ from weaviate.collections.batch.collection import (
 )
 from weaviate.collections.batch.grpc_batch import _BatchGRPC
 from weaviate.collections.batch.grpc_batch_delete import _BatchDeleteGRPC
+from weaviate.collections.batch.grpc_properties import _PropertySerializer
 from weaviate.collections.batch.rest import _BatchREST
 from weaviate.collections.classes.batch import (
     BatchObjectReturn,
@@ -55,10 +56,12 @@ from weaviate.collections.classes.types import (
     WeaviateField,
     _PhoneNumber,
 )
+from weaviate.collections.grpc.shared import _Pack, _Packing
 from weaviate.connect import executor
 from weaviate.connect.v4 import ConnectionAsync, ConnectionType, _ExpectedStatusCodes
 from weaviate.exceptions import WeaviateInvalidInputError
 from weaviate.logger import logger
+from weaviate.proto.v1 import base_pb2
 from weaviate.types import BEACON, UUID, VECTORS
 from weaviate.util import _datetime_to_string, _get_vector_v4
 from weaviate.validator import _validate_input, _ValidateArgument
@@ -83,10 +86,18 @@ class _DataCollectionExecutor(Generic[ConnectionType, Properties]):
         self._consistency_level = consistency_level
         self._tenant = tenant
         self._validate_arguments = validate_arguments
+        self.__property_serializer = (
+            _PropertySerializer.from_data_model(type_) if type_ is not None else None
+        )
         self.__batch_grpc = _BatchGRPC(
             weaviate_version=connection._weaviate_version,
             consistency_level=consistency_level,
             grpc_max_msg_size=connection._grpc_max_msg_size,
+            property_serializers=(
+                {name: self.__property_serializer}
+                if self.__property_serializer is not None
+                else None
+            ),
         )
         self.__batch_rest = _BatchREST(consistency_level=consistency_level)
         self.__batch_delete = _BatchDeleteGRPC(
@@ -217,6 +228,161 @@ class _DataCollectionExecutor(Generic[ConnectionType, Properties]):
             max_retries=2,
         )
 
+    def insert_columns(
+        self,
+        vectors: Optional[Any] = None,
+        properties: Optional[Mapping[str, Sequence[Any]]] = None,
+        uuids: Optional[Sequence[Any]] = None,
+    ) -> executor.Result[BatchObjectReturn]:
+        """Insert multiple objects into the collection from column-oriented data.
+
+        This is a faster alternative to `insert_many` for large, homogeneous imports, e.g. the rows of a parquet file together
+        with a matrix of their embeddings. The data is not validated on the client and the objects are split into as many
+        requests as needed to stay within the maximum gRPC message size of your Weaviate instance.
+
+        Args:
+            vectors: The vectors of the objects as a 2-D `numpy.ndarray` (or anything `numpy.asarray` accepts) of shape
+                `(objects, dimensions)`, where row `i` is the vector of object `i`. For named vectors, supply a dictionary
+                with the names of the vectors as keys and one such matrix per name as values. Requires `numpy`.
+            properties: The properties of the objects as a mapping from property name to a column of values, where value `i`
+                belongs to object `i`. Columns can be lists, `numpy.ndarray`, `pd.Series` or `pl.Series`.
+            uuids: The UUIDs of the objects. Can be strings, `uuid.UUID` or the 16 raw bytes of a UUID, for example the `uuids`
+                column of a `ColumnarQueryReturn`. If not provided, a random UUID will be generated for each object.
+
+        Returns:
+            The results of the insertion. The keys of `uuids` and `errors` are the row indices of the objects.
+
+        Raises:
+            weaviate.exceptions.WeaviateInvalidInputError: If the columns do not all have the same length or a vector matrix is not 2-D.
+            weaviate.exceptions.WeaviateBatchValidationError: If a single object is too large to be sent in a request.
+            weaviate.exceptions.WeaviateInsertManyAllFailedError: If every object in one of the requests fails to be inserted.
+        """
+        if self._validate_arguments:
+            _validate_input(
+                [
+                    _ValidateArgument(
+                        expected=[Mapping, None], name="properties", value=properties
+                    ),
+                ]
+            )
+
+        named_rows: Dict[str, List[bytes]] = {}
+        single_rows: Optional[List[bytes]] = None
+        if isinstance(vectors, Mapping):
+            named_rows = {name: _Pack.rows(matrix) for name, matrix in vectors.items()}
+        elif vectors is not None:
+            single_rows = _Pack.rows(vectors)
+
+        columns = {
+            name: self.__column_to_list(column) for name, column in (properties or {}).items()
+        }
+        lengths = {f"property '{name}'": len(column) for name, column in columns.items()}
+        lengths.update({f"vector '{name}'": len(rows) for name, rows in named_rows.items()})
+        if single_rows is not None:
+            lengths["vectors"] = len(single_rows)
+        if uuids is not None:
+            lengths["uuids"] = len(uuids)
+            if getattr(getattr(uuids, "dtype", None), "kind", None) == "S":
+                # the elements of fixed-width bytes arrays lose their trailing null bytes, the buffer keeps them
+                uuids = cast(Any, uuids).view(f"V{cast(Any, uuids).dtype.itemsize}")
+        if len(set(lengths.values())) > 1:
+            raise WeaviateInvalidInputError(
+                f"All columns must have the same length, but got the lengths {lengths}"
+            )
+        n_objects = next(iter(lengths.values()), 0)
+
+        names = list(columns.keys())
+        rows = zip(*columns.values()) if len(names) > 0 else ((),) * n_objects
+        objs = (
+            _BatchObject(
+                collection=self.name,
+                vector=None,
+                uuid=(
+                    str(uuid_package.uuid4())
+                    if uuids is None
+                    else self.__column_uuid_to_str(uuids[idx])
+                ),
+                properties=dict(zip(names, row)),
+                tenant=self._tenant,
+                references=None,
+                index=idx,
+                packed_vector=single_rows[idx] if single_rows is not None else None,
+                packed_vectors=(
+                    {
+                        name: _Packing(
+                            bytes_=rows_[idx], type_=base_pb2.Vectors.VECTOR_TYPE_SINGLE_FP32
+                        )
+                        for name, rows_ in named_rows.items()
+                    }
+                    if len(named_rows) > 0
+                    else None
+                ),
+            )
+            for idx, row in enumerate(rows)
+        )
+        chunks = self.__batch_grpc.grpc_object_chunks(objs)
+
+        def log_errors(res: BatchObjectReturn) -> BatchObjectReturn:
+            if (n_obj_errs := len(res.errors)) > 0:
+                logger.error(
+                    {
+                        "message": f"Failed to send {n_obj_errs} objects in a batch of {n_objects}. Please inspect the errors variable of the returned object for more information.",
+                        "errors": res.errors,
+                    }
+                )
+            return res
+
+        if isinstance(self._connection, ConnectionAsync):
+            con = self._connection
+
+            async def execute() -> BatchObjectReturn:
+                res = BatchObjectReturn()
+                for chunk, weaviate_objs in chunks:
+                    res += await executor.aresult(
+                        self.__batch_grpc.send_objects(
+                            con,
+                            objects=chunk,
+                            weaviate_objs=weaviate_objs,
+                            timeout=con.timeout_config.insert,
+                            max_retries=2,
+                        )
+                    )
+                return log_errors(res)
+
+            return execute()
+
+        res = BatchObjectReturn()
+        for chunk, weaviate_objs in chunks:
+            res += executor.result(
+                self.__batch_grpc.send_objects(
+                    self._connection,
+                    objects=chunk,
+                    weaviate_objs=weaviate_objs,
+                    timeout=self._connection.timeout_config.insert,
+                    max_retries=2,
+                )
+            )
+        return log_errors(res)
+
+    @staticmethod
+    def __column_to_list(column: Any) -> List[Any]:
+        # converting whole columns turns numpy scalars into Python values in one go
+        if isinstance(column, list):
+            return column
+        if hasattr(column, "tolist"):  # numpy.ndarray and pd.Series
+            return cast(List[Any], column.tolist())
+        if hasattr(column, "to_list"):  # pl.Series
+            return cast(List[Any], column.to_list())
+        return list(column)
+
+    @staticmethod
+    def __column_uuid_to_str(uuid: Any) -> str:
+        if not isinstance(uuid, (str, bytes, uuid_package.UUID)) and hasattr(uuid, "tobytes"):
+            uuid = uuid.tobytes()  # an element of a numpy "V16" column
+        if isinstance(uuid, bytes):
+            return str(uuid_package.UUID(bytes=uuid))
+        return str(uuid)
+
     def exists(self, uuid: UUID) -> executor.Result[bool]:
         """Check for existence of a single object in the collection.
 
@@ -736,6 +902,7 @@ class _DataCollectionExecutor(Generic[ConnectionType, Properties]):
                         consistency_level=self._consistency_level,
                         name=self.name,
                         tenant=self._tenant,
+                        property_serializer=self.__property_serializer,
                     )
                 )
                 async with ctx as batch:
@@ -766,6 +933,7 @@ class _DataCollectionExecutor(Generic[ConnectionType, Properties]):
                 consistency_level=self._consistency_level,
                 name=self.name,
                 tenant=self._tenant,
+                property_serializer=self.__property_serializer,
             )
         )
         with ctx as batch:
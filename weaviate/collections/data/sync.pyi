@@ -1,5 +1,16 @@
 import uuid as uuid_package
-from typing import Generic, Iterable, List, Literal, Optional, Sequence, Union, overload
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
 
 from weaviate.collections.batch.grpc_batch import _BatchGRPC
 from weaviate.collections.batch.grpc_batch_delete import _BatchDeleteGRPC
@@ -39,6 +50,12 @@ class _DataCollection(Generic[Properties,], _DataCollectionExecutor[ConnectionSy
         self,
         objects: Sequence[Union[Properties, DataObject[Properties, Optional[ReferenceInputs]]]],
     ) -> BatchObjectReturn: ...
+    def insert_columns(
+        self,
+        vectors: Optional[Any] = None,
+        properties: Optional[Mapping[str, Sequence[Any]]] = None,
+        uuids: Optional[Sequence[Any]] = None,
+    ) -> BatchObjectReturn: ...
     def exists(self, uuid: UUID) -> bool: ...
     def replace(
         self,
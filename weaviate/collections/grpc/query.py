@@ -1,6 +1,9 @@
+import functools
 import uuid as uuid_lib
 from dataclasses import dataclass
 from typing import (
+    Any,
+    Callable,
     Dict,
     List,
     Literal,
@@ -45,6 +48,7 @@ from weaviate.collections.classes.internal import (
 )
 from weaviate.collections.filters import _FilterToGRPC
 from weaviate.collections.grpc.shared import _BaseGRPC
+from weaviate.instrumentation import _NO_INSTRUMENTATION, _Instrumentation
 from weaviate.proto.v1 import base_search_pb2, search_get_pb2
 from weaviate.types import NUMBER, UUID
 from weaviate.util import _ServerVersion
@@ -73,7 +77,30 @@ class _Move:
     objects: List[uuid_lib.UUID]
 
 
+@dataclass
+class _PreparedNearVectorRequest:
+    template: search_get_pb2.SearchRequest
+    certainty: Optional[NUMBER]
+    distance: Optional[NUMBER]
+    target_vector: Optional[TargetVectorJoinType]
+    diversity_selection: Optional[MMR]
+
+
 A = TypeVar("A")
+F = TypeVar("F", bound=Callable[..., search_get_pb2.SearchRequest])
+
+
+def _build_span(method: F) -> F:
+    @functools.wraps(method)
+    def wrapper(self: "_QueryGRPC", *args: Any, **kwargs: Any) -> search_get_pb2.SearchRequest:
+        if not self._instrumentation.enabled:
+            return method(self, *args, **kwargs)
+        with self._instrumentation.span(
+            "weaviate.query.build", {"weaviate.collection": self._name}
+        ):
+            return method(self, *args, **kwargs)
+
+    return cast(F, wrapper)
 
 
 class _QueryGRPC(_BaseGRPC):
@@ -86,9 +113,11 @@ class _QueryGRPC(_BaseGRPC):
         validate_arguments: bool,
         uses_125_api: bool,
         uses_127_api: bool,
+        instrumentation: _Instrumentation = _NO_INSTRUMENTATION,
     ):
         super().__init__(weaviate_version, consistency_level, validate_arguments)
         self._name: str = name
+        self._instrumentation = instrumentation
         self._tenant = tenant
         self._validate_arguments = validate_arguments
         self.__uses_125_api = uses_125_api
@@ -111,6 +140,7 @@ class _QueryGRPC(_BaseGRPC):
             float(distance) if distance is not None else None,
         )
 
+    @_build_span
     def get(
         self,
         *,
@@ -151,6 +181,7 @@ class _QueryGRPC(_BaseGRPC):
             sort_by=sort_by,
         )
 
+    @_build_span
     def hybrid(
         self,
         *,
@@ -200,6 +231,7 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
+    @_build_span
     def bm25(
         self,
         *,
@@ -249,6 +281,7 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
+    @_build_span
     def near_vector(
         self,
         *,
@@ -290,6 +323,69 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        autocut: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Optional[_GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        return_metadata: Optional[_MetadataQuery] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Optional[REFERENCES] = None,
+        diversity_selection: Optional[MMR] = None,
+    ) -> _PreparedNearVectorRequest:
+        """Build everything of a near_vector request except the vector, to be completed by `near_vector_prepared`."""
+        template = self.__create_request(
+            limit=limit,
+            offset=offset,
+            filters=filters,
+            metadata=return_metadata,
+            return_properties=return_properties,
+            return_references=return_references,
+            rerank=rerank,
+            boost=boost,
+            autocut=autocut,
+            group_by=group_by,
+            near_vector=self._parse_near_vector_options(
+                certainty, distance, target_vector, diversity_selection
+            ),
+        )
+        return _PreparedNearVectorRequest(
+            template=template,
+            certainty=certainty,
+            distance=distance,
+            target_vector=target_vector,
+            diversity_selection=diversity_selection,
+        )
+
+    @_build_span
+    def near_vector_prepared(
+        self, prepared: _PreparedNearVectorRequest, near_vector: NearVectorInputType
+    ) -> search_get_pb2.SearchRequest:
+        request = search_get_pb2.SearchRequest()
+        request.CopyFrom(prepared.template)
+        if (packing := self._pack_near_vector(near_vector)) is not None:
+            request.near_vector.vectors.add(vector_bytes=packing.bytes_, type=packing.type_)
+        else:
+            request.near_vector.CopyFrom(
+                self._parse_near_vector(
+                    near_vector,
+                    prepared.certainty,
+                    prepared.distance,
+                    target_vector=prepared.target_vector,
+                    diversity_selection=prepared.diversity_selection,
+                )
+            )
+        return request
+
+    @_build_span
     def near_object(
         self,
         *,
@@ -331,6 +427,7 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
+    @_build_span
     def near_text(
         self,
         *,
@@ -376,6 +473,7 @@ class _QueryGRPC(_BaseGRPC):
             ),
         )
 
+    @_build_span
     def near_media(
         self,
         *,
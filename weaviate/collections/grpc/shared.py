@@ -449,6 +449,54 @@ class _BaseGRPC:
             selection=self._diversity_selection_to_grpc(diversity_selection),
         )
 
+    def _parse_near_vector_options(
+        self,
+        certainty: Optional[NUMBER],
+        distance: Optional[NUMBER],
+        target_vector: Optional[TargetVectorJoinType],
+        diversity_selection: Optional[MMR] = None,
+    ) -> base_search_pb2.NearVector:
+        """Build the vector-independent fields of a `NearVector`, to be completed by `_pack_near_vector`."""
+        if self._validate_arguments:
+            _validate_input(
+                _ValidateArgument(
+                    [str, None, List, _MultiTargetVectorJoin], "target_vector", target_vector
+                )
+            )
+        certainty, distance = self._parse_near_options(certainty, distance)
+        targets, target_vectors = self.__target_vector_to_grpc(target_vector)
+        return base_search_pb2.NearVector(
+            certainty=certainty,
+            distance=distance,
+            targets=targets,
+            target_vectors=target_vectors,
+            selection=self._diversity_selection_to_grpc(diversity_selection),
+        )
+
+    def _pack_near_vector(self, near_vector: NearVectorInputType) -> Optional["_Packing"]:
+        """Pack a plain single or multi vector into the `vectors` field of a `NearVector`.
+
+        Returns `None` if the vector needs the full `_parse_near_vector` treatment, e.g. because it targets several named
+        vectors or the server predates the `vectors` field.
+        """
+        if self._weaviate_version.is_lower_than(1, 29, 0) or isinstance(near_vector, dict):
+            return None
+        packing = _Pack.array(near_vector)
+        if packing is None:
+            if _is_1d_vector(near_vector):
+                packing = _Packing(
+                    bytes_=_Pack.single(near_vector),
+                    type_=base_pb2.Vectors.VECTOR_TYPE_SINGLE_FP32,
+                )
+            elif _is_2d_vector(near_vector):
+                packing = _Packing(
+                    bytes_=_Pack.multi(near_vector),
+                    type_=base_pb2.Vectors.VECTOR_TYPE_MULTI_FP32,
+                )
+            else:
+                return None
+        return packing
+
     @staticmethod
     def __parse_move(
         move: Optional[Move],
@@ -809,6 +857,8 @@ class _Packing:
 class _Pack:
     @staticmethod
     def parse_single_or_multi_vec(vector: PrimitiveVectorType) -> _Packing:
+        if (packing := _Pack.array(vector)) is not None:
+            return packing
         if _is_2d_vector(vector):
             return _Packing(
                 bytes_=_Pack.multi(vector),
@@ -822,13 +872,69 @@ class _Pack:
         else:
             raise WeaviateInvalidInputError(f"Invalid vectors: {vector}")
 
+    @staticmethod
+    def array(vector: Any, squeeze: bool = False) -> Optional[_Packing]:
+        """Pack a numpy array or buffer-protocol vector straight from its memory.
+
+        If `squeeze` is set, dimensions of size one are removed first like `_get_vector_v4` does, so that e.g. an array of
+        shape `(1, D)` is packed as a single vector.
+
+        Returns `None` if `vector` is not array-like, in which case the caller should fall back to the list-based packing.
+        """
+        arr = _as_float32_array(vector)
+        if arr is None:
+            return None
+        if squeeze:
+            arr = arr.squeeze()
+        if arr.ndim == 1 and len(arr) > 0:
+            return _Packing(bytes_=arr.tobytes(), type_=base_pb2.Vectors.VECTOR_TYPE_SINGLE_FP32)
+        if arr.ndim == 2 and arr.size > 0:
+            return _Packing(
+                bytes_=struct.pack("<H", arr.shape[1]) + arr.tobytes(),
+                type_=base_pb2.Vectors.VECTOR_TYPE_MULTI_FP32,
+            )
+        return None
+
+    @staticmethod
+    def array_single(vector: Any) -> Optional[bytes]:
+        """Pack a numpy array or buffer-protocol vector as a single vector, squeezing it like `_get_vector_v4` does.
+
+        Returns `None` if `vector` is not array-like or does not squeeze to one dimension.
+        """
+        arr = _as_float32_array(vector)
+        if arr is None or (arr := arr.squeeze()).ndim != 1:
+            return None
+        return cast(bytes, arr.tobytes())
+
+    @staticmethod
+    def rows(matrix: Any) -> List[bytes]:
+        """Pack every row of a 2-D matrix as a single vector, converting the whole matrix to float32 at once."""
+        import numpy as np
+
+        try:
+            arr = np.ascontiguousarray(matrix, dtype="<f4")
+        except (TypeError, ValueError) as e:
+            raise WeaviateInvalidInputError(f"Invalid vector matrix: {e}") from e
+        if arr.ndim != 2 or arr.shape[1] == 0:
+            raise WeaviateInvalidInputError(
+                f"Expected a 2-D matrix of shape (objects, dimensions), but got shape {arr.shape}"
+            )
+        buffer = arr.tobytes()
+        stride = arr.shape[1] * UINT32_LEN
+        return [buffer[i : i + stride] for i in range(0, len(buffer), stride)]
+
     @staticmethod
     def single(vector: OneDimensionalVectorType) -> bytes:
+        if (packed := _Pack.array_single(vector)) is not None:
+            return packed
         vector_list = _get_vector_v4(vector)
         return struct.pack("{}f".format(len(vector_list)), *vector_list)
 
     @staticmethod
     def multi(vector: TwoDimensionalVectorType) -> bytes:
+        arr = _as_float32_array(vector)
+        if arr is not None and arr.ndim == 2:
+            return struct.pack("<H", arr.shape[1]) + arr.tobytes()
         vector_list = [item for sublist in vector for item in sublist]
         return struct.pack("<H", len(vector[0])) + struct.pack(
             "{}f".format(len(vector_list)), *vector_list
@@ -851,6 +957,42 @@ class _Unpack:
             for i in range(how_many)
         ]
 
+    @staticmethod
+    def single_numpy(byte_vector: bytes) -> Any:
+        """Decode a single vector as a read-only `numpy.ndarray` view over `byte_vector` without copying."""
+        import numpy as np
+
+        return np.frombuffer(byte_vector, dtype="<f4")
+
+    @staticmethod
+    def multi_numpy(byte_vector: bytes) -> Any:
+        """Decode a multi-vector as a read-only 2-D `numpy.ndarray` view over `byte_vector` without copying."""
+        import numpy as np
+
+        dim = int(struct.unpack("<H", byte_vector[:2])[0])
+        return np.frombuffer(byte_vector, dtype="<f4", offset=2).reshape(-1, dim)
+
+
+def _as_float32_array(vector: Any) -> Optional[Any]:
+    """Return `vector` as a little-endian float32 `numpy.ndarray` if it is a numpy array or exposes the buffer protocol.
+
+    Returns `None` for all other inputs, e.g. lists, tensors and series, or if numpy is not installed.
+    """
+    if isinstance(vector, (list, tuple, dict, str, bytes, bytearray)):
+        return None
+    try:
+        memoryview(vector)
+    except (TypeError, ValueError):
+        return None
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    try:
+        return np.asarray(vector, dtype="<f4")
+    except (TypeError, ValueError):
+        return None
+
 
 def _is_1d_vector(inputs: Any) -> TypeGuard[OneDimensionalVectorType]:
     try:
@@ -1,16 +1,30 @@
+import asyncio
+import functools
+import threading
 from collections import deque
 from dataclasses import dataclass
 from typing import (
     Any,
     AsyncIterable,
     AsyncIterator,
+    Awaitable,
+    Callable,
     Generic,
     Iterable,
     Iterator,
+    List,
     Optional,
+    Sequence,
+    Tuple,
+    Union,
 )
 from uuid import UUID
 
+from weaviate.collections.classes.batch import (
+    OBJECT_SIZE_OVERHEAD,
+    _estimate_size,
+    _estimate_vector_size,
+)
 from weaviate.collections.classes.grpc import METADATA
 from weaviate.collections.classes.internal import (
     Object,
@@ -26,6 +40,9 @@ from weaviate.collections.queries.fetch_objects import (
 from weaviate.types import UUID as UUIDorStr
 
 ITERATOR_CACHE_SIZE = 100
+ITERATOR_MAX_PAGE_SIZE = 10000
+# the number of objects of a page whose size is estimated to adapt the page size
+ITERATOR_SIZE_SAMPLE = 16
 
 
 @dataclass
@@ -41,6 +58,269 @@ def _parse_after(after: Optional[UUIDorStr]) -> Optional[UUID]:
     return after if after is None or isinstance(after, UUID) else UUID(after)
 
 
+def _next_page_size(
+    page_size: int, page: Sequence[Object[Any, Any]], page_bytes: Optional[int]
+) -> int:
+    """Move the page size towards the number of objects that fit into `page_bytes`, at most doubling it per page."""
+    if page_bytes is None or len(page) == 0:
+        return page_size
+    sample = page[:ITERATOR_SIZE_SAMPLE]
+    object_bytes = sum(
+        OBJECT_SIZE_OVERHEAD + _estimate_size(obj.properties) + _estimate_vector_size(obj.vector)
+        for obj in sample
+    ) / len(sample)
+    return max(1, min(int(page_bytes // object_bytes), 2 * page_size, ITERATOR_MAX_PAGE_SIZE))
+
+
+_Page = List[Object[Any, Any]]
+_Scan = Tuple[Callable[[Optional[UUID], int], _Page], Optional[UUID]]
+_AsyncScan = Tuple[Callable[[Optional[UUID], int], Awaitable[_Page]], Optional[UUID]]
+
+
+def _partition_bounds(
+    after: Optional[UUID], parallelism: int
+) -> List[Tuple[Optional[UUID], Optional[UUID]]]:
+    """Split the UUIDs above `after` into `parallelism` ranges of equal size.
+
+    Every range is returned as a pair of the exclusive lower and upper bound, `None` stands for an unbounded side.
+    """
+    lower = 0 if after is None else after.int + 1
+    bounds = [lower + i * (2**128 - lower) // parallelism for i in range(parallelism + 1)]
+    return [
+        (
+            after if i == 0 else UUID(int=bounds[i] - 1),
+            None if i == parallelism - 1 else UUID(int=bounds[i + 1]),
+        )
+        for i in range(parallelism)
+    ]
+
+
+def _truncate(page: _Page, before: Optional[UUID]) -> _Page:
+    if before is None or len(page) == 0 or page[-1].uuid < before:
+        return page
+    return [obj for obj in page if obj.uuid < before]
+
+
+def _fetch_page(
+    query: _FetchObjectsQuery[Any, Any],
+    inputs: _IteratorInputs[Any, Any],
+    after: Optional[UUID],
+    limit: int,
+) -> _Page:
+    res = query.fetch_objects(
+        limit=limit,
+        after=after,
+        include_vector=inputs.include_vector,
+        return_metadata=inputs.return_metadata,
+        return_properties=inputs.return_properties,
+        return_references=inputs.return_references,
+    )
+    return res.objects  # type: ignore
+
+
+def _fetch_range_page(
+    query: _FetchObjectsQuery[Any, Any],
+    inputs: _IteratorInputs[Any, Any],
+    before: Optional[UUID],
+    after: Optional[UUID],
+    limit: int,
+) -> _Page:
+    # a range is paged with the cursor API like a full scan, the page that crosses the end of the range is cut off there
+    return _truncate(_fetch_page(query, inputs, after, limit), before)
+
+
+async def _afetch_page(
+    query: _FetchObjectsQueryAsync[Any, Any],
+    inputs: _IteratorInputs[Any, Any],
+    after: Optional[UUID],
+    limit: int,
+) -> _Page:
+    res = await query.fetch_objects(
+        limit=limit,
+        after=after,
+        include_vector=inputs.include_vector,
+        return_metadata=inputs.return_metadata,
+        return_properties=inputs.return_properties,
+        return_references=inputs.return_references,
+    )
+    return res.objects  # type: ignore
+
+
+async def _afetch_range_page(
+    query: _FetchObjectsQueryAsync[Any, Any],
+    inputs: _IteratorInputs[Any, Any],
+    before: Optional[UUID],
+    after: Optional[UUID],
+    limit: int,
+) -> _Page:
+    return _truncate(await _afetch_page(query, inputs, after, limit), before)
+
+
+class _PagePrefetcher:
+    """Fetches the pages of one or more scans in background threads, up to `depth` pages ahead of the consumer.
+
+    Every scan runs in its own thread and fetches its pages one after another, as every page starts after the last object
+    of the previous one. The pages of all scans are handed out in the order they arrive. An error of a fetch is raised by
+    `next_page` once the pages before it are consumed.
+    """
+
+    def __init__(
+        self,
+        scans: Sequence[_Scan],
+        page_size: int,
+        page_bytes: Optional[int],
+        depth: int,
+    ) -> None:
+        self.__page_bytes = page_bytes
+        self.__depth = depth
+        self.__pages: deque[Union[_Page, BaseException]] = deque()
+        self.__condition = threading.Condition()
+        self.__stopped = False
+        self.__running = len(scans)
+        for fetch, after in scans:
+            threading.Thread(
+                target=self.__run,
+                args=(fetch, after, page_size),
+                daemon=True,
+                name="WeaviateIteratorPrefetch",
+            ).start()
+
+    def __run(
+        self,
+        fetch: Callable[[Optional[UUID], int], _Page],
+        after: Optional[UUID],
+        page_size: int,
+    ) -> None:
+        try:
+            self.__scan(fetch, after, page_size)
+        finally:
+            with self.__condition:
+                self.__running -= 1
+                self.__condition.notify_all()
+
+    def __scan(
+        self,
+        fetch: Callable[[Optional[UUID], int], _Page],
+        after: Optional[UUID],
+        page_size: int,
+    ) -> None:
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(
+                    lambda: self.__stopped or len(self.__pages) < self.__depth
+                )
+                if self.__stopped:
+                    return
+            try:
+                page: Union[_Page, BaseException] = fetch(after, page_size)
+            except Exception as e:
+                page = e
+            if not isinstance(page, BaseException) and len(page) == 0:
+                return
+            with self.__condition:
+                self.__pages.append(page)
+                self.__condition.notify_all()
+            # the cursor only returns fewer objects than requested at the end of a scan
+            if isinstance(page, BaseException) or len(page) < page_size:
+                return
+            after = page[-1].uuid
+            page_size = _next_page_size(page_size, page, self.__page_bytes)
+
+    def next_page(self) -> _Page:
+        """Return the next page, or an empty page once all scans are exhausted."""
+        with self.__condition:
+            self.__condition.wait_for(lambda: len(self.__pages) > 0 or self.__running == 0)
+            if len(self.__pages) == 0:
+                return []
+            page = self.__pages.popleft()
+            self.__condition.notify_all()
+        if isinstance(page, BaseException):
+            raise page
+        return page
+
+    def stop(self) -> None:
+        with self.__condition:
+            self.__stopped = True
+            self.__condition.notify_all()
+
+
+class _AsyncPagePrefetcher:
+    """Fetches the pages of one or more scans in background tasks, up to `depth` pages ahead of the consumer.
+
+    This is the asyncio counterpart of `_PagePrefetcher`.
+    """
+
+    def __init__(
+        self,
+        scans: Sequence[_AsyncScan],
+        page_size: int,
+        page_bytes: Optional[int],
+        depth: int,
+    ) -> None:
+        self.__page_bytes = page_bytes
+        self.__depth = depth
+        self.__pages: deque[Union[_Page, BaseException]] = deque()
+        self.__condition = asyncio.Condition()
+        self.__running = len(scans)
+        self.__tasks = [
+            asyncio.create_task(self.__run(fetch, after, page_size)) for fetch, after in scans
+        ]
+
+    async def __run(
+        self,
+        fetch: Callable[[Optional[UUID], int], Awaitable[_Page]],
+        after: Optional[UUID],
+        page_size: int,
+    ) -> None:
+        try:
+            await self.__scan(fetch, after, page_size)
+        finally:
+            self.__running -= 1
+        async with self.__condition:
+            self.__condition.notify_all()
+
+    async def __scan(
+        self,
+        fetch: Callable[[Optional[UUID], int], Awaitable[_Page]],
+        after: Optional[UUID],
+        page_size: int,
+    ) -> None:
+        while True:
+            async with self.__condition:
+                await self.__condition.wait_for(lambda: len(self.__pages) < self.__depth)
+            try:
+                page: Union[_Page, BaseException] = await fetch(after, page_size)
+            except Exception as e:
+                page = e
+            if not isinstance(page, BaseException) and len(page) == 0:
+                return
+            async with self.__condition:
+                self.__pages.append(page)
+                self.__condition.notify_all()
+            # the cursor only returns fewer objects than requested at the end of a scan
+            if isinstance(page, BaseException) or len(page) < page_size:
+                return
+            after = page[-1].uuid
+            page_size = _next_page_size(page_size, page, self.__page_bytes)
+
+    async def next_page(self) -> _Page:
+        """Return the next page, or an empty page once all scans are exhausted."""
+        async with self.__condition:
+            await self.__condition.wait_for(lambda: len(self.__pages) > 0 or self.__running == 0)
+            if len(self.__pages) == 0:
+                return []
+            page = self.__pages.popleft()
+            self.__condition.notify_all()
+        if isinstance(page, BaseException):
+            raise page
+        return page
+
+    def stop(self) -> None:
+        for task in self.__tasks:
+            if not task.done() and not task.get_loop().is_closed():
+                task.cancel()
+
+
 class _ObjectIterator(
     Generic[TProperties, TReferences],
     Iterable[Object[TProperties, TReferences]],
@@ -50,6 +330,9 @@ class _ObjectIterator(
         query: _FetchObjectsQuery[Any, Any],
         inputs: _IteratorInputs[TProperties, TReferences],
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> None:
         self.__query = query
         self.__inputs = inputs
@@ -57,26 +340,67 @@ class _ObjectIterator(
         self.__iter_object_cache: deque[Object[TProperties, TReferences]] = deque()
         self.__iter_object_last_uuid: Optional[UUID] = _parse_after(self.__inputs.after)
         self.__iter_cache_size = cache_size or ITERATOR_CACHE_SIZE
+        self.__iter_page_size = self.__iter_cache_size
+        self.__prefetch = prefetch
+        self.__page_bytes = page_bytes
+        self.__parallelism = parallelism
+        self.__prefetcher: Optional[_PagePrefetcher] = None
+
+    def __del__(self) -> None:
+        self.__stop_prefetching()
 
     def __iter__(
         self,
     ) -> Iterator[Object[TProperties, TReferences]]:
+        self.__stop_prefetching()
         self.__iter_object_cache = deque()
         self.__iter_object_last_uuid = _parse_after(self.__inputs.after)
+        self.__iter_page_size = self.__iter_cache_size
         return self
 
+    def __stop_prefetching(self) -> None:
+        if self.__prefetcher is not None:
+            self.__prefetcher.stop()
+            self.__prefetcher = None
+
+    def __scans(self) -> List[_Scan]:
+        # the scans must not reference the iterator, otherwise the prefetching threads keep it from being collected
+        if self.__parallelism <= 1:
+            return [
+                (
+                    functools.partial(_fetch_page, self.__query, self.__inputs),
+                    self.__iter_object_last_uuid,
+                )
+            ]
+        return [
+            (functools.partial(_fetch_range_page, self.__query, self.__inputs, before), after)
+            for after, before in _partition_bounds(self.__iter_object_last_uuid, self.__parallelism)
+        ]
+
     def __next__(self) -> Object[TProperties, TReferences]:
         if len(self.__iter_object_cache) == 0:
-            res = self.__query.fetch_objects(
-                limit=self.__iter_cache_size,
-                after=self.__iter_object_last_uuid,
-                include_vector=self.__inputs.include_vector,
-                return_metadata=self.__inputs.return_metadata,
-                return_properties=self.__inputs.return_properties,
-                return_references=self.__inputs.return_references,
-            )
-            self.__iter_object_cache = deque(res.objects)  # type: ignore
+            if self.__prefetch > 0 or self.__parallelism > 1:
+                if self.__prefetcher is None:
+                    self.__prefetcher = _PagePrefetcher(
+                        self.__scans(),
+                        self.__iter_page_size,
+                        self.__page_bytes,
+                        max(self.__prefetch, self.__parallelism),
+                    )
+                page = self.__prefetcher.next_page()
+            else:
+                page = _fetch_page(
+                    self.__query,
+                    self.__inputs,
+                    self.__iter_object_last_uuid,
+                    self.__iter_page_size,
+                )
+                self.__iter_page_size = _next_page_size(
+                    self.__iter_page_size, page, self.__page_bytes
+                )
+            self.__iter_object_cache = deque(page)
             if len(self.__iter_object_cache) == 0:
+                self.__stop_prefetching()
                 raise StopIteration
 
         ret_object = self.__iter_object_cache.popleft()
@@ -96,6 +420,9 @@ class _ObjectAIterator(
         query: _FetchObjectsQueryAsync[Any, Any],
         inputs: _IteratorInputs[TProperties, TReferences],
         cache_size: Optional[int] = None,
+        prefetch: int = 0,
+        page_bytes: Optional[int] = None,
+        parallelism: int = 1,
     ) -> None:
         self.__query = query
         self.__inputs = inputs
@@ -103,28 +430,69 @@ class _ObjectAIterator(
         self.__iter_object_cache: deque[Object[TProperties, TReferences]] = deque()
         self.__iter_object_last_uuid: Optional[UUID] = _parse_after(self.__inputs.after)
         self.__iter_cache_size = cache_size or ITERATOR_CACHE_SIZE
+        self.__iter_page_size = self.__iter_cache_size
+        self.__prefetch = prefetch
+        self.__page_bytes = page_bytes
+        self.__parallelism = parallelism
+        self.__prefetcher: Optional[_AsyncPagePrefetcher] = None
+
+    def __del__(self) -> None:
+        self.__stop_prefetching()
 
     def __aiter__(
         self,
     ) -> AsyncIterator[Object[TProperties, TReferences]]:
+        self.__stop_prefetching()
         self.__iter_object_cache = deque()
         self.__iter_object_last_uuid = _parse_after(self.__inputs.after)
+        self.__iter_page_size = self.__iter_cache_size
         return self
 
+    def __stop_prefetching(self) -> None:
+        if self.__prefetcher is not None:
+            self.__prefetcher.stop()
+            self.__prefetcher = None
+
+    def __scans(self) -> List[_AsyncScan]:
+        # the scans must not reference the iterator, otherwise the prefetching tasks keep it from being collected
+        if self.__parallelism <= 1:
+            return [
+                (
+                    functools.partial(_afetch_page, self.__query, self.__inputs),
+                    self.__iter_object_last_uuid,
+                )
+            ]
+        return [
+            (functools.partial(_afetch_range_page, self.__query, self.__inputs, before), after)
+            for after, before in _partition_bounds(self.__iter_object_last_uuid, self.__parallelism)
+        ]
+
     async def __anext__(
         self,
     ) -> Object[TProperties, TReferences]:
         if len(self.__iter_object_cache) == 0:
-            res = await self.__query.fetch_objects(
-                limit=self.__iter_cache_size,
-                after=self.__iter_object_last_uuid,
-                include_vector=self.__inputs.include_vector,
-                return_metadata=self.__inputs.return_metadata,
-                return_properties=self.__inputs.return_properties,
-                return_references=self.__inputs.return_references,
-            )
-            self.__iter_object_cache = deque(res.objects)  # type: ignore
+            if self.__prefetch > 0 or self.__parallelism > 1:
+                if self.__prefetcher is None:
+                    self.__prefetcher = _AsyncPagePrefetcher(
+                        self.__scans(),
+                        self.__iter_page_size,
+                        self.__page_bytes,
+                        max(self.__prefetch, self.__parallelism),
+                    )
+                page = await self.__prefetcher.next_page()
+            else:
+                page = await _afetch_page(
+                    self.__query,
+                    self.__inputs,
+                    self.__iter_object_last_uuid,
+                    self.__iter_page_size,
+                )
+                self.__iter_page_size = _next_page_size(
+                    self.__iter_page_size, page, self.__page_bytes
+                )
+            self.__iter_object_cache = deque(page)
             if len(self.__iter_object_cache) == 0:
+                self.__stop_prefetching()
                 raise StopAsyncIteration
 
         ret_object = self.__iter_object_cache.popleft()
@@ -1,14 +1,19 @@
 import datetime
 import uuid as uuid_lib
+from dataclasses import replace
+from functools import cached_property, wraps
 from typing import (
     Any,
+    Callable,
     Dict,
     Generic,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
     Type,
+    TypeVar,
     Union,
     cast,
 )
@@ -26,6 +31,7 @@ from weaviate.collections.classes.grpc import (
     _QueryReference,
 )
 from weaviate.collections.classes.internal import (
+    ColumnarQueryReturn,
     CrossReferences,
     GenerativeGroup,
     GenerativeGroupByReturn,
@@ -42,6 +48,7 @@ from weaviate.collections.classes.internal import (
     Object,
     QueryProfileReturn,
     QueryReturn,
+    ReturnFormat,
     ReturnProperties,
     ReturnReferences,
     SearchProfileReturn,
@@ -60,12 +67,167 @@ from weaviate.exceptions import WeaviateInvalidInputError, WeaviateUnsupportedFe
 from weaviate.proto.v1 import base_pb2, generative_pb2, properties_pb2, search_get_pb2
 from weaviate.types import INCLUDE_VECTOR
 from weaviate.util import (
+    _datetime64_from_weaviate_strs,
     _datetime_from_weaviate_str,
     _WeaviateUUIDInt,
 )
 from weaviate.validator import _validate_input, _ValidateArgument
 from weaviate.warnings import _Warnings
 
+_FLOAT_METADATA_FIELDS = ("distance", "certainty", "score", "rerank_score")
+_TIME_METADATA_FIELDS = {
+    "creation_time": "creation_time_unix",
+    "last_update_time": "last_update_time_unix",
+}
+_OBJECT_METADATA_FIELDS = ("explain_score", "is_consistent")
+
+
+def _deserialize_properties(properties: properties_pb2.Properties) -> dict:
+    return {name: _deserialize_non_ref_prop(value) for name, value in properties.fields.items()}
+
+
+def _deserialize_non_ref_prop(value: properties_pb2.Value) -> Any:
+    # a single lookup of the set member of the oneof instead of probing every member with HasField
+    kind = value.WhichOneof("kind")
+    if kind is None or (decode := _VALUE_DECODERS.get(kind)) is None:
+        _Warnings.unknown_type_encountered(str(kind))
+        return None
+    return decode(getattr(value, kind))
+
+
+def _deserialize_list_value_prop_125(value: properties_pb2.ListValue) -> Optional[List[Any]]:
+    kind = value.WhichOneof("kind")
+    if kind is None or (decode := _LIST_VALUE_DECODERS.get(kind)) is None:
+        _Warnings.unknown_type_encountered(str(kind))
+        return None
+    return decode(getattr(value, kind).values)
+
+
+def _deserialize_column_value(value: properties_pb2.Value) -> Any:
+    # lists of dates are decoded into a single datetime64 array instead of one datetime per date
+    if value.WhichOneof("kind") == "list_value" and value.list_value.HasField("date_values"):
+        return _datetime64_from_weaviate_strs(value.list_value.date_values.values)
+    return _deserialize_non_ref_prop(value)
+
+
+def _deserialize_phone_number(phone: properties_pb2.PhoneNumber) -> _PhoneNumber:
+    return _PhoneNumber(
+        country_code=phone.country_code,
+        default_country=phone.default_country,
+        international_formatted=phone.international_formatted,
+        national=phone.national,
+        national_formatted=phone.national_formatted,
+        number=phone.input,
+        valid=phone.valid,
+    )
+
+
+# decoders of the members of the `kind` oneof of `properties_pb2.Value`, called with the value of the set member
+_VALUE_DECODERS: Dict[str, Callable[[Any], Any]] = {
+    "text_value": str,
+    "int_value": int,
+    "number_value": float,
+    "bool_value": bool,
+    "uuid_value": uuid_lib.UUID,
+    "date_value": _datetime_from_weaviate_str,
+    "list_value": _deserialize_list_value_prop_125,
+    "object_value": _deserialize_properties,
+    "geo_value": lambda geo: GeoCoordinate(latitude=geo.latitude, longitude=geo.longitude),
+    "blob_value": lambda blob: blob,
+    "phone_value": _deserialize_phone_number,
+    "null_value": lambda _: None,
+}
+
+# decoders of the members of the `kind` oneof of `properties_pb2.ListValue`, called with the repeated values
+_LIST_VALUE_DECODERS: Dict[str, Callable[[Any], List[Any]]] = {
+    "bool_values": list,
+    "date_values": lambda values: [_datetime_from_weaviate_str(val) for val in values],
+    "int_values": _ByteOps.decode_int64s,
+    "number_values": _ByteOps.decode_float64s,
+    "text_values": list,
+    "uuid_values": lambda values: [uuid_lib.UUID(val) for val in values],
+    "object_values": lambda values: [_deserialize_properties(val) for val in values],
+}
+
+
+_FieldDecoder = Callable[
+    [search_get_pb2.PropertiesResult, search_get_pb2.MetadataResult, _QueryOptions], Any
+]
+
+
+D = TypeVar("D", bound=Callable[..., Any])
+
+
+def _decode_span(method: D) -> D:
+    @wraps(method)
+    def wrapper(
+        self: "_BaseExecutor", res: search_get_pb2.SearchReply, options: _QueryOptions
+    ) -> Any:
+        instrumentation = self._connection._instrumentation
+        if not instrumentation.enabled:
+            return method(self, res, options)
+        with instrumentation.span(
+            "weaviate.query.decode",
+            {
+                "weaviate.collection": self._name,
+                "weaviate.results": len(res.results)
+                + sum(len(group.objects) for group in res.group_by_results),
+            },
+        ):
+            return method(self, res, options)
+
+    return cast(D, wrapper)
+
+
+class _ObjectDecoders(NamedTuple):
+    properties: _FieldDecoder
+    metadata: _FieldDecoder
+    references: _FieldDecoder
+    vector: _FieldDecoder
+
+
+class _LazyObject(Object[Any, Any]):
+    """An `Object` that retains the messages of its search result and decodes its fields when they are first accessed.
+
+    The `uuid` and `collection` are decoded right away. The properties, metadata, references and vectors are decoded on
+    first access and cached on the instance afterwards.
+    """
+
+    def __init__(
+        self,
+        props: search_get_pb2.PropertiesResult,
+        meta: search_get_pb2.MetadataResult,
+        options: _QueryOptions,
+        decoders: _ObjectDecoders,
+    ) -> None:
+        self.collection = props.target_collection
+        self.uuid = _WeaviateUUIDInt(int.from_bytes(meta.id_as_bytes, byteorder="big"))
+        self.__props = props
+        self.__meta = meta
+        self.__options = options
+        self.__decoders = decoders
+
+    @cached_property
+    def properties(self) -> Any:  # type: ignore[override]
+        return self.__decoders.properties(self.__props, self.__meta, self.__options)
+
+    @cached_property
+    def metadata(self) -> MetadataReturn:  # type: ignore[override]
+        return cast(
+            MetadataReturn, self.__decoders.metadata(self.__props, self.__meta, self.__options)
+        )
+
+    @cached_property
+    def references(self) -> Any:  # type: ignore[override]
+        return self.__decoders.references(self.__props, self.__meta, self.__options)
+
+    @cached_property
+    def vector(self) -> Dict[str, Union[List[float], List[List[float]]]]:  # type: ignore[override]
+        return cast(
+            Dict[str, Union[List[float], List[List[float]]]],
+            self.__decoders.vector(self.__props, self.__meta, self.__options),
+        )
+
 
 class _BaseExecutor(Generic[ConnectionType]):
     def __init__(
@@ -86,6 +248,14 @@ class _BaseExecutor(Generic[ConnectionType]):
         self._references = references
         self._validate_arguments = validate_arguments
 
+        self.__vectors_as_numpy = connection._vector_format == "numpy"
+        self.__object_decoders = _ObjectDecoders(
+            properties=self.__decode_object_properties,
+            metadata=self.__decode_object_metadata,
+            references=self.__decode_object_references,
+            vector=self.__decode_object_vector,
+        )
+
         self.__uses_125_api = connection._weaviate_version.is_at_least(1, 25, 0)
         self.__uses_127_api = connection._weaviate_version.is_at_least(1, 27, 0)
         self._query = _QueryGRPC(
@@ -96,6 +266,7 @@ class _BaseExecutor(Generic[ConnectionType]):
             validate_arguments=self._validate_arguments,
             uses_125_api=self.__uses_125_api,
             uses_127_api=self.__uses_127_api,
+            instrumentation=connection._instrumentation,
         )
 
     def __retrieve_timestamp(
@@ -158,6 +329,9 @@ class _BaseExecutor(Generic[ConnectionType]):
         ):
             return {}
 
+        if self.__vectors_as_numpy:
+            return self.__extract_numpy_vector_for_object(add_props)
+
         if len(add_props.vector_bytes) > 0:
             vec = _ByteOps.decode_float32s(add_props.vector_bytes)
             return {"default": vec}
@@ -172,6 +346,22 @@ class _BaseExecutor(Generic[ConnectionType]):
                 vecs[vec.name] = _Unpack.single(vec.vector_bytes)
         return vecs
 
+    def __extract_numpy_vector_for_object(
+        self,
+        add_props: "search_get_pb2.MetadataResult",
+    ) -> Dict[str, Any]:
+        if len(add_props.vector_bytes) > 0:
+            return {"default": _Unpack.single_numpy(add_props.vector_bytes)}
+
+        return {
+            vec.name: (
+                _Unpack.multi_numpy(vec.vector_bytes)
+                if vec.type == base_pb2.Vectors.VECTOR_TYPE_MULTI_FP32
+                else _Unpack.single_numpy(vec.vector_bytes)
+            )
+            for vec in add_props.vectors
+        }
+
     def __extract_generated_from_metadata(
         self,
         add_props: search_get_pb2.MetadataResult,
@@ -244,76 +434,11 @@ class _BaseExecutor(Generic[ConnectionType]):
             )
         return None
 
-    def __deserialize_list_value_prop_125(
-        self, value: properties_pb2.ListValue
-    ) -> Optional[List[Any]]:
-        if value.HasField("bool_values"):
-            return list(value.bool_values.values)
-        if value.HasField("date_values"):
-            return [_datetime_from_weaviate_str(val) for val in value.date_values.values]
-        if value.HasField("int_values"):
-            return _ByteOps.decode_int64s(value.int_values.values)
-        if value.HasField("number_values"):
-            return _ByteOps.decode_float64s(value.number_values.values)
-        if value.HasField("text_values"):
-            return list(value.text_values.values)
-        if value.HasField("uuid_values"):
-            return [uuid_lib.UUID(val) for val in value.uuid_values.values]
-        if value.HasField("object_values"):
-            return [
-                self.__parse_nonref_properties_result(val) for val in value.object_values.values
-            ]
-        _Warnings.unknown_type_encountered(value.WhichOneof("value"))
-        return None
-
-    def __deserialize_non_ref_prop(self, value: properties_pb2.Value) -> Any:
-        if value.HasField("uuid_value"):
-            return uuid_lib.UUID(value.uuid_value)
-        if value.HasField("date_value"):
-            return _datetime_from_weaviate_str(value.date_value)
-
-        if value.HasField("text_value"):
-            return str(value.text_value)
-        if value.HasField("int_value"):
-            return int(value.int_value)
-        if value.HasField("number_value"):
-            return float(value.number_value)
-        if value.HasField("bool_value"):
-            return bool(value.bool_value)
-        if value.HasField("list_value"):
-            return self.__deserialize_list_value_prop_125(value.list_value)
-        if value.HasField("object_value"):
-            return self.__parse_nonref_properties_result(value.object_value)
-        if value.HasField("geo_value"):
-            return GeoCoordinate(
-                latitude=value.geo_value.latitude, longitude=value.geo_value.longitude
-            )
-        if value.HasField("blob_value"):
-            return value.blob_value
-        if value.HasField("phone_value"):
-            return _PhoneNumber(
-                country_code=value.phone_value.country_code,
-                default_country=value.phone_value.default_country,
-                international_formatted=value.phone_value.international_formatted,
-                national=value.phone_value.national,
-                national_formatted=value.phone_value.national_formatted,
-                number=value.phone_value.input,
-                valid=value.phone_value.valid,
-            )
-        if value.HasField("null_value"):
-            return None
-
-        _Warnings.unknown_type_encountered(value.WhichOneof("value"))
-        return None
-
     def __parse_nonref_properties_result(
         self,
         properties: properties_pb2.Properties,
     ) -> dict:
-        return {
-            name: self.__deserialize_non_ref_prop(value)
-            for name, value in properties.fields.items()
-        }
+        return _deserialize_properties(properties)
 
     def __parse_ref_properties_result(
         self,
@@ -336,29 +461,61 @@ class _BaseExecutor(Generic[ConnectionType]):
             for ref_prop in properties.ref_props
         }
 
+    def __decode_object_properties(
+        self,
+        props: search_get_pb2.PropertiesResult,
+        meta: search_get_pb2.MetadataResult,
+        options: _QueryOptions,
+    ) -> dict:
+        if not options.include_properties:
+            return {}
+        return self.__parse_nonref_properties_result(props.non_ref_props)
+
+    def __decode_object_metadata(
+        self,
+        props: search_get_pb2.PropertiesResult,
+        meta: search_get_pb2.MetadataResult,
+        options: _QueryOptions,
+    ) -> MetadataReturn:
+        if not options.include_metadata:
+            return MetadataReturn()
+        return self.__extract_metadata_for_object(meta)
+
+    def __decode_object_references(
+        self,
+        props: search_get_pb2.PropertiesResult,
+        meta: search_get_pb2.MetadataResult,
+        options: _QueryOptions,
+    ) -> Optional[dict]:
+        if not options.include_references:
+            return None
+        return self.__parse_ref_properties_result(props)
+
+    def __decode_object_vector(
+        self,
+        props: search_get_pb2.PropertiesResult,
+        meta: search_get_pb2.MetadataResult,
+        options: _QueryOptions,
+    ) -> Dict[str, Union[List[float], List[List[float]]]]:
+        if not options.include_vector:
+            return {}
+        return self.__extract_vector_for_object(meta)
+
     def __result_to_query_object(
         self,
         props: search_get_pb2.PropertiesResult,
         meta: search_get_pb2.MetadataResult,
         options: _QueryOptions,
     ) -> Object[Any, Any]:
+        if options.lazy:
+            return _LazyObject(props, meta, options, self.__object_decoders)
         return Object(
             collection=props.target_collection,
-            properties=(
-                self.__parse_nonref_properties_result(props.non_ref_props)
-                if options.include_properties
-                else {}
-            ),
-            metadata=(
-                self.__extract_metadata_for_object(meta)
-                if options.include_metadata
-                else MetadataReturn()
-            ),
-            references=(
-                self.__parse_ref_properties_result(props) if options.include_references else None
-            ),
+            properties=self.__decode_object_properties(props, meta, options),
+            metadata=self.__decode_object_metadata(props, meta, options),
+            references=self.__decode_object_references(props, meta, options),
             uuid=self.__extract_id_for_object(meta),
-            vector=(self.__extract_vector_for_object(meta) if options.include_vector else {}),
+            vector=self.__decode_object_vector(props, meta, options),
         )
 
     def __result_to_generative_object(
@@ -474,6 +631,7 @@ class _BaseExecutor(Generic[ConnectionType]):
             ]
         )
 
+    @_decode_span
     def _result_to_query_return(
         self,
         res: search_get_pb2.SearchReply,
@@ -487,6 +645,103 @@ class _BaseExecutor(Generic[ConnectionType]):
             query_profile=self.__extract_query_profile(res),
         )
 
+    @_decode_span
+    def _result_to_columnar_return(
+        self,
+        res: search_get_pb2.SearchReply,
+        options: _QueryOptions,
+    ) -> ColumnarQueryReturn:
+        import numpy as np
+
+        metas = [obj.metadata for obj in res.results]
+        return ColumnarQueryReturn(
+            # not "S16", whose elements lose their trailing null bytes
+            uuids=np.array([meta.id_as_bytes for meta in metas], dtype="V16"),
+            metadata=self.__extract_metadata_columns(metas) if options.include_metadata else {},
+            vectors=self.__extract_vector_columns(metas) if options.include_vector else {},
+            properties=(self.__extract_property_columns(res) if options.include_properties else {}),
+            query_profile=self.__extract_query_profile(res),
+        )
+
+    def __extract_metadata_columns(
+        self, metas: List[search_get_pb2.MetadataResult]
+    ) -> Dict[str, Any]:
+        import numpy as np
+
+        columns: Dict[str, Any] = {}
+        for field in _FLOAT_METADATA_FIELDS:
+            present = f"{field}_present"
+            if any(getattr(meta, present) for meta in metas):
+                columns[field] = np.array(
+                    [getattr(meta, field) if getattr(meta, present) else np.nan for meta in metas],
+                    dtype=np.float64,
+                )
+        for field, unix_field in _TIME_METADATA_FIELDS.items():
+            present = f"{unix_field}_present"
+            if any(getattr(meta, present) for meta in metas):
+                nat = np.iinfo(np.int64).min
+                stamps = np.array(
+                    [
+                        getattr(meta, unix_field) if getattr(meta, present) else nat
+                        for meta in metas
+                    ],
+                    dtype=np.int64,
+                )
+                # timestamps are sent in milliseconds or nanoseconds, see __retrieve_timestamp
+                stamps = np.where((stamps >= 10**13) & (stamps != nat), stamps // 10**6, stamps)
+                columns[field] = stamps.astype("datetime64[ms]")
+        for field in _OBJECT_METADATA_FIELDS:
+            present = f"{field}_present"
+            if any(getattr(meta, present) for meta in metas):
+                columns[field] = np.array(
+                    [getattr(meta, field) if getattr(meta, present) else None for meta in metas],
+                    dtype=object,
+                )
+        return columns
+
+    def __extract_vector_columns(
+        self, metas: List[search_get_pb2.MetadataResult]
+    ) -> Dict[str, Any]:
+        import numpy as np
+
+        singles: Dict[str, List[Optional[bytes]]] = {}
+        multis: Dict[str, List[Any]] = {}
+        for idx, meta in enumerate(metas):
+            if len(meta.vector_bytes) > 0:
+                singles.setdefault("default", [None] * len(metas))[idx] = meta.vector_bytes
+            for vec in meta.vectors:
+                if vec.type == base_pb2.Vectors.VECTOR_TYPE_MULTI_FP32:
+                    multis.setdefault(vec.name, [None] * len(metas))[idx] = _Unpack.multi_numpy(
+                        vec.vector_bytes
+                    )
+                else:
+                    singles.setdefault(vec.name, [None] * len(metas))[idx] = vec.vector_bytes
+
+        columns: Dict[str, Any] = dict(multis)
+        for name, vectors in singles.items():
+            present = [vec for vec in vectors if vec is not None]
+            if len(present) == len(vectors) and len({len(vec) for vec in present}) == 1:
+                # all objects have a vector of the same dimensionality so they can share one buffer
+                columns[name] = np.frombuffer(b"".join(present), dtype="<f4").reshape(
+                    len(present), -1
+                )
+            else:
+                columns[name] = [
+                    None if vec is None else _Unpack.single_numpy(vec) for vec in vectors
+                ]
+        return columns
+
+    def __extract_property_columns(self, res: search_get_pb2.SearchReply) -> Dict[str, List[Any]]:
+        columns: Dict[str, List[Any]] = {}
+        for idx, obj in enumerate(res.results):
+            for name, value in obj.properties.non_ref_props.fields.items():
+                column = columns.get(name)
+                if column is None:
+                    column = columns[name] = [None] * len(res.results)
+                column[idx] = _deserialize_column_value(value)
+        return columns
+
+    @_decode_span
     def _result_to_generative_query_return(
         self,
         res: search_get_pb2.SearchReply,
@@ -520,6 +775,7 @@ class _BaseExecutor(Generic[ConnectionType]):
             else self._result_to_generative_groupby_return(res, options)
         )
 
+    @_decode_span
     def _result_to_groupby_return(
         self,
         res: search_get_pb2.SearchReply,
@@ -537,6 +793,7 @@ class _BaseExecutor(Generic[ConnectionType]):
             query_profile=self.__extract_query_profile(res),
         )
 
+    @_decode_span
     def _result_to_generative_groupby_return(
         self,
         res: search_get_pb2.SearchReply,
@@ -582,6 +839,32 @@ class _BaseExecutor(Generic[ConnectionType]):
             else self._result_to_groupby_return(res, options)
         )
 
+    def _query_options_for_format(
+        self,
+        return_format: ReturnFormat,
+        options: _QueryOptions,
+    ) -> _QueryOptions:
+        if return_format == "columns":
+            if options.is_group_by:
+                raise WeaviateInvalidInputError(
+                    'return_format="columns" cannot be combined with group_by'
+                )
+            if options.include_references:
+                raise WeaviateInvalidInputError(
+                    'return_format="columns" does not support returning references'
+                )
+        elif return_format == "lazy":
+            if options.is_group_by:
+                raise WeaviateInvalidInputError(
+                    'return_format="lazy" cannot be combined with group_by'
+                )
+            return replace(options, lazy=True)
+        elif return_format != "objects":
+            raise WeaviateInvalidInputError(
+                f'return_format must be "objects", "lazy" or "columns" but is {return_format}'
+            )
+        return options
+
     def _parse_return_properties(
         self,
         return_properties: Optional[ReturnProperties[WeaviateProperties]],
@@ -0,0 +1,7 @@
+from .async_ import _BatchQueryAsync
+from .sync import _BatchQuery
+
+__all__ = [
+    "_BatchQuery",
+    "_BatchQueryAsync",
+]
@@ -0,0 +1,14 @@
+from typing import Generic
+
+from weaviate.collections.classes.types import Properties, References
+from weaviate.collections.queries.batch.executor import _BatchQueryExecutor
+from weaviate.connect import executor
+from weaviate.connect.v4 import ConnectionAsync
+
+
+@executor.wrap("async")
+class _BatchQueryAsync(
+    Generic[Properties, References],
+    _BatchQueryExecutor[ConnectionAsync, Properties, References],
+):
+    pass
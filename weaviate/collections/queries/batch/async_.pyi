@@ -0,0 +1,19 @@
+from typing import Generic, Sequence
+
+from weaviate.collections.classes.grpc import _BatchQueryInput
+from weaviate.collections.classes.internal import BatchQueryReturn
+from weaviate.collections.classes.types import Properties, References
+from weaviate.connect.v4 import ConnectionAsync
+
+from .executor import _BatchQueryExecutor
+
+class _BatchQueryAsync(
+    Generic[Properties, References],
+    _BatchQueryExecutor[ConnectionAsync, Properties, References],
+):
+    async def batch(
+        self,
+        queries: Sequence[_BatchQueryInput],
+        *,
+        max_concurrency: int = 8,
+    ) -> BatchQueryReturn[Properties, References]: ...
@@ -0,0 +1,93 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Generic, List, Sequence, Tuple
+
+from weaviate.collections.classes.grpc import _BatchQueryInput
+from weaviate.collections.classes.internal import BatchQueryReturn
+from weaviate.collections.classes.types import Properties, References
+from weaviate.collections.queries.bm25.query.executor import _BM25QueryExecutor
+from weaviate.collections.queries.hybrid.query.executor import _HybridQueryExecutor
+from weaviate.collections.queries.near_vector.query.executor import _NearVectorQueryExecutor
+from weaviate.connect import executor
+from weaviate.connect.v4 import ConnectionAsync, ConnectionType
+from weaviate.exceptions import WeaviateInvalidInputError
+
+BATCH_QUERY_CONCURRENCY = 8
+
+
+class _BatchQueryExecutor(
+    Generic[ConnectionType, Properties, References],
+    _BM25QueryExecutor[ConnectionType, Properties, References],
+    _HybridQueryExecutor[ConnectionType, Properties, References],
+    _NearVectorQueryExecutor[ConnectionType, Properties, References],
+):
+    def batch(
+        self,
+        queries: Sequence[_BatchQueryInput],
+        *,
+        max_concurrency: int = BATCH_QUERY_CONCURRENCY,
+    ) -> executor.Result[BatchQueryReturn[Properties, References]]:
+        """Run many queries concurrently over the connection of the client.
+
+        At most `max_concurrency` queries are in flight at the same time. The sync client runs the queries in a pool of
+        threads, the async client in tasks on the running event loop. The failure of a query does not stop the others.
+
+        Args:
+            queries: The queries to run, defined with the methods of `wvc.query.BatchQuery`.
+            max_concurrency: The maximum number of queries that are sent to Weaviate at the same time. The default is 8.
+
+        Returns:
+            A `BatchQueryReturn` object with the result of every query, in the order of `queries`, and the errors of the
+            queries that failed.
+
+        Raises:
+            weaviate.exceptions.WeaviateInvalidInputError: If `max_concurrency` is lower than 1.
+        """
+        if max_concurrency < 1:
+            raise WeaviateInvalidInputError(
+                f"max_concurrency must be at least 1 but is {max_concurrency}"
+            )
+        results: List[Any] = [None] * len(queries)
+        errors: Dict[int, Exception] = {}
+        # the workers take the next query from a shared iterator, so that only the queries in flight are built
+        pending = iter(enumerate(queries))
+        workers = min(max_concurrency, len(queries))
+
+        if isinstance(self._connection, ConnectionAsync):
+
+            async def _worker() -> None:
+                for idx, query in pending:
+                    try:
+                        results[idx] = await executor.aresult(self.__run(query))
+                    except Exception as e:
+                        errors[idx] = e
+
+            async def _execute() -> BatchQueryReturn[Properties, References]:
+                await asyncio.gather(*(_worker() for _ in range(workers)))
+                return BatchQueryReturn(results=results, errors=dict(sorted(errors.items())))
+
+            return _execute()
+
+        lock = threading.Lock()
+
+        def _next() -> Tuple[int, Any]:
+            with lock:
+                return next(pending, (-1, None))
+
+        def _worker_sync() -> None:
+            while (item := _next())[0] >= 0:
+                idx, query = item
+                try:
+                    results[idx] = executor.result(self.__run(query))
+                except Exception as e:
+                    errors[idx] = e
+
+        if workers > 0:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for future in [pool.submit(_worker_sync) for _ in range(workers)]:
+                    future.result()
+        return BatchQueryReturn(results=results, errors=dict(sorted(errors.items())))
+
+    def __run(self, query: _BatchQueryInput) -> executor.Result[Any]:
+        return getattr(self, query.method)(**query.kwargs)
@@ -11,6 +11,7 @@ from weaviate.collections.classes.grpc import (
     _Boost,
 )
 from weaviate.collections.classes.internal import (
+    ColumnarQueryReturn,
     CrossReferences,
     GroupByReturn,
     QueryReturn,
@@ -45,6 +46,27 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["columns"],
+    ) -> ColumnarQueryReturn: ...
+    @overload
+    def bm25(
+        self,
+        query: Optional[str],
+        *,
+        query_properties: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        operator: Optional[BM25OperatorOptions] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, References]: ...
     @overload
     def bm25(
@@ -64,6 +86,7 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, CrossReferences]: ...
     @overload
     def bm25(
@@ -83,6 +106,7 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, TReferences]: ...
     @overload
     def bm25(
@@ -102,6 +126,7 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, References]: ...
     @overload
     def bm25(
@@ -121,6 +146,7 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, CrossReferences]: ...
     @overload
     def bm25(
@@ -140,6 +166,7 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, TReferences]: ...
     @overload
     def bm25(
@@ -159,6 +186,7 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[Properties, References]: ...
     @overload
     def bm25(
@@ -178,6 +206,7 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[Properties, CrossReferences]: ...
     @overload
     def bm25(
@@ -197,6 +226,7 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[Properties, TReferences]: ...
     @overload
     def bm25(
@@ -216,6 +246,7 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[TProperties, References]: ...
     @overload
     def bm25(
@@ -235,6 +266,7 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[TProperties, CrossReferences]: ...
     @overload
     def bm25(
@@ -254,6 +286,7 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[TProperties, TReferences]: ...
     @overload
     def bm25(
@@ -273,4 +306,5 @@ class _BM25Query(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
@@ -3,9 +3,11 @@ from typing import Any, Generic, Literal, Optional, Type, Union, cast, overload
 from weaviate.collections.classes.filters import FilterReturn
 from weaviate.collections.classes.grpc import METADATA, PROPERTIES, REFERENCES, Sorting
 from weaviate.collections.classes.internal import (
+    ColumnarQueryReturn,
     CrossReferences,
     QueryReturn,
     QueryReturnType,
+    ReturnFormat,
     ReturnProperties,
     ReturnReferences,
     _QueryOptions,
@@ -39,6 +41,23 @@ class _FetchObjectsQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["columns"],
+    ) -> executor.Result[ColumnarQueryReturn]: ...
+
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[FilterReturn] = None,
+        sort: Optional[Sorting] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[Properties, References]]: ...
 
     @overload
@@ -54,6 +73,7 @@ class _FetchObjectsQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[Properties, CrossReferences]]: ...
 
     @overload
@@ -69,6 +89,7 @@ class _FetchObjectsQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[Properties, TReferences]]: ...
 
     @overload
@@ -84,6 +105,7 @@ class _FetchObjectsQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[TProperties, References]]: ...
 
     @overload
@@ -99,6 +121,7 @@ class _FetchObjectsQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[TProperties, CrossReferences]]: ...
 
     @overload
@@ -114,6 +137,7 @@ class _FetchObjectsQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[TProperties, TReferences]]: ...
 
     @overload
@@ -129,6 +153,7 @@ class _FetchObjectsQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturnType[Properties, References, TProperties, TReferences]]: ...
 
     def fetch_objects(
@@ -143,7 +168,12 @@ class _FetchObjectsQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> executor.Result[QueryReturnType[Properties, References, TProperties, TReferences]]:
+        return_format: ReturnFormat = "objects",
+    ) -> executor.Result[
+        Union[
+            QueryReturnType[Properties, References, TProperties, TReferences], ColumnarQueryReturn
+        ]
+    ]:
         """Retrieve the objects in this collection without any search.
 
         Args:
@@ -156,6 +186,10 @@ class _FetchObjectsQueryExecutor(
             return_metadata: The metadata to return for each object, defaults to `None`.
             return_properties: The properties to return for each object.
             return_references: The references to return for each object.
+            return_format: How to return the results. `"objects"` (the default) returns one `Object` per result, `"columns"` decodes
+                the results directly into a `ColumnarQueryReturn` with one column per field, which is much faster for large result sets.
+                `"lazy"` returns one `Object` per result as well, but decodes its properties, metadata, references and vectors only
+                when they are first accessed, which is faster when only some of the results are used.
 
         NOTE:
             - If `return_properties` is not provided then all properties are returned except for blob properties.
@@ -164,27 +198,30 @@ class _FetchObjectsQueryExecutor(
 
         Returns:
             A `QueryReturn` object that includes the searched objects.
+            If `return_format="columns"` is provided then a `ColumnarQueryReturn` object is returned instead.
 
         Raises:
             weaviate.exceptions.WeaviateGRPCQueryError: If the network connection to Weaviate fails.
         """
+        options = self._query_options_for_format(
+            return_format,
+            _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
+            ),
+        )
 
         def resp(
             res: search_get_pb2.SearchReply,
-        ) -> QueryReturnType[Properties, References, TProperties, TReferences]:
-            return cast(
-                Any,
-                self._result_to_query_return(
-                    res,
-                    _QueryOptions.from_input(
-                        return_metadata,
-                        return_properties,
-                        include_vector,
-                        self._references,
-                        return_references,
-                    ),
-                ),
-            )
+        ) -> Union[
+            QueryReturnType[Properties, References, TProperties, TReferences], ColumnarQueryReturn
+        ]:
+            if return_format == "columns":
+                return self._result_to_columnar_return(res, options)
+            return cast(Any, self._result_to_query_return(res, options))
 
         request = self._query.get(
             limit=limit,
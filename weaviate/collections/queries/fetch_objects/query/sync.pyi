@@ -3,6 +3,7 @@ from typing import Generic, Literal, Optional, Type, Union, overload
 from weaviate.collections.classes.filters import FilterReturn
 from weaviate.collections.classes.grpc import METADATA, PROPERTIES, REFERENCES, Sorting
 from weaviate.collections.classes.internal import (
+    ColumnarQueryReturn,
     CrossReferences,
     QueryReturn,
     QueryReturnType,
@@ -32,6 +33,22 @@ class _FetchObjectsQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["columns"],
+    ) -> ColumnarQueryReturn: ...
+    @overload
+    def fetch_objects(
+        self,
+        *,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        after: Optional[UUID] = None,
+        filters: Optional[FilterReturn] = None,
+        sort: Optional[Sorting] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, References]: ...
     @overload
     def fetch_objects(
@@ -46,6 +63,7 @@ class _FetchObjectsQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, CrossReferences]: ...
     @overload
     def fetch_objects(
@@ -60,6 +78,7 @@ class _FetchObjectsQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, TReferences]: ...
     @overload
     def fetch_objects(
@@ -74,6 +93,7 @@ class _FetchObjectsQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, References]: ...
     @overload
     def fetch_objects(
@@ -88,6 +108,7 @@ class _FetchObjectsQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, CrossReferences]: ...
     @overload
     def fetch_objects(
@@ -102,6 +123,7 @@ class _FetchObjectsQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, TReferences]: ...
     @overload
     def fetch_objects(
@@ -116,4 +138,5 @@ class _FetchObjectsQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturnType[Properties, References, TProperties, TReferences]: ...
@@ -17,10 +17,12 @@ from weaviate.collections.classes.grpc import (
     _Boost,
 )
 from weaviate.collections.classes.internal import (
+    ColumnarQueryReturn,
     CrossReferences,
     GroupByReturn,
     QueryReturn,
     QuerySearchReturnType,
+    ReturnFormat,
     ReturnProperties,
     ReturnReferences,
     _GroupBy,
@@ -66,6 +68,34 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["columns"],
+    ) -> executor.Result[ColumnarQueryReturn]: ...
+
+    @overload
+    def hybrid(
+        self,
+        query: Optional[str],
+        *,
+        alpha: Optional[NUMBER] = None,
+        vector: Optional[HybridVectorType] = None,
+        query_properties: Optional[List[str]] = None,
+        fusion_type: Optional[HybridFusion] = None,
+        max_vector_distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        bm25_operator: Optional[BM25OperatorOptions] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        diversity_selection: Optional[MMR] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[Properties, References]]: ...
 
     @overload
@@ -92,6 +122,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[Properties, CrossReferences]]: ...
 
     @overload
@@ -118,6 +149,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[Properties, TReferences]]: ...
 
     @overload
@@ -144,6 +176,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[TProperties, References]]: ...
 
     @overload
@@ -170,6 +203,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[TProperties, CrossReferences]]: ...
 
     @overload
@@ -196,6 +230,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[TProperties, TReferences]]: ...
 
     ##### GROUP BY #####
@@ -224,6 +259,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[Properties, References]]: ...
 
     @overload
@@ -250,6 +286,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[Properties, CrossReferences]]: ...
 
     @overload
@@ -276,6 +313,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[Properties, TReferences]]: ...
 
     @overload
@@ -302,6 +340,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[TProperties, References]]: ...
 
     @overload
@@ -328,6 +367,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[TProperties, CrossReferences]]: ...
 
     @overload
@@ -354,6 +394,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[TProperties, TReferences]]: ...
 
     ### DEFAULT ###
@@ -381,6 +422,7 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[
         QuerySearchReturnType[Properties, References, TProperties, TReferences]
     ]: ...
@@ -408,7 +450,13 @@ class _HybridQueryExecutor(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
-    ) -> executor.Result[QuerySearchReturnType[Properties, References, TProperties, TReferences]]:
+        return_format: ReturnFormat = "objects",
+    ) -> executor.Result[
+        Union[
+            QuerySearchReturnType[Properties, References, TProperties, TReferences],
+            ColumnarQueryReturn,
+        ]
+    ]:
         """Search for objects in this collection using the hybrid algorithm blending keyword-based BM25 and vector-based similarity.
 
         See the [docs](https://weaviate.io/developers/weaviate/search/hybrid) for a more detailed explanation.
@@ -433,6 +481,10 @@ class _HybridQueryExecutor(
             return_metadata: The metadata to return for each object, defaults to `None`.
             return_properties: The properties to return for each object.
             return_references: The references to return for each object.
+            return_format: How to return the results. `"objects"` (the default) returns one `Object` per result, `"columns"` decodes
+                the results directly into a `ColumnarQueryReturn` with one column per field, which is much faster for large result sets.
+                `"lazy"` returns one `Object` per result as well, but decodes its properties, metadata, references and vectors only
+                when they are first accessed, which is faster when only some of the results are used. It cannot be combined with `group_by`.
 
         NOTE:
             - If `return_properties` is not provided then all properties are returned except for blob properties.
@@ -442,30 +494,34 @@ class _HybridQueryExecutor(
         Returns:
             A `QueryReturn` or `GroupByReturn` object that includes the searched objects.
             If `group_by` is provided then a `GroupByReturn` object is returned, otherwise a `QueryReturn` object is returned.
+            If `return_format="columns"` is provided then a `ColumnarQueryReturn` object is returned instead.
 
         Raises:
             weaviate.exceptions.WeaviateQueryError: If the network connection to Weaviate fails.
             weaviate.exceptions.WeaviateNotImplementedError: If a group by is provided and the Weaviate server version is lower than 1.25.0.
         """
+        options = self._query_options_for_format(
+            return_format,
+            _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
+                rerank,
+                group_by,
+            ),
+        )
 
         def resp(
             res: search_get_pb2.SearchReply,
-        ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]:
-            return cast(
-                Any,
-                self._result_to_query_or_groupby_return(
-                    res,
-                    _QueryOptions.from_input(
-                        return_metadata,
-                        return_properties,
-                        include_vector,
-                        self._references,
-                        return_references,
-                        rerank,
-                        group_by,
-                    ),
-                ),
-            )
+        ) -> Union[
+            QuerySearchReturnType[Properties, References, TProperties, TReferences],
+            ColumnarQueryReturn,
+        ]:
+            if return_format == "columns":
+                return self._result_to_columnar_return(res, options)
+            return cast(Any, self._result_to_query_or_groupby_return(res, options))
 
         request = self._query.hybrid(
             query=query,
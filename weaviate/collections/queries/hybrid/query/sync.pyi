@@ -15,6 +15,7 @@ from weaviate.collections.classes.grpc import (
     _Boost,
 )
 from weaviate.collections.classes.internal import (
+    ColumnarQueryReturn,
     CrossReferences,
     GroupByReturn,
     QueryReturn,
@@ -55,6 +56,33 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["columns"],
+    ) -> ColumnarQueryReturn: ...
+    @overload
+    def hybrid(
+        self,
+        query: Optional[str],
+        *,
+        alpha: Optional[NUMBER] = None,
+        vector: Optional[HybridVectorType] = None,
+        query_properties: Optional[List[str]] = None,
+        fusion_type: Optional[HybridFusion] = None,
+        max_vector_distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        bm25_operator: Optional[BM25OperatorOptions] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        diversity_selection: Optional[MMR] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, References]: ...
     @overload
     def hybrid(
@@ -80,6 +108,7 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, CrossReferences]: ...
     @overload
     def hybrid(
@@ -105,6 +134,7 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, TReferences]: ...
     @overload
     def hybrid(
@@ -130,6 +160,7 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, References]: ...
     @overload
     def hybrid(
@@ -155,6 +186,7 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, CrossReferences]: ...
     @overload
     def hybrid(
@@ -180,6 +212,7 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, TReferences]: ...
     @overload
     def hybrid(
@@ -205,6 +238,7 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[Properties, References]: ...
     @overload
     def hybrid(
@@ -230,6 +264,7 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[Properties, CrossReferences]: ...
     @overload
     def hybrid(
@@ -255,6 +290,7 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[Properties, TReferences]: ...
     @overload
     def hybrid(
@@ -280,6 +316,7 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[TProperties, References]: ...
     @overload
     def hybrid(
@@ -305,6 +342,7 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: REFERENCES,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[TProperties, CrossReferences]: ...
     @overload
     def hybrid(
@@ -330,6 +368,7 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[TProperties, TReferences]: ...
     @overload
     def hybrid(
@@ -355,4 +394,5 @@ class _HybridQuery(
         return_metadata: Optional[METADATA] = None,
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
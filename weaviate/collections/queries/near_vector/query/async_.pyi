@@ -13,6 +13,7 @@ from weaviate.collections.classes.grpc import (
     _Boost,
 )
 from weaviate.collections.classes.internal import (
+    ColumnarQueryReturn,
     CrossReferences,
     GroupByReturn,
     QueryReturn,
@@ -21,6 +22,7 @@ from weaviate.collections.classes.internal import (
     ReturnReferences,
 )
 from weaviate.collections.classes.types import Properties, References, TProperties, TReferences
+from weaviate.collections.queries.near_vector.query.prepared import _PreparedNearVector
 from weaviate.connect.v4 import ConnectionAsync
 from weaviate.types import INCLUDE_VECTOR, NUMBER
 
@@ -50,6 +52,29 @@ class _NearVectorQueryAsync(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["columns"],
+    ) -> ColumnarQueryReturn: ...
+    @overload
+    async def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, References]: ...
     @overload
     async def near_vector(
@@ -71,6 +96,7 @@ class _NearVectorQueryAsync(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, CrossReferences]: ...
     @overload
     async def near_vector(
@@ -92,6 +118,7 @@ class _NearVectorQueryAsync(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[Properties, TReferences]: ...
     @overload
     async def near_vector(
@@ -113,6 +140,7 @@ class _NearVectorQueryAsync(
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, References]: ...
     @overload
     async def near_vector(
@@ -134,6 +162,7 @@ class _NearVectorQueryAsync(
         return_properties: Type[TProperties],
         return_references: REFERENCES,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, CrossReferences]: ...
     @overload
     async def near_vector(
@@ -155,6 +184,7 @@ class _NearVectorQueryAsync(
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> QueryReturn[TProperties, TReferences]: ...
     @overload
     async def near_vector(
@@ -176,6 +206,7 @@ class _NearVectorQueryAsync(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[Properties, References]: ...
     @overload
     async def near_vector(
@@ -197,6 +228,7 @@ class _NearVectorQueryAsync(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[Properties, CrossReferences]: ...
     @overload
     async def near_vector(
@@ -218,6 +250,7 @@ class _NearVectorQueryAsync(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[Properties, TReferences]: ...
     @overload
     async def near_vector(
@@ -239,6 +272,7 @@ class _NearVectorQueryAsync(
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[TProperties, References]: ...
     @overload
     async def near_vector(
@@ -260,6 +294,7 @@ class _NearVectorQueryAsync(
         return_properties: Type[TProperties],
         return_references: REFERENCES,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[TProperties, CrossReferences]: ...
     @overload
     async def near_vector(
@@ -281,6 +316,7 @@ class _NearVectorQueryAsync(
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> GroupByReturn[TProperties, TReferences]: ...
     @overload
     async def near_vector(
@@ -302,4 +338,301 @@ class _NearVectorQueryAsync(
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["columns"],
+    ) -> _PreparedNearVector[ConnectionAsync, ColumnarQueryReturn]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, QueryReturn[Properties, References]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: REFERENCES,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, QueryReturn[Properties, CrossReferences]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Type[TReferences],
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, QueryReturn[Properties, TReferences]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, QueryReturn[TProperties, References]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, QueryReturn[TProperties, CrossReferences]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, QueryReturn[TProperties, TReferences]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, GroupByReturn[Properties, References]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: REFERENCES,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, GroupByReturn[Properties, CrossReferences]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Type[TReferences],
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, GroupByReturn[Properties, TReferences]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, GroupByReturn[TProperties, References]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, GroupByReturn[TProperties, CrossReferences]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionAsync, GroupByReturn[TProperties, TReferences]]: ...
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[
+        ConnectionAsync, QuerySearchReturnType[Properties, References, TProperties, TReferences]
+    ]: ...
@@ -15,10 +15,12 @@ from weaviate.collections.classes.grpc import (
     _Boost,
 )
 from weaviate.collections.classes.internal import (
+    ColumnarQueryReturn,
     CrossReferences,
     GroupByReturn,
     QueryReturn,
     QuerySearchReturnType,
+    ReturnFormat,
     ReturnProperties,
     ReturnReferences,
     _GroupBy,
@@ -31,6 +33,7 @@ from weaviate.collections.classes.types import (
     TReferences,
 )
 from weaviate.collections.queries.base_executor import _BaseExecutor
+from weaviate.collections.queries.near_vector.query.prepared import _PreparedNearVector
 from weaviate.connect import executor
 from weaviate.connect.v4 import ConnectionType
 from weaviate.proto.v1 import search_get_pb2
@@ -60,6 +63,30 @@ class _NearVectorQueryExecutor(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["columns"],
+    ) -> executor.Result[ColumnarQueryReturn]: ...
+
+    @overload
+    def near_vector(
+        self,
+        near_vector: NearVectorInputType,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[Properties, References]]: ...
 
     @overload
@@ -82,6 +109,7 @@ class _NearVectorQueryExecutor(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[Properties, CrossReferences]]: ...
 
     @overload
@@ -104,6 +132,7 @@ class _NearVectorQueryExecutor(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[Properties, TReferences]]: ...
 
     @overload
@@ -126,6 +155,7 @@ class _NearVectorQueryExecutor(
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[TProperties, References]]: ...
 
     @overload
@@ -148,6 +178,7 @@ class _NearVectorQueryExecutor(
         return_properties: Type[TProperties],
         return_references: REFERENCES,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[TProperties, CrossReferences]]: ...
 
     @overload
@@ -170,6 +201,7 @@ class _NearVectorQueryExecutor(
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
     ) -> executor.Result[QueryReturn[TProperties, TReferences]]: ...
 
     ### GroupBy ###
@@ -194,6 +226,7 @@ class _NearVectorQueryExecutor(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Literal[None] = None,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[Properties, References]]: ...
 
     @overload
@@ -216,6 +249,7 @@ class _NearVectorQueryExecutor(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: REFERENCES,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[Properties, CrossReferences]]: ...
 
     @overload
@@ -238,6 +272,7 @@ class _NearVectorQueryExecutor(
         return_properties: Union[PROPERTIES, bool, None] = None,
         return_references: Type[TReferences],
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[Properties, TReferences]]: ...
 
     @overload
@@ -260,6 +295,7 @@ class _NearVectorQueryExecutor(
         return_properties: Type[TProperties],
         return_references: Literal[None] = None,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[TProperties, References]]: ...
 
     @overload
@@ -282,6 +318,7 @@ class _NearVectorQueryExecutor(
         return_properties: Type[TProperties],
         return_references: REFERENCES,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[TProperties, CrossReferences]]: ...
 
     @overload
@@ -304,6 +341,7 @@ class _NearVectorQueryExecutor(
         return_properties: Type[TProperties],
         return_references: Type[TReferences],
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[GroupByReturn[TProperties, TReferences]]: ...
 
     ### DEFAULT ###
@@ -327,6 +365,7 @@ class _NearVectorQueryExecutor(
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
         diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
     ) -> executor.Result[
         QuerySearchReturnType[Properties, References, TProperties, TReferences]
     ]: ...
@@ -350,7 +389,13 @@ class _NearVectorQueryExecutor(
         return_properties: Optional[ReturnProperties[TProperties]] = None,
         return_references: Optional[ReturnReferences[TReferences]] = None,
         diversity_selection: Optional[MMR] = None,
-    ) -> executor.Result[QuerySearchReturnType[Properties, References, TProperties, TReferences]]:
+        return_format: ReturnFormat = "objects",
+    ) -> executor.Result[
+        Union[
+            QuerySearchReturnType[Properties, References, TProperties, TReferences],
+            ColumnarQueryReturn,
+        ]
+    ]:
         """Search for objects by vector in this collection using and vector-based similarity search.
 
         See the [docs](https://weaviate.io/developers/weaviate/search/similarity) for a more detailed explanation.
@@ -372,6 +417,10 @@ class _NearVectorQueryExecutor(
             return_properties: The properties to return for each object.
             return_references: The references to return for each object.
             diversity_selection: Apply diversity selection (e.g. MMR) to the results. Requires Weaviate >= 1.37.0.
+            return_format: How to return the results. `"objects"` (the default) returns one `Object` per result, `"columns"` decodes
+                the results directly into a `ColumnarQueryReturn` with one column per field, which is much faster for large result sets.
+                `"lazy"` returns one `Object` per result as well, but decodes its properties, metadata, references and vectors only
+                when they are first accessed, which is faster when only some of the results are used. It cannot be combined with `group_by`.
 
         NOTE:
             - If `return_properties` is not provided then all properties are returned except for blob properties.
@@ -381,29 +430,33 @@ class _NearVectorQueryExecutor(
         Returns:
             A `QueryReturn` or `GroupByReturn` object that includes the searched objects.
             If `group_by` is provided then a `GroupByReturn` object is returned, otherwise a `QueryReturn` object is returned.
+            If `return_format="columns"` is provided then a `ColumnarQueryReturn` object is returned instead.
 
         Raises:
             weaviate.exceptions.WeaviateGRPCQueryError: If the request to the Weaviate server fails.
         """
+        options = self._query_options_for_format(
+            return_format,
+            _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
+                rerank,
+                group_by,
+            ),
+        )
 
         def resp(
             res: search_get_pb2.SearchReply,
-        ) -> QuerySearchReturnType[Properties, References, TProperties, TReferences]:
-            return cast(
-                Any,
-                self._result_to_generative_return(
-                    res,
-                    _QueryOptions.from_input(
-                        return_metadata,
-                        return_properties,
-                        include_vector,
-                        self._references,
-                        return_references,
-                        rerank,
-                        group_by,
-                    ),
-                ),
-            )
+        ) -> Union[
+            QuerySearchReturnType[Properties, References, TProperties, TReferences],
+            ColumnarQueryReturn,
+        ]:
+            if return_format == "columns":
+                return self._result_to_columnar_return(res, options)
+            return cast(Any, self._result_to_generative_return(res, options))
 
         request = self._query.near_vector(
             near_vector=near_vector,
@@ -427,3 +480,403 @@ class _NearVectorQueryExecutor(
             method=self._connection.grpc_search,
             request=request,
         )
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["columns"],
+    ) -> _PreparedNearVector[ConnectionType, ColumnarQueryReturn]: ...
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, QueryReturn[Properties, References]]: ...
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: REFERENCES,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, QueryReturn[Properties, CrossReferences]]: ...
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Type[TReferences],
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, QueryReturn[Properties, TReferences]]: ...
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, QueryReturn[TProperties, References]]: ...
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, QueryReturn[TProperties, CrossReferences]]: ...
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Literal[None] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects", "lazy"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, QueryReturn[TProperties, TReferences]]: ...
+
+    ### GroupBy ###
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, GroupByReturn[Properties, References]]: ...
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: REFERENCES,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, GroupByReturn[Properties, CrossReferences]]: ...
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Union[PROPERTIES, bool, None] = None,
+        return_references: Type[TReferences],
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, GroupByReturn[Properties, TReferences]]: ...
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Literal[None] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, GroupByReturn[TProperties, References]]: ...
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: REFERENCES,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, GroupByReturn[TProperties, CrossReferences]]: ...
+
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: GroupBy,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Type[TProperties],
+        return_references: Type[TReferences],
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[ConnectionType, GroupByReturn[TProperties, TReferences]]: ...
+
+    ### DEFAULT ###
+    @overload
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: Literal["objects"] = "objects",
+    ) -> _PreparedNearVector[
+        ConnectionType, QuerySearchReturnType[Properties, References, TProperties, TReferences]
+    ]: ...
+
+    @executor.no_wrapping
+    def prepare_near_vector(
+        self,
+        *,
+        certainty: Optional[NUMBER] = None,
+        distance: Optional[NUMBER] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        auto_limit: Optional[int] = None,
+        filters: Optional[FilterReturn] = None,
+        group_by: Optional[GroupBy] = None,
+        rerank: Optional[Rerank] = None,
+        boost: Optional[_Boost] = None,
+        target_vector: Optional[TargetVectorJoinType] = None,
+        include_vector: INCLUDE_VECTOR = False,
+        return_metadata: Optional[METADATA] = None,
+        return_properties: Optional[ReturnProperties[TProperties]] = None,
+        return_references: Optional[ReturnReferences[TReferences]] = None,
+        diversity_selection: Optional[MMR] = None,
+        return_format: ReturnFormat = "objects",
+    ) -> _PreparedNearVector[
+        ConnectionType,
+        Union[
+            QuerySearchReturnType[Properties, References, TProperties, TReferences],
+            ColumnarQueryReturn,
+        ],
+    ]:
+        """Prepare a vector-based similarity search that is then run by calling the returned object with just the vector.
+
+        The request, including its filters, return properties and target vectors, is built once here and only the vector is
+        set on every call. This saves the client-side cost of building the request when the same search is repeated for many
+        vectors. The arguments have the same meaning as in `near_vector`.
+
+        Example:
+            >>> search = collection.query.prepare_near_vector(
+            ...     limit=10, filters=Filter.by_property("lang").equal("en"), return_properties=["title"]
+            ... )
+            >>> for vector in vectors:
+            ...     res = search(vector)
+
+        Returns:
+            A callable that takes the vector to search on and returns the same objects `near_vector` would.
+
+        Raises:
+            weaviate.exceptions.WeaviateInvalidInputError: If any of the arguments are invalid.
+        """
+        options = self._query_options_for_format(
+            return_format,
+            _QueryOptions.from_input(
+                return_metadata,
+                return_properties,
+                include_vector,
+                self._references,
+                return_references,
+                rerank,
+                group_by,
+            ),
+        )
+
+        def resp(
+            res: search_get_pb2.SearchReply,
+        ) -> Union[
+            QuerySearchReturnType[Properties, References, TProperties, TReferences],
+            ColumnarQueryReturn,
+        ]:
+            if return_format == "columns":
+                return self._result_to_columnar_return(res, options)
+            return cast(Any, self._result_to_generative_return(res, options))
+
+        prepared = self._query.prepare_near_vector(
+            certainty=certainty,
+            distance=distance,
+            filters=filters,
+            group_by=_GroupBy.from_input(group_by),
+            limit=limit,
+            offset=offset,
+            autocut=auto_limit,
+            rerank=rerank,
+            diversity_selection=diversity_selection,
+            boost=boost,
+            target_vector=target_vector,
+            return_metadata=self._parse_return_metadata(return_metadata, include_vector),
+            return_properties=self._parse_return_properties(return_properties),
+            return_references=self._parse_return_references(return_references),
+        )
+        return _PreparedNearVector(self._connection, self._query, prepared, resp)
@@ -0,0 +1,47 @@
+from typing import Awaitable, Callable, Generic, TypeVar, overload
+
+from weaviate.collections.classes.grpc import NearVectorInputType
+from weaviate.collections.grpc.query import _PreparedNearVectorRequest, _QueryGRPC
+from weaviate.connect import executor
+from weaviate.connect.v4 import ConnectionAsync, ConnectionSync, ConnectionType
+from weaviate.proto.v1 import search_get_pb2
+
+T = TypeVar("T", covariant=True)
+
+
+class _PreparedNearVector(Generic[ConnectionType, T]):
+    """A near_vector search whose filters, return properties and other options were built once by `prepare_near_vector`."""
+
+    def __init__(
+        self,
+        connection: ConnectionType,
+        query: _QueryGRPC,
+        prepared: _PreparedNearVectorRequest,
+        response_callback: Callable[[search_get_pb2.SearchReply], T],
+    ) -> None:
+        self.__connection: ConnectionType = connection
+        self.__query = query
+        self.__prepared = prepared
+        self.__response_callback = response_callback
+
+    @overload
+    def __call__(
+        self: "_PreparedNearVector[ConnectionSync, T]", near_vector: NearVectorInputType
+    ) -> T: ...
+
+    @overload
+    def __call__(
+        self: "_PreparedNearVector[ConnectionAsync, T]", near_vector: NearVectorInputType
+    ) -> Awaitable[T]: ...
+
+    def __call__(self, near_vector: NearVectorInputType) -> executor.Result[T]:
+        """Search for objects by vector using the prepared options.
+
+        Args:
+            near_vector: The vector to search on, REQUIRED.
+        """
+        return executor.execute(
+            response_callback=self.__response_callback,
+            method=self.__connection.grpc_search,
+            request=self.__query.near_vector_prepared(self.__prepared, near_vector),
+        )
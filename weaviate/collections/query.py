@@ -1,6 +1,7 @@
 from typing import Generic
 
 from weaviate.collections.classes.types import References, TProperties
+from weaviate.collections.queries.batch import _BatchQuery, _BatchQueryAsync
 from weaviate.collections.queries.bm25 import _BM25Query, _BM25QueryAsync
 from weaviate.collections.queries.fetch_object_by_id import (
     _FetchObjectByIDQuery,
@@ -36,6 +37,7 @@ from weaviate.collections.queries.near_vector import (
 
 class _QueryCollectionAsync(
     Generic[TProperties, References],
+    _BatchQueryAsync[TProperties, References],
     _BM25QueryAsync[TProperties, References],
     _FetchObjectByIDQueryAsync[TProperties, References],
     _FetchObjectsByIDsQueryAsync[TProperties, References],
@@ -52,6 +54,7 @@ class _QueryCollectionAsync(
 
 class _QueryCollection(
     Generic[TProperties, References],
+    _BatchQuery[TProperties, References],
     _BM25Query[TProperties, References],
     _FetchObjectByIDQuery[TProperties, References],
     _FetchObjectsByIDsQuery[TProperties, References],
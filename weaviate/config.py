@@ -1,17 +1,41 @@
 from dataclasses import dataclass, field
-from typing import Optional, Tuple, Union
+from importlib.util import find_spec
+from typing import Any, Dict, Literal, Optional, Set, Tuple, Union
 
-from grpc import ChannelCredentials
+from grpc import ChannelCredentials, StatusCode
 from grpc.aio._typing import ChannelArgumentType
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from weaviate.instrumentation import Tracer
+
+VectorFormat = Literal["list", "numpy"]
+LoadBalancing = Literal["round_robin", "least_outstanding"]
+GrpcCompression = Literal["none", "gzip"]
+GrpcOperation = Literal["search", "aggregate", "batch", "batch_stream"]
 
 
 @dataclass
 class ConnectionConfig:
+    """Configuration of the HTTP connection pool of the REST client.
+
+    The pool keeps up to `session_pool_connections` idle connections open for `keepalive_expiry` seconds and opens at most
+    `session_pool_maxsize` connections in total.
+
+    With `http2`, REST requests to an `https` URL are multiplexed over HTTP/2 connections, so that concurrent requests do
+    not need a connection each. This requires the `h2` package, e.g. `pip install weaviate-client[http2]`.
+
+    With `share_transport`, all clients of the process with the same connection settings share one connection pool. Use
+    this when creating many clients, e.g. one per worker or tenant, to bound the number of open connections and reuse
+    them across clients. The pool is closed when the last client using it is closed.
+    """
+
     session_pool_connections: int = 20
     session_pool_maxsize: int = 100
     session_pool_max_retries: int = 3
     session_pool_timeout: int = 5
+    http2: bool = False
+    keepalive_expiry: float = 5
+    share_transport: bool = False
 
     def __post_init__(self) -> None:
         if not isinstance(self.session_pool_connections, int) or isinstance(
@@ -38,6 +62,12 @@ class ConnectionConfig:
             raise TypeError(
                 f"session_pool_timeout must be {int}, received {type(self.session_pool_timeout)}"
             )
+        if self.keepalive_expiry < 0:
+            raise ValueError(f"keepalive_expiry must be >= 0, received {self.keepalive_expiry}")
+        if self.http2 and find_spec("h2") is None:
+            raise ValueError(
+                "http2=True requires the h2 package, install it with `pip install weaviate-client[http2]`"
+            )
 
 
 # used in v3 only
@@ -101,12 +131,155 @@ class GrpcConfig(BaseModel):
         credentials=ssl_channel_credentials(...),
     )
     ```
+
+    By default, all gRPC calls share a single channel to the configured host. Searches, aggregations and batch inserts can
+    instead be spread over a pool of channels:
+    - `pool_size` opens that many channels to every target, each with its own HTTP/2 connection, so that the number of
+        concurrent calls is not limited by the stream limit of a single connection.
+    - `discover_nodes` looks up the nodes of the cluster when connecting and sends the calls to all of them directly. The
+        address of a node is built from `node_address`, in which `{name}` is replaced by the node name and `{port}` by the
+        configured gRPC port. The default assumes that the node names are resolvable host names, as is the case for
+        Kubernetes StatefulSets with `node_address="{name}.<headless-service>:{port}"`.
+    - `load_balancing` picks the channel for each call, either in turn (`"round_robin"`) or the one with the fewest
+        calls in flight (`"least_outstanding"`).
+    - A node that fails a call with `UNAVAILABLE` receives no calls for `ejection_time` seconds.
+
+    Requests are sent uncompressed by default. `compression` sets the algorithm for searches, aggregations and batches,
+    and `compression_overrides` sets it per operation, e.g. `{"batch": "gzip", "search": "none"}` to compress text-heavy
+    imports but not small queries. With a `compression_threshold`, only requests of at least that many bytes are
+    compressed, since compressing small messages costs more CPU than it saves bandwidth. The threshold does not apply to
+    `"batch_stream"`, whose messages are all sent with the same compression. Batch results report the
+    `compression_ratio` of the compressed requests, estimated from every 16th of them.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     channel_options: Optional[ChannelArgumentType] = Field(default=None)
     credentials: Optional[ChannelCredentials] = Field(default=None)
+    pool_size: int = Field(default=1, gt=0)
+    discover_nodes: bool = Field(default=False)
+    node_address: str = Field(default="{name}:{port}")
+    load_balancing: LoadBalancing = Field(default="round_robin")
+    ejection_time: float = Field(default=30, gt=0)
+    compression: GrpcCompression = Field(default="none")
+    compression_overrides: Dict[GrpcOperation, GrpcCompression] = Field(default_factory=dict)
+    compression_threshold: int = Field(default=0, ge=0)
+
+    def _uses_pool(self) -> bool:
+        return self.pool_size > 1 or self.discover_nodes
+
+
+class RetryPolicy(BaseModel):
+    """Configuration of how failed requests to Weaviate are retried.
+
+    A request is attempted at most `max_attempts` times. Before retry number `n` (starting at 0) the client waits up to
+    `min(max_backoff, initial_backoff * 2**n)` seconds. With `jitter`, the wait is drawn uniformly between zero and that
+    value, so that clients that failed at the same time, e.g. during a rolling upgrade, do not retry in lockstep. If
+    `total_timeout` is set, no retry is started that could not finish within that many seconds of the first attempt and
+    the timeout of every attempt is shortened to the remaining time.
+
+    gRPC calls are retried when they fail with one of the `retryable_codes`. Searches, aggregations and tenant lookups are
+    idempotent and are also retried on the `retryable_read_codes`, e.g. `RESOURCE_EXHAUSTED` or `DEADLINE_EXCEEDED`.
+    REST `GET` and `HEAD` requests are retried when they return one of the `retryable_http_statuses`. Codes can be given as
+    `grpc.StatusCode` members or by their name.
+
+    Batches keep retrying for longer than other requests to survive a scale-up of the cluster, the `max_attempts` of the
+    policy do not apply to them.
+
+    Example usage:
+    ```python
+    import weaviate.classes as wvc
+
+    conf = wvc.init.AdditionalConfig(
+        retry_policy=wvc.init.RetryPolicy(
+            max_attempts=3, max_backoff=5, total_timeout=20, retryable_read_codes={"RESOURCE_EXHAUSTED"}
+        ),
+    )
+    ```
+    """
+
+    max_attempts: int = Field(default=5, ge=1)
+    initial_backoff: float = Field(default=1.0, gt=0)
+    max_backoff: float = Field(default=30.0, gt=0)
+    jitter: bool = Field(default=True)
+    total_timeout: Optional[float] = Field(default=None, gt=0)
+    retryable_codes: Set[StatusCode] = Field(default_factory=lambda: {StatusCode.UNAVAILABLE})
+    retryable_read_codes: Set[StatusCode] = Field(default_factory=set)
+    retryable_http_statuses: Set[int] = Field(default_factory=lambda: {502, 503, 504})
+
+    @field_validator("retryable_codes", "retryable_read_codes", mode="before")
+    @classmethod
+    def _parse_codes(cls, v: Any) -> Any:
+        if not isinstance(v, (set, frozenset, list, tuple)):
+            return v
+        codes = set()
+        for code in v:
+            if isinstance(code, str):
+                if code not in StatusCode.__members__:
+                    raise ValueError(f"Unknown gRPC status code {code}")
+                code = StatusCode[code]
+            codes.add(code)
+        return codes
+
+
+class Hedging(BaseModel):
+    """Configuration of hedged searches and aggregations, which send a duplicate of a slow request.
+
+    If a search or aggregation has not been answered after the `percentile` of the latencies of the last `window` requests
+    to the same collection, the client sends the same request again and returns whichever reply arrives first. The
+    other request is cancelled. Until `min_samples` latencies were observed for a collection, `initial_delay` is used.
+    The delay is never shorter than `min_delay` seconds.
+
+    Hedging pays off when the latency is dominated by a slow replica, so it is best combined with `ConsistencyLevel.ONE`
+    reads and a `GrpcConfig` channel pool that discovers the cluster nodes, so that the duplicate is sent to another node.
+    With the default percentile of 95, about 5% of the requests are sent twice.
+
+    Example usage:
+    ```python
+    import weaviate.classes as wvc
+
+    conf = wvc.init.AdditionalConfig(hedging=wvc.init.Hedging(percentile=90))
+    ```
+    """
+
+    percentile: float = Field(default=95, gt=0, lt=100)
+    window: int = Field(default=1000, gt=0)
+    min_samples: int = Field(default=20, gt=0)
+    initial_delay: float = Field(default=0.1, gt=0)
+    min_delay: float = Field(default=0.005, ge=0)
+
+
+class QueryCache(BaseModel):
+    """Configuration of the opt-in client-side cache for search results.
+
+    Replies are keyed on the serialized search request, which includes the collection, tenant and consistency level, and
+    are evicted least-recently-used once `max_entries` is reached. Entries expire after `ttl` seconds, or after the
+    value in `collection_ttl` for collections listed there. A `ttl` of `None` keeps entries until they are evicted.
+
+    Writes made through this client (`collection.data`, batching, deletes and schema changes) drop the cached entries of
+    the affected collection. Writes made by other clients are only picked up once the entries expire.
+
+    Example usage:
+    ```python
+    import weaviate.classes as wvc
+
+    conf = wvc.init.AdditionalConfig(
+        query_cache=wvc.init.QueryCache(max_entries=5000, ttl=60, collection_ttl={"Products": 5}),
+    )
+    ```
+    """
+
+    max_entries: int = Field(default=1024, gt=0)
+    ttl: Optional[float] = Field(default=60, gt=0)
+    collection_ttl: Dict[str, float] = Field(default_factory=dict)
+
+    @field_validator("collection_ttl")
+    @classmethod
+    def _check_collection_ttl(cls, v: Dict[str, float]) -> Dict[str, float]:
+        for name, ttl in v.items():
+            if ttl <= 0:
+                raise ValueError(f"ttl for collection {name} must be positive, got {ttl}")
+        return v
 
 
 class AdditionalConfig(BaseModel):
@@ -118,13 +291,48 @@ class AdditionalConfig(BaseModel):
 
     When specifying the proxies, be aware that supplying a URL (`str`) will populate all of the `http`, `https`, and grpc proxies.
     In order for this to be possible, you must have a proxy that is capable of handling simultaneous HTTP/1.1 and HTTP/2 traffic.
+
+    When specifying the `vector_format`, `"list"` returns the vectors of query results as (nested) lists of floats while
+    `"numpy"` returns them as read-only `numpy.ndarray` views over the bytes received from Weaviate, avoiding the creation
+    of a Python float per dimension. Multi-vectors are returned as 2-D arrays. The `numpy` package must be installed.
+
+    When specifying the `query_cache`, identical searches are answered from a local cache instead of being sent to Weaviate.
+    See `QueryCache` for the available settings.
+
+    When specifying the `tracer`, the client reports how long it spends building requests, waiting for Weaviate, retrying
+    and decoding results as spans on it. Any OpenTelemetry tracer can be used, or a `CallbackTracer` to receive the timings
+    without depending on OpenTelemetry. See `weaviate.instrumentation` for the emitted spans.
+
+    When specifying the `retry_policy`, failed requests are retried with the given number of attempts, backoff and time
+    budget. See `RetryPolicy` for the defaults.
+
+    When specifying `hedging`, slow searches and aggregations are sent a second time and the first reply is used. See
+    `Hedging` for when the duplicate is sent.
+
+    When enabling `metrics`, the client counts its requests, retries, transferred bytes and batched objects and records
+    latency histograms, which can be read from `client.metrics()`. See `weaviate.metrics` for the collected metrics.
     """
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     connection: ConnectionConfig = Field(default_factory=ConnectionConfig)
     proxies: Union[str, Proxies, None] = Field(default=None)
     timeout_: Union[Tuple[int, int], Timeout] = Field(default_factory=Timeout, alias="timeout")
     trust_env: bool = Field(default=False)
     grpc_config: Optional[GrpcConfig] = Field(default=None)
+    vector_format: VectorFormat = Field(default="list")
+    query_cache: Optional[QueryCache] = Field(default=None)
+    tracer: Optional[Tracer] = Field(default=None)
+    metrics: bool = Field(default=False)
+    retry_policy: Optional[RetryPolicy] = Field(default=None)
+    hedging: Optional[Hedging] = Field(default=None)
+
+    @field_validator("vector_format")
+    @classmethod
+    def _check_vector_format(cls, v: VectorFormat) -> VectorFormat:
+        if v == "numpy" and find_spec("numpy") is None:
+            raise ValueError('vector_format="numpy" requires the numpy package to be installed')
+        return v
 
     @property
     def timeout(self) -> Timeout:
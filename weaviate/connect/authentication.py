@@ -25,8 +25,8 @@ OIDC_CONFIG = Dict[str, Union[str, List[str]]]
 
 Result = Union[OAuth2Client, Awaitable[AsyncOAuth2Client]]
 MountsMaker = Union[
-    Callable[[], Dict[str, httpx.AsyncHTTPTransport]],
-    Callable[[], Dict[str, httpx.HTTPTransport]],
+    Callable[[], Dict[str, httpx.AsyncBaseTransport]],
+    Callable[[], Dict[str, httpx.BaseTransport]],
 ]
 
 
@@ -123,7 +123,7 @@ class _Auth:
             async def _execute() -> str:
                 mounts: Dict[str, httpx.AsyncBaseTransport] = {}
                 for key, mount in self.__make_mounts().items():
-                    assert isinstance(mount, httpx.AsyncHTTPTransport)
+                    assert isinstance(mount, httpx.AsyncBaseTransport)
                     mounts[key] = mount
                 async with httpx.AsyncClient(mounts=mounts) as client:
                     return resp(await client.get(self._open_id_config_url))
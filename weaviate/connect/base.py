@@ -117,14 +117,23 @@ class ConnectionParams(BaseModel):
         grpc_msg_size: Optional[int],
         is_async: bool,
         grpc_config: Optional[GrpcConfig] = None,
+        address: Optional[Tuple[str, int]] = None,
+        dedicated: bool = False,
     ) -> Union[AsyncChannel, SyncChannel]:
+        """Open a channel to the configured gRPC host or to `address`.
+
+        Channels with the same target and options share their connection, `dedicated` channels open their own.
+        """
         if grpc_msg_size is None:
             grpc_msg_size = MAX_GRPC_MESSAGE_LENGTH
+        host, port = address if address is not None else self._grpc_address
         opts = [
             ("grpc.max_send_message_length", grpc_msg_size),
             ("grpc.max_receive_message_length", grpc_msg_size),
-            ("grpc.default_authority", self.grpc.host),
+            ("grpc.default_authority", host),
         ]
+        if dedicated:
+            opts.append(("grpc.use_local_subchannel_pool", 1))
 
         if (p := proxies.get("grpc")) is not None:
             options: list = [*opts, ("grpc.http_proxy", p)]
@@ -144,13 +153,13 @@ class ConnectionParams(BaseModel):
             else:
                 creds = ssl_channel_credentials()
             return mod.secure_channel(
-                target=self._grpc_target,
+                target=f"{host}:{port}",
                 credentials=creds,
                 options=options,
             )
         else:
             return mod.insecure_channel(
-                target=self._grpc_target,
+                target=f"{host}:{port}",
                 options=options,
             )
 
@@ -0,0 +1,65 @@
+import itertools
+import zlib
+from typing import Iterable, NamedTuple, Optional
+
+from google.protobuf.message import Message
+from grpc import Compression  # type: ignore
+
+from weaviate.config import GrpcCompression, GrpcConfig, GrpcOperation
+
+# without a configured algorithm the calls use the default of the channel, which can be set in `channel_options`
+_ALGORITHMS = {"none": None, "gzip": Compression.Gzip}
+
+# compressing a sample of this many bytes is enough to estimate the ratio of a batch without compressing it twice
+_SAMPLE_SIZE = 64 * 1024
+# the ratio is only estimated for the first and then every this many compressed batches, as the sample is compressed on
+# the thread that sends the batches
+_ESTIMATE_EVERY = 16
+
+
+class _CompressedSize(NamedTuple):
+    size: int
+    compressed: int
+
+
+class _Compression:
+    """Chooses the compression of a gRPC call from the `GrpcConfig`."""
+
+    def __init__(self, config: Optional[GrpcConfig]) -> None:
+        self.__default: GrpcCompression = config.compression if config is not None else "none"
+        self.__overrides = dict(config.compression_overrides) if config is not None else {}
+        self.__threshold = config.compression_threshold if config is not None else 0
+        self.__requests = itertools.count()
+
+    def algorithm(self, operation: GrpcOperation) -> GrpcCompression:
+        return self.__overrides.get(operation, self.__default)
+
+    def for_stream(self, operation: GrpcOperation) -> Optional[Compression]:
+        """Return the compression of all messages of a stream, which does not depend on their size."""
+        return _ALGORITHMS[self.algorithm(operation)]
+
+    def for_request(self, operation: GrpcOperation, request: Message) -> Optional[Compression]:
+        """Return the compression of a unary call, which is skipped for requests below the threshold."""
+        algorithm = self.algorithm(operation)
+        if algorithm != "none" and self.__threshold > 0 and request.ByteSize() < self.__threshold:
+            return Compression.NoCompression
+        return _ALGORITHMS[algorithm]
+
+    def sample(self, size: int, messages: Iterable[Message]) -> Optional[_CompressedSize]:
+        """Estimate the compressed size of a compressed request for every `_ESTIMATE_EVERY`th request, see `estimate`."""
+        if next(self.__requests) % _ESTIMATE_EVERY != 0:
+            return None
+        return self.estimate(size, messages)
+
+    @staticmethod
+    def estimate(size: int, messages: Iterable[Message]) -> _CompressedSize:
+        """Estimate the compressed size of a request of `size` bytes from a sample of its `messages`."""
+        sample = bytearray()
+        for message in messages:
+            sample += message.SerializeToString()
+            if len(sample) >= _SAMPLE_SIZE:
+                break
+        if len(sample) == 0:
+            return _CompressedSize(size, size)
+        ratio = len(zlib.compress(bytes(sample))) / len(sample)
+        return _CompressedSize(size, max(1, round(size * ratio)))
@@ -0,0 +1,148 @@
+import asyncio
+import math
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from grpc import Future, FutureTimeoutError  # type: ignore
+
+from weaviate.config import Hedging
+
+_Key = Tuple[str, str]
+
+
+class _LatencyWindow:
+    def __init__(self, size: int) -> None:
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.updates = 0
+        self.delay: Optional[float] = None
+
+
+class _Hedger:
+    """Sends a duplicate of a request that is slower than a percentile of the recent latencies of its collection.
+
+    The latencies are kept in a rolling window per RPC method and collection. The percentile is recomputed after every
+    twentieth of the window, so that sorting the samples does not add to every request.
+    """
+
+    def __init__(self, config: Hedging) -> None:
+        self.__config = config
+        self.__windows: Dict[_Key, _LatencyWindow] = {}
+        self.__recompute_every = max(1, config.window // 20)
+        self.__lock = threading.Lock()
+
+    def delay(self, key: _Key) -> float:
+        window = self.__windows.get(key)
+        if window is None or window.delay is None:
+            return self.__config.initial_delay
+        return window.delay
+
+    def record(self, key: _Key, latency: float) -> None:
+        with self.__lock:
+            window = self.__windows.get(key)
+            if window is None:
+                window = self.__windows[key] = _LatencyWindow(self.__config.window)
+            window.samples.append(latency)
+            window.updates += 1
+            if len(window.samples) < self.__config.min_samples:
+                return
+            if window.delay is not None and window.updates < self.__recompute_every:
+                return
+            window.updates = 0
+            samples = sorted(window.samples)
+            idx = math.ceil(self.__config.percentile / 100 * len(samples)) - 1
+            window.delay = max(self.__config.min_delay, samples[idx])
+
+    @staticmethod
+    def __remaining(kwargs: Dict[str, Any], elapsed: float) -> Dict[str, Any]:
+        """Return the arguments of the duplicate, whose timeout ends at the same time as the one of the first request."""
+        if kwargs.get("timeout") is None:
+            return kwargs
+        return {**kwargs, "timeout": max(kwargs["timeout"] - elapsed, 0)}
+
+    def call(
+        self,
+        key: _Key,
+        start: Callable[..., Future],
+        on_hedge: Callable[[float], None],
+        request: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Send `request` with `start`, which returns a `grpc.Future`, and hedge it once it is slower than the delay."""
+        delay = self.delay(key)
+        begin = time.perf_counter()
+        primary = start(request, **kwargs)
+        try:
+            res = primary.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        else:
+            self.record(key, time.perf_counter() - begin)
+            return res
+
+        on_hedge(delay)
+        futures: List[Future] = [primary]
+        try:
+            futures.append(start(request, **self.__remaining(kwargs, time.perf_counter() - begin)))
+        except Exception:
+            # if the duplicate cannot be started, the first request is still in flight
+            return primary.result()
+
+        done: "queue.SimpleQueue[Future]" = queue.SimpleQueue()
+        for future in futures:
+            future.add_done_callback(done.put)
+        error: Optional[BaseException] = None
+        for _ in futures:
+            future = done.get()
+            if future.exception() is None:
+                for other in futures:
+                    if other is not future:
+                        other.cancel()
+                self.record(key, time.perf_counter() - begin)
+                return future.result()
+            error = error or future.exception()
+        assert error is not None
+        raise error
+
+    async def acall(
+        self,
+        key: _Key,
+        call: Callable[..., Awaitable[Any]],
+        on_hedge: Callable[[float], None],
+        request: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Send `request` with the coroutine function `call` and hedge it once it is slower than the delay."""
+
+        async def run(**kwargs: Any) -> Any:
+            return await call(request, **kwargs)
+
+        delay = self.delay(key)
+        begin = time.perf_counter()
+        tasks = [asyncio.ensure_future(run(**kwargs))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if len(done) == 0:
+                on_hedge(delay)
+                tasks.append(
+                    asyncio.ensure_future(
+                        run(**self.__remaining(kwargs, time.perf_counter() - begin))
+                    )
+                )
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while len(pending) > 0:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self.record(key, time.perf_counter() - begin)
+                        return task.result()
+                    error = error or task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
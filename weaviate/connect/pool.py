@@ -0,0 +1,155 @@
+import threading
+import time
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union, cast
+
+from grpc import Channel as SyncChannel  # type: ignore
+from grpc import Call, Future, RpcError, StatusCode  # type: ignore
+from grpc.aio import Channel as AsyncChannel  # type: ignore
+
+from weaviate.config import LoadBalancing
+from weaviate.proto.v1 import weaviate_pb2_grpc
+
+_Channel = Union[AsyncChannel, SyncChannel]
+
+
+def _parse_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    if host == "" or not port.isdigit():
+        raise ValueError(f"Expected a gRPC address of the form 'host:port', got '{address}'")
+    return host, int(port)
+
+
+class _PoolMember:
+    __slots__ = ("target", "channel", "stub", "outstanding", "ejected_until")
+
+    def __init__(self, target: str, channel: _Channel) -> None:
+        self.target = target
+        self.channel = channel
+        self.stub = weaviate_pb2_grpc.WeaviateStub(channel)
+        self.outstanding = 0
+        self.ejected_until = 0.0
+
+
+class _ChannelPool:
+    """A set of gRPC channels to one or more Weaviate nodes that unary calls are balanced across.
+
+    Every target gets `channels_per_target` channels, each with its own HTTP/2 connection, so that the number of concurrent
+    streams is not capped by a single connection. A target whose call fails with `UNAVAILABLE` is ejected from the
+    rotation for `ejection_time` seconds. If every target is ejected, calls are balanced across all of them again.
+    """
+
+    def __init__(
+        self,
+        channel_factory: Callable[[Tuple[str, int]], _Channel],
+        addresses: Sequence[Tuple[str, int]],
+        channels_per_target: int,
+        load_balancing: LoadBalancing,
+        ejection_time: float,
+        is_async: bool,
+    ) -> None:
+        self.__members: List[_PoolMember] = []
+        for host, port in dict.fromkeys(addresses):
+            for _ in range(channels_per_target):
+                self.__members.append(_PoolMember(f"{host}:{port}", channel_factory((host, port))))
+        self.__least_outstanding = load_balancing == "least_outstanding"
+        self.__ejection_time = ejection_time
+        self.__is_async = is_async
+        self.__next = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def targets(self) -> List[str]:
+        return list(dict.fromkeys(member.target for member in self.__members))
+
+    def ejected(self) -> List[str]:
+        now = time.monotonic()
+        with self.__lock:
+            return list(dict.fromkeys(m.target for m in self.__members if m.ejected_until > now))
+
+    def _acquire(self) -> _PoolMember:
+        now = time.monotonic()
+        with self.__lock:
+            members = [m for m in self.__members if m.ejected_until <= now] or self.__members
+            start = self.__next % len(members)
+            self.__next += 1
+            if self.__least_outstanding:
+                # start the scan at a rotating offset so that ties are spread over all members
+                member = min(members[start:] + members[:start], key=lambda m: m.outstanding)
+            else:
+                member = members[start]
+            member.outstanding += 1
+            return member
+
+    def _release(self, member: _PoolMember, error: Optional[Exception]) -> None:
+        with self.__lock:
+            member.outstanding -= 1
+            if error is not None and _is_unavailable(error):
+                ejected_until = time.monotonic() + self.__ejection_time
+                for m in self.__members:
+                    if m.target == member.target:
+                        m.ejected_until = ejected_until
+
+    def method(self, name: str) -> Callable[..., Any]:
+        """Return a callable that sends the unary RPC `name` over the next channel of the pool."""
+        if self.__is_async:
+
+            async def call_async(request: Any, **kwargs: Any) -> Any:
+                member = self._acquire()
+                error: Optional[Exception] = None
+                try:
+                    return await getattr(member.stub, name)(request, **kwargs)
+                except Exception as e:
+                    error = e
+                    raise
+                finally:
+                    # also runs when the call is cancelled, so that the member is not counted as busy forever
+                    self._release(member, error)
+
+            return call_async
+
+        def call(request: Any, **kwargs: Any) -> Any:
+            member = self._acquire()
+            error: Optional[Exception] = None
+            try:
+                return getattr(member.stub, name)(request, **kwargs)
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                self._release(member, error)
+
+        return call
+
+    def future(self, name: str) -> Callable[..., Future]:
+        """Return a callable that starts the unary RPC `name` on the next channel of the pool without waiting for it.
+
+        Only available for synchronous pools.
+        """
+
+        def call(request: Any, **kwargs: Any) -> Future:
+            member = self._acquire()
+            try:
+                future = getattr(member.stub, name).future(request, **kwargs)
+            except Exception as e:
+                self._release(member, e)
+                raise
+            future.add_done_callback(
+                lambda f: self._release(member, None if f.cancelled() else f.exception())
+            )
+            return future
+
+        return call
+
+    def close(self) -> None:
+        for member in self.__members:
+            assert isinstance(member.channel, SyncChannel)
+            member.channel.close()
+
+    async def aclose(self) -> None:
+        for member in self.__members:
+            assert isinstance(member.channel, AsyncChannel)
+            await member.channel.close()
+
+
+def _is_unavailable(error: Exception) -> bool:
+    return isinstance(error, RpcError) and cast(Call, error).code() == StatusCode.UNAVAILABLE
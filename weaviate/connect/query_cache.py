@@ -0,0 +1,146 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Set, Tuple
+
+from weaviate.config import QueryCache
+from weaviate.proto.v1 import batch_pb2, search_get_pb2
+
+_INVALIDATING_ROOTS = ("objects", "batch", "schema")
+
+_Generation = Tuple[int, int]
+
+
+@dataclass
+class QueryCacheStats:
+    """Counters of the client-side query cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+    size: int
+
+
+class _CacheEntry(NamedTuple):
+    collection: str
+    expires_at: Optional[float]
+    reply: search_get_pb2.SearchReply
+
+
+class _QueryCache:
+    """LRU cache of search replies keyed on the deterministic serialization of the search request.
+
+    Every collection carries a generation number that is bumped on invalidation, next to an epoch that is bumped when the
+    whole cache is invalidated. A search records both before it is sent and its reply is only stored if no write to the
+    collection completed in the meantime.
+    """
+
+    def __init__(self, config: QueryCache) -> None:
+        self.__max_entries = config.max_entries
+        self.__ttl = config.ttl
+        self.__collection_ttl = dict(config.collection_ttl)
+        self.__entries: "OrderedDict[bytes, _CacheEntry]" = OrderedDict()
+        self.__keys: Dict[str, Set[bytes]] = {}
+        self.__generations: Dict[str, int] = {}
+        self.__epoch = 0
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__invalidations = 0
+
+    @staticmethod
+    def key(request: search_get_pb2.SearchRequest) -> bytes:
+        return request.SerializeToString(deterministic=True)
+
+    def get(
+        self, request: search_get_pb2.SearchRequest
+    ) -> Tuple[bytes, _Generation, Optional[search_get_pb2.SearchReply]]:
+        """Look up a request, returning its key and the generation to pass to `put` on a miss."""
+        key = self.key(request)
+        with self.__lock:
+            generation = (self.__epoch, self.__generations.get(request.collection, 0))
+            entry = self.__entries.get(key)
+            if entry is not None:
+                if entry.expires_at is None or entry.expires_at > time.monotonic():
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return key, generation, entry.reply
+                self.__remove(key)
+            self.__misses += 1
+            return key, generation, None
+
+    def put(
+        self,
+        key: bytes,
+        generation: _Generation,
+        request: search_get_pb2.SearchRequest,
+        reply: search_get_pb2.SearchReply,
+    ) -> None:
+        collection = request.collection
+        ttl = self.__collection_ttl.get(collection, self.__ttl)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self.__lock:
+            if (self.__epoch, self.__generations.get(collection, 0)) != generation:
+                return
+            if key in self.__entries:
+                self.__remove(key)
+            self.__entries[key] = _CacheEntry(collection, expires_at, reply)
+            self.__keys.setdefault(collection, set()).add(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__remove(next(iter(self.__entries)))
+                self.__evictions += 1
+
+    def invalidate(self, collections: Optional[Iterable[str]] = None) -> None:
+        """Drop the entries of the given collections, or of every collection if `None`."""
+        with self.__lock:
+            if collections is None:
+                self.__entries.clear()
+                self.__keys.clear()
+                self.__epoch += 1
+            else:
+                for collection in collections:
+                    for key in self.__keys.pop(collection, ()):
+                        del self.__entries[key]
+                    self.__generations[collection] = self.__generations.get(collection, 0) + 1
+            self.__invalidations += 1
+
+    def invalidate_rest_write(self, path: str, payload: Any) -> None:
+        """Invalidate the collections written to by a mutating REST request to `path` (relative to `/v1`)."""
+        parts = path.strip("/").split("/")
+        if parts[0] not in _INVALIDATING_ROOTS:
+            return
+        if parts[0] in ("objects", "schema") and len(parts) > 1:
+            self.invalidate([parts[1]])
+        elif isinstance(payload, dict) and "class" in payload:
+            self.invalidate([payload["class"]])
+        else:
+            self.invalidate()
+
+    def invalidate_batch_stream(self, request: batch_pb2.BatchStreamRequest) -> None:
+        if request.HasField("data"):
+            collections = {obj.collection for obj in request.data.objects.values} | {
+                ref.from_collection for ref in request.data.references.values
+            }
+            if len(collections) > 0:
+                self.invalidate(collections)
+
+    def stats(self) -> QueryCacheStats:
+        with self.__lock:
+            return QueryCacheStats(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                invalidations=self.__invalidations,
+                size=len(self.__entries),
+            )
+
+    def __remove(self, key: bytes) -> None:
+        entry = self.__entries.pop(key)
+        keys = self.__keys.get(entry.collection)
+        if keys is not None:
+            keys.discard(key)
+            if len(keys) == 0:
+                del self.__keys[entry.collection]
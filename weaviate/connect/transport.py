@@ -0,0 +1,126 @@
+import asyncio
+import ipaddress
+import threading
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar, Union
+from urllib.request import getproxies
+
+import httpx
+
+_Transport = TypeVar("_Transport", httpx.HTTPTransport, httpx.AsyncHTTPTransport)
+
+
+class _SharedTransports(Generic[_Transport]):
+    """Reference-counted HTTP transports that the connections of a process with the same settings share.
+
+    Sharing a transport shares its connection pool, so that many clients to the same Weaviate instance keep a bounded
+    number of connections open instead of one pool each. Every client gets its own handle, the transport is closed when
+    the last handle is closed.
+    """
+
+    def __init__(self) -> None:
+        self.__transports: Dict[Hashable, Tuple[_Transport, int]] = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__transports)
+
+    def acquire(self, key: Hashable, factory: Callable[[], _Transport]) -> _Transport:
+        with self.__lock:
+            transport, count = self.__transports.get(key, (None, 0))
+            if transport is None:
+                transport = factory()
+            self.__transports[key] = (transport, count + 1)
+            return transport
+
+    def release(self, key: Hashable) -> Union[_Transport, None]:
+        """Release a handle and return the transport if it is no longer used and has to be closed."""
+        with self.__lock:
+            transport, count = self.__transports[key]
+            if count > 1:
+                self.__transports[key] = (transport, count - 1)
+                return None
+            del self.__transports[key]
+            return transport
+
+
+_SHARED_TRANSPORTS: _SharedTransports[httpx.HTTPTransport] = _SharedTransports()
+_ASYNC_SHARED_TRANSPORTS: _SharedTransports[httpx.AsyncHTTPTransport] = _SharedTransports()
+
+# the connection pool limits of the default transport of httpx
+_HTTPX_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=5.0
+)
+
+
+def _is_ip_address(hostname: str, version: int) -> bool:
+    try:
+        return ipaddress.ip_address(hostname.split("/")[0]).version == version
+    except ValueError:
+        return False
+
+
+def _no_proxy_mounts() -> Dict[str, None]:
+    """Return the mounts that exclude the hosts in the `NO_PROXY` environment variable from proxying.
+
+    httpx only reads the proxy environment variables if no transport is given to the client, so a client with a custom
+    transport mounts these itself. The patterns follow `httpx._utils.get_environment_proxies`.
+    """
+    mounts: Dict[str, None] = {}
+    for hostname in (host.strip() for host in getproxies().get("no", "").split(",")):
+        if hostname == "*":
+            return {}
+        if hostname == "":
+            continue
+        if "://" in hostname:
+            mounts[hostname] = None
+        elif _is_ip_address(hostname, 4) or hostname.lower() == "localhost":
+            mounts[f"all://{hostname}"] = None
+        elif _is_ip_address(hostname, 6):
+            mounts[f"all://[{hostname}]"] = None
+        else:
+            mounts[f"all://*{hostname}"] = None
+    return mounts
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class _SharedTransport(httpx.BaseTransport):
+    def __init__(self, key: Hashable, factory: Callable[[], httpx.HTTPTransport]) -> None:
+        self.__key = key
+        self.__transport = _SHARED_TRANSPORTS.acquire(key, factory)
+        self.__closed = False
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.__transport.handle_request(request)
+
+    def close(self) -> None:
+        if self.__closed:
+            return
+        self.__closed = True
+        transport = _SHARED_TRANSPORTS.release(self.__key)
+        if transport is not None:
+            transport.close()
+
+
+class _AsyncSharedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, key: Hashable, factory: Callable[[], httpx.AsyncHTTPTransport]) -> None:
+        # the connections of an async transport belong to the event loop that opened them
+        self.__key = (key, _running_loop())
+        self.__transport = _ASYNC_SHARED_TRANSPORTS.acquire(self.__key, factory)
+        self.__closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.__transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if self.__closed:
+            return
+        self.__closed = True
+        transport = _ASYNC_SHARED_TRANSPORTS.release(self.__key)
+        if transport is not None:
+            await transport.aclose()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import time
 from copy import copy
+from functools import partial
 from dataclasses import dataclass, field
 from ssl import SSLZeroReturnError
 from threading import Event, Thread
@@ -10,8 +11,10 @@ from typing import (
     Any,
     AsyncGenerator,
     Awaitable,
+    Callable,
     Dict,
     Generator,
+    Hashable,
     List,
     Literal,
     Optional,
@@ -34,8 +37,10 @@ from grpc.aio import Channel as AsyncChannel  # type: ignore
 
 # from grpclib.client import Channel
 from httpx import (
+    AsyncBaseTransport,
     AsyncClient,
     AsyncHTTPTransport,
+    BaseTransport,
     Client,
     ConnectError,
     HTTPError,
@@ -46,6 +51,7 @@ from httpx import (
     ReadError,
     ReadTimeout,
     RemoteProtocolError,
+    Request,
     RequestError,
     Response,
     Timeout,
@@ -53,7 +59,15 @@ from httpx import (
 
 from weaviate import __version__ as client_version
 from weaviate.auth import AuthApiKey, AuthClientCredentials, AuthCredentials
-from weaviate.config import ConnectionConfig, GrpcConfig, Proxies
+from weaviate.config import (
+    ConnectionConfig,
+    GrpcConfig,
+    Hedging,
+    Proxies,
+    QueryCache,
+    RetryPolicy,
+    VectorFormat,
+)
 from weaviate.config import Timeout as TimeoutConfig
 from weaviate.connect import executor
 from weaviate.connect.authentication import _Auth
@@ -62,8 +76,18 @@ from weaviate.connect.base import (
     JSONPayload,
     _get_proxies,
 )
+from weaviate.connect.compression import _Compression, _CompressedSize
 from weaviate.connect.event_loop import _EventLoopSingleton
+from weaviate.connect.hedging import _Hedger
 from weaviate.connect.integrations import _IntegrationConfig
+from weaviate.connect.pool import _ChannelPool, _parse_address
+from weaviate.connect.query_cache import _QueryCache
+from weaviate.connect.transport import (
+    _HTTPX_LIMITS,
+    _AsyncSharedTransport,
+    _no_proxy_mounts,
+    _SharedTransport,
+)
 from weaviate.embedded import EmbeddedV4
 from weaviate.exceptions import (
     AuthenticationFailedError,
@@ -83,6 +107,14 @@ from weaviate.exceptions import (
     WeaviateTimeoutError,
     _BatchStreamShutdownError,
 )
+from weaviate.instrumentation import (
+    AttributeValue,
+    Span,
+    Tracer,
+    _combine_tracers,
+    _Instrumentation,
+)
+from weaviate.metrics import ClientMetrics
 from weaviate.proto.v1 import (
     aggregate_pb2,
     batch_delete_pb2,
@@ -136,6 +168,12 @@ class _ConnectionBase:
         embedded_db: Optional[EmbeddedV4] = None,
         skip_init_checks: bool = False,
         grpc_config: Optional[GrpcConfig] = None,
+        vector_format: VectorFormat = "list",
+        query_cache: Optional[QueryCache] = None,
+        tracer: Optional[Tracer] = None,
+        metrics: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedging: Optional[Hedging] = None,
     ):
         self.url = connection_params._http_url
         self.embedded_db = embedded_db
@@ -146,6 +184,7 @@ class _ConnectionBase:
         self._connection_params = connection_params
         self._grpc_stub: Optional[weaviate_pb2_grpc.WeaviateStub] = None
         self._grpc_channel: Union[AsyncChannel, SyncChannel, None] = None
+        self._grpc_pool: Optional[_ChannelPool] = None
         self.timeout_config = timeout_config
         self.__connection_config = connection_config
         self.__trust_env = trust_env
@@ -154,6 +193,13 @@ class _ConnectionBase:
         self._connected = False
         self._skip_init_checks = skip_init_checks
         self._grpc_config = grpc_config
+        self._compression = _Compression(grpc_config)
+        self._vector_format = vector_format
+        self._query_cache = _QueryCache(query_cache) if query_cache is not None else None
+        self._metrics = ClientMetrics() if metrics else None
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._hedger = _Hedger(hedging) if hedging is not None else None
+        self._instrumentation = _Instrumentation(_combine_tracers(tracer, self._metrics))
 
         client_type = "sync" if isinstance(self, ConnectionSync) else "async"
         embedded_suffix = "-embedded" if self.embedded_db is not None else ""
@@ -204,56 +250,90 @@ class _ConnectionBase:
     def _make_client(self, colour: Literal["sync"]) -> Client: ...
 
     def _make_client(self, colour: executor.Colour) -> Union[AsyncClient, Client]:
+        config = self.__connection_config
+        # httpx ignores the proxy environment variables once a transport is given, so it is only set if it is needed
+        with_transport = config.http2 or config.share_transport or self.__limits() != _HTTPX_LIMITS
+        no_proxy_mounts = _no_proxy_mounts() if with_transport and self.__trust_env else {}
         if colour == "async":
             return AsyncClient(
                 headers=self._headers,
-                mounts=self._make_mounts(colour),
+                transport=self._make_async_transport() if with_transport else None,
+                mounts={**no_proxy_mounts, **self._make_mounts(colour)},
                 trust_env=self.__trust_env,
             )
         if colour == "sync":
             return Client(
                 headers=self._headers,
-                mounts=self._make_mounts(colour),
+                transport=self._make_transport() if with_transport else None,
+                mounts={**no_proxy_mounts, **self._make_mounts(colour)},
                 trust_env=self.__trust_env,
             )
 
     @overload
-    def _make_mounts(self, colour: Literal["async"]) -> Dict[str, AsyncHTTPTransport]: ...
+    def _make_mounts(self, colour: Literal["async"]) -> Dict[str, AsyncBaseTransport]: ...
 
     @overload
-    def _make_mounts(self, colour: Literal["sync"]) -> Dict[str, HTTPTransport]: ...
+    def _make_mounts(self, colour: Literal["sync"]) -> Dict[str, BaseTransport]: ...
 
     def _make_mounts(
         self, colour: executor.Colour
-    ) -> Union[Dict[str, AsyncHTTPTransport], Dict[str, HTTPTransport]]:
+    ) -> Union[Dict[str, AsyncBaseTransport], Dict[str, BaseTransport]]:
+        proxies = {
+            (f"{key}://" if key == "http" or key == "https" else key): proxy
+            for key, proxy in self._proxies.items()
+            if key != "grpc"
+        }
         if colour == "async":
-            return {
-                (f"{key}://" if key == "http" or key == "https" else key): AsyncHTTPTransport(
-                    limits=Limits(
-                        max_connections=self.__connection_config.session_pool_maxsize,
-                        max_keepalive_connections=self.__connection_config.session_pool_connections,
-                    ),
-                    proxy=Proxy(url=proxy),
-                    retries=self.__connection_config.session_pool_max_retries,
-                    trust_env=self.__trust_env,
-                )
-                for key, proxy in self._proxies.items()
-                if key != "grpc"
-            }
-        if colour == "sync":
-            return {
-                f"{key}://" if key == "http" or key == "https" else key: HTTPTransport(
-                    limits=Limits(
-                        max_connections=self.__connection_config.session_pool_maxsize,
-                        max_keepalive_connections=self.__connection_config.session_pool_connections,
-                    ),
-                    proxy=Proxy(url=proxy),
-                    retries=self.__connection_config.session_pool_max_retries,
-                    trust_env=self.__trust_env,
-                )
-                for key, proxy in self._proxies.items()
-                if key != "grpc"
-            }
+            return {key: self._make_async_transport(proxy) for key, proxy in proxies.items()}
+        return {key: self._make_transport(proxy) for key, proxy in proxies.items()}
+
+    def _make_transport(self, proxy: Optional[str] = None) -> BaseTransport:
+        """Create the transport for requests through `proxy`, or for direct requests if it is `None`."""
+        kwargs = self.__transport_kwargs(proxy)
+        if self.__connection_config.share_transport:
+            return _SharedTransport(self.__transport_key(proxy), partial(HTTPTransport, **kwargs))
+        return HTTPTransport(**kwargs)
+
+    def _make_async_transport(self, proxy: Optional[str] = None) -> AsyncBaseTransport:
+        """Create the async transport for requests through `proxy`, or for direct requests if it is `None`."""
+        kwargs = self.__transport_kwargs(proxy)
+        if self.__connection_config.share_transport:
+            return _AsyncSharedTransport(
+                self.__transport_key(proxy), partial(AsyncHTTPTransport, **kwargs)
+            )
+        return AsyncHTTPTransport(**kwargs)
+
+    def __transport_kwargs(self, proxy: Optional[str]) -> Dict[str, Any]:
+        config = self.__connection_config
+        kwargs: Dict[str, Any] = {
+            "limits": self.__limits(),
+            "trust_env": self.__trust_env,
+            "http2": config.http2,
+        }
+        if proxy is not None:
+            kwargs["proxy"] = Proxy(url=proxy)
+            kwargs["retries"] = config.session_pool_max_retries
+        return kwargs
+
+    def __limits(self) -> Limits:
+        config = self.__connection_config
+        return Limits(
+            max_connections=config.session_pool_maxsize,
+            max_keepalive_connections=config.session_pool_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+
+    def __transport_key(self, proxy: Optional[str]) -> Hashable:
+        config = self.__connection_config
+        return (
+            proxy,
+            self.__trust_env,
+            config.session_pool_connections,
+            config.session_pool_maxsize,
+            config.session_pool_max_retries,
+            config.http2,
+            config.keepalive_expiry,
+        )
 
     def is_connected(self) -> bool:
         return self._connected
@@ -383,6 +463,84 @@ class _ConnectionBase:
         assert self._grpc_channel is not None
         self._grpc_stub = weaviate_pb2_grpc.WeaviateStub(self._grpc_channel)
 
+    def _grpc_method(self, name: str) -> Callable[..., Any]:
+        """Return the unary RPC `name`, balanced over the channel pool if there is one."""
+        stub = self.grpc_stub
+        if self._grpc_pool is not None:
+            return self._grpc_pool.method(name)
+        return getattr(stub, name)
+
+    def _grpc_read_method(
+        self, name: str, collection: str, span: Optional[Span]
+    ) -> Callable[..., Any]:
+        """Return the idempotent unary RPC `name`, hedged with a duplicate request if `Hedging` is configured."""
+        if self._hedger is None:
+            return self._grpc_method(name)
+        on_hedge = self._instrumentation.hedge_recorder(span)
+        if isinstance(self, ConnectionAsync):
+            return partial(
+                self._hedger.acall, (name, collection), self._grpc_method(name), on_hedge
+            )
+        if self._grpc_pool is not None:
+            start = self._grpc_pool.future(name)
+        else:
+            start = getattr(self.grpc_stub, name).future
+        return partial(self._hedger.call, (name, collection), start, on_hedge)
+
+    def _discover_grpc_addresses(self) -> executor.Result[List[Tuple[str, int]]]:
+        """Get the gRPC addresses of the healthy nodes of the cluster, falling back to the configured address."""
+        assert self._grpc_config is not None
+        template = self._grpc_config.node_address
+        port = self._connection_params.grpc.port
+        fallback = [self._connection_params._grpc_address]
+
+        def resp(res: Response) -> List[Tuple[str, int]]:
+            nodes = (_decode_json_response_dict(res, "Nodes status") or {}).get("nodes") or []
+            addresses = [
+                _parse_address(template.format(name=node["name"], port=port))
+                for node in nodes
+                if node.get("status") == "HEALTHY"
+            ]
+            if len(addresses) == 0:
+                _Warnings.grpc_node_discovery_failed("no healthy nodes were found")
+                return fallback
+            return addresses
+
+        def exc(e: Exception) -> List[Tuple[str, int]]:
+            _Warnings.grpc_node_discovery_failed(str(e))
+            return fallback
+
+        return executor.execute(
+            response_callback=resp,
+            exception_callback=exc,
+            method=self.get,
+            path="/nodes",
+            error_msg="Get nodes status failed",
+            check_is_connected=False,
+        )
+
+    def _open_grpc_pool(self, addresses: List[Tuple[str, int]], colour: executor.Colour) -> None:
+        assert self._grpc_config is not None
+
+        def channel(address: Tuple[str, int]) -> Union[AsyncChannel, SyncChannel]:
+            return self._connection_params._grpc_channel(
+                proxies=self._proxies,
+                grpc_msg_size=self._grpc_max_msg_size,
+                is_async=colour == "async",
+                grpc_config=self._grpc_config,
+                address=address,
+                dedicated=True,
+            )
+
+        self._grpc_pool = _ChannelPool(
+            channel,
+            addresses,
+            channels_per_target=self._grpc_config.pool_size,
+            load_balancing=self._grpc_config.load_balancing,
+            ejection_time=self._grpc_config.ejection_time,
+            is_async=colour == "async",
+        )
+
     def _open_connections_rest(
         self, auth_client_secret: Optional[AuthCredentials], colour: executor.Colour
     ) -> Union[None, Awaitable[None]]:
@@ -696,7 +854,12 @@ class _ConnectionBase:
         )
 
         def resp(res: Response) -> Response:
-            return self.__handle_response(res, error_msg, status_codes)
+            res = self.__handle_response(res, error_msg, status_codes)
+            if self._query_cache is not None and method not in ("GET", "HEAD"):
+                self._query_cache.invalidate_rest_write(
+                    url[len(self.url + self._api_version_path) :], weaviate_object
+                )
+            return res
 
         def exc(e: Exception) -> None:
             self.__handle_exceptions(e, error_msg)
@@ -704,10 +867,61 @@ class _ConnectionBase:
         return executor.execute(
             response_callback=resp,
             exception_callback=exc,
-            method=self._client.send,
+            method=self.__send_method(method, url[len(self.url) :]),
             request=request,
         )
 
+    def __send_method(
+        self, method: str, path: str
+    ) -> Union[Callable[..., Response], Callable[..., Awaitable[Response]]]:
+        """Return the function sending a request, which retries idempotent requests and records them on a span."""
+        client = self._client
+        assert client is not None
+        retry = method in ("GET", "HEAD") and len(self._retry_policy.retryable_http_statuses) > 0
+        if not retry and not self._instrumentation.enabled:
+            return client.send
+        name = f"weaviate.rest.{method}"
+
+        def attributes(request: Request) -> Dict[str, AttributeValue]:
+            return {
+                "http.request.method": method,
+                "url.path": path,
+                "http.request.body.size": int(request.headers.get("content-length", 0)),
+            }
+
+        def record(span: Optional[Span], res: Response) -> None:
+            if span is not None:
+                span.set_attribute("http.response.status_code", res.status_code)
+                span.set_attribute("http.response.body.size", len(res.content))
+
+        if isinstance(client, AsyncClient):
+
+            async def send_async(request: Request) -> Response:
+                with self._instrumentation.span(name, attributes(request)) as span:
+                    if retry:
+                        res = await _Retry(
+                            self._retry_policy, self._instrumentation.retry_recorder(span)
+                        ).asend(client.send, request)
+                    else:
+                        res = await client.send(request)
+                    record(span, res)
+                    return res
+
+            return send_async
+
+        def send(request: Request) -> Response:
+            with self._instrumentation.span(name, attributes(request)) as span:
+                if retry:
+                    res = _Retry(
+                        self._retry_policy, self._instrumentation.retry_recorder(span)
+                    ).send(client.send, request)
+                else:
+                    res = client.send(request)
+                record(span, res)
+                return res
+
+        return send
+
     def close(self, colour: executor.Colour) -> executor.Result[None]:
         if self.embedded_db is not None:
             self.embedded_db.stop()
@@ -724,6 +938,9 @@ class _ConnectionBase:
                     await self._grpc_channel.close()
                     self._grpc_stub = None
                     self._grpc_channel = None
+                if self._grpc_pool is not None:
+                    await self._grpc_pool.aclose()
+                    self._grpc_pool = None
                 self._connected = False
 
             return execute()
@@ -737,6 +954,9 @@ class _ConnectionBase:
             self._grpc_channel.close()
             self._grpc_stub = None
             self._grpc_channel = None
+        if self._grpc_pool is not None:
+            self._grpc_pool.close()
+            self._grpc_pool = None
         self._connected = False
 
     def _check_package_version(self, colour: executor.Colour) -> executor.Result[None]:
@@ -938,6 +1158,14 @@ class ConnectionSync(_ConnectionBase):
                 f"Weaviate version {self._weaviate_version} is not supported. Please use Weaviate version 1.27.0 or higher."
             )
 
+        if self._grpc_config is not None and self._grpc_config._uses_pool():
+            addresses = (
+                executor.result(self._discover_grpc_addresses())
+                if self._grpc_config.discover_nodes
+                else [self._connection_params._grpc_address]
+            )
+            self._open_grpc_pool(addresses, "sync")
+
         if not self._skip_init_checks:
             try:
                 executor.result(self._ping_grpc("sync"))
@@ -969,16 +1197,31 @@ class ConnectionSync(_ConnectionBase):
             ) from error
 
     def grpc_search(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
+        if self._query_cache is None:
+            return self.__grpc_search(request)
+        key, generation, cached = self._query_cache.get(request)
+        if cached is not None:
+            return cached
+        res = self.__grpc_search(request)
+        self._query_cache.put(key, generation, request, res)
+        return res
+
+    def __grpc_search(self, request: search_get_pb2.SearchRequest) -> search_get_pb2.SearchReply:
         try:
             assert self.grpc_stub is not None
-            res = _Retry(4).with_exponential_backoff(
-                0,
-                f"Searching in collection {request.collection}",
-                self.grpc_stub.Search,
-                request,
-                metadata=self.grpc_headers(),
-                timeout=self.timeout_config.query,
-            )
+            with self._instrumentation.rpc_span("Search", request, request.collection) as span:
+                res = _Retry(
+                    self._retry_policy, self._instrumentation.retry_recorder(span), read=True
+                ).with_exponential_backoff(
+                    0,
+                    f"Searching in collection {request.collection}",
+                    self._grpc_read_method("Search", request.collection, span),
+                    request,
+                    metadata=self.grpc_headers(),
+                    timeout=self.timeout_config.query,
+                    compression=self._compression.for_request("search", request),
+                )
+                self._instrumentation.record_reply(span, res)
             return cast(search_get_pb2.SearchReply, res)
         except RpcError as e:
             error = cast(Call, e)
@@ -993,23 +1236,36 @@ class ConnectionSync(_ConnectionBase):
         request: batch_pb2.BatchObjectsRequest,
         timeout: Union[int, float],
         max_retries: float,
-    ) -> Dict[int, str]:
+    ) -> Tuple[Dict[int, str], Optional[_CompressedSize]]:
         try:
             assert self.grpc_stub is not None
-            res = _Retry(max_retries).with_exponential_backoff(
-                count=0,
-                error="Batch objects",
-                f=self.grpc_stub.BatchObjects,
-                request=request,
-                metadata=self.grpc_headers(),
-                timeout=timeout,
-            )
+            compression = self._compression.for_request("batch", request)
+            with self._instrumentation.rpc_span("BatchObjects", request) as span:
+                res = _Retry(
+                    self._retry_policy,
+                    self._instrumentation.retry_recorder(span),
+                    max_retries=max_retries,
+                ).with_exponential_backoff(
+                    count=0,
+                    error="Batch objects",
+                    f=self._grpc_method("BatchObjects"),
+                    request=request,
+                    metadata=self.grpc_headers(),
+                    timeout=timeout,
+                    compression=compression,
+                )
+                self._instrumentation.record_reply(span, res)
+                self._instrumentation.record_batch(span, len(request.objects), len(res.errors))
             res = cast(batch_pb2.BatchObjectsReply, res)
+            if self._query_cache is not None:
+                self._query_cache.invalidate({obj.collection for obj in request.objects})
 
             objects: Dict[int, str] = {}
             for err in res.errors:
                 objects[err.index] = err.error
-            return objects
+            if compression in (None, grpc.Compression.NoCompression):
+                return objects, None
+            return objects, self._compression.sample(request.ByteSize(), request.objects)
         except RpcError as e:
             error = cast(Call, e)
             if error.code() == StatusCode.PERMISSION_DENIED:
@@ -1020,12 +1276,15 @@ class ConnectionSync(_ConnectionBase):
         self,
         requests: Generator[batch_pb2.BatchStreamRequest, None, None],
     ) -> Generator[batch_pb2.BatchStreamReply, None, None]:
+        if self._query_cache is not None:
+            requests = self.__invalidate_on_send(requests, self._query_cache)
         try:
             assert self.grpc_stub is not None
             for msg in self.grpc_stub.BatchStream(
                 request_iterator=requests,
                 timeout=self.timeout_config.stream,
                 metadata=self.grpc_headers(),
+                compression=self._compression.for_stream("batch_stream"),
             ):
                 yield msg
         except RpcError as e:
@@ -1036,19 +1295,32 @@ class ConnectionSync(_ConnectionBase):
                 raise _BatchStreamShutdownError()
             raise WeaviateBatchStreamError(f"{error.code()}({error.details()})")
 
+    @staticmethod
+    def __invalidate_on_send(
+        requests: Generator[batch_pb2.BatchStreamRequest, None, None], cache: _QueryCache
+    ) -> Generator[batch_pb2.BatchStreamRequest, None, None]:
+        for request in requests:
+            yield request
+            cache.invalidate_batch_stream(request)
+
     def grpc_batch_delete(
         self, request: batch_delete_pb2.BatchDeleteRequest
     ) -> batch_delete_pb2.BatchDeleteReply:
         try:
             assert self.grpc_stub is not None
-            return cast(
-                batch_delete_pb2.BatchDeleteReply,
-                self.grpc_stub.BatchDelete(
-                    request,
-                    metadata=self.grpc_headers(),
-                    timeout=self.timeout_config.insert,
-                ),
-            )
+            with self._instrumentation.rpc_span("BatchDelete", request, request.collection) as span:
+                res = cast(
+                    batch_delete_pb2.BatchDeleteReply,
+                    self.grpc_stub.BatchDelete(
+                        request,
+                        metadata=self.grpc_headers(),
+                        timeout=self.timeout_config.insert,
+                    ),
+                )
+                self._instrumentation.record_reply(span, res)
+            if self._query_cache is not None and not request.dry_run:
+                self._query_cache.invalidate([request.collection])
+            return res
         except RpcError as e:
             error = cast(Call, e)
             if error.code() == StatusCode.PERMISSION_DENIED:
@@ -1060,14 +1332,18 @@ class ConnectionSync(_ConnectionBase):
     ) -> tenants_pb2.TenantsGetReply:
         try:
             assert self.grpc_stub is not None
-            res = _Retry().with_exponential_backoff(
-                0,
-                f"Get tenants for collection {request.collection}",
-                self.grpc_stub.TenantsGet,
-                request,
-                metadata=self.grpc_headers(),
-                timeout=self.timeout_config.query,
-            )
+            with self._instrumentation.rpc_span("TenantsGet", request, request.collection) as span:
+                res = _Retry(
+                    self._retry_policy, self._instrumentation.retry_recorder(span), read=True
+                ).with_exponential_backoff(
+                    0,
+                    f"Get tenants for collection {request.collection}",
+                    self.grpc_stub.TenantsGet,
+                    request,
+                    metadata=self.grpc_headers(),
+                    timeout=self.timeout_config.query,
+                )
+                self._instrumentation.record_reply(span, res)
         except RpcError as e:
             error = cast(Call, e)
             if error.code() == StatusCode.PERMISSION_DENIED:
@@ -1081,14 +1357,19 @@ class ConnectionSync(_ConnectionBase):
     ) -> aggregate_pb2.AggregateReply:
         try:
             assert self.grpc_stub is not None
-            res = _Retry(4).with_exponential_backoff(
-                0,
-                f"Searching in collection {request.collection}",
-                self.grpc_stub.Aggregate,
-                request,
-                metadata=self.grpc_headers(),
-                timeout=self.timeout_config.query,
-            )
+            with self._instrumentation.rpc_span("Aggregate", request, request.collection) as span:
+                res = _Retry(
+                    self._retry_policy, self._instrumentation.retry_recorder(span), read=True
+                ).with_exponential_backoff(
+                    0,
+                    f"Searching in collection {request.collection}",
+                    self._grpc_read_method("Aggregate", request.collection, span),
+                    request,
+                    metadata=self.grpc_headers(),
+                    timeout=self.timeout_config.query,
+                    compression=self._compression.for_request("aggregate", request),
+                )
+                self._instrumentation.record_reply(span, res)
             return cast(aggregate_pb2.AggregateReply, res)
         except RpcError as e:
             error = cast(Call, e)
@@ -1142,6 +1423,14 @@ class ConnectionAsync(_ConnectionBase):
                 f"Weaviate version {self._weaviate_version} is not supported. Please use Weaviate version 1.27.0 or higher."
             )
 
+        if self._grpc_config is not None and self._grpc_config._uses_pool():
+            addresses = (
+                await executor.aresult(self._discover_grpc_addresses())
+                if self._grpc_config.discover_nodes
+                else [self._connection_params._grpc_address]
+            )
+            self._open_grpc_pool(addresses, "async")
+
         if not self._skip_init_checks:
             try:
                 await executor.aresult(self._ping_grpc("async"))
@@ -1174,17 +1463,34 @@ class ConnectionAsync(_ConnectionBase):
 
     async def grpc_search(
         self, request: search_get_pb2.SearchRequest
+    ) -> search_get_pb2.SearchReply:
+        if self._query_cache is None:
+            return await self.__grpc_search(request)
+        key, generation, cached = self._query_cache.get(request)
+        if cached is not None:
+            return cached
+        res = await self.__grpc_search(request)
+        self._query_cache.put(key, generation, request, res)
+        return res
+
+    async def __grpc_search(
+        self, request: search_get_pb2.SearchRequest
     ) -> search_get_pb2.SearchReply:
         try:
             assert self.grpc_stub is not None
-            res = await _Retry(4).awith_exponential_backoff(
-                0,
-                f"Searching in collection {request.collection}",
-                self.grpc_stub.Search,
-                request,
-                metadata=self.grpc_headers(),
-                timeout=self.timeout_config.query,
-            )
+            with self._instrumentation.rpc_span("Search", request, request.collection) as span:
+                res = await _Retry(
+                    self._retry_policy, self._instrumentation.retry_recorder(span), read=True
+                ).awith_exponential_backoff(
+                    0,
+                    f"Searching in collection {request.collection}",
+                    self._grpc_read_method("Search", request.collection, span),
+                    request,
+                    metadata=self.grpc_headers(),
+                    timeout=self.timeout_config.query,
+                    compression=self._compression.for_request("search", request),
+                )
+                self._instrumentation.record_reply(span, res)
             return cast(search_get_pb2.SearchReply, res)
         except AioRpcError as e:
             if e.code().name == PERMISSION_DENIED:
@@ -1198,23 +1504,36 @@ class ConnectionAsync(_ConnectionBase):
         request: batch_pb2.BatchObjectsRequest,
         timeout: Union[int, float],
         max_retries: float,
-    ) -> Dict[int, str]:
+    ) -> Tuple[Dict[int, str], Optional[_CompressedSize]]:
         try:
             assert self.grpc_stub is not None
-            res = await _Retry(max_retries).awith_exponential_backoff(
-                count=0,
-                error="Batch objects",
-                f=self.grpc_stub.BatchObjects,
-                request=request,
-                metadata=self.grpc_headers(),
-                timeout=timeout,
-            )
+            compression = self._compression.for_request("batch", request)
+            with self._instrumentation.rpc_span("BatchObjects", request) as span:
+                res = await _Retry(
+                    self._retry_policy,
+                    self._instrumentation.retry_recorder(span),
+                    max_retries=max_retries,
+                ).awith_exponential_backoff(
+                    count=0,
+                    error="Batch objects",
+                    f=self._grpc_method("BatchObjects"),
+                    request=request,
+                    metadata=self.grpc_headers(),
+                    timeout=timeout,
+                    compression=compression,
+                )
+                self._instrumentation.record_reply(span, res)
+                self._instrumentation.record_batch(span, len(request.objects), len(res.errors))
             res = cast(batch_pb2.BatchObjectsReply, res)
+            if self._query_cache is not None:
+                self._query_cache.invalidate({obj.collection for obj in request.objects})
 
             objects: Dict[int, str] = {}
             for err in res.errors:
                 objects[err.index] = err.error
-            return objects
+            if compression in (None, grpc.Compression.NoCompression):
+                return objects, None
+            return objects, self._compression.sample(request.ByteSize(), request.objects)
         except AioRpcError as e:
             if e.code().name == PERMISSION_DENIED:
                 raise InsufficientPermissionsError(e)
@@ -1225,11 +1544,16 @@ class ConnectionAsync(_ConnectionBase):
     ) -> batch_delete_pb2.BatchDeleteReply:
         try:
             assert self.grpc_stub is not None
-            return await self.grpc_stub.BatchDelete(
-                request,
-                metadata=self.grpc_headers(),
-                timeout=self.timeout_config.insert,
-            )
+            with self._instrumentation.rpc_span("BatchDelete", request, request.collection) as span:
+                res = await self.grpc_stub.BatchDelete(
+                    request,
+                    metadata=self.grpc_headers(),
+                    timeout=self.timeout_config.insert,
+                )
+                self._instrumentation.record_reply(span, res)
+            if self._query_cache is not None and not request.dry_run:
+                self._query_cache.invalidate([request.collection])
+            return res
         except AioRpcError as e:
             if e.code().name == PERMISSION_DENIED:
                 raise InsufficientPermissionsError(e)
@@ -1240,6 +1564,8 @@ class ConnectionAsync(_ConnectionBase):
         requests: AsyncGenerator[batch_pb2.BatchStreamRequest, None],
     ) -> AsyncGenerator[batch_pb2.BatchStreamReply, None]:
         assert isinstance(self._grpc_channel, grpc.aio.Channel)
+        if self._query_cache is not None:
+            requests = self.__invalidate_on_send(requests, self._query_cache)
         try:
             async for msg in self._grpc_channel.stream_stream(
                 "/weaviate.v1.Weaviate/BatchStream",
@@ -1249,6 +1575,7 @@ class ConnectionAsync(_ConnectionBase):
                 request_iterator=requests,
                 timeout=self.timeout_config.stream,
                 metadata=self.grpc_headers(),
+                compression=self._compression.for_stream("batch_stream"),
             ):
                 yield msg
         except RpcError as e:
@@ -1259,6 +1586,14 @@ class ConnectionAsync(_ConnectionBase):
                 raise _BatchStreamShutdownError()
             raise WeaviateBatchStreamError(f"{error.code()}({error.details()})")
 
+    @staticmethod
+    async def __invalidate_on_send(
+        requests: AsyncGenerator[batch_pb2.BatchStreamRequest, None], cache: _QueryCache
+    ) -> AsyncGenerator[batch_pb2.BatchStreamRequest, None]:
+        async for request in requests:
+            yield request
+            cache.invalidate_batch_stream(request)
+
     async def grpc_batch_stream_write(
         self,
         stream: StreamStreamCall[batch_pb2.BatchStreamRequest, batch_pb2.BatchStreamReply],
@@ -1266,6 +1601,8 @@ class ConnectionAsync(_ConnectionBase):
     ) -> None:
         try:
             await stream.write(request)
+            if self._query_cache is not None:
+                self._query_cache.invalidate_batch_stream(request)
         except AioRpcError as e:
             error = cast(Call, e)
             if error.code() == StatusCode.PERMISSION_DENIED:
@@ -1296,14 +1633,18 @@ class ConnectionAsync(_ConnectionBase):
     ) -> tenants_pb2.TenantsGetReply:
         try:
             assert self.grpc_stub is not None
-            res = await _Retry().awith_exponential_backoff(
-                0,
-                f"Get tenants for collection {request.collection}",
-                self.grpc_stub.TenantsGet,
-                request,
-                metadata=self.grpc_headers(),
-                timeout=self.timeout_config.query,
-            )
+            with self._instrumentation.rpc_span("TenantsGet", request, request.collection) as span:
+                res = await _Retry(
+                    self._retry_policy, self._instrumentation.retry_recorder(span), read=True
+                ).awith_exponential_backoff(
+                    0,
+                    f"Get tenants for collection {request.collection}",
+                    self.grpc_stub.TenantsGet,
+                    request,
+                    metadata=self.grpc_headers(),
+                    timeout=self.timeout_config.query,
+                )
+                self._instrumentation.record_reply(span, res)
         except AioRpcError as e:
             if e.code().name == PERMISSION_DENIED:
                 raise InsufficientPermissionsError(e)
@@ -1316,14 +1657,19 @@ class ConnectionAsync(_ConnectionBase):
     ) -> aggregate_pb2.AggregateReply:
         try:
             assert self.grpc_stub is not None
-            res = await _Retry(4).awith_exponential_backoff(
-                0,
-                f"Searching in collection {request.collection}",
-                self.grpc_stub.Aggregate,
-                request,
-                metadata=self.grpc_headers(),
-                timeout=self.timeout_config.query,
-            )
+            with self._instrumentation.rpc_span("Aggregate", request, request.collection) as span:
+                res = await _Retry(
+                    self._retry_policy, self._instrumentation.retry_recorder(span), read=True
+                ).awith_exponential_backoff(
+                    0,
+                    f"Searching in collection {request.collection}",
+                    self._grpc_read_method("Aggregate", request.collection, span),
+                    request,
+                    metadata=self.grpc_headers(),
+                    timeout=self.timeout_config.query,
+                    compression=self._compression.for_request("aggregate", request),
+                )
+                self._instrumentation.record_reply(span, res)
             return cast(aggregate_pb2.AggregateReply, res)
         except AioRpcError as e:
             if e.code().name == PERMISSION_DENIED:
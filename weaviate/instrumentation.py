@@ -0,0 +1,237 @@
+"""Tracing hooks that report how long the client spends in each phase of an operation.
+
+Pass any OpenTelemetry tracer, e.g. `opentelemetry.trace.get_tracer("weaviate")`, or a `CallbackTracer` as
+`AdditionalConfig(tracer=...)`. The client emits the following spans:
+
+- `weaviate.query.build`: building the gRPC search request.
+- `weaviate.grpc.<Method>`: a gRPC call including its retries, with the `rpc.request.size`, `rpc.response.size`,
+  `weaviate.retries` and `weaviate.took` (the processing time reported by Weaviate) attributes and one `retry` event per
+  retry. `weaviate.grpc.BatchObjects` spans also carry the `weaviate.objects` and `weaviate.errors` attributes. Hedged
+  searches and aggregations carry `weaviate.hedged` and one `hedge` event per duplicate request.
+- `weaviate.query.decode`: decoding a search reply into the returned objects, with the `weaviate.results` attribute.
+- `weaviate.rest.<METHOD>`: a REST call including its retries, with the `url.path`, `http.request.body.size`,
+  `http.response.body.size` and `http.response.status_code` attributes. Retried requests also carry `weaviate.retries`
+  and one `retry` event per retry.
+
+All spans carry the `weaviate.collection` attribute when the operation targets a single collection.
+"""
+
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Union,
+    runtime_checkable,
+)
+
+AttributeValue = Union[str, bool, int, float]
+
+
+@runtime_checkable
+class Span(Protocol):
+    """The subset of the OpenTelemetry `Span` API used by the client."""
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None: ...
+
+    def add_event(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None
+    ) -> None: ...
+
+
+@runtime_checkable
+class Tracer(Protocol):
+    """The subset of the OpenTelemetry `Tracer` API used by the client."""
+
+    def start_as_current_span(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None
+    ) -> ContextManager[Span]: ...
+
+
+@dataclass
+class SpanRecord:
+    """A finished span as reported by `CallbackTracer`.
+
+    `duration` is in seconds. `events` holds the name and attributes of every event added to the span.
+    """
+
+    name: str
+    duration: float
+    attributes: Dict[str, AttributeValue]
+    events: List[Tuple[str, Dict[str, AttributeValue]]] = field(default_factory=list)
+
+
+class _RecordingSpan:
+    def __init__(self, record: SpanRecord) -> None:
+        self.record = record
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.record.attributes[key] = value
+
+    def add_event(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None
+    ) -> None:
+        self.record.events.append((name, dict(attributes or {})))
+
+
+class CallbackTracer:
+    """A `Tracer` that calls `callback` with a `SpanRecord` whenever a span ends.
+
+    Use this to collect timings without depending on OpenTelemetry. The callback is called on the thread or event loop that
+    ran the operation, so it should be fast and must not block.
+
+    Example usage:
+    ```python
+    import weaviate.classes as wvc
+
+    timings = []
+    conf = wvc.init.AdditionalConfig(tracer=wvc.init.CallbackTracer(timings.append))
+    ```
+    """
+
+    def __init__(self, callback: Callable[[SpanRecord], None]) -> None:
+        self.__callback = callback
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None
+    ) -> Iterator[Span]:
+        span = _RecordingSpan(
+            SpanRecord(name=name, duration=0.0, attributes=dict(attributes or {}))
+        )
+        start = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.record.duration = time.perf_counter() - start
+            self.__callback(span.record)
+
+
+class _TeeSpan:
+    def __init__(self, spans: Sequence[Span]) -> None:
+        self.__spans = spans
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        for span in self.__spans:
+            span.set_attribute(key, value)
+
+    def add_event(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None
+    ) -> None:
+        for span in self.__spans:
+            span.add_event(name, attributes)
+
+
+class _TeeTracer:
+    """Opens every span on all of the given tracers."""
+
+    def __init__(self, tracers: Sequence[Tracer]) -> None:
+        self.__tracers = tracers
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None
+    ) -> Iterator[Span]:
+        with ExitStack() as stack:
+            yield _TeeSpan(
+                [
+                    stack.enter_context(tracer.start_as_current_span(name, attributes=attributes))
+                    for tracer in self.__tracers
+                ]
+            )
+
+
+def _combine_tracers(*tracers: Optional[Tracer]) -> Optional[Tracer]:
+    configured = [tracer for tracer in tracers if tracer is not None]
+    if len(configured) == 0:
+        return None
+    if len(configured) == 1:
+        return configured[0]
+    return _TeeTracer(configured)
+
+
+_NO_SPAN: ContextManager[Optional[Span]] = nullcontext(None)
+
+
+class _Instrumentation:
+    """Opens spans on the configured tracer, or does nothing if there is none."""
+
+    def __init__(self, tracer: Optional[Tracer]) -> None:
+        self.__tracer = tracer
+        self.enabled = tracer is not None
+
+    def span(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None
+    ) -> ContextManager[Optional[Span]]:
+        if self.__tracer is None:
+            return _NO_SPAN
+        return self.__tracer.start_as_current_span(name, attributes=attributes)
+
+    @staticmethod
+    def retry_recorder(span: Optional[Span]) -> Optional[Callable[[int, float, Exception], None]]:
+        """Return a callback for `_Retry` that counts the retries of an RPC on its span."""
+        if span is None:
+            return None
+        retries = 0
+
+        def record(attempt: int, backoff: float, error: Exception) -> None:
+            nonlocal retries
+            retries += 1
+            span.set_attribute("weaviate.retries", retries)
+            span.add_event(
+                "retry",
+                {"attempt": attempt, "backoff_seconds": backoff, "error": type(error).__name__},
+            )
+
+        return record
+
+    def rpc_span(
+        self, method: str, request: Any, collection: str = ""
+    ) -> ContextManager[Optional[Span]]:
+        if self.__tracer is None:
+            return _NO_SPAN
+        attributes: Dict[str, AttributeValue] = {
+            "rpc.system": "grpc",
+            "rpc.method": method,
+            "rpc.request.size": request.ByteSize(),
+            "weaviate.retries": 0,
+        }
+        if collection != "":
+            attributes["weaviate.collection"] = collection
+        return self.__tracer.start_as_current_span(f"weaviate.grpc.{method}", attributes=attributes)
+
+    @staticmethod
+    def record_reply(span: Optional[Span], reply: Any) -> None:
+        if span is not None:
+            span.set_attribute("rpc.response.size", reply.ByteSize())
+            span.set_attribute("weaviate.took", reply.took)
+
+    @staticmethod
+    def hedge_recorder(span: Optional[Span]) -> Callable[[float], None]:
+        """Return a callback for `_Hedger` that marks the RPC on its span as hedged."""
+
+        def record(delay: float) -> None:
+            if span is not None:
+                span.set_attribute("weaviate.hedged", True)
+                span.add_event("hedge", {"delay_seconds": delay})
+
+        return record
+
+    @staticmethod
+    def record_batch(span: Optional[Span], objects: int, errors: int) -> None:
+        if span is not None:
+            span.set_attribute("weaviate.objects", objects)
+            span.set_attribute("weaviate.errors", errors)
+
+
+_NO_INSTRUMENTATION = _Instrumentation(None)
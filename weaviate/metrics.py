@@ -0,0 +1,354 @@
+"""Throughput and latency metrics collected by the client.
+
+Enable them with `AdditionalConfig(metrics=True)` and read them from `client.metrics()`. The metrics are derived from the
+spans described in `weaviate.instrumentation`, so they cover the same gRPC and REST calls. Every request is labelled with
+`rpc`, which is `grpc.<Method>` for gRPC calls and `rest.<METHOD>` for REST calls:
+
+- `weaviate_requests_total`, `weaviate_request_errors_total` and `weaviate_retries_total`: counters of finished requests,
+  of requests that raised and of retried attempts.
+- `weaviate_request_duration_seconds`: a histogram of the client-side latency of each request, including retries.
+- `weaviate_server_took_seconds`: a histogram of the processing time reported by Weaviate in gRPC replies.
+- `weaviate_sent_bytes_total` and `weaviate_received_bytes_total`: counters of the request and reply payload sizes.
+- `weaviate_in_flight_requests`: a gauge of the requests currently waiting for Weaviate.
+- `weaviate_hedged_requests_total`: a counter of the requests for which a duplicate was sent, see `Hedging`.
+- `weaviate_batch_objects_total` and `weaviate_batch_object_errors_total`: counters of the objects sent in batches and of
+  the objects Weaviate reported as failed.
+- `weaviate_batch_queue_depth`: a gauge of the objects queued in client-side batching and not sent yet.
+- `weaviate_query_results_total`: a counter of the objects returned by searches.
+"""
+
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from weaviate.instrumentation import AttributeValue, Span
+
+_DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+_Value = Union[float, Dict[str, Any]]
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(
+        self, name: str, description: str, label: Optional[str], lock: threading.Lock
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.label = label
+        self._lock = lock
+
+    @abstractmethod
+    def snapshot(self) -> _Value: ...
+
+    @abstractmethod
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]: ...
+
+    def _labels(self, label: str) -> Dict[str, str]:
+        return {self.label: label} if self.label is not None else {}
+
+
+class _Counter(_Metric):
+    kind = "counter"
+
+    def __init__(
+        self, name: str, description: str, label: Optional[str], lock: threading.Lock
+    ) -> None:
+        super().__init__(name, description, label, lock)
+        self._values: Dict[str, float] = {}
+
+    def inc(self, amount: float = 1, label: str = "") -> None:
+        with self._lock:
+            self._values[label] = self._values.get(label, 0) + amount
+
+    def snapshot(self) -> _Value:
+        with self._lock:
+            if self.label is None:
+                return self._values.get("", 0)
+            return dict(self._values)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        with self._lock:
+            if self.label is None and len(self._values) == 0:
+                return [(self.name, {}, 0)]
+            return [(self.name, self._labels(k), v) for k, v in sorted(self._values.items())]
+
+
+class _Gauge(_Counter):
+    kind = "gauge"
+
+    def set_value(self, value: float, label: str = "") -> None:
+        with self._lock:
+            self._values[label] = value
+
+    def dec(self, amount: float = 1, label: str = "") -> None:
+        self.inc(-amount, label)
+
+
+class _HistogramValue:
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+
+class _Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        label: Optional[str],
+        lock: threading.Lock,
+        buckets: Sequence[float] = _DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, description, label, lock)
+        self.__buckets = tuple(buckets)
+        self.__values: Dict[str, _HistogramValue] = {}
+
+    def observe(self, value: float, label: str = "") -> None:
+        with self._lock:
+            hist = self.__values.get(label)
+            if hist is None:
+                hist = self.__values[label] = _HistogramValue(self.__buckets)
+            idx = bisect.bisect_left(self.__buckets, value)
+            if idx < len(self.__buckets):
+                hist.counts[idx] += 1
+            hist.count += 1
+            hist.sum += value
+
+    def __cumulative(self, hist: _HistogramValue) -> List[int]:
+        cumulative, total = [], 0
+        for count in hist.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+    def snapshot(self) -> _Value:
+        with self._lock:
+            values = {
+                label: {
+                    "count": hist.count,
+                    "sum": hist.sum,
+                    "buckets": dict(zip(self.__buckets, self.__cumulative(hist))),
+                }
+                for label, hist in self.__values.items()
+            }
+        if self.label is None:
+            return values.get("", {"count": 0, "sum": 0.0, "buckets": {}})
+        return values
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        samples: List[Tuple[str, Dict[str, str], float]] = []
+        with self._lock:
+            for label, hist in sorted(self.__values.items()):
+                labels = self._labels(label)
+                for bound, count in zip(self.__buckets, self.__cumulative(hist)):
+                    samples.append((f"{self.name}_bucket", {**labels, "le": repr(bound)}, count))
+                samples.append((f"{self.name}_bucket", {**labels, "le": "+Inf"}, hist.count))
+                samples.append((f"{self.name}_sum", labels, hist.sum))
+                samples.append((f"{self.name}_count", labels, hist.count))
+        return samples
+
+
+class _MetricsSpan:
+    def __init__(self, attributes: Optional[Mapping[str, AttributeValue]]) -> None:
+        self.attributes: Dict[str, AttributeValue] = dict(attributes or {})
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def add_event(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None
+    ) -> None:
+        pass
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+class ClientMetrics:
+    """Counters, gauges and histograms of the requests made by a client.
+
+    Get an instance from `client.metrics()` after enabling metrics with `AdditionalConfig(metrics=True)`. The values are
+    totals since the client was created, use `snapshot()` to read them as a dictionary or `to_prometheus()` to serve them
+    to a Prometheus scraper. See `weaviate.metrics` for the collected metrics.
+
+    Example usage:
+    ```python
+    metrics = client.metrics()
+    assert metrics is not None
+    print(metrics.snapshot()["weaviate_request_duration_seconds"]["grpc.Search"]["count"])
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.__created = time.monotonic()
+        lock = threading.Lock()
+        self.__requests = _Counter("weaviate_requests_total", "Finished requests.", "rpc", lock)
+        self.__errors = _Counter(
+            "weaviate_request_errors_total", "Requests that raised an error.", "rpc", lock
+        )
+        self.__retries = _Counter(
+            "weaviate_retries_total", "Retried request attempts.", "rpc", lock
+        )
+        self.__duration = _Histogram(
+            "weaviate_request_duration_seconds",
+            "Client-side request latency including retries.",
+            "rpc",
+            lock,
+        )
+        self.__took = _Histogram(
+            "weaviate_server_took_seconds", "Processing time reported by Weaviate.", "rpc", lock
+        )
+        self.__sent = _Counter("weaviate_sent_bytes_total", "Request payload bytes.", "rpc", lock)
+        self.__received = _Counter(
+            "weaviate_received_bytes_total", "Reply payload bytes.", "rpc", lock
+        )
+        self.__in_flight = _Gauge(
+            "weaviate_in_flight_requests", "Requests waiting for Weaviate.", "rpc", lock
+        )
+        self.__hedged = _Counter(
+            "weaviate_hedged_requests_total",
+            "Requests for which a duplicate was sent.",
+            "rpc",
+            lock,
+        )
+        self.__batch_objects = _Counter(
+            "weaviate_batch_objects_total", "Objects sent in batches.", None, lock
+        )
+        self.__batch_errors = _Counter(
+            "weaviate_batch_object_errors_total", "Batched objects that failed.", None, lock
+        )
+        self.__queue_depth = _Gauge(
+            "weaviate_batch_queue_depth",
+            "Objects queued for batching and not sent yet.",
+            None,
+            lock,
+        )
+        self.__results = _Counter(
+            "weaviate_query_results_total", "Objects returned by searches.", None, lock
+        )
+        self.__metrics: List[_Metric] = [
+            self.__requests,
+            self.__errors,
+            self.__retries,
+            self.__duration,
+            self.__took,
+            self.__sent,
+            self.__received,
+            self.__in_flight,
+            self.__hedged,
+            self.__batch_objects,
+            self.__batch_errors,
+            self.__queue_depth,
+            self.__results,
+        ]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current values as a dictionary keyed by metric name.
+
+        Metrics labelled with `rpc` map each label value to its value. Histograms are given as a dictionary with the
+        `count`, the `sum` and the cumulative `buckets` keyed by their upper bound. `elapsed_seconds` is the time since the
+        client was created and `rates` holds the average objects and bytes per second over that time.
+        """
+        elapsed = time.monotonic() - self.__created
+        snapshot: Dict[str, Any] = {metric.name: metric.snapshot() for metric in self.__metrics}
+        snapshot["elapsed_seconds"] = elapsed
+        snapshot["rates"] = {
+            "batch_objects_per_second": snapshot["weaviate_batch_objects_total"] / elapsed,
+            "sent_bytes_per_second": sum(snapshot["weaviate_sent_bytes_total"].values()) / elapsed,
+            "received_bytes_per_second": sum(snapshot["weaviate_received_bytes_total"].values())
+            / elapsed,
+        }
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """Return the current values in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self.__metrics:
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                if len(labels) > 0:
+                    label_str = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                    name = f"{name}{{{label_str}}}"
+                lines.append(f"{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _set_batch_queue_depth(self, depth: int) -> None:
+        self.__queue_depth.set_value(depth)
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None
+    ) -> Iterator[Span]:
+        """Collect the metrics of a span, so that this object can be used as a `Tracer`."""
+        span = _MetricsSpan(attributes)
+        if name == "weaviate.query.decode":
+            yield span
+            self.__results.inc(int(span.attributes.get("weaviate.results", 0)))
+            return
+        if not name.startswith(("weaviate.grpc.", "weaviate.rest.")):
+            yield span
+            return
+
+        rpc = name[len("weaviate.") :]
+        self.__in_flight.inc(label=rpc)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException:
+            self.__errors.inc(label=rpc)
+            raise
+        finally:
+            self.__duration.observe(time.perf_counter() - start, rpc)
+            self.__in_flight.dec(label=rpc)
+            self.__requests.inc(label=rpc)
+            self.__record(rpc, span.attributes)
+
+    def __record(self, rpc: str, attributes: Dict[str, AttributeValue]) -> None:
+        sent = attributes.get("rpc.request.size", attributes.get("http.request.body.size", 0))
+        received = attributes.get("rpc.response.size", attributes.get("http.response.body.size", 0))
+        self.__sent.inc(int(sent), rpc)
+        self.__received.inc(int(received), rpc)
+        retries = int(attributes.get("weaviate.retries", 0))
+        if retries > 0:
+            self.__retries.inc(retries, rpc)
+        if attributes.get("weaviate.hedged", False):
+            self.__hedged.inc(label=rpc)
+        took = attributes.get("weaviate.took")
+        if took is not None:
+            self.__took.observe(float(took), rpc)
+        objects = attributes.get("weaviate.objects")
+        if objects is not None:
+            self.__batch_objects.inc(int(objects))
+            self.__batch_errors.inc(int(attributes.get("weaviate.errors", 0)))
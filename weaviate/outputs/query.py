@@ -17,6 +17,8 @@ from weaviate.collections.classes.grpc import (
     TargetVectorJoinType,
 )
 from weaviate.collections.classes.internal import (
+    BatchQueryReturn,
+    ColumnarQueryReturn,
     GenerativeGroup,
     GenerativeGroupByReturn,
     GenerativeGroupByReturnType,
@@ -49,8 +51,11 @@ from weaviate.collections.classes.types import (
     WeaviateField,
     WeaviateProperties,
 )
+from weaviate.connect.query_cache import QueryCacheStats
 
 __all__ = [
+    "BatchQueryReturn",
+    "ColumnarQueryReturn",
     "FilterByCreationTime",
     "FilterById",
     "FilterByProperty",
@@ -82,6 +87,7 @@ __all__ = [
     "GenerativeGroup",
     "PhoneNumberType",
     "QueryNearMediaReturnType",
+    "QueryCacheStats",
     "QueryProfileReturn",
     "QueryReturnType",
     "QueryReturn",
@@ -1,21 +1,79 @@
 import asyncio
+import random
 import time
-from typing import Awaitable, Callable, cast
+from typing import Any, Awaitable, Callable, Dict, Optional, cast
 
-from grpc import Call, RpcError, StatusCode  # type: ignore
-from grpc.aio import AioRpcError  # type: ignore
+from grpc import Call, RpcError  # type: ignore
+from httpx import Request, Response
 from typing_extensions import ParamSpec, TypeVar
 
+from weaviate.config import RetryPolicy
 from weaviate.exceptions import WeaviateRetryError
 from weaviate.logger import logger
 
 P = ParamSpec("P")
 T = TypeVar("T")
 
+_DEFAULT_POLICY = RetryPolicy()
+
 
 class _Retry:
-    def __init__(self, n: float = 4) -> None:
-        self.n = n
+    """Retries calls according to a `RetryPolicy`.
+
+    `max_retries` overrides the number of retries of the policy, e.g. for batches that should survive a scale-up of the
+    cluster. `read` marks idempotent reads, which are also retried on the `retryable_read_codes` of the policy.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy = _DEFAULT_POLICY,
+        on_retry: Optional[Callable[[int, float, Exception], None]] = None,
+        max_retries: Optional[float] = None,
+        read: bool = False,
+    ) -> None:
+        self.policy = policy
+        self.on_retry = on_retry
+        self.max_retries = max_retries if max_retries is not None else policy.max_attempts - 1
+        self.codes = (
+            policy.retryable_codes | policy.retryable_read_codes
+            if read
+            else (policy.retryable_codes)
+        )
+
+    def __backoff(self, count: int, start: float) -> Optional[float]:
+        """Return how long to wait before retry number `count`, or `None` if the retries or the time budget are used up."""
+        if count >= self.max_retries:
+            return None
+        backoff = min(self.policy.max_backoff, self.policy.initial_backoff * 2**count)
+        if self.policy.jitter:
+            backoff = random.uniform(0, backoff)
+        if (
+            self.policy.total_timeout is not None
+            and time.monotonic() - start + backoff >= self.policy.total_timeout
+        ):
+            return None
+        return backoff
+
+    def __cap_timeout(self, kwargs: Dict[str, Any], timeout: Any, start: float) -> None:
+        """Shorten the timeout of the next attempt so that it ends within the time budget."""
+        if self.policy.total_timeout is None:
+            return
+        remaining = self.policy.total_timeout - (time.monotonic() - start)
+        kwargs["timeout"] = remaining if timeout is None else min(timeout, remaining)
+
+    def __retry(self, count: int, start: float, error: str, e: Exception) -> float:
+        code = cast(Call, e).code()
+        if code not in self.codes:
+            raise e
+        backoff = self.__backoff(count, start)
+        if backoff is None:
+            raise WeaviateRetryError(str(e), count) from e
+        logger.info(
+            f"{error} received exception: {e}. Retrying with exponential backoff in {backoff:.2f} seconds"
+        )
+        if self.on_retry is not None:
+            self.on_retry(count, backoff, e)
+        return backoff
 
     async def awith_exponential_backoff(
         self,
@@ -25,18 +83,15 @@ class _Retry:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> T:
-        try:
-            return await f(*args, **kwargs)
-        except AioRpcError as e:
-            if e.code() != StatusCode.UNAVAILABLE:
-                raise e
-            logger.info(
-                f"{error} received exception: {e}. Retrying with exponential backoff in {2**count} seconds"
-            )
-            await asyncio.sleep(2**count)
-            if count > self.n:
-                raise WeaviateRetryError(str(e), count) from e
-            return await self.awith_exponential_backoff(count + 1, error, f, *args, **kwargs)
+        start = time.monotonic()
+        timeout = kwargs.get("timeout")
+        while True:
+            self.__cap_timeout(kwargs, timeout, start)
+            try:
+                return await f(*args, **kwargs)
+            except RpcError as e:
+                await asyncio.sleep(self.__retry(count, start, error, e))
+                count += 1
 
     def with_exponential_backoff(
         self,
@@ -46,16 +101,61 @@ class _Retry:
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> T:
-        try:
-            return f(*args, **kwargs)
-        except RpcError as e:
-            err = cast(Call, e)
-            if err.code() != StatusCode.UNAVAILABLE:
-                raise e
-            logger.info(
-                f"{error} received exception: {e}. Retrying with exponential backoff in {2**count} seconds"
-            )
-            time.sleep(2**count)
-            if count > self.n:
-                raise WeaviateRetryError(str(e), count) from e
-            return self.with_exponential_backoff(count + 1, error, f, *args, **kwargs)
+        start = time.monotonic()
+        timeout = kwargs.get("timeout")
+        while True:
+            self.__cap_timeout(kwargs, timeout, start)
+            try:
+                return f(*args, **kwargs)
+            except RpcError as e:
+                time.sleep(self.__retry(count, start, error, e))
+                count += 1
+
+    def __retry_http(
+        self, count: int, start: float, request: Request, res: Response
+    ) -> Optional[float]:
+        if res.status_code not in self.policy.retryable_http_statuses:
+            return None
+        backoff = self.__backoff(count, start)
+        if backoff is None:
+            return None
+        logger.info(
+            f"{request.method} {request.url.path} returned status {res.status_code}. Retrying with exponential backoff in {backoff:.2f} seconds"
+        )
+        if self.on_retry is not None:
+            self.on_retry(count, backoff, RetryableHTTPStatus(res.status_code))
+        return backoff
+
+    async def asend(
+        self, send: Callable[[Request], Awaitable[Response]], request: Request
+    ) -> Response:
+        """Send an idempotent REST request, retrying on the `retryable_http_statuses` of the policy."""
+        start, count = time.monotonic(), 0
+        while True:
+            res = await send(request)
+            backoff = self.__retry_http(count, start, request, res)
+            if backoff is None:
+                return res
+            await res.aclose()
+            await asyncio.sleep(backoff)
+            count += 1
+
+    def send(self, send: Callable[[Request], Response], request: Request) -> Response:
+        """Send an idempotent REST request, retrying on the `retryable_http_statuses` of the policy."""
+        start, count = time.monotonic(), 0
+        while True:
+            res = send(request)
+            backoff = self.__retry_http(count, start, request, res)
+            if backoff is None:
+                return res
+            res.close()
+            time.sleep(backoff)
+            count += 1
+
+
+class RetryableHTTPStatus(Exception):
+    """Passed to `on_retry` when a REST request is retried because of its status code."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"status code {status_code}")
+        self.status_code = status_code
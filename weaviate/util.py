@@ -32,6 +32,7 @@ MINIMUM_NO_WARNING_VERSION = (
     "v1.16.0"  # The minimum version of Weaviate that will not trigger an upgrade warning.
 )
 BYTES_PER_CHUNK = 65535  # The number of bytes to read per chunk when encoding files ~ 64kb
+DATE_CACHE_SIZE = 4096  # The number of distinct date strings whose parsed datetime is kept
 
 
 def docstring_deprecated(details: str = "", deprecated_in: str = "") -> Callable:
@@ -761,7 +762,69 @@ def _datetime_to_string(value: TIME) -> str:
     return value.isoformat(sep="T", timespec="microseconds")
 
 
+@functools.lru_cache(maxsize=None)
+def _fixed_timezone(offset_minutes: int) -> datetime.timezone:
+    if offset_minutes == 0:
+        return datetime.timezone.utc
+    return datetime.timezone(datetime.timedelta(minutes=offset_minutes))
+
+
+def _parse_rfc3339(string: str) -> datetime.datetime:
+    """Parse the `YYYY-MM-DDTHH:MM:SS[.fraction](Z|+HH:MM|-HH:MM)` layout that Weaviate returns by slicing at fixed offsets.
+
+    The fraction can have up to 9 digits and is truncated to microseconds. Raises a `ValueError` for any other layout.
+    """
+    if (
+        len(string) < 20
+        or string[4] != "-"
+        or string[7] != "-"
+        or string[10] != "T"
+        or string[13] != ":"
+        or string[16] != ":"
+    ):
+        raise ValueError(f"{string} is not an RFC3339 date")
+    end = 19
+    microsecond = 0
+    if string[19] == ".":
+        end = 20
+        while end < len(string) and string[end].isdigit():
+            end += 1
+        if end == 20:
+            raise ValueError(f"{string} is not an RFC3339 date")
+        microsecond = int(string[20 : min(end, 26)].ljust(6, "0"))
+    zone = string[end:]
+    if zone == "Z":
+        tzinfo = datetime.timezone.utc
+    elif len(zone) == 6 and zone[0] in "+-" and zone[3] == ":":
+        offset = int(zone[1:3]) * 60 + int(zone[4:6])
+        tzinfo = _fixed_timezone(-offset if zone[0] == "-" else offset)
+    else:
+        raise ValueError(f"{string} is not an RFC3339 date")
+    return datetime.datetime(
+        int(string[0:4]),
+        int(string[5:7]),
+        int(string[8:10]),
+        int(string[11:13]),
+        int(string[14:16]),
+        int(string[17:19]),
+        microsecond,
+        tzinfo,
+    )
+
+
+# dates repeat a lot in event data, datetimes are immutable so that the parsed values can be shared
+_parse_rfc3339_cached = functools.lru_cache(maxsize=DATE_CACHE_SIZE)(_parse_rfc3339)
+
+
 def _datetime_from_weaviate_str(string: str) -> datetime.datetime:
+    try:
+        return _parse_rfc3339_cached(string)
+    except ValueError:
+        # other layouts and out of range dates, like year 0, are handled by the strptime based parser
+        return _datetime_from_weaviate_str_strptime(string)
+
+
+def _datetime_from_weaviate_str_strptime(string: str) -> datetime.datetime:
     if string[-1] != "Z":
         string = "".join(string.rsplit(":", 1))
 
@@ -782,6 +845,28 @@ def _datetime_from_weaviate_str(string: str) -> datetime.datetime:
         raise e
 
 
+def _datetime64_from_weaviate_strs(strings: Sequence[str]) -> Any:
+    """Decode a list of dates into a `numpy.ndarray` of UTC `datetime64[us]` values.
+
+    Dates in UTC are parsed by numpy in a single call, other dates are parsed one by one and converted to UTC.
+    """
+    import numpy as np
+
+    if all(string[-1] == "Z" for string in strings):
+        return np.array([string[:-1] for string in strings], dtype="datetime64[us]")
+    return np.array(
+        [
+            (
+                dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+                if (dt := _datetime_from_weaviate_str(string)).tzinfo is not None
+                else dt
+            )
+            for string in strings
+        ],
+        dtype="datetime64[us]",
+    )
+
+
 class _WeaviateUUIDInt(uuid_lib.UUID):
     def __init__(self, hex_: int) -> None:
         object.__setattr__(self, "int", hex_)
@@ -325,6 +325,15 @@ class _Warnings:
             stacklevel=1,
         )
 
+    @staticmethod
+    def grpc_node_discovery_failed(reason: str) -> None:
+        warnings.warn(
+            message=f"""Con006: Could not discover the nodes of the cluster, only the configured gRPC address is used.
+            Reason: {reason}""",
+            category=UserWarning,
+            stacklevel=1,
+        )
+
     @staticmethod
     def unknown_permission_encountered(permission: Any) -> None:
         warnings.warn(